@@ -24,9 +24,20 @@ import contextlib
 import dataclasses
 import json
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import requests
 from aea.configurations.base import PublicId
@@ -37,6 +48,7 @@ from aea.protocols.dialogue.base import Dialogue
 from eth_abi import encode
 from eth_utils import keccak, to_checksum_address
 from py_builder_relayer_client.client import RelayClient
+from py_builder_relayer_client.exceptions import RelayerApiException
 from py_builder_relayer_client.models import OperationType, SafeTransaction
 from py_clob_client_v2 import BuilderConfig, ClobClient, MarketOrderArgs, OrderType
 from py_clob_client_v2.exceptions import PolyApiException
@@ -46,6 +58,10 @@ from py_clob_client_v2.order_utils.model.signature_type_v2 import SignatureTypeV
 from web3 import Web3
 from web3.middleware.proof_of_authority import ExtraDataToPOAMiddleware
 
+from packages.valory.connections.polymarket_client.http_pool import (
+    HostRateLimiter,
+    build_pooled_session,
+)
 from packages.valory.connections.polymarket_client.relayer_proxy import (
     DW_FACTORY,
     RelayerProxyClient,
@@ -53,7 +69,16 @@ from packages.valory.connections.polymarket_client.relayer_proxy import (
     TX_TERMINAL_FAIL,
     TX_TERMINAL_OK,
 )
-from packages.valory.connections.polymarket_client.request_types import RequestType
+from packages.valory.connections.polymarket_client.request_types import (
+    REDEEM_BATCH_GAS_LIMIT,
+    REDEEM_POSITION_GAS_ESTIMATE,
+    RequestType,
+)
+from packages.valory.connections.polymarket_client.response_cache import (
+    DEFAULT_MAX_ENTRIES,
+    NOT_MODIFIED_STATUS,
+    ResponseCache,
+)
 from packages.valory.protocols.srr.dialogues import SrrDialogue
 from packages.valory.protocols.srr.dialogues import SrrDialogues as BaseSrrDialogues
 from packages.valory.protocols.srr.message import SrrMessage
@@ -96,6 +121,20 @@ MAX_API_RETRIES = 3
 RETRY_DELAY = 1  # base seconds for transient connection errors
 RATE_LIMIT_RETRY_DELAY = 10  # base seconds for HTTP 429 (rate-limit) responses
 MAX_RATE_LIMIT_SLEEP = 60  # upper bound on a single Retry-After-aware sleep
+# Number of categories whose markets are fetched concurrently, over a shared
+# keep-alive session pool. 1 keeps the sequential, one-category-at-a-time walk.
+MARKETS_FETCH_MAX_WORKERS = 4
+# Per-host request rate of the concurrent category fetch. Non-positive disables the spacing.
+API_MAX_REQUESTS_PER_SECOND = 10.0
+# Seconds during which a Gamma API response is served from the response cache
+# before it is revalidated. Market listings tolerate a short staleness.
+GAMMA_API_CACHE_TTL = 30.0
+# The Data API serves the agent's own positions and trades, which change with
+# every bet, so its responses are always revalidated (ETag / Last-Modified).
+DATA_API_CACHE_TTL = 0.0
+# Seconds during which the order book of a token is served from the response
+# cache, so that repeated quotes within a period do not refetch it.
+ORDER_BOOK_CACHE_TTL = 10.0
 # Subgraph indexes markets created after this date; exclude older markets
 MARKETS_MIN_CREATED_AT = "2025-12-15T19:20:11Z"
 # The CLOB refuses a marketable order worth less than this, measured on the
@@ -190,6 +229,84 @@ EXPECTED_SIZING_ERRORS = (
 )
 
 
+# The status of the relayer's rejection of a request it will not relay. The
+# request is rejected before anything is submitted, so a part of it can safely
+# be retried. Any other error, e.g., a timeout, may follow a submission.
+RELAYER_REJECTED_STATUS = 400
+
+
+def _is_rejected_by_relayer(error: Exception) -> bool:
+    """Whether the relayer rejected a request before submitting anything."""
+    return (
+        isinstance(error, RelayerApiException)
+        and getattr(error, "status_code", None) == RELAYER_REJECTED_STATUS
+    )
+
+
+def _trade_timestamp(trade: Dict[str, Any]) -> int:
+    """Get the timestamp of a Data API trade, or -1 if it is missing or invalid."""
+    try:
+        return int(trade.get("timestamp"))
+    except (TypeError, ValueError):
+        return -1
+
+
+def _book_levels(
+    levels: List[Dict[str, str]], descending: bool
+) -> Tuple[List[float], List[float]]:
+    """Parse the valid levels of one side of an order book, sorted by price.
+
+    :param levels: the levels, each ``{"price": str, "size": str}``.
+    :param descending: whether to sort the levels from the highest price, as for the bids.
+    :return: the prices and the sizes of the levels with a positive price and size.
+    """
+    parsed = []
+    for level in levels:
+        try:
+            price, size = float(level["price"]), float(level["size"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if price > 0 and size > 0:
+            parsed.append((price, size))
+    parsed.sort(reverse=descending)
+    return [price for price, _ in parsed], [size for _, size in parsed]
+
+
+def _compact_order_book(
+    asks: List[Dict[str, str]], bids: List[Dict[str, str]]
+) -> Dict[str, List[float]]:
+    """Parse an order book once into sorted float arrays, with the cumulative depth of the asks.
+
+    The asks are sorted from the best (lowest) price and the bids from the best
+    (highest) one, so the best prices are the first entries. ``ask_cum_costs``
+    and ``ask_cum_shares`` are the collateral and the shares of a market buy
+    which fills every ask up to and including each level.
+
+    :param asks: the ask levels, each ``{"price": str, "size": str}``.
+    :param bids: the bid levels, each ``{"price": str, "size": str}``.
+    :return: the compact order book.
+    """
+    ask_prices, ask_sizes = _book_levels(asks, descending=False)
+    bid_prices, bid_sizes = _book_levels(bids, descending=True)
+    ask_cum_costs: List[float] = []
+    ask_cum_shares: List[float] = []
+    cost = shares = 0.0
+    for price, size in zip(ask_prices, ask_sizes):
+        cost += price * size
+        shares += size
+        ask_cum_costs.append(cost)
+        ask_cum_shares.append(shares)
+
+    return {
+        "ask_prices": ask_prices,
+        "ask_sizes": ask_sizes,
+        "ask_cum_costs": ask_cum_costs,
+        "ask_cum_shares": ask_cum_shares,
+        "bid_prices": bid_prices,
+        "bid_sizes": bid_sizes,
+    }
+
+
 class BuySizing(NamedTuple):  # pylint: disable=too-few-public-methods
     """What a market buy would actually put on the book, per the SDK's own sizing.
 
@@ -380,6 +497,44 @@ class PolymarketClientConnection(BaseSyncConnection):
             self.configuration.config.get("neg_risk_ctf_collateral_adapter_address")
         )
 
+        # Markets discovery fetches the categories concurrently over a shared
+        # keep-alive session pool, spacing out the requests sent to each host.
+        self.markets_fetch_max_workers = max(
+            1,
+            int(
+                self.configuration.config.get(
+                    "markets_fetch_max_workers", MARKETS_FETCH_MAX_WORKERS
+                )
+            ),
+        )
+        self.http_session = build_pooled_session(self.markets_fetch_max_workers)
+        self.rate_limiter = HostRateLimiter(
+            float(
+                self.configuration.config.get(
+                    "api_max_requests_per_second", API_MAX_REQUESTS_PER_SECOND
+                )
+            )
+        )
+
+        # GET responses of the Gamma and Data APIs are cached and revalidated
+        # with If-None-Match / If-Modified-Since where the API supports it.
+        self.response_cache = ResponseCache(
+            int(
+                self.configuration.config.get(
+                    "api_cache_max_entries", DEFAULT_MAX_ENTRIES
+                )
+            )
+        )
+        self.gamma_api_cache_ttl = float(
+            self.configuration.config.get("gamma_api_cache_ttl", GAMMA_API_CACHE_TTL)
+        )
+        self.data_api_cache_ttl = float(
+            self.configuration.config.get("data_api_cache_ttl", DATA_API_CACHE_TTL)
+        )
+        self.order_book_cache_ttl = float(
+            self.configuration.config.get("order_book_cache_ttl", ORDER_BOOK_CACHE_TTL)
+        )
+
         # Initialize Web3 for approval checking
         rpc_url = self.configuration.config.get("polygon_ledger_rpc")
         self.w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 30}))
@@ -524,6 +679,9 @@ class PolymarketClientConnection(BaseSyncConnection):
 
         Connection status set automatically.
         """
+        http_session = getattr(self, "http_session", None)
+        if http_session is not None:
+            http_session.close()
 
     def _route_request(self, payload: Dict[str, Any]) -> Tuple[Any, str]:
         """Route the request to the appropriate method.
@@ -558,6 +716,7 @@ class PolymarketClientConnection(BaseSyncConnection):
             RequestType.GET_TRADES: self._get_trades,
             RequestType.FETCH_ALL_TRADES: self._fetch_all_trades,
             RequestType.REDEEM_POSITIONS: self._redeem_positions,
+            RequestType.REDEEM_POSITIONS_BATCH: self._redeem_positions_batch,
             RequestType.SET_APPROVAL: self._set_approval,
             RequestType.CHECK_APPROVAL: self._check_approval,
             RequestType.FETCH_ORDER_BOOK: self._fetch_order_book,
@@ -950,22 +1109,81 @@ class PolymarketClientConnection(BaseSyncConnection):
             self.logger.error(error_msg)
             return {"error": error_msg}, error_msg
 
+    def _cache_ttl(self, url: str) -> Optional[float]:
+        """Get the response cache's time-to-live for the given url, or `None` if it must not be cached."""
+        if url.startswith(GAMMA_API_BASE_URL):
+            return self.gamma_api_cache_ttl
+        if url.startswith(DATA_API_BASE_URL):
+            return self.data_api_cache_ttl
+        return None
+
+    def _cached_get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        http_get: Optional[Callable] = None,
+    ) -> Any:
+        """GET a JSON payload, going through the response cache for the Gamma and Data APIs.
+
+        A fresh cached response is served without a request. A stale one is
+        revalidated with a conditional request, and reused on ``304 Not
+        Modified``. Errors propagate exactly as with a plain ``requests.get``.
+
+        :param url: The URL to request
+        :param params: Optional query parameters
+        :param http_get: The GET callable to use; defaults to ``requests.get``
+        :return: The decoded JSON payload
+        """
+        http_get = http_get or requests.get
+        ttl = self._cache_ttl(url)
+        if ttl is None:
+            response = http_get(url, params=params, timeout=API_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.json()
+
+        cache = self.response_cache
+        key = cache.key(url, params)
+        entry = cache.lookup(key)
+        if entry is not None and cache.is_fresh(entry):
+            return cache.hit(entry)
+
+        response = http_get(
+            url,
+            params=params,
+            headers=cache.conditional_headers(entry),
+            timeout=API_REQUEST_TIMEOUT,
+        )
+        if entry is not None and response.status_code == NOT_MODIFIED_STATUS:
+            return cache.revalidate(entry, response.headers, ttl)
+        response.raise_for_status()
+        data = response.json()
+        cache.store(key, data, response.headers, ttl)
+        return data
+
     def _request_with_retries(
-        self, url: str, params: Dict = None, max_retries: int = MAX_API_RETRIES
+        self,
+        url: str,
+        params: Dict = None,
+        max_retries: int = MAX_API_RETRIES,
+        session: Optional[requests.Session] = None,
     ) -> Tuple[Any, str]:
         """Make an API request with retry logic.
 
         :param url: The URL to request
         :param params: Optional query parameters
         :param max_retries: Maximum number of retry attempts
+        :param session: Optional pooled session, shared by concurrent workers.
+            Requests sent through it are spaced out per host by the rate
+            limiter, and a rate-limit back-off holds back every worker.
         :return: Tuple of (response_data, error_message)
         """
+        http_get = requests.get if session is None else session.get
         last_error = None
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, params=params, timeout=API_REQUEST_TIMEOUT)
-                response.raise_for_status()
-                return response.json(), None
+                if session is not None:
+                    self.rate_limiter.wait(url)
+                return self._cached_get(url, params=params, http_get=http_get), None
             except (requests.exceptions.RequestException, ValueError) as e:
                 last_error = str(e)
                 if attempt < max_retries - 1:
@@ -990,6 +1208,8 @@ class PolymarketClientConnection(BaseSyncConnection):
                                 delay = max(
                                     delay, min(float(header), MAX_RATE_LIMIT_SLEEP)
                                 )
+                        if session is not None:
+                            self.rate_limiter.back_off(url, delay)
                     self.logger.warning(
                         f"API request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying..."
                     )
@@ -1002,7 +1222,11 @@ class PolymarketClientConnection(BaseSyncConnection):
         return None, last_error
 
     def _fetch_markets_by_tag_slug(
-        self, tag_slug: str, end_date_min: str, end_date_max: str
+        self,
+        tag_slug: str,
+        end_date_min: str,
+        end_date_max: str,
+        session: Optional[requests.Session] = None,
     ) -> Tuple[list, str]:
         """Fetch markets for a tag slug via /events, flattened with per-market tags.
 
@@ -1014,6 +1238,7 @@ class PolymarketClientConnection(BaseSyncConnection):
         :param tag_slug: The tag slug to filter events by
         :param end_date_min: Minimum end date filter
         :param end_date_max: Maximum end date filter
+        :param session: Optional pooled session to send the requests through
         :return: Tuple of (markets_list, error_message)
         """
         after_cursor: Optional[str] = None
@@ -1030,7 +1255,7 @@ class PolymarketClientConnection(BaseSyncConnection):
                 params["after_cursor"] = after_cursor
 
             response, error = self._request_with_retries(
-                f"{GAMMA_API_BASE_URL}/events/keyset", params=params
+                f"{GAMMA_API_BASE_URL}/events/keyset", params=params, session=session
             )
 
             if error:
@@ -1049,7 +1274,7 @@ class PolymarketClientConnection(BaseSyncConnection):
                     markets_this_page += 1
 
             self.logger.info(
-                f"  Fetched {len(events_data)} events "
+                f"  [{tag_slug}] Fetched {len(events_data)} events "
                 f"→ {markets_this_page} markets (total: {len(all_markets)})"
             )
 
@@ -1139,6 +1364,45 @@ class PolymarketClientConnection(BaseSyncConnection):
 
         return unique_markets
 
+    def _fetch_categories(
+        self, end_date_min: str, end_date_max: str
+    ) -> Iterator[Tuple[str, Tuple[list, str]]]:
+        """Fetch the markets of every category, concurrently when more than one worker is configured.
+
+        The categories are submitted to a bounded thread pool sharing the
+        pooled keep-alive session, so the wall-clock time follows the slowest
+        category rather than the sum of all of them. The results are yielded
+        in the order of ``POLYMARKET_CATEGORY_TAGS`` regardless of which
+        category finishes first.
+
+        :param end_date_min: Minimum end date filter
+        :param end_date_max: Maximum end date filter
+        :yield: Tuples of (category, (markets_list, error_message))
+        """
+        max_workers = min(self.markets_fetch_max_workers, len(POLYMARKET_CATEGORY_TAGS))
+        if max_workers <= 1:
+            for category in POLYMARKET_CATEGORY_TAGS:
+                yield category, self._fetch_markets_by_tag_slug(
+                    category, end_date_min, end_date_max
+                )
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="polymarket_markets"
+        ) as executor:
+            futures: Dict[str, Future] = {
+                category: executor.submit(
+                    self._fetch_markets_by_tag_slug,
+                    category,
+                    end_date_min,
+                    end_date_max,
+                    session=self.http_session,
+                )
+                for category in POLYMARKET_CATEGORY_TAGS
+            }
+            for category, future in futures.items():
+                yield category, future.result()
+
     def _fetch_markets(self) -> Tuple[Any, Any]:
         """Fetch current markets from Polymarket with category-based filtering.
 
@@ -1165,12 +1429,10 @@ class PolymarketClientConnection(BaseSyncConnection):
             )
             self.logger.info(f"Time window: {end_date_min} to {end_date_max}")
 
-            for category in POLYMARKET_CATEGORY_TAGS:
+            for category, (category_markets, error) in self._fetch_categories(
+                end_date_min, end_date_max
+            ):
                 self.logger.info(f"Processing category: {category}")
-
-                category_markets, error = self._fetch_markets_by_tag_slug(
-                    category, end_date_min, end_date_max
-                )
                 if error:
                     self.logger.error(
                         f"  Error fetching markets for '{category}': {error}"
@@ -1220,6 +1482,7 @@ class PolymarketClientConnection(BaseSyncConnection):
             self.logger.info(
                 f"Fetched {total_markets} Yes/No markets across {len(filtered_markets_by_category)} categories"
             )
+            self.logger.info(f"API response cache: {self.response_cache.stats}")
 
             return filtered_markets_by_category, None
 
@@ -1236,11 +1499,7 @@ class PolymarketClientConnection(BaseSyncConnection):
         """
         try:
             url = f"{GAMMA_API_BASE_URL}/markets/slug/{slug}"
-
-            response = requests.get(url, timeout=API_REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            market = response.json()
+            market = self._cached_get(url)
             self.logger.info(f"Fetched market with slug: {slug}")
             return market, None
 
@@ -1291,10 +1550,7 @@ class PolymarketClientConnection(BaseSyncConnection):
             if redeemable is not None:
                 params["redeemable"] = redeemable
 
-            response = requests.get(url, params=params, timeout=API_REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            positions = response.json()
+            positions = self._cached_get(url, params=params)
             self.logger.info(f"Fetched {len(positions)} positions for {user}")
             return positions, None
 
@@ -1393,10 +1649,7 @@ class PolymarketClientConnection(BaseSyncConnection):
             request_url = f"{url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}"
             self.logger.info(f"Fetching trades from: {request_url}")
 
-            response = requests.get(url, params=params, timeout=API_REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            trades = response.json()
+            trades = self._cached_get(url, params=params)
             self.logger.info(
                 f"Fetched {len(trades)} trades for {self.safe_address} "
                 f"(offset={offset}, limit={limit}, takerOnly={taker_only})"
@@ -1415,10 +1668,17 @@ class PolymarketClientConnection(BaseSyncConnection):
     def _fetch_all_trades(
         self,
         taker_only: bool = True,
+        since_timestamp: Optional[int] = None,
     ) -> Tuple[Any, Any]:
         """Fetch all trades from Polymarket by paginating through all results for the safe address.
 
+        The Data API returns the trades newest first, so when ``since_timestamp``
+        is given, the pagination stops at the first page which reaches older
+        trades and only the trades at or after it are returned. This lets a
+        caller which persists a cursor sync only the trades it has not seen.
+
         :param taker_only: Only show trades where user was taker (default: True)
+        :param since_timestamp: Only return trades with a timestamp at or after this one (default: all trades)
         :return: Tuple of (all_trades_data, error_message)
         """
         all_trades = []
@@ -1427,7 +1687,8 @@ class PolymarketClientConnection(BaseSyncConnection):
 
         try:
             self.logger.info(
-                f"Starting to fetch all trades (takerOnly={taker_only}, limit={limit})"
+                f"Starting to fetch all trades (takerOnly={taker_only}, limit={limit}, "
+                f"since={since_timestamp})"
             )
 
             while True:
@@ -1443,7 +1704,18 @@ class PolymarketClientConnection(BaseSyncConnection):
                 if not trades or len(trades) == 0:
                     break
 
-                all_trades.extend(trades)
+                if since_timestamp is not None:
+                    newer_trades = [
+                        trade
+                        for trade in trades
+                        if _trade_timestamp(trade) >= since_timestamp
+                    ]
+                    all_trades.extend(newer_trades)
+                    if len(newer_trades) < len(trades):
+                        # reached the trades which were already synced
+                        break
+                else:
+                    all_trades.extend(trades)
 
                 self.logger.info(
                     f"Paginating: fetched {len(trades)} trades, "
@@ -1474,6 +1746,57 @@ class PolymarketClientConnection(BaseSyncConnection):
             self.logger.exception(error_msg)
             return None, error_msg
 
+    def _build_redeem_tx(
+        self,
+        condition_id: str,
+        index_sets: list[int],
+        collateral_token: str,
+        is_neg_risk: bool = False,
+    ) -> Tuple[SafeTransaction, str]:
+        """Build the Safe transaction which redeems the positions of a condition.
+
+        :param condition_id: The condition ID (hex string with or without 0x prefix)
+        :param index_sets: List of index sets to redeem (uint256[])
+        :param collateral_token: The collateral token address
+        :param is_neg_risk: Whether this is a negative risk market
+        :return: Tuple of (transaction, market type description)
+        """
+        # Convert condition_id to bytes
+        condition_id_clean = condition_id.removeprefix("0x")
+        condition_id_bytes = bytes.fromhex(condition_id_clean)
+
+        # Both CtfCollateralAdapter and NegRiskCtfCollateralAdapter expose
+        # the same 4-arg redeemPositions(address,bytes32,bytes32,uint256[])
+        # signature; only the destination contract differs. Under CLOB v2,
+        # neg-risk markets are plain CTF binary conditions and the v1
+        # 2-arg overload (0xdbeccb23) reverts with GS013.
+        selector = bytes.fromhex("01b7037c")
+        encoded_args = encode(
+            ["address", "bytes32", "bytes32", "uint256[]"],
+            [
+                collateral_token,
+                PARENT_COLLECTION_ID,
+                condition_id_bytes,
+                index_sets,
+            ],
+        )
+        calldata = selector + encoded_args
+
+        if is_neg_risk:
+            target_address = self.neg_risk_ctf_collateral_adapter
+            market_type = "negative risk (via NegRiskCtfCollateralAdapter)"
+        else:
+            target_address = self.ctf_collateral_adapter
+            market_type = "standard (via CtfCollateralAdapter)"
+
+        tx = SafeTransaction(
+            to=target_address,
+            operation=OperationType.Call,
+            data="0x" + calldata.hex(),
+            value="0",
+        )
+        return tx, market_type
+
     def _redeem_positions(
         self,
         condition_id: str,
@@ -1496,40 +1819,8 @@ class PolymarketClientConnection(BaseSyncConnection):
                 self.logger.error(error_msg)
                 return None, error_msg
 
-            # Convert condition_id to bytes
-            condition_id_clean = condition_id.removeprefix("0x")
-            condition_id_bytes = bytes.fromhex(condition_id_clean)
-
-            # Both CtfCollateralAdapter and NegRiskCtfCollateralAdapter expose
-            # the same 4-arg redeemPositions(address,bytes32,bytes32,uint256[])
-            # signature; only the destination contract differs. Under CLOB v2,
-            # neg-risk markets are plain CTF binary conditions and the v1
-            # 2-arg overload (0xdbeccb23) reverts with GS013.
-            selector = bytes.fromhex("01b7037c")
-            encoded_args = encode(
-                ["address", "bytes32", "bytes32", "uint256[]"],
-                [
-                    collateral_token,
-                    PARENT_COLLECTION_ID,
-                    condition_id_bytes,
-                    index_sets,
-                ],
-            )
-            calldata = selector + encoded_args
-
-            if is_neg_risk:
-                target_address = self.neg_risk_ctf_collateral_adapter
-                market_type = "negative risk (via NegRiskCtfCollateralAdapter)"
-            else:
-                target_address = self.ctf_collateral_adapter
-                market_type = "standard (via CtfCollateralAdapter)"
-
-            # Create SafeTransaction
-            tx = SafeTransaction(
-                to=target_address,
-                operation=OperationType.Call,
-                data="0x" + calldata.hex(),
-                value="0",
+            tx, market_type = self._build_redeem_tx(
+                condition_id, index_sets, collateral_token, is_neg_risk
             )
 
             # Execute transaction
@@ -1548,6 +1839,113 @@ class PolymarketClientConnection(BaseSyncConnection):
             self.logger.exception(error_msg)
             return None, error_msg
 
+    def _redeem_positions_batch(
+        self,
+        redemptions: list,
+        gas_limit: int = REDEEM_BATCH_GAS_LIMIT,
+    ) -> Tuple[Any, Any]:
+        """Redeem the positions of several conditions with as few relayer transactions as possible.
+
+        The redemptions are packed into relayer transactions, each of which the
+        relayer executes as a single Safe multisend. A transaction holds as many
+        redemptions as fit in the gas budget. Redemptions of the same condition
+        are merged, since the collateral adapters redeem every position of a
+        condition at once. A single rejected redemption fails its whole
+        multisend, so a transaction which the relayer rejects before
+        submitting it is split in halves and retried, down to a condition at a
+        time. This way, a condition which cannot be redeemed does not hold back
+        the rest. Any other error, e.g., a timeout, may follow a submission, so
+        the conditions of that transaction are reported as failed without
+        being retried. The transactions are submitted, not awaited, so the
+        submitted conditions are not necessarily redeemed yet.
+
+        :param redemptions: list of ``{"condition_id", "index_sets",
+            "collateral_token", "is_neg_risk"}`` redemptions, i.e., the params
+            of a ``REDEEM_POSITIONS`` request.
+        :param gas_limit: the gas budget of a single relayer transaction.
+        :return: ``({"transactions", "submitted", "failed"}, error_or_none)``.
+        """
+        if self.relayer_client is None:
+            error_msg = "Relayer client not initialized. Enable polymarket_builder_program_enabled in config."
+            self.logger.error(error_msg)
+            return None, error_msg
+
+        merged: Dict[Tuple[str, str, bool], set] = {}
+        try:
+            for redemption in redemptions:
+                condition_id = "0x" + redemption["condition_id"].removeprefix("0x")
+                key = (
+                    condition_id.lower(),
+                    redemption["collateral_token"],
+                    bool(redemption.get("is_neg_risk", False)),
+                )
+                merged.setdefault(key, set()).update(redemption["index_sets"])
+        except (KeyError, TypeError, AttributeError) as e:
+            error_msg = f"Invalid redemptions: {e}"
+            self.logger.error(error_msg)
+            return {"error": error_msg}, error_msg
+
+        transactions: List[Any] = []
+        submitted: List[str] = []
+        failed: List[str] = []
+        errors: List[str] = []
+        built: List[Tuple[str, Any]] = []
+        for (condition_id, collateral_token, is_neg_risk), index_sets in merged.items():
+            try:
+                tx, _ = self._build_redeem_tx(
+                    condition_id, sorted(index_sets), collateral_token, is_neg_risk
+                )
+            except Exception as e:  # noqa: BLE001 - must not abort the rest
+                self.logger.exception(
+                    f"Error building the redemption of condition {condition_id}: {e}"
+                )
+                failed.append(condition_id)
+                errors.append(str(e))
+                continue
+            built.append((condition_id, tx))
+
+        per_tx = max(1, gas_limit // REDEEM_POSITION_GAS_ESTIMATE)
+        pending = [
+            built[start : start + per_tx] for start in range(0, len(built), per_tx)
+        ]
+        while pending:
+            chunk = pending.pop(0)
+            condition_ids = [condition_id for condition_id, _ in chunk]
+            txs = [tx for _, tx in chunk]
+            try:
+                result = self.relayer_client.execute(
+                    transactions=txs,
+                    metadata=f"Redeem conditional tokens of {len(txs)} condition(s)",
+                )
+                transaction_data = result.get_transaction()
+            except Exception as e:  # noqa: BLE001 - must not abort the rest
+                self.logger.exception(
+                    f"Error redeeming positions for conditions {condition_ids}: {e}"
+                )
+                if len(chunk) > 1 and _is_rejected_by_relayer(e):
+                    # isolate the rejected redemptions by retrying each half on its own
+                    middle = len(chunk) // 2
+                    pending[:0] = [chunk[:middle], chunk[middle:]]
+                    continue
+                failed.extend(condition_ids)
+                errors.append(str(e))
+                continue
+
+            self.logger.info(
+                f"Submitted the redemption of {len(txs)} condition(s) in a single relayer transaction: {transaction_data}"
+            )
+            transactions.append(transaction_data)
+            submitted.extend(condition_ids)
+
+        response = {
+            "transactions": transactions,
+            "submitted": submitted,
+            "failed": failed,
+        }
+        if errors:
+            return response, f"Error redeeming positions: {'; '.join(errors)}"
+        return response, None
+
     def _encode_approve(self, spender: str, amount: int) -> str:
         """Encode ERC20 approve function call.
 
@@ -2144,11 +2542,17 @@ class PolymarketClientConnection(BaseSyncConnection):
 
         v2 ``get_order_book`` returns the raw CLOB response as a plain dict
         (v1 wrapped it in an ``OrderBookSummary`` object); each level is a
-        ``{"price": "...", "size": "..."}`` dict.
+        ``{"price": "...", "size": "..."}`` dict. Besides the raw levels, the
+        result carries the ``book``, parsed once by ``_compact_order_book``.
 
         :param token_id: The CLOB token ID for the outcome.
         :return: Tuple of (order_book_dict, error_string).
         """
+        cache_key = ResponseCache.key("order_book", {"token_id": token_id})
+        cached = self.response_cache.lookup(cache_key)
+        if cached is not None and self.response_cache.is_fresh(cached):
+            return self.response_cache.hit(cached), None
+
         try:
             raw = self.client.get_order_book(token_id)
             raw_asks = (raw.get("asks") if isinstance(raw, dict) else raw.asks) or []
@@ -2167,13 +2571,20 @@ class PolymarketClientConnection(BaseSyncConnection):
                     }
                 return {"price": str(level.price), "size": str(level.size)}
 
-            return {
-                "asks": [_level_to_dict(a) for a in raw_asks],
-                "bids": [_level_to_dict(b) for b in raw_bids],
+            asks = [_level_to_dict(a) for a in raw_asks]
+            bids = [_level_to_dict(b) for b in raw_bids]
+            order_book = {
+                "asks": asks,
+                "bids": bids,
                 "min_order_size": (
                     str(min_order_size) if min_order_size is not None else None
                 ),
-            }, None
+                "book": _compact_order_book(asks, bids),
+            }
+            self.response_cache.store(
+                cache_key, order_book, {}, self.order_book_cache_ttl
+            )
+            return order_book, None
         except Exception as e:
             error_msg = f"Error fetching order book for token {token_id}: {str(e)}"
             self.logger.exception(error_msg)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Pooled HTTP sessions and per-host rate limiting for the Polymarket APIs.
+
+The Gamma and Data APIs are queried by several worker threads at once when
+the markets of all the categories are fetched concurrently. The workers share
+a single keep-alive ``requests.Session`` whose connection pool is sized to the
+number of workers, so that each category does not pay for a fresh TCP + TLS
+handshake on every page.
+
+A ``HostRateLimiter`` spaces out the requests sent to the same host and
+propagates a rate-limit back-off (HTTP 429, optionally with ``Retry-After``)
+observed by one worker to all the others, so the pool does not keep hammering
+an endpoint which asked us to slow down.
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTPS_PREFIX = "https://"
+HTTP_PREFIX = "http://"
+
+
+def build_pooled_session(pool_maxsize: int) -> requests.Session:
+    """Build a keep-alive session whose connection pool fits the given number of concurrent workers.
+
+    :param pool_maxsize: the maximum number of connections kept alive per host.
+    :return: the session.
+    """
+    pool_maxsize = max(1, pool_maxsize)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount(HTTPS_PREFIX, adapter)
+    session.mount(HTTP_PREFIX, adapter)
+    return session
+
+
+class HostRateLimiter:
+    """A thread-safe limiter which spaces out the requests sent to each host."""
+
+    def __init__(self, max_requests_per_second: float) -> None:
+        """Initialize the limiter.
+
+        :param max_requests_per_second: the maximum request rate per host; non-positive values disable the spacing.
+        """
+        self._min_interval = (
+            1 / max_requests_per_second if max_requests_per_second > 0 else 0.0
+        )
+        # the monotonic time before which no request may be sent to each host
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        """Get the host of the given url."""
+        return urlsplit(url).netloc
+
+    def wait(self, url: str) -> None:
+        """Block until a request to the url's host is allowed, and reserve a slot for it.
+
+        :param url: the url which is about to be requested.
+        """
+        host = self._host(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self._min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, url: str, delay: float) -> None:
+        """Hold back every request to the url's host for the given delay, e.g., after a rate-limit response.
+
+        :param url: the url which was rate-limited.
+        :param delay: the number of seconds to hold the host back for.
+        """
+        host = self._host(url)
+        with self._lock:
+            until = time.monotonic() + delay
+            self._next_allowed[host] = max(self._next_allowed.get(host, 0.0), until)
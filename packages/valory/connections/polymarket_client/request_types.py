@@ -23,6 +23,14 @@
 from enum import Enum
 
 
+# A batched redeem packs as many redemptions into one relayer transaction as fit
+# in this gas budget, kept well under the Polygon block gas limit. The estimate
+# is a conservative bound of a single collateral adapter redeemPositions call.
+REDEEM_BATCH_GAS_LIMIT = 10_000_000
+REDEEM_POSITION_GAS_ESTIMATE = 300_000
+MAX_REDEEMS_PER_TX = REDEEM_BATCH_GAS_LIMIT // REDEEM_POSITION_GAS_ESTIMATE
+
+
 class RequestType(Enum):
     """Enum for supported Polymarket request types."""
 
@@ -37,6 +45,9 @@ class RequestType(Enum):
     GET_TRADES = "get_trades"
     FETCH_ALL_TRADES = "fetch_all_trades"
     REDEEM_POSITIONS = "redeem_positions"
+    # Redeems the positions of several conditions, packing them into as few
+    # relayer transactions (Safe multisends) as the gas budget allows.
+    REDEEM_POSITIONS_BATCH = "redeem_positions_batch"
     SET_APPROVAL = "set_approval"
     CHECK_APPROVAL = "check_approval"
     FETCH_ORDER_BOOK = "fetch_order_book"
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""A bounded, conditional response cache for the Gamma and Data API GET requests.
+
+Every entry is kept for a short time-to-live, during which it is served
+without touching the network. Once stale, the entry is revalidated with
+``If-None-Match`` / ``If-Modified-Since`` when the server sent an ``ETag`` or
+a ``Last-Modified`` header: a ``304 Not Modified`` answer refreshes the entry
+without downloading the payload again. Endpoints which send no validators
+simply fall back to the time-to-live. The cache holds a bounded number of
+entries and evicts the least recently used one first.
+
+The cached payloads are deep-copied on the way in and out, because the callers
+annotate the markets they receive (e.g., ``_poly_tags``).
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_MAX_ENTRIES = 256
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+NOT_MODIFIED_STATUS = 304
+
+
+@dataclass
+class CachedResponse:
+    """A cached API response and its validators."""
+
+    data: Any
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+
+def _validator(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    """Get a validator header, ignoring anything that is not a string."""
+    value = headers.get(name)
+    return value if isinstance(value, str) and value else None
+
+
+class ResponseCache:
+    """A thread-safe LRU cache of JSON responses, with TTL and conditional revalidation."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the cache.
+
+        :param max_entries: the maximum number of cached responses; non-positive values disable the cache.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Get the cache's counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "entries": len(self._entries),
+            }
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Get the cache key of a request."""
+        return f"{url}?{json.dumps(params or {}, sort_keys=True, default=str)}"
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response, marking it as the most recently used one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CachedResponse) -> Any:
+        """Serve a fresh cached response."""
+        with self._lock:
+            self.hits += 1
+        return copy.deepcopy(entry.data)
+
+    @staticmethod
+    def is_fresh(entry: CachedResponse) -> bool:
+        """Whether a cached response can be served without asking the server."""
+        return time.monotonic() < entry.expires_at
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """Get the headers which revalidate a stale cached response."""
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag is not None:
+            headers[IF_NONE_MATCH_HEADER] = entry.etag
+        if entry.last_modified is not None:
+            headers[IF_MODIFIED_SINCE_HEADER] = entry.last_modified
+        return headers
+
+    def revalidate(
+        self, entry: CachedResponse, headers: Mapping[str, Any], ttl: float
+    ) -> Any:
+        """Refresh a cached response which the server reported as not modified."""
+        with self._lock:
+            entry.expires_at = time.monotonic() + ttl
+            entry.etag = _validator(headers, ETAG_HEADER) or entry.etag
+            entry.last_modified = (
+                _validator(headers, LAST_MODIFIED_HEADER) or entry.last_modified
+            )
+            self.revalidated += 1
+        return copy.deepcopy(entry.data)
+
+    def store(
+        self, key: str, data: Any, headers: Mapping[str, Any], ttl: float
+    ) -> None:
+        """Cache a downloaded response, if it can ever be served from the cache.
+
+        :param key: the cache key of the request.
+        :param data: the decoded payload.
+        :param headers: the response's headers.
+        :param ttl: the number of seconds during which the response is served without asking the server.
+        """
+        entry = CachedResponse(
+            data=None,
+            expires_at=time.monotonic() + ttl,
+            etag=_validator(headers, ETAG_HEADER),
+            last_modified=_validator(headers, LAST_MODIFIED_HEADER),
+        )
+        with self._lock:
+            self.misses += 1
+            if self.max_entries <= 0 or (ttl <= 0 and not entry.revalidatable):
+                self._entries.pop(key, None)
+                return
+            entry.data = copy.deepcopy(data)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
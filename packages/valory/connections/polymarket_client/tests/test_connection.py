@@ -20,6 +20,8 @@
 """Tests for the polymarket_client connection."""
 
 import json
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -35,10 +37,17 @@ from packages.valory.connections.polymarket_client.connection import (
     POLYMARKET_CATEGORY_TAGS,
     PolymarketClientConnection,
     RATE_LIMIT_RETRY_DELAY,
+    REDEEM_POSITION_GAS_ESTIMATE,
     RETRY_DELAY,
     SrrDialogues,
+    _compact_order_book,
     _validate_builder_code,
 )
+from packages.valory.connections.polymarket_client.http_pool import HostRateLimiter
+from packages.valory.connections.polymarket_client.response_cache import (
+    IF_NONE_MATCH_HEADER,
+    ResponseCache,
+)
 from packages.valory.connections.polymarket_client.request_types import RequestType
 
 # ---------------------------------------------------------------------------
@@ -55,6 +64,14 @@ NEG_RISK_CTF_EXCHANGE = "0xe2222d279d744050d28e00520010520000310F59"  # v2
 NEG_RISK_ADAPTER = "0xd91E80cF2E7be2e162c6513ceD06f1dD0dA35296"
 CTF_COLLATERAL_ADAPTER = "0xAdA100Db00Ca00073811820692005400218FcE1f"
 NEG_RISK_CTF_COLLATERAL_ADAPTER = "0xadA2005600Dec949baf300f4C6120000bDB6eAab"
+EMPTY_COMPACT_BOOK = {
+    "ask_prices": [],
+    "ask_sizes": [],
+    "ask_cum_costs": [],
+    "ask_cum_shares": [],
+    "bid_prices": [],
+    "bid_sizes": [],
+}
 
 
 class _TestableConnection(PolymarketClientConnection):
@@ -93,6 +110,13 @@ def _make_connection() -> _TestableConnection:
     conn.ctf_collateral_adapter = CTF_COLLATERAL_ADAPTER
     conn.neg_risk_ctf_collateral_adapter = NEG_RISK_CTF_COLLATERAL_ADAPTER
     conn.clob_version = "v2"
+    conn.markets_fetch_max_workers = 1
+    conn.http_session = MagicMock()
+    conn.rate_limiter = HostRateLimiter(0)
+    conn.response_cache = ResponseCache()
+    conn.gamma_api_cache_ttl = 0.0
+    conn.data_api_cache_ttl = 0.0
+    conn.order_book_cache_ttl = 0.0
     conn.dialogues = MagicMock()
     configuration_mock = MagicMock()
     safe_contract_addresses = {"polygon": SAFE_ADDRESS}
@@ -362,6 +386,7 @@ class TestRouteRequest:
             "_get_trades",
             "_fetch_all_trades",
             "_redeem_positions",
+            "_redeem_positions_batch",
             "_set_approval",
             "_check_approval",
             "_fetch_order_book",
@@ -1572,6 +1597,129 @@ class TestRequestWithRetries:
             RATE_LIMIT_RETRY_DELAY * 2,
         ]
 
+    def test_session_is_used_and_rate_limited(self) -> None:
+        """A pooled session replaces ``requests.get`` and every attempt waits for the host's slot."""
+        conn = _make_connection()
+        conn.rate_limiter = MagicMock()
+        session = MagicMock()
+        session.get.return_value.json.return_value = {"id": "1"}
+
+        with patch("requests.get") as mock_get:
+            result, error = conn._request_with_retries(
+                "https://example.com/api", session=session
+            )
+
+        assert (result, error) == ({"id": "1"}, None)
+        mock_get.assert_not_called()
+        session.get.assert_called_once()
+        conn.rate_limiter.wait.assert_called_once_with("https://example.com/api")
+
+    def test_session_429_backs_off_the_host(self) -> None:
+        """A 429 seen through the pooled session holds back the host for every worker."""
+        conn = _make_connection()
+        conn.rate_limiter = MagicMock()
+        _, mock_response = self._make_429_with_header("30")
+        session = MagicMock()
+        session.get.return_value = mock_response
+
+        with patch(
+            "packages.valory.connections.polymarket_client.connection.time.sleep"
+        ):
+            conn._request_with_retries(
+                "https://example.com/api", max_retries=2, session=session
+            )
+
+        conn.rate_limiter.back_off.assert_called_once_with(
+            "https://example.com/api", 30.0
+        )
+
+
+# ---------------------------------------------------------------------------
+# _cached_get
+# ---------------------------------------------------------------------------
+
+
+class TestCachedGet:
+    """Tests for _cached_get."""
+
+    @staticmethod
+    def _response(
+        payload: Any, status_code: int = 200, headers: dict = None
+    ) -> MagicMock:
+        """Build a mocked response."""
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.json.return_value = payload
+        return response
+
+    def test_fresh_entry_is_served_without_request(self) -> None:
+        """Within the TTL, a Gamma response is served from the cache as a copy."""
+        conn = _make_connection()
+        conn.gamma_api_cache_ttl = 60.0
+        url = f"{GAMMA_API_BASE_URL}/markets/slug/test"
+
+        with patch(
+            "requests.get", return_value=self._response({"id": "m1"})
+        ) as mock_get:
+            first = conn._cached_get(url)
+            first["_poly_tags"] = ["mutated"]
+            second = conn._cached_get(url)
+
+        assert mock_get.call_count == 1
+        assert second == {"id": "m1"}
+        assert conn.response_cache.stats["hits"] == 1
+        assert conn.response_cache.stats["misses"] == 1
+
+    def test_stale_entry_is_revalidated(self) -> None:
+        """A stale entry is revalidated with its ETag and reused on 304."""
+        conn = _make_connection()
+        url = f"{DATA_API_BASE_URL}/trades"
+        params = {"user": SAFE_ADDRESS}
+        responses = [
+            self._response([{"id": "t1"}], headers={"ETag": '"v1"'}),
+            self._response(None, status_code=304),
+        ]
+
+        with patch("requests.get", side_effect=responses) as mock_get:
+            assert conn._cached_get(url, params=params) == [{"id": "t1"}]
+            assert conn._cached_get(url, params=params) == [{"id": "t1"}]
+
+        assert mock_get.call_args_list[0][1]["headers"] == {}
+        assert mock_get.call_args_list[1][1]["headers"] == {
+            IF_NONE_MATCH_HEADER: '"v1"'
+        }
+        assert conn.response_cache.stats["revalidated"] == 1
+
+    def test_changed_payload_replaces_entry(self) -> None:
+        """A 200 answer to a revalidation replaces the cached payload."""
+        conn = _make_connection()
+        url = f"{DATA_API_BASE_URL}/positions"
+        responses = [
+            self._response([1], headers={"ETag": '"v1"'}),
+            self._response([1, 2], headers={"ETag": '"v2"'}),
+        ]
+
+        with patch("requests.get", side_effect=responses):
+            assert conn._cached_get(url) == [1]
+            assert conn._cached_get(url) == [1, 2]
+
+        entry = conn.response_cache.lookup(ResponseCache.key(url))
+        assert entry is not None and entry.etag == '"v2"'
+
+    def test_other_hosts_are_not_cached(self) -> None:
+        """Requests to other hosts bypass the cache."""
+        conn = _make_connection()
+        conn.gamma_api_cache_ttl = 60.0
+
+        with patch("requests.get", return_value=self._response({})) as mock_get:
+            conn._cached_get("https://example.com/api")
+            conn._cached_get("https://example.com/api")
+
+        assert mock_get.call_count == 2
+        assert "headers" not in mock_get.call_args[1]
+        assert conn.response_cache.stats["misses"] == 0
+
 
 # ---------------------------------------------------------------------------
 # _filter_tradeable_markets
@@ -1972,6 +2120,47 @@ class TestFetchMarkets:
         assert result is None
         assert "Unexpected error" in error
 
+    def test_concurrent_fetch_follows_slowest_category(self) -> None:
+        """With several workers, categories are fetched in parallel over the pooled session.
+
+        The wall-clock time must follow the slowest category rather than the
+        sum of all of them, and the results must keep the categories' order.
+        """
+        conn = _make_connection()
+        conn.markets_fetch_max_workers = len(POLYMARKET_CATEGORY_TAGS)
+        delay = 0.2
+        threads = set()
+
+        def fetch(category: str, *_: Any, **kwargs: Any) -> tuple:
+            """Fetch a category slowly."""
+            assert kwargs["session"] is conn.http_session
+            threads.add(threading.get_ident())
+            time.sleep(delay)
+            return [], None
+
+        conn._fetch_markets_by_tag_slug = MagicMock(side_effect=fetch)
+
+        start = time.monotonic()
+        result, error = conn._fetch_markets()
+        elapsed = time.monotonic() - start
+
+        assert error is None
+        assert list(result) == POLYMARKET_CATEGORY_TAGS
+        assert len(threads) > 1
+        assert elapsed < delay * len(POLYMARKET_CATEGORY_TAGS) / 2
+
+    def test_concurrent_fetch_exception_returns_error(self) -> None:
+        """An unexpected exception in a worker surfaces as the usual error."""
+        conn = _make_connection()
+        conn.markets_fetch_max_workers = 4
+        conn._fetch_markets_by_tag_slug = MagicMock(
+            side_effect=RuntimeError("disk full")
+        )
+
+        result, error = conn._fetch_markets()
+        assert result is None
+        assert "Unexpected error" in error
+
     def test_fetch_markets_warns_on_full_tradeable_drop(self) -> None:
         """WARN when the tradeable filter drops 100% of a non-empty input.
 
@@ -2527,6 +2716,31 @@ class TestFetchAllTrades:
         assert len(result) == 100
         assert error is None
 
+    def test_since_timestamp_stops_at_older_trades(self) -> None:
+        """Only the trades at or after since_timestamp are returned, without fetching older pages."""
+        conn = _make_connection()
+        page1 = [{"conditionId": f"c{i}", "timestamp": 1000 - i} for i in range(100)]
+        conn._get_trades = MagicMock(side_effect=[(page1, None), (page1, None)])
+
+        result, error = conn._fetch_all_trades(since_timestamp=951)
+
+        assert conn._get_trades.call_count == 1
+        assert [trade["timestamp"] for trade in result] == list(range(1000, 950, -1))
+        assert error is None
+
+    def test_since_timestamp_paginates_newer_pages(self) -> None:
+        """Pagination continues while whole pages are newer than since_timestamp."""
+        conn = _make_connection()
+        page1 = [{"conditionId": f"c{i}", "timestamp": 1000} for i in range(100)]
+        page2 = [{"conditionId": "c", "timestamp": ts} for ts in (900, "bad", None)]
+        conn._get_trades = MagicMock(side_effect=[(page1, None), (page2, None)])
+
+        result, error = conn._fetch_all_trades(since_timestamp=900)
+
+        assert conn._get_trades.call_count == 2
+        assert len(result) == 101
+        assert error is None
+
 
 # ---------------------------------------------------------------------------
 # _redeem_positions
@@ -2828,6 +3042,212 @@ class TestRedeemPositions:
         assert neg_risk_tx.to == NEG_RISK_CTF_COLLATERAL_ADAPTER
 
 
+# ---------------------------------------------------------------------------
+# _redeem_positions_batch
+# ---------------------------------------------------------------------------
+
+
+def _redemption(condition_id: str, index_sets: Any, is_neg_risk: bool = False) -> dict:
+    """Build a redemption of a batched redeem request."""
+    return {
+        "condition_id": condition_id,
+        "index_sets": index_sets,
+        "collateral_token": COLLATERAL_ADDRESS,
+        "is_neg_risk": is_neg_risk,
+    }
+
+
+def _relayer_rejection(error_msg: str) -> Exception:
+    """Build the relayer's rejection of a request it will not relay."""
+    from py_builder_relayer_client.exceptions import RelayerApiException
+
+    error = RelayerApiException(error_msg=error_msg)
+    error.status_code = 400
+    return error
+
+
+class TestRedeemPositionsBatch:
+    """Tests for _redeem_positions_batch."""
+
+    def test_single_relayer_transaction(self) -> None:
+        """The redemptions which fit in the gas limit are relayed with a single transaction."""
+        conn = _make_connection()
+        result_mock = MagicMock()
+        result_mock.get_transaction.return_value = {"hash": "0xabc"}
+        conn.relayer_client.execute.return_value = result_mock
+
+        result, error = conn._redeem_positions_batch(
+            [
+                _redemption("0x" + "ab" * 32, [1]),
+                _redemption("cd" * 32, [2], is_neg_risk=True),
+            ]
+        )
+
+        assert error is None
+        assert result == {
+            "transactions": [{"hash": "0xabc"}],
+            "submitted": ["0x" + "ab" * 32, "0x" + "cd" * 32],
+            "failed": [],
+        }
+        conn.relayer_client.execute.assert_called_once()
+        txs = conn.relayer_client.execute.call_args.kwargs["transactions"]
+        assert [tx.to for tx in txs] == [
+            CTF_COLLATERAL_ADAPTER,
+            NEG_RISK_CTF_COLLATERAL_ADAPTER,
+        ]
+
+    def test_merges_the_redemptions_of_a_condition(self) -> None:
+        """The redemptions of the same condition are merged into a single call."""
+        conn = _make_connection()
+        conn.relayer_client.execute.return_value = MagicMock()
+
+        result, error = conn._redeem_positions_batch(
+            [
+                _redemption("0x" + "ab" * 32, [2]),
+                _redemption("0x" + "AB" * 32, [1, 2]),
+            ]
+        )
+
+        assert error is None
+        assert result["submitted"] == ["0x" + "ab" * 32]
+        txs = conn.relayer_client.execute.call_args.kwargs["transactions"]
+        expected_tx, _ = conn._build_redeem_tx(
+            "0x" + "ab" * 32, [1, 2], COLLATERAL_ADDRESS, False
+        )
+        assert [tx.data for tx in txs] == [expected_tx.data]
+
+    def test_chunks_by_the_gas_limit(self) -> None:
+        """The redemptions which do not fit in the gas limit are split into several transactions."""
+        conn = _make_connection()
+        conn.relayer_client.execute.return_value = MagicMock()
+        redemptions = [_redemption(f"0x{i:064x}", [1]) for i in range(5)]
+
+        result, error = conn._redeem_positions_batch(
+            redemptions, gas_limit=2 * REDEEM_POSITION_GAS_ESTIMATE
+        )
+
+        assert error is None
+        assert len(result["transactions"]) == 3
+        assert len(result["submitted"]) == 5
+        chunk_sizes = [
+            len(call.kwargs["transactions"])
+            for call in conn.relayer_client.execute.call_args_list
+        ]
+        assert chunk_sizes == [2, 2, 1]
+
+    def test_failed_transaction_does_not_abort_the_rest(self) -> None:
+        """A failed relayer transaction is reported, while the rest are still relayed."""
+        conn = _make_connection()
+        conn.relayer_client.execute.side_effect = [
+            RuntimeError("relay error"),
+            MagicMock(),
+        ]
+        redemptions = [_redemption(f"0x{i:064x}", [1]) for i in range(2)]
+
+        result, error = conn._redeem_positions_batch(
+            redemptions, gas_limit=REDEEM_POSITION_GAS_ESTIMATE
+        )
+
+        assert "Error redeeming positions" in error
+        assert result["failed"] == [f"0x{0:064x}"]
+        assert result["submitted"] == [f"0x{1:064x}"]
+
+    def test_rejected_transaction_is_split_until_the_rejected_condition(
+        self,
+    ) -> None:
+        """A rejected multisend is retried in halves, so only the rejected condition is left out."""
+        conn = _make_connection()
+        failing = f"0x{2:064x}"
+
+        def _execute(transactions: Any, metadata: str) -> MagicMock:
+            failing_tx, _ = conn._build_redeem_tx(
+                failing, [1], COLLATERAL_ADDRESS, False
+            )
+            if any(tx.data == failing_tx.data for tx in transactions):
+                raise _relayer_rejection("execution reverted")
+            return MagicMock()
+
+        conn.relayer_client.execute.side_effect = _execute
+        redemptions = [_redemption(f"0x{i:064x}", [1]) for i in range(5)]
+
+        result, error = conn._redeem_positions_batch(redemptions)
+
+        assert "execution reverted" in error
+        assert result["failed"] == [failing]
+        assert result["submitted"] == [
+            f"0x{i:064x}" for i in range(5) if f"0x{i:064x}" != failing
+        ]
+        chunk_sizes = [
+            len(call.kwargs["transactions"])
+            for call in conn.relayer_client.execute.call_args_list
+        ]
+        # [0..4] -> [0, 1] + [2, 3, 4] -> [2] + [3, 4]
+        assert chunk_sizes == [5, 2, 3, 1, 2]
+
+    @pytest.mark.parametrize(
+        "error",
+        (
+            RuntimeError("read timed out"),
+            requests.exceptions.ConnectionError("connection reset"),
+        ),
+    )
+    def test_unknown_error_fails_the_transaction_without_retrying(
+        self, error: Exception
+    ) -> None:
+        """A transaction which may have been submitted is reported as failed, and not retried."""
+        conn = _make_connection()
+        conn.relayer_client.execute.side_effect = error
+        redemptions = [_redemption(f"0x{i:064x}", [1]) for i in range(5)]
+
+        result, error_msg = conn._redeem_positions_batch(redemptions)
+
+        assert error_msg == f"Error redeeming positions: {error}"
+        assert result["failed"] == [f"0x{i:064x}" for i in range(5)]
+        assert result["submitted"] == []
+        conn.relayer_client.execute.assert_called_once()
+
+    def test_unbuildable_redemption_fails_only_its_condition(self) -> None:
+        """A redemption whose transaction cannot be built is left out of the multisend."""
+        conn = _make_connection()
+        conn.relayer_client.execute.return_value = MagicMock()
+        failing = f"0x{1:064x}"
+        build_redeem_tx = conn._build_redeem_tx
+
+        def _build(condition_id: str, *args: Any) -> Any:
+            if condition_id == failing:
+                raise ValueError("invalid condition")
+            return build_redeem_tx(condition_id, *args)
+
+        redemptions = [_redemption(f"0x{i:064x}", [1]) for i in range(3)]
+        with patch.object(conn, "_build_redeem_tx", side_effect=_build):
+            result, error = conn._redeem_positions_batch(redemptions)
+
+        assert "invalid condition" in error
+        assert result["failed"] == [failing]
+        assert result["submitted"] == [f"0x{0:064x}", f"0x{2:064x}"]
+        conn.relayer_client.execute.assert_called_once()
+
+    def test_invalid_redemptions(self) -> None:
+        """Malformed redemptions are rejected without relaying anything."""
+        conn = _make_connection()
+
+        result, error = conn._redeem_positions_batch([{"condition_id": "0xab"}])
+
+        assert "Invalid redemptions" in error
+        assert result == {"error": error}
+        conn.relayer_client.execute.assert_not_called()
+
+    def test_no_relayer_client_returns_error(self) -> None:
+        """Returns error when relayer_client is None."""
+        conn = _make_connection()
+        conn.relayer_client = None
+
+        result, error = conn._redeem_positions_batch([_redemption("0xab", [1])])
+
+        assert result is None
+        assert "not initialized" in error
+
+
 # ---------------------------------------------------------------------------
 # _encode_approve / _encode_set_approval_for_all
 # ---------------------------------------------------------------------------
@@ -3344,6 +3764,14 @@ class TestFetchOrderBook:
             "asks": [{"price": "0.55", "size": "100"}],
             "bids": [{"price": "0.45", "size": "50"}],
             "min_order_size": "5",
+            "book": {
+                "ask_prices": [0.55],
+                "ask_sizes": [100.0],
+                "ask_cum_costs": [pytest.approx(55.0)],
+                "ask_cum_shares": [100.0],
+                "bid_prices": [0.45],
+                "bid_sizes": [50.0],
+            },
         }
 
     def test_empty_book(self) -> None:
@@ -3358,7 +3786,12 @@ class TestFetchOrderBook:
         result, error = conn._fetch_order_book("token_123")
 
         assert error is None
-        assert result == {"asks": [], "bids": [], "min_order_size": "5"}
+        assert result == {
+            "asks": [],
+            "bids": [],
+            "min_order_size": "5",
+            "book": EMPTY_COMPACT_BOOK,
+        }
 
     def test_none_min_order_size(self) -> None:
         """None min_order_size returns None."""
@@ -3386,7 +3819,12 @@ class TestFetchOrderBook:
         result, error = conn._fetch_order_book("token_123")
 
         assert error is None
-        assert result == {"asks": [], "bids": [], "min_order_size": None}
+        assert result == {
+            "asks": [],
+            "bids": [],
+            "min_order_size": None,
+            "book": EMPTY_COMPACT_BOOK,
+        }
 
     def test_client_exception(self) -> None:
         """Client exception returns None with error message."""
@@ -3415,11 +3853,11 @@ class TestFetchOrderBook:
         result, error = conn._fetch_order_book("token_123")
 
         assert error is None
-        assert result == {
-            "asks": [{"price": "0.55", "size": "100"}],
-            "bids": [{"price": "0.45", "size": "50"}],
-            "min_order_size": "5",
-        }
+        assert result["asks"] == [{"price": "0.55", "size": "100"}]
+        assert result["bids"] == [{"price": "0.45", "size": "50"}]
+        assert result["min_order_size"] == "5"
+        assert result["book"]["ask_prices"] == [0.55]
+        assert result["book"]["bid_prices"] == [0.45]
 
     def test_v2_dict_response_missing_keys(self) -> None:
         """v2 dict response with absent keys falls back to empty/None."""
@@ -3429,7 +3867,78 @@ class TestFetchOrderBook:
         result, error = conn._fetch_order_book("token_123")
 
         assert error is None
-        assert result == {"asks": [], "bids": [], "min_order_size": None}
+        assert result == {
+            "asks": [],
+            "bids": [],
+            "min_order_size": None,
+            "book": EMPTY_COMPACT_BOOK,
+        }
+
+    def test_cached_within_ttl(self) -> None:
+        """A fresh order book is served from the cache, without asking the CLOB."""
+        conn = _make_connection()
+        conn.order_book_cache_ttl = 60.0
+        conn.client.get_order_book.return_value = {
+            "asks": [{"price": "0.55", "size": "100"}],
+            "bids": [],
+        }
+
+        first, _ = conn._fetch_order_book("token_123")
+        second, error = conn._fetch_order_book("token_123")
+        conn._fetch_order_book("token_456")
+
+        assert error is None
+        assert second == first
+        assert conn.client.get_order_book.call_count == 2
+
+    def test_error_not_cached(self) -> None:
+        """A failed fetch is retried on the next quote."""
+        conn = _make_connection()
+        conn.order_book_cache_ttl = 60.0
+        conn.client.get_order_book.side_effect = [Exception("API timeout"), {}]
+
+        assert conn._fetch_order_book("token_123")[0] is None
+        assert conn._fetch_order_book("token_123")[0] is not None
+
+
+class TestCompactOrderBook:
+    """Tests for _compact_order_book."""
+
+    def test_sorted_with_cumulative_depth(self) -> None:
+        """Asks are sorted ascending, bids descending, with the asks' cumulative depth."""
+        book = _compact_order_book(
+            asks=[
+                {"price": "0.60", "size": "10"},
+                {"price": "0.50", "size": "20"},
+            ],
+            bids=[
+                {"price": "0.40", "size": "5"},
+                {"price": "0.45", "size": "15"},
+            ],
+        )
+
+        assert book["ask_prices"] == [0.50, 0.60]
+        assert book["ask_sizes"] == [20.0, 10.0]
+        assert book["ask_cum_costs"] == pytest.approx([10.0, 16.0])
+        assert book["ask_cum_shares"] == [20.0, 30.0]
+        assert book["bid_prices"] == [0.45, 0.40]
+        assert book["bid_sizes"] == [15.0, 5.0]
+
+    def test_invalid_levels_skipped(self) -> None:
+        """Unparseable, zero and negative levels are left out."""
+        book = _compact_order_book(
+            asks=[
+                {"price": "None", "size": "10"},
+                {"price": "0", "size": "10"},
+                {"price": "0.50", "size": "0"},
+                {"price": "-0.1", "size": "10"},
+                {"price": "0.55", "size": "10"},
+            ],
+            bids=[{"price": "0.45"}],
+        )
+
+        assert book["ask_prices"] == [0.55]
+        assert book["bid_prices"] == []
 
 
 # ---------------------------------------------------------------------------
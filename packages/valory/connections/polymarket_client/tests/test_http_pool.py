@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the pooled HTTP helpers of the polymarket_client connection."""
+
+from unittest.mock import patch
+
+from packages.valory.connections.polymarket_client.http_pool import (
+    HostRateLimiter,
+    build_pooled_session,
+)
+
+MODULE = "packages.valory.connections.polymarket_client.http_pool"
+
+
+class TestBuildPooledSession:
+    """Tests for build_pooled_session."""
+
+    def test_pool_is_sized_to_the_workers(self) -> None:
+        """Both schemes share an adapter whose pool fits the workers."""
+        session = build_pooled_session(4)
+        adapter = session.get_adapter("https://gamma-api.polymarket.com")
+        assert adapter is session.get_adapter("http://example.com")
+        assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+        session.close()
+
+    def test_pool_has_at_least_one_connection(self) -> None:
+        """A non-positive size is clamped to one connection."""
+        session = build_pooled_session(0)
+        adapter = session.get_adapter("https://gamma-api.polymarket.com")
+        assert adapter._pool_maxsize == 1  # pylint: disable=protected-access
+        session.close()
+
+
+class TestHostRateLimiter:
+    """Tests for HostRateLimiter."""
+
+    def test_spaces_out_requests_to_the_same_host(self) -> None:
+        """Consecutive requests to a host are spaced by the minimum interval."""
+        limiter = HostRateLimiter(max_requests_per_second=2)
+        with (
+            patch(f"{MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{MODULE}.time.sleep") as mock_sleep,
+        ):
+            for _ in range(3):
+                limiter.wait("https://gamma-api.polymarket.com/events/keyset")
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_hosts_are_limited_independently(self) -> None:
+        """A request to another host does not wait for the first host's slot."""
+        limiter = HostRateLimiter(max_requests_per_second=1)
+        with (
+            patch(f"{MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter.wait("https://gamma-api.polymarket.com/events")
+            limiter.wait("https://data-api.polymarket.com/trades")
+
+        mock_sleep.assert_not_called()
+
+    def test_disabled_spacing(self) -> None:
+        """A non-positive rate never waits."""
+        limiter = HostRateLimiter(max_requests_per_second=0)
+        with patch(f"{MODULE}.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.wait("https://gamma-api.polymarket.com/events")
+
+        mock_sleep.assert_not_called()
+
+    def test_back_off_holds_back_the_host(self) -> None:
+        """After a back-off, the next request to the host waits for it to expire."""
+        limiter = HostRateLimiter(max_requests_per_second=0)
+        with (
+            patch(f"{MODULE}.time.monotonic", return_value=100.0),
+            patch(f"{MODULE}.time.sleep") as mock_sleep,
+        ):
+            limiter.back_off("https://gamma-api.polymarket.com/events", 30.0)
+            limiter.wait("https://gamma-api.polymarket.com/markets")
+            limiter.wait("https://data-api.polymarket.com/trades")
+
+        mock_sleep.assert_called_once_with(30.0)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the response cache of the polymarket_client connection."""
+
+from unittest.mock import patch
+
+from packages.valory.connections.polymarket_client.response_cache import (
+    IF_MODIFIED_SINCE_HEADER,
+    IF_NONE_MATCH_HEADER,
+    ResponseCache,
+)
+
+MODULE = "packages.valory.connections.polymarket_client.response_cache"
+URL = "https://gamma-api.polymarket.com/events/keyset"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_key_ignores_params_order(self) -> None:
+        """Equal params produce the same key regardless of their order."""
+        assert ResponseCache.key(URL, {"a": 1, "b": 2}) == ResponseCache.key(
+            URL, {"b": 2, "a": 1}
+        )
+        assert ResponseCache.key(URL, {"a": 1}) != ResponseCache.key(URL, {"a": 2})
+
+    def test_store_and_expire(self) -> None:
+        """An entry is fresh within its TTL and stale afterwards."""
+        cache = ResponseCache()
+        key = ResponseCache.key(URL)
+        with patch(f"{MODULE}.time.monotonic", return_value=100.0):
+            cache.store(key, {"events": []}, {}, ttl=30)
+        entry = cache.lookup(key)
+        assert entry is not None
+
+        with patch(f"{MODULE}.time.monotonic", return_value=129.0):
+            assert cache.is_fresh(entry)
+        with patch(f"{MODULE}.time.monotonic", return_value=130.0):
+            assert not cache.is_fresh(entry)
+
+    def test_hit_returns_a_copy(self) -> None:
+        """Mutating a served payload does not alter the cached one."""
+        cache = ResponseCache()
+        key = ResponseCache.key(URL)
+        payload = {"markets": [{"id": "m1"}]}
+        cache.store(key, payload, {}, ttl=30)
+        payload["markets"].append({"id": "m2"})
+
+        served = cache.hit(cache.lookup(key))  # type: ignore[arg-type]
+        served["markets"][0]["_poly_tags"] = ["politics"]
+
+        assert cache.hit(cache.lookup(key)) == {"markets": [{"id": "m1"}]}  # type: ignore[arg-type]
+
+    def test_uncacheable_response_is_not_stored(self) -> None:
+        """Without a TTL or validators, a response is counted but not stored."""
+        cache = ResponseCache()
+        cache.store(ResponseCache.key(URL), [], {}, ttl=0)
+        assert cache.stats == {"hits": 0, "misses": 1, "revalidated": 0, "entries": 0}
+
+    def test_conditional_headers(self) -> None:
+        """The validators of an entry are turned into conditional request headers."""
+        cache = ResponseCache()
+        key = ResponseCache.key(URL)
+        headers = {"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}
+        cache.store(key, [], headers, ttl=0)
+
+        assert ResponseCache.conditional_headers(None) == {}
+        assert ResponseCache.conditional_headers(cache.lookup(key)) == {
+            IF_NONE_MATCH_HEADER: '"abc"',
+            IF_MODIFIED_SINCE_HEADER: "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+
+    def test_revalidate_refreshes_the_entry(self) -> None:
+        """A not-modified answer extends the entry's lifetime and keeps its payload."""
+        cache = ResponseCache()
+        key = ResponseCache.key(URL)
+        with patch(f"{MODULE}.time.monotonic", return_value=100.0):
+            cache.store(key, [1], {"ETag": '"v1"'}, ttl=0)
+            entry = cache.lookup(key)
+            assert entry is not None
+            assert cache.revalidate(entry, {"ETag": '"v2"'}, ttl=10) == [1]
+
+        assert entry.expires_at == 110.0
+        assert entry.etag == '"v2"'
+        assert cache.stats["revalidated"] == 1
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted once the cache is full."""
+        cache = ResponseCache(max_entries=2)
+        keys = [ResponseCache.key(URL, {"page": i}) for i in range(3)]
+        cache.store(keys[0], 0, {}, ttl=30)
+        cache.store(keys[1], 1, {}, ttl=30)
+        # touch the first entry so that the second one becomes the least recently used
+        cache.lookup(keys[0])
+        cache.store(keys[2], 2, {}, ttl=30)
+
+        assert cache.lookup(keys[0]) is not None
+        assert cache.lookup(keys[1]) is None
+        assert cache.lookup(keys[2]) is not None
+
+    def test_disabled_cache(self) -> None:
+        """A non-positive capacity never stores anything."""
+        cache = ResponseCache(max_entries=0)
+        cache.store(ResponseCache.key(URL), [], {"ETag": '"v1"'}, ttl=30)
+        assert cache.stats["entries"] == 0
+
+    def test_clear(self) -> None:
+        """Clearing drops every entry."""
+        cache = ResponseCache()
+        cache.store(ResponseCache.key(URL), [], {}, ttl=30)
+        cache.clear()
+        assert cache.stats["entries"] == 0
@@ -20,7 +20,7 @@
 """This module contains the class to connect to a Market Maker contract."""
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
@@ -28,6 +28,7 @@ from aea.contracts.base import Contract as BaseContract
 from aea.crypto.base import LedgerApi
 from aea_ledger_ethereum import EthereumApi
 from hexbytes import HexBytes
+from web3.exceptions import BadFunctionCallOutput
 
 from packages.valory.contracts.conditional_tokens.contract import (
     ConditionalTokensContract,
@@ -46,6 +47,38 @@ FPMM_SELL_TOPIC0 = HexBytes(
 )
 _ADDRESS_HEX_LEN = 40
 _WORD_BYTES = 32
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+PAYOUT_DENOMINATOR_SIGNATURE = "payoutDenominator(bytes32)"
+GET_HISTORY_HASH_SIGNATURE = "getHistoryHash(bytes32)"
 
 
 class Contract(BaseContract):
@@ -356,3 +389,74 @@ class FixedProductMarketMakerContract(Contract):
             )
             balances.append(balance)
         return {"balances": balances}
+
+    @classmethod
+    def get_redeem_statuses(
+        cls,
+        ledger_api: EthereumApi,
+        contract_address: str,
+        realitio_address: str,
+        condition_ids: Sequence[str],
+        question_ids: Sequence[str],
+    ) -> JSONLike:
+        """Read the resolution status and the history hash of several markets with a single Multicall3 call.
+
+        For every market, the payout denominator of its condition is read from the ConditionalTokens contract,
+        which is non-zero once the condition has been resolved, and the history hash of its question is read
+        from the Realitio contract, which is null once the winnings have been claimed.
+
+        :param ledger_api: the ledger API object
+        :param contract_address: the ConditionalTokens contract address
+        :param realitio_address: the Realitio contract address
+        :param condition_ids: the markets' condition ids (bytes32 hex)
+        :param question_ids: the markets' question ids (bytes32 hex), in the same order as the condition ids
+        :return: ``{"statuses": [[resolved, history_hash], ...]}``, in the order of the given markets
+        """
+        if len(condition_ids) != len(question_ids):
+            raise ValueError(
+                f"Got {len(condition_ids)} condition ids but {len(question_ids)} question ids."
+            )
+
+        codec = ledger_api.api.codec
+        ct_address = ledger_api.api.to_checksum_address(contract_address)
+        realitio_checksum = ledger_api.api.to_checksum_address(realitio_address)
+        payout_selector = bytes(
+            ledger_api.api.keccak(text=PAYOUT_DENOMINATOR_SIGNATURE)[:4]
+        )
+        history_selector = bytes(
+            ledger_api.api.keccak(text=GET_HISTORY_HASH_SIGNATURE)[:4]
+        )
+
+        calls = []
+        for condition_id, question_id in zip(condition_ids, question_ids):
+            condition_arg = codec.encode(["bytes32"], [HexBytes(condition_id)])
+            question_arg = codec.encode(["bytes32"], [HexBytes(question_id)])
+            calls.append((ct_address, False, payout_selector + condition_arg))
+            calls.append((realitio_checksum, False, history_selector + question_arg))
+
+        if not calls:
+            return {"statuses": []}
+
+        try:
+            multicall = ledger_api.api.eth.contract(
+                address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+            )
+            # the aggregator is not part of the FPMM ABI, so it is looked up by name
+            aggregate3 = multicall.get_function_by_name("aggregate3")
+            results = aggregate3(calls).call()
+            return_data = [data for _success, data in results]
+        except BadFunctionCallOutput:
+            # Multicall3 is not deployed on this chain, read the values one by one
+            return_data = [
+                ledger_api.api.eth.call({"to": target, "data": call_data})
+                for target, _allow_failure, call_data in calls
+            ]
+
+        statuses = []
+        for payout_data, history_data in zip(return_data[::2], return_data[1::2]):
+            payout_denominator = codec.decode(["uint256"], payout_data)[0]
+            history_hash = codec.decode(["bytes32"], history_data)[0]
+            statuses.append(
+                [payout_denominator > 0, HexBytes(history_hash).to_0x_hex()]
+            )
+        return {"statuses": statuses}
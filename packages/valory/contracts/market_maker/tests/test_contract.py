@@ -24,12 +24,18 @@ import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
 
 from packages.valory.contracts.market_maker.contract import (
     Contract,
     FPMM_SELL_TOPIC0,
     FixedProductMarketMakerContract,
+    GET_HISTORY_HASH_SIGNATURE,
+    MULTICALL3_ADDRESS,
+    PAYOUT_DENOMINATOR_SIGNATURE,
 )
 
 # Public on-chain addresses used as test fixtures. Bandit flags any
@@ -42,6 +48,9 @@ CONDITIONAL_TOKENS_ADDRESS = (  # nosec B105 gitleaks:allow — public CT contra
 )
 FPMM_ADDR = "0x9371158c040dc04AdeC99E03f82CDa9C0D804af7"  # nosec B105 — public FPMM
 SELLER_ADDR = "0x19f4d0728906968649862788c7975ef503f43380"  # nosec B105 — public addr
+REALITIO_ADDRESS = (  # nosec B105 gitleaks:allow — public Realitio contract
+    "0x79e32aE03fb27B07C89c0c568F80287C01ca2E57"
+)
 
 
 def _padded_address(addr: str) -> str:
@@ -559,6 +568,98 @@ class TestGetPoolBalancesViaCT:
         assert result == {"balances": [100, 200]}
 
 
+class TestGetRedeemStatuses:
+    """Tests for FixedProductMarketMakerContract.get_redeem_statuses."""
+
+    CONDITION_IDS = ["0x" + "aa" * 32, "0x" + "bb" * 32]
+    QUESTION_IDS = ["0x" + "01" * 32, "0x" + "02" * 32]
+    # the payout denominators of the conditions and the history hashes of the questions
+    PAYOUT_DENOMINATORS = {CONDITION_IDS[0]: 1, CONDITION_IDS[1]: 0}
+    HISTORY_HASHES = {QUESTION_IDS[0]: b"\x00" * 32, QUESTION_IDS[1]: b"\xff" * 32}
+
+    def setup_method(self) -> None:
+        """Set up a ledger api with a real codec and a mocked Multicall3."""
+        self.w3 = Web3()
+        self.ledger_api = MagicMock()
+        self.ledger_api.api.codec = self.w3.codec
+        self.ledger_api.api.keccak = Web3.keccak
+        self.ledger_api.api.to_checksum_address = Web3.to_checksum_address
+        multicall = self.ledger_api.api.eth.contract.return_value
+        self.aggregate3 = multicall.get_function_by_name.return_value
+        self.aggregate3.side_effect = lambda calls: MagicMock(
+            call=MagicMock(return_value=[(True, self._respond(*c)) for c in calls])
+        )
+
+    def _respond(self, target: str, _allow_failure: bool, call_data: bytes) -> bytes:
+        """Respond to a call with the encoded value of the called function."""
+        selector, arg = call_data[:4], HexBytes(call_data[4:]).to_0x_hex()
+        if selector == Web3.keccak(text=PAYOUT_DENOMINATOR_SIGNATURE)[:4]:
+            assert target == Web3.to_checksum_address(CONDITIONAL_TOKENS_ADDRESS)
+            return self.w3.codec.encode(["uint256"], [self.PAYOUT_DENOMINATORS[arg]])
+        assert selector == Web3.keccak(text=GET_HISTORY_HASH_SIGNATURE)[:4]
+        assert target == Web3.to_checksum_address(REALITIO_ADDRESS)
+        return self.w3.codec.encode(["bytes32"], [self.HISTORY_HASHES[arg]])
+
+    def _get_redeem_statuses(self) -> dict:
+        """Get the redeem statuses of the test markets."""
+        return FixedProductMarketMakerContract.get_redeem_statuses(
+            self.ledger_api,
+            CONDITIONAL_TOKENS_ADDRESS,
+            realitio_address=REALITIO_ADDRESS,
+            condition_ids=self.CONDITION_IDS,
+            question_ids=self.QUESTION_IDS,
+        )
+
+    def test_single_aggregate_call(self) -> None:
+        """Test that the statuses of all the markets are read in a single aggregate call."""
+        result = self._get_redeem_statuses()
+
+        assert result == {
+            "statuses": [[True, "0x" + "00" * 32], [False, "0x" + "ff" * 32]]
+        }
+        self.aggregate3.assert_called_once()
+        assert len(self.aggregate3.call_args.args[0]) == 4
+        assert (
+            self.ledger_api.api.eth.contract.call_args.kwargs["address"]
+            == MULTICALL3_ADDRESS
+        )
+
+    def test_fallback_without_multicall(self) -> None:
+        """Test that the values are read one by one if Multicall3 is not deployed."""
+        self.aggregate3.side_effect = BadFunctionCallOutput("no code")
+        self.ledger_api.api.eth.call.side_effect = lambda tx: self._respond(
+            tx["to"], False, tx["data"]
+        )
+
+        result = self._get_redeem_statuses()
+
+        assert result["statuses"] == [
+            [True, "0x" + "00" * 32],
+            [False, "0x" + "ff" * 32],
+        ]
+        assert self.ledger_api.api.eth.call.call_count == 4
+
+    def test_no_markets(self) -> None:
+        """Test that nothing is read without any markets."""
+        result = FixedProductMarketMakerContract.get_redeem_statuses(
+            self.ledger_api, CONDITIONAL_TOKENS_ADDRESS, REALITIO_ADDRESS, [], []
+        )
+
+        assert result == {"statuses": []}
+        self.aggregate3.assert_not_called()
+
+    def test_mismatching_ids(self) -> None:
+        """Test that the condition and the question ids must correspond to each other."""
+        with pytest.raises(ValueError):
+            FixedProductMarketMakerContract.get_redeem_statuses(
+                self.ledger_api,
+                CONDITIONAL_TOKENS_ADDRESS,
+                REALITIO_ADDRESS,
+                self.CONDITION_IDS,
+                self.QUESTION_IDS[:1],
+            )
+
+
 PACKAGE_DIR = Path(__file__).parent.parent
 
 
@@ -19,10 +19,88 @@
 
 """This module contains the class to connect to the `ServiceStakingTokenMechUsage` contract."""
 
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea.crypto.base import LedgerApi
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+SERVICE_INFO_TYPE = "(address,address,uint256[],uint256,uint256,uint256)"
+
+# a snapshot read, as `(target, function signature, uint256 arguments, output type)`
+_SnapshotRead = Tuple[str, str, Tuple[int, ...], str]
+# the reads which may fail without failing the snapshot, with the value they default to,
+# which matches the default the staking behaviours use when the value has not been read
+_OPTIONAL_READ_DEFAULTS: Dict[str, Any] = {"agent_ids": []}
+# the aggregate call either reverts, because a required read failed, or is not deployed
+_AGGREGATE_FAILURE = (BadFunctionCallOutput, ContractLogicError)
+
+
+def _read(
+    ledger_api: LedgerApi, target: str, call_data: bytes, allow_failure: bool
+) -> Optional[bytes]:
+    """Perform a single read of the staking snapshot.
+
+    :param ledger_api: the ledger API object.
+    :param target: the address to call.
+    :param call_data: the encoded call.
+    :param allow_failure: whether a reverting call is returned as `None` instead of raising.
+    :return: the returned data, or `None` if an allowed failure occurred.
+    """
+    try:
+        return ledger_api.api.eth.call({"to": target, "data": call_data})
+    except ContractLogicError:
+        if allow_failure:
+            return None
+        raise
+
+
+class StakingSnapshot(NamedTuple):
+    """The staking values of a service, read at the same block.
+
+    The service-specific values are `None` if no service id was given,
+    and the epoch values are `None` if they were not requested.
+    """
+
+    staking_state: Optional[int]
+    service_info: Optional[Tuple[Any, ...]]
+    ts_checkpoint: Optional[int]
+    next_checkpoint: Optional[int]
+    liveness_period: Optional[int]
+    liveness_ratio: Optional[int]
+    agent_ids: Optional[List[int]]
 
 
 class ServiceStakingTokenContract(Contract):
@@ -199,3 +277,96 @@ class ServiceStakingTokenContract(Contract):
         contract = cls.get_instance(ledger_api, contract_address)
         agent_ids = contract.functions.getAgentIds().call()
         return dict(data=agent_ids)
+
+    @classmethod
+    def get_staking_snapshot(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        service_id: Optional[int],
+        activity_checker: Optional[str] = None,
+        epoch_values: bool = True,
+    ) -> JSONLike:
+        """Retrieve all the staking values of a service with a single Multicall3 aggregate call.
+
+        The agent ids are optional, and take their default value if their read fails. If the aggregate call fails,
+        e.g., because Multicall3 is not deployed on the chain or a required read reverted, the values are read one
+        by one, so that a failing required read raises its own error.
+
+        :param ledger_api: the ledger API object.
+        :param contract_address: the staking contract address.
+        :param service_id: the id of the service, or `None` to skip the service-specific values.
+        :param activity_checker: the mech activity checker of a V2 staking contract. If given, the staking state is
+            read with the V2 getter and the liveness ratio is read from the activity checker.
+        :param epoch_values: whether to read the values that only change once per epoch, i.e., the checkpoints,
+            the liveness period and ratio and the agent ids.
+        :return: a `{"data": <the fields of the StakingSnapshot>}` mapping.
+        """
+        epoch_reads: Dict[str, _SnapshotRead] = {
+            "ts_checkpoint": (contract_address, "tsCheckpoint()", (), "uint256"),
+            "next_checkpoint": (
+                contract_address,
+                "getNextRewardCheckpointTimestamp()",
+                (),
+                "uint256",
+            ),
+            "liveness_period": (contract_address, "livenessPeriod()", (), "uint256"),
+            "liveness_ratio": (
+                activity_checker or contract_address,
+                "livenessRatio()",
+                (),
+                "uint256",
+            ),
+            "agent_ids": (contract_address, "getAgentIds()", (), "uint256[]"),
+        }
+        reads = epoch_reads if epoch_values else {}
+        if service_id is not None:
+            state_getter = (
+                "getStakingState" if activity_checker else "getServiceStakingState"
+            )
+            reads["staking_state"] = (
+                contract_address,
+                f"{state_getter}(uint256)",
+                (service_id,),
+                "uint8",
+            )
+            reads["service_info"] = (
+                contract_address,
+                "getServiceInfo(uint256)",
+                (service_id,),
+                SERVICE_INFO_TYPE,
+            )
+
+        codec = ledger_api.api.codec
+        calls = []
+        for field, (target, signature, args, _) in reads.items():
+            selector = bytes(ledger_api.api.keccak(text=signature)[:4])
+            call_data = selector + codec.encode(["uint256"] * len(args), list(args))
+            allow_failure = field in _OPTIONAL_READ_DEFAULTS
+            calls.append(
+                (ledger_api.api.to_checksum_address(target), allow_failure, call_data)
+            )
+
+        try:
+            multicall = ledger_api.api.eth.contract(
+                address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+            )
+            # the aggregator is not part of the staking ABI, so it is looked up by name
+            aggregate3 = multicall.get_function_by_name("aggregate3")
+            results = aggregate3(calls).call()
+            return_data = [data if success else None for success, data in results]
+        except _AGGREGATE_FAILURE:
+            return_data = [
+                _read(ledger_api, target, call_data, allow_failure)
+                for target, allow_failure, call_data in calls
+            ]
+
+        snapshot: Dict[str, Any] = dict.fromkeys(StakingSnapshot._fields)
+        for (field, (_, _, _, output_type)), data in zip(reads.items(), return_data):
+            if field in _OPTIONAL_READ_DEFAULTS and not data:
+                snapshot[field] = _OPTIONAL_READ_DEFAULTS[field]
+                continue
+            snapshot[field] = codec.decode([output_type], data)[0]
+        if snapshot["agent_ids"] is not None:
+            snapshot["agent_ids"] = list(snapshot["agent_ids"])
+        return dict(data=StakingSnapshot(**snapshot)._asdict())
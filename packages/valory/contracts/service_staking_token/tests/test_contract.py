@@ -22,13 +22,40 @@
 import json
 import re
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 from unittest.mock import MagicMock, patch
 
+import pytest
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
 from packages.valory.contracts.service_staking_token.contract import (
+    MULTICALL3_ADDRESS,
+    SERVICE_INFO_TYPE,
     ServiceStakingTokenContract,
 )
 
 CONTRACT_ADDRESS = "0x1234567890abcdef1234567890abcdef12345678"
+CHECKER_ADDRESS = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+SERVICE_INFO = (
+    "0x" + "11" * 20,
+    "0x" + "22" * 20,
+    (3, 7),
+    1000,
+    50,
+    0,
+)
+# the value returned for each function signature, with its output type
+SNAPSHOT_RESPONSES: Dict[str, Tuple[str, Any]] = {
+    "tsCheckpoint()": ("uint256", 1000),
+    "getNextRewardCheckpointTimestamp()": ("uint256", 2000),
+    "livenessPeriod()": ("uint256", 86400),
+    "livenessRatio()": ("uint256", 10**14),
+    "getAgentIds()": ("uint256[]", (25,)),
+    "getServiceStakingState(uint256)": ("uint8", 1),
+    "getStakingState(uint256)": ("uint8", 2),
+    "getServiceInfo(uint256)": (SERVICE_INFO_TYPE, SERVICE_INFO),
+}
 
 
 class TestServiceStakingTokenContract:
@@ -218,6 +245,190 @@ class TestServiceStakingTokenContract:
         assert result == {"data": [10, 20]}
 
 
+class TestGetStakingSnapshot:
+    """Tests for ServiceStakingTokenContract.get_staking_snapshot."""
+
+    def setup_method(self) -> None:
+        """Set up a ledger api with a real codec and a mocked Multicall3."""
+        self.w3 = Web3()
+        self.ledger_api = MagicMock()
+        self.ledger_api.api.codec = self.w3.codec
+        self.ledger_api.api.keccak = Web3.keccak
+        self.ledger_api.api.to_checksum_address = Web3.to_checksum_address
+        multicall = self.ledger_api.api.eth.contract.return_value
+        self.aggregate3 = multicall.get_function_by_name.return_value
+        self.aggregate3.side_effect = lambda calls: MagicMock(
+            call=MagicMock(return_value=[(True, self._respond(*c)) for c in calls])
+        )
+        self.targets: List[Tuple[str, str]] = []
+
+    def _respond(self, target: str, _allow_failure: bool, call_data: bytes) -> bytes:
+        """Respond to a call with the encoded value of the called function."""
+        for signature, (output_type, value) in SNAPSHOT_RESPONSES.items():
+            if call_data[:4] == Web3.keccak(text=signature)[:4]:
+                self.targets.append((signature, target))
+                return self.w3.codec.encode([output_type], [value])
+        raise AssertionError(f"Unexpected call {call_data.hex()}")  # pragma: no cover
+
+    def test_v1_snapshot(self) -> None:
+        """Test that a V1 snapshot is read in a single aggregate call."""
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42
+        )
+
+        assert result == {
+            "data": {
+                "staking_state": 1,
+                "service_info": SERVICE_INFO,
+                "ts_checkpoint": 1000,
+                "next_checkpoint": 2000,
+                "liveness_period": 86400,
+                "liveness_ratio": 10**14,
+                "agent_ids": [25],
+            }
+        }
+        self.aggregate3.assert_called_once()
+        self.ledger_api.api.eth.contract.assert_called_once()
+        assert (
+            self.ledger_api.api.eth.contract.call_args.kwargs["address"]
+            == MULTICALL3_ADDRESS
+        )
+        staking = Web3.to_checksum_address(CONTRACT_ADDRESS)
+        assert {target for _, target in self.targets} == {staking}
+        service_id_arg = self.w3.codec.encode(["uint256"], [42])
+        calls = self.aggregate3.call_args.args[0]
+        assert all(
+            call_data.endswith(service_id_arg)
+            for _, _, call_data in calls
+            if len(call_data) > 4
+        )
+
+    def test_v2_snapshot(self) -> None:
+        """Test that a V2 snapshot uses the V2 state getter and the activity checker's liveness ratio."""
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api,
+            CONTRACT_ADDRESS,
+            service_id=42,
+            activity_checker=CHECKER_ADDRESS,
+        )
+
+        assert result["data"]["staking_state"] == 2
+        targets = dict(self.targets)
+        assert "getServiceStakingState(uint256)" not in targets
+        assert targets["livenessRatio()"] == Web3.to_checksum_address(CHECKER_ADDRESS)
+        assert targets["tsCheckpoint()"] == Web3.to_checksum_address(CONTRACT_ADDRESS)
+
+    def test_no_service_id(self) -> None:
+        """Test that the service-specific values are skipped without a service id."""
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=None
+        )
+
+        assert result["data"]["staking_state"] is None
+        assert result["data"]["service_info"] is None
+        assert result["data"]["ts_checkpoint"] == 1000
+        assert len(self.targets) == 5
+
+    def test_without_epoch_values(self) -> None:
+        """Test that only the service-specific values are read if the epoch values are not requested."""
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42, epoch_values=False
+        )
+
+        assert result["data"]["staking_state"] == 1
+        assert result["data"]["service_info"] == SERVICE_INFO
+        assert result["data"]["ts_checkpoint"] is None
+        assert result["data"]["agent_ids"] is None
+        assert {signature for signature, _ in self.targets} == {
+            "getServiceStakingState(uint256)",
+            "getServiceInfo(uint256)",
+        }
+
+    def test_fallback_without_multicall(self) -> None:
+        """Test that the values are read one by one if Multicall3 is not deployed."""
+        self.aggregate3.side_effect = BadFunctionCallOutput("no code")
+        self.ledger_api.api.eth.call.side_effect = lambda tx: self._respond(
+            tx["to"], False, tx["data"]
+        )
+
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42
+        )
+
+        assert result["data"]["staking_state"] == 1
+        assert result["data"]["agent_ids"] == [25]
+        assert self.ledger_api.api.eth.call.call_count == 7
+
+    def test_only_the_optional_reads_may_fail(self) -> None:
+        """Test that only the agent ids are read with an allowed failure."""
+        ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42
+        )
+
+        agent_ids_selector = Web3.keccak(text="getAgentIds()")[:4]
+        calls = self.aggregate3.call_args.args[0]
+        assert {
+            call_data[:4] == agent_ids_selector
+            for _, allow_failure, call_data in calls
+            if allow_failure
+        } == {True}
+
+    def test_failed_optional_read_takes_its_default(self) -> None:
+        """Test that a failed optional read is mapped to its default value."""
+        agent_ids_selector = Web3.keccak(text="getAgentIds()")[:4]
+        self.aggregate3.side_effect = lambda calls: MagicMock(
+            call=MagicMock(
+                return_value=[
+                    (
+                        (False, b"")
+                        if call_data[:4] == agent_ids_selector
+                        else (True, self._respond(target, allow_failure, call_data))
+                    )
+                    for target, allow_failure, call_data in calls
+                ]
+            )
+        )
+
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42
+        )
+
+        assert result["data"]["agent_ids"] == []
+        assert result["data"]["staking_state"] == 1
+
+    def test_fallback_on_aggregate_revert(self) -> None:
+        """Test that the values are read one by one if the aggregate call reverts."""
+        self.aggregate3.side_effect = ContractLogicError("execution reverted")
+
+        def call(tx: Dict[str, Any]) -> bytes:
+            """Revert the optional read and respond to the rest."""
+            if tx["data"][:4] == Web3.keccak(text="getAgentIds()")[:4]:
+                raise ContractLogicError("execution reverted")
+            return self._respond(tx["to"], False, tx["data"])
+
+        self.ledger_api.api.eth.call.side_effect = call
+
+        result = ServiceStakingTokenContract.get_staking_snapshot(
+            self.ledger_api, CONTRACT_ADDRESS, service_id=42
+        )
+
+        assert result["data"]["staking_state"] == 1
+        assert result["data"]["agent_ids"] == []
+        assert self.ledger_api.api.eth.call.call_count == 7
+
+    def test_fallback_raises_the_failed_required_read(self) -> None:
+        """Test that a reverting required read still fails the snapshot."""
+        self.aggregate3.side_effect = ContractLogicError("execution reverted")
+        self.ledger_api.api.eth.call.side_effect = ContractLogicError(
+            "execution reverted"
+        )
+
+        with pytest.raises(ContractLogicError):
+            ServiceStakingTokenContract.get_staking_snapshot(
+                self.ledger_api, CONTRACT_ADDRESS, service_id=42
+            )
+
+
 PACKAGE_DIR = Path(__file__).parent.parent
 
 
@@ -20,6 +20,7 @@
 """Execution-aware Kelly criterion bet sizing for CLOB and FPMM markets."""
 
 import math
+from bisect import bisect_right
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 # --- Required / optional field contracts ---
@@ -51,6 +52,9 @@ OPTIONAL_FIELDS = frozenset(
         "bet_fee",
         "orderbook_asks_yes",
         "orderbook_asks_no",
+        # the same asks, pre-parsed into a `BookCurve` by the caller; preferred when given
+        "orderbook_curve_yes",
+        "orderbook_curve_no",
         # accepted but NOT consulted in the CLOB sizing path post-PR #971
         # (FOK takers are not share-count-constrained); still populated by
         # decision_receive.py — kept here to avoid breaking those callers.
@@ -78,41 +82,70 @@ DEFAULT_TOKEN_DECIMALS = 18
 # --- Execution models ---
 
 
-def walk_book(asks: List[Dict[str, str]], spend: float) -> Tuple[float, float]:
-    """Walk CLOB ask-side orderbook to simulate a market buy.
+BookCurve = Tuple[List[float], List[float], List[float]]
+
+
+def book_curve(asks: List[Dict[str, str]]) -> BookCurve:
+    """Parse and sort the CLOB ask-side orderbook once into cumulative curves.
 
     :param asks: ask levels from CLOB, each {"price": str, "size": str}.
-    :param spend: maximum amount to spend in native units.
-    :return: (cost, shares) tuple.
+    :return: (prices, cumulative costs, cumulative shares) of the valid levels, in ascending price order.
     """
-    if spend <= 0 or not asks:
-        return 0.0, 0.0
+    levels = [(float(level["price"]), float(level["size"])) for level in asks]
+    levels.sort(key=lambda level: level[0])
 
-    remaining = float(spend)
+    prices: List[float] = []
+    cum_costs: List[float] = []
+    cum_shares: List[float] = []
     cost = 0.0
     shares = 0.0
-
-    for level in sorted(asks, key=lambda a: float(a["price"])):
-        price = float(level["price"])
-        size = float(level["size"])
+    for price, size in levels:
         if price <= 0 or size <= 0:
             continue
+        cost += price * size
+        shares += size
+        prices.append(price)
+        cum_costs.append(cost)
+        cum_shares.append(shares)
 
-        level_cost = price * size
-        if level_cost <= remaining:
-            cost += level_cost
-            shares += size
-            remaining -= level_cost
-        else:
-            fill_shares = remaining / price
-            cost += remaining
-            shares += fill_shares
-            remaining = 0.0
-            break
+    return prices, cum_costs, cum_shares
+
+
+def walk_book_curve(curve: BookCurve, spend: float) -> Tuple[float, float]:
+    """Simulate a market buy on a pre-computed orderbook curve.
+
+    :param curve: the orderbook curve, as returned by `book_curve`.
+    :param spend: maximum amount to spend in native units.
+    :return: (cost, shares) tuple.
+    """
+    prices, cum_costs, cum_shares = curve
+    if spend <= 0 or not prices:
+        return 0.0, 0.0
+
+    # the number of levels that are fully filled with the given spend
+    n_filled = bisect_right(cum_costs, spend)
+    cost = cum_costs[n_filled - 1] if n_filled else 0.0
+    shares = cum_shares[n_filled - 1] if n_filled else 0.0
+    if n_filled < len(prices):
+        # partially fill the next level with the remaining spend
+        shares += (spend - cost) / prices[n_filled]
+        cost = float(spend)
 
     return cost, shares
 
 
+def walk_book(asks: List[Dict[str, str]], spend: float) -> Tuple[float, float]:
+    """Walk CLOB ask-side orderbook to simulate a market buy.
+
+    :param asks: ask levels from CLOB, each {"price": str, "size": str}.
+    :param spend: maximum amount to spend in native units.
+    :return: (cost, shares) tuple.
+    """
+    if spend <= 0 or not asks:
+        return 0.0, 0.0
+    return walk_book_curve(book_curve(asks), spend)
+
+
 def fpmm_execution(b: float, x: float, y: float, alpha: float) -> Tuple[float, float]:
     """FPMM constant-product AMM execution model.
 
@@ -150,6 +183,7 @@ def optimize_side(  # pylint: disable=too-many-arguments,too-many-locals
     x: float = 0.0,
     y: float = 0.0,
     alpha: float = 1.0,
+    curve: Optional[BookCurve] = None,
 ) -> Tuple[float, float, float, float]:
     """Grid-search for the spend that maximizes log-growth on one side.
 
@@ -164,6 +198,7 @@ def optimize_side(  # pylint: disable=too-many-arguments,too-many-locals
     :param x: FPMM selected token reserve.
     :param y: FPMM other token reserve.
     :param alpha: FPMM fee fraction.
+    :param curve: the pre-computed curve of the CLOB asks, used instead of parsing `asks`.
     :return: (best_spend, best_shares, best_G, G_baseline).
     """
     g_baseline = math.log(w_bet) if w_bet > 0 else -math.inf
@@ -180,12 +215,17 @@ def optimize_side(  # pylint: disable=too-many-arguments,too-many-locals
     best_g = g_baseline
 
     step = (b_max - b_min) / (grid_points - 1)
+    # the orderbook is parsed and sorted once, instead of once per candidate spend
+    if market_type != "clob":
+        curve = None
+    elif curve is None:
+        curve = book_curve(asks or [])
 
     for i in range(grid_points):
         b = b_min + i * step
 
-        if market_type == "clob":
-            cost, n_shares = walk_book(asks or [], b)
+        if curve is not None:
+            cost, n_shares = walk_book_curve(curve, b)
         else:
             cost, n_shares = fpmm_execution(b, x, y, alpha)
 
@@ -347,15 +387,28 @@ def run(**kwargs: Any) -> Dict[str, Any]:  # pylint: disable=too-many-locals
             asks_key = (
                 "orderbook_asks_yes" if side["vote"] == 0 else "orderbook_asks_no"
             )
+            curve_key = (
+                "orderbook_curve_yes" if side["vote"] == 0 else "orderbook_curve_no"
+            )
             asks = kwargs.get(asks_key)
-            if not asks:
+            curve = kwargs.get(curve_key)
+            if not asks and not curve:
                 msg = f"{label}: no orderbook asks available ({asks_key})"
                 info.append(msg)
                 all_rejections.append(msg)
                 continue
 
-            sorted_asks = sorted(asks, key=lambda a: float(a["price"]))
-            best_ask_price = float(sorted_asks[0]["price"])
+            if not curve:
+                curve = book_curve(asks)
+            ask_prices = curve[0]
+            if not ask_prices:
+                # every level has a non-positive price or size
+                msg = f"{label}: book filled to 0 at all grid points (thin or invalid)"
+                info.append(msg)
+                all_rejections.append(msg)
+                continue
+
+            best_ask_price = ask_prices[0]
 
             # No venue-minimum floor for CLOB: ``min_order_size`` (~5 shares)
             # is a maker/limit constraint, not enforced on the FOK *taker*
@@ -385,6 +438,7 @@ def run(**kwargs: Any) -> Dict[str, Any]:  # pylint: disable=too-many-locals
 
         else:  # fpmm
             asks = None
+            curve = None
             b_min_side = min_bet
             tokens_yes = kwargs.get("tokens_yes", 0) / scale
             tokens_no = kwargs.get("tokens_no", 0) / scale
@@ -414,6 +468,7 @@ def run(**kwargs: Any) -> Dict[str, Any]:  # pylint: disable=too-many-locals
             x=x_native,
             y=y_native,
             alpha=alpha,
+            curve=curve,
         )
 
         # True edge: oracle probability minus actual execution price (VWAP)
@@ -435,7 +490,7 @@ def run(**kwargs: Any) -> Dict[str, Any]:  # pylint: disable=too-many-locals
             # The book genuinely cannot fill (empty / all zero-price /
             # invalid): keep an explicit signal so a no-bet on a high-edge
             # market is not mistaken for a legitimately unprofitable one.
-            _, depth_shares = walk_book(sorted_asks, max_bet)
+            _, depth_shares = walk_book_curve(cast(BookCurve, curve), max_bet)
             if depth_shares <= 0:
                 msg = (
                     f"{label}: book filled to 0 at all grid points "
@@ -19,13 +19,19 @@
 
 """Tests for the kelly_criterion strategy."""
 
+import math
+import random
+from typing import Dict, List, Tuple
+
 import pytest
 
 from packages.valory.customs.kelly_criterion.kelly_criterion import (
+    book_curve,
     fpmm_execution,
     optimize_side,
     run,
     walk_book,
+    walk_book_curve,
 )
 
 # ---------------------------------------------------------------------------
@@ -76,6 +82,67 @@ FPMM_KWARGS = {
 }
 
 
+def _reference_walk_book(
+    asks: List[Dict[str, str]], spend: float
+) -> Tuple[float, float]:
+    """Walk the orderbook level by level, re-sorting and re-parsing it on every call."""
+    if spend <= 0 or not asks:
+        return 0.0, 0.0
+    remaining = float(spend)
+    cost = 0.0
+    shares = 0.0
+    for level in sorted(asks, key=lambda a: float(a["price"])):
+        price = float(level["price"])
+        size = float(level["size"])
+        if price <= 0 or size <= 0:
+            continue
+        level_cost = price * size
+        if level_cost <= remaining:
+            cost += level_cost
+            shares += size
+            remaining -= level_cost
+        else:
+            cost += remaining
+            shares += remaining / price
+            break
+    return cost, shares
+
+
+def _reference_optimize_side(  # pylint: disable=too-many-arguments
+    p: float,
+    w_bet: float,
+    b_min: float,
+    b_max: float,
+    fee: float,
+    grid_points: int,
+    asks: List[Dict[str, str]],
+) -> Tuple[float, float, float]:
+    """Grid-search the CLOB spend that maximizes log-growth, walking the raw orderbook for every candidate."""
+    best_spend, best_shares, best_g = 0.0, 0.0, math.log(w_bet)
+    step = (b_max - b_min) / (grid_points - 1)
+    for i in range(grid_points):
+        cost, n_shares = _reference_walk_book(asks, b_min + i * step)
+        w_win = w_bet - cost + n_shares - fee
+        w_lose = w_bet - cost - fee
+        if cost <= 0 or n_shares <= 0 or w_win <= 0 or w_lose <= 0:
+            continue
+        g = p * math.log(w_win) + (1 - p) * math.log(w_lose)
+        if g > best_g:
+            best_spend, best_shares, best_g = cost, n_shares, g
+    return best_spend, best_shares, best_g
+
+
+def _random_asks(rng: random.Random, n_levels: int) -> List[Dict[str, str]]:
+    """Generate an unsorted orderbook with random price levels and sizes."""
+    return [
+        {
+            "price": f"{rng.uniform(0.0, 0.99):.2f}",
+            "size": f"{rng.uniform(0.0, 50.0):.2f}",
+        }
+        for _ in range(n_levels)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # walk_book
 # ---------------------------------------------------------------------------
@@ -157,6 +224,50 @@ class TestWalkBook:
         assert shares == pytest.approx(10.0)
 
 
+# ---------------------------------------------------------------------------
+# book_curve / walk_book_curve
+# ---------------------------------------------------------------------------
+
+
+class TestBookCurve:
+    """Tests for the pre-computed CLOB orderbook curve."""
+
+    def test_sorts_and_accumulates(self) -> None:
+        """Levels are sorted by price and accumulated, skipping invalid ones."""
+        asks = [
+            {"price": "0.60", "size": "10"},
+            {"price": "0", "size": "100"},
+            {"price": "0.50", "size": "10"},
+            {"price": "0.55", "size": "0"},
+        ]
+        prices, cum_costs, cum_shares = book_curve(asks)
+        assert prices == [0.5, 0.6]
+        assert cum_costs == pytest.approx([5.0, 11.0])
+        assert cum_shares == pytest.approx([10.0, 20.0])
+
+    def test_walk_exhausts_book(self) -> None:
+        """A spend above the book's depth fills every level and nothing more."""
+        cost, shares = walk_book_curve(book_curve(SAMPLE_ASKS), spend=1000.0)
+        assert cost == pytest.approx(172.0)
+        assert shares == pytest.approx(300.0)
+
+    def test_walk_empty_curve(self) -> None:
+        """An empty curve returns zero."""
+        assert walk_book_curve(book_curve([]), spend=10.0) == (0.0, 0.0)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference_walk(self, seed: int) -> None:
+        """Walking the curve matches walking the raw orderbook level by level."""
+        rng = random.Random(seed)
+        asks = _random_asks(rng, n_levels=20)
+        curve = book_curve(asks)
+        for _ in range(50):
+            spend = rng.uniform(-1.0, 300.0)
+            assert walk_book_curve(curve, spend) == pytest.approx(
+                _reference_walk_book(asks, spend)
+            )
+
+
 # ---------------------------------------------------------------------------
 # fpmm_execution
 # ---------------------------------------------------------------------------
@@ -319,6 +430,25 @@ class TestOptimizeSide:
         # Should still produce a result (2 grid points: b_min and b_max)
         assert best_g >= g_baseline
 
+    @pytest.mark.parametrize("seed", range(5))
+    def test_clob_matches_reference_grid_search(self, seed: int) -> None:
+        """The CLOB search on the pre-computed curve matches the per-candidate orderbook walk."""
+        rng = random.Random(seed)
+        asks = _random_asks(rng, n_levels=30)
+        kwargs = dict(
+            p=rng.uniform(0.5, 0.95),
+            w_bet=rng.uniform(1.0, 20.0),
+            b_min=0.01,
+            b_max=rng.uniform(1.0, 20.0),
+            fee=0.01,
+            grid_points=500,
+        )
+        best_spend, best_shares, best_g, _ = optimize_side(
+            market_type="clob", asks=asks, **kwargs  # type: ignore[arg-type]
+        )
+        expected = _reference_optimize_side(asks=asks, **kwargs)  # type: ignore[arg-type]
+        assert (best_spend, best_shares, best_g) == pytest.approx(expected)
+
     def test_b_min_clamped_to_b_max(self) -> None:
         """When b_min > b_max, b_min is clamped to b_max."""
         best_spend, _, _, _ = optimize_side(
@@ -617,6 +747,39 @@ class TestRunClob:
         # Should still work — zero-price level is skipped
         assert result["bet_amount"] > 0
 
+    def test_precomputed_curve_matches_asks(self) -> None:
+        """A pre-computed curve sizes exactly as the asks it was computed from."""
+        curve_kwargs = {
+            **CLOB_KWARGS,
+            "orderbook_asks_yes": None,
+            "orderbook_curve_yes": book_curve(CLOB_KWARGS["orderbook_asks_yes"]),
+        }
+        result = run(**curve_kwargs)
+        expected = run(**CLOB_KWARGS)
+        assert result["bet_amount"] == expected["bet_amount"] > 0
+        assert result["vote"] == expected["vote"]
+
+    def test_precomputed_curve_is_preferred(self) -> None:
+        """The asks are not parsed when a pre-computed curve is given."""
+        kwargs = {
+            **CLOB_KWARGS,
+            "orderbook_asks_yes": [{"price": "unparseable", "size": "100"}],
+            "orderbook_curve_yes": book_curve(CLOB_KWARGS["orderbook_asks_yes"]),
+        }
+        assert run(**kwargs)["bet_amount"] > 0
+
+    def test_empty_precomputed_curve_emits_rejection(self) -> None:
+        """A pre-computed curve without valid levels rejects the side."""
+        kwargs = {
+            **CLOB_KWARGS,
+            "orderbook_asks_yes": None,
+            "orderbook_curve_yes": ([], [], []),
+        }
+        result = run(**kwargs)
+        assert result["bet_amount"] == 0
+        info_text = " ".join(result.get("info", []))
+        assert "yes: book filled to 0 at all grid points" in info_text
+
     def test_return_format(self) -> None:
         """Result dict has all required keys."""
         result = run(**CLOB_KWARGS)
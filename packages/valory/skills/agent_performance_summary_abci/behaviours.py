@@ -183,7 +183,7 @@ class FetchPerformanceSummaryBehaviour(
 
     def _should_update(self) -> bool:
         """Check if we should update."""
-        existing_summary = self.shared_state.read_existing_performance_summary()
+        existing_summary = self.shared_state.get_performance_summary()
 
         if not existing_summary or self.synchronized_data.period_count == 0:
             return True  # First run
@@ -20,8 +20,22 @@
 
 """Helper for fetching and formatting predictions data."""
 
+import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, List
+
+from packages.valory.skills.market_manager_abci.bets_journal import load_raw_bets
+
+MULTI_BETS_FILENAME = "multi_bets.json"
+
+
+def load_multi_bets_data(store_path: str) -> List[Dict]:
+    """Load the raw bets from `multi_bets.json`, applying the journal of the changes not yet compacted into it.
+
+    :param store_path: the path of the agent's store.
+    :return: the raw bets.
+    """
+    return load_raw_bets(os.path.join(store_path, MULTI_BETS_FILENAME))
 
 
 class PredictionsFetcher(ABC):
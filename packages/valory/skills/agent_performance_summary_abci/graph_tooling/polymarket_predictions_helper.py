@@ -29,6 +29,7 @@ import requests
 
 from packages.valory.skills.agent_performance_summary_abci.graph_tooling.base_predictions_helper import (
     PredictionsFetcher,
+    load_multi_bets_data,
 )
 from packages.valory.skills.agent_performance_summary_abci.graph_tooling.mech_analytics_client import (
     PER_POSITION_LOOKUP_WINDOW_DAYS,
@@ -769,11 +770,7 @@ class PolymarketPredictionsFetcher(
     def _load_multi_bets_data(self, store_path: str) -> List[Dict]:
         """Load data from multi_bets.json file."""
         try:
-            import os
-
-            multi_bets_path = os.path.join(store_path, "multi_bets.json")
-            with open(multi_bets_path, "r") as f:
-                return json.load(f)
+            return load_multi_bets_data(store_path)
         except Exception as e:
             self.logger.error(f"Error loading multi_bets.json: {e}")
             return []
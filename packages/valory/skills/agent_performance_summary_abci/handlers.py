@@ -20,9 +20,11 @@
 
 """This module contains the handlers for the 'agent_performance_summary' skill."""
 
+import asyncio
+import concurrent.futures
 import json
 import re
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from http import HTTPStatus
@@ -94,6 +96,11 @@ VALID_PREDICTION_STATUSES = [
     PREDICTION_STATUS_INVALID,
 ]
 SECONDS_PER_DAY = 86400
+# the maximum number of requests whose blocking work runs concurrently off the agent's event loop
+HTTP_REQUEST_WORKERS = 4
+# the time after which a deferred request is answered with a gateway timeout,
+# kept below the 30 seconds after which the http server connection drops the request
+HTTP_REQUEST_TIMEOUT_SECONDS = 25.0
 
 
 class HttpMethod(Enum):
@@ -124,6 +131,18 @@ class HttpContentType(Enum):
 DEFAULT_HEADER = HttpContentType.HTML.header
 
 
+@dataclass
+class DeferredRequest:
+    """An HTTP request whose response is sent once its blocking work has completed."""
+
+    http_msg: HttpMessage
+    http_dialogue: HttpDialogue
+    respond: Callable[[Any], None]
+    error: Dict[str, str]
+    timer: Optional[asyncio.TimerHandle] = None
+    responded: bool = False
+
+
 AgentPerformanceSummaryABCIHandler = ABCIRoundHandler
 SigningHandler = BaseSigningHandler
 LedgerApiHandler = BaseLedgerApiHandler
@@ -142,6 +161,11 @@ class HttpHandler(BaseHttpHandler):
         super().__init__(**kwargs)
         self.handler_url_regex: str = ""
         self.routes: Dict[tuple, list] = {}
+        self._request_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=HTTP_REQUEST_WORKERS, thread_name_prefix="http-request"
+        )
+        # the number of deferred requests whose blocking work has not completed yet
+        self._requests_in_flight = 0
 
     @property
     def synchronized_data(self) -> BaseSynchronizedData:
@@ -220,11 +244,112 @@ class HttpHandler(BaseHttpHandler):
             ],
         }
 
+    def teardown(self) -> None:
+        """Tear down the handler."""
+        super().teardown()
+        self._request_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_deferred(
+        self,
+        http_msg: HttpMessage,
+        http_dialogue: HttpDialogue,
+        work: Callable[[], Any],
+        respond: Callable[[Any], None],
+        error: Dict[str, str],
+        reject_when_busy: bool = True,
+    ) -> None:
+        """Run the blocking work of a request off the agent's event loop, and respond when it completes.
+
+        The work runs on a bounded worker pool, so that slow subgraphs and APIs cannot freeze the agent.
+        The response is sent from the agent's event loop, as the outbox and the dialogues are not thread-safe.
+        If all the workers are busy, the request is rejected, unless it should rather wait for a worker,
+        and if the work does not complete in time, the request is answered with a gateway timeout
+        and the late result is dropped.
+
+        :param http_msg: the HTTP request.
+        :param http_dialogue: the HTTP dialogue.
+        :param work: the blocking work, which must not send any message.
+        :param respond: the callback which sends the response, given the result of the work.
+        :param error: the body of the internal server error response, sent if the work fails.
+        :param reject_when_busy: whether to reject the request if all the workers are busy.
+        """
+        request = DeferredRequest(http_msg, http_dialogue, respond, error)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # not called from the agent's event loop, so there is no loop to defer the response to
+            self._complete_deferred(request, work)
+            return
+
+        if reject_when_busy and self._requests_in_flight >= HTTP_REQUEST_WORKERS:
+            self.context.logger.warning(
+                f"Rejecting {http_msg.url!r}: {self._requests_in_flight} requests are already in flight."
+            )
+            self._send_too_many_requests_response(
+                http_msg, http_dialogue, {"error": "Too many requests, retry later."}
+            )
+            return
+
+        self._requests_in_flight += 1
+        request.timer = loop.call_later(
+            HTTP_REQUEST_TIMEOUT_SECONDS, self._timeout_deferred, request
+        )
+
+        def on_done(future: concurrent.futures.Future) -> None:
+            """Hand the outcome of the work back to the agent's event loop."""
+            try:
+                loop.call_soon_threadsafe(
+                    self._complete_deferred, request, future.result
+                )
+            except RuntimeError:
+                # the event loop has been closed, as the agent is stopping
+                pass
+
+        self._request_executor.submit(work).add_done_callback(on_done)
+
+    def _complete_deferred(
+        self, request: DeferredRequest, outcome: Callable[[], Any]
+    ) -> None:
+        """Respond to a deferred request with the outcome of its work, unless it has timed out."""
+        if request.timer is not None:
+            self._requests_in_flight -= 1
+            request.timer.cancel()
+        if request.responded:
+            self.context.logger.warning(
+                f"Dropping the late result of {request.http_msg.url!r}."
+            )
+            return
+        request.responded = True
+
+        try:
+            request.respond(outcome())
+        except Exception as e:
+            self.context.logger.error(f"Error handling {request.http_msg.url!r}: {e}")
+            self._send_internal_server_error_response(
+                request.http_msg, request.http_dialogue, request.error
+            )
+
+    def _timeout_deferred(self, request: DeferredRequest) -> None:
+        """Answer a deferred request whose work has not completed in time."""
+        if request.responded:
+            return
+        request.responded = True
+        self.context.logger.error(
+            f"Timed out after {HTTP_REQUEST_TIMEOUT_SECONDS}s handling {request.http_msg.url!r}."
+        )
+        self._send_http_response(
+            request.http_msg,
+            request.http_dialogue,
+            {"error": "The request timed out."},
+            HTTPStatus.GATEWAY_TIMEOUT.value,
+            HTTPStatus.GATEWAY_TIMEOUT.phrase,
+        )
+
     def _handle_get_agent_details(
         self, http_msg: HttpMessage, http_dialogue: HttpDialogue
     ) -> None:
         """Handle GET /api/v1/agent/details request."""
-        summary = self.shared_state.read_existing_performance_summary()
+        summary = self.shared_state.get_performance_summary()
         details = summary.agent_details
 
         if not details:
@@ -450,7 +575,7 @@ class HttpHandler(BaseHttpHandler):
         """
         try:
             safe_address = self.synchronized_data.safe_contract_address.lower()
-            summary = self.shared_state.read_existing_performance_summary()
+            summary = self.shared_state.get_performance_summary()
             performance = summary.agent_performance
 
             if not performance:
@@ -506,7 +631,7 @@ class HttpHandler(BaseHttpHandler):
             skip = (page - 1) * page_size
 
             # Check stored history first
-            summary = self.shared_state.read_existing_performance_summary()
+            summary = self.shared_state.get_performance_summary()
             history = summary.prediction_history
 
             if history and history.stored_count > 0 and skip < history.stored_count:
@@ -532,28 +657,43 @@ class HttpHandler(BaseHttpHandler):
 
             # Fetch from subgraph
             self.context.logger.info(f"Querying subgraph (page {page})")
-            fetcher = PredictionsFetcher(self.context, self.context.logger)
-            result = fetcher.fetch_predictions(
-                safe_address=safe_address,
-                first=page_size,
-                skip=skip,
-                status_filter=(
-                    status_filter if status_filter != PREDICTION_STATUS_ALL else None
-                ),
-            )
 
-            response = {
-                "agent_id": safe_address,
-                "currency": "USD",
-                "page": page,
-                "page_size": page_size,
-                "total": result["total_predictions"],
-                "items": result["items"],
-                "last_updated": None,
-            }
+            def fetch_predictions() -> Dict[str, Any]:
+                """Query the predictions from the subgraph."""
+                fetcher = PredictionsFetcher(self.context, self.context.logger)
+                return fetcher.fetch_predictions(
+                    safe_address=safe_address,
+                    first=page_size,
+                    skip=skip,
+                    status_filter=(
+                        status_filter
+                        if status_filter != PREDICTION_STATUS_ALL
+                        else None
+                    ),
+                )
 
-            self.context.logger.info(f"Sending {len(result['items'])} predictions")
-            self._send_ok_response(http_msg, http_dialogue, response)
+            def respond(result: Dict[str, Any]) -> None:
+                """Send the fetched predictions."""
+                response = {
+                    "agent_id": safe_address,
+                    "currency": "USD",
+                    "page": page,
+                    "page_size": page_size,
+                    "total": result["total_predictions"],
+                    "items": result["items"],
+                    "last_updated": None,
+                }
+
+                self.context.logger.info(f"Sending {len(result['items'])} predictions")
+                self._send_ok_response(http_msg, http_dialogue, response)
+
+            self._run_deferred(
+                http_msg,
+                http_dialogue,
+                fetch_predictions,
+                respond,
+                {"error": "Failed to fetch predictions"},
+            )
 
         except Exception as e:
             self.context.logger.error(f"Error in predictions endpoint: {e}")
@@ -626,7 +766,7 @@ class HttpHandler(BaseHttpHandler):
                 return
 
             safe_address = self.synchronized_data.safe_contract_address.lower()
-            summary = self.shared_state.read_existing_performance_summary()
+            summary = self.shared_state.get_performance_summary()
             profit_data = summary.profit_over_time
 
             if not profit_data or not profit_data.data_points:
@@ -792,14 +932,26 @@ class HttpHandler(BaseHttpHandler):
 
             store_path = str(self.context.params.store_path)
 
-            response = fetcher.fetch_position_details(bet_id, safe_address, store_path)
+            def respond(response: Optional[Dict[str, Any]]) -> None:
+                """Send the fetched position details."""
+                if not response:
+                    self._send_not_found_response(http_msg, http_dialogue)
+                    return
 
-            if not response:
-                self._send_not_found_response(http_msg, http_dialogue)
-                return
+                self.context.logger.info(
+                    f"Sending position details for market: {bet_id}"
+                )
+                self._send_ok_response(http_msg, http_dialogue, response)
 
-            self.context.logger.info(f"Sending position details for market: {bet_id}")
-            self._send_ok_response(http_msg, http_dialogue, response)
+            self._run_deferred(
+                http_msg,
+                http_dialogue,
+                lambda: fetcher.fetch_position_details(
+                    bet_id, safe_address, store_path
+                ),
+                respond,
+                {"error": "Failed to fetch position details"},
+            )
 
         except Exception as e:
             self.context.logger.error(f"Error in position details endpoint: {str(e)}")
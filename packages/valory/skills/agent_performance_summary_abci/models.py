@@ -26,7 +26,9 @@ import os
 import tempfile
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
+
+from aea.skills.base import SkillContext
 
 from packages.valory.protocols.http import HttpMessage
 from packages.valory.skills.abstract_round_abci.base import AbciApp
@@ -384,6 +386,14 @@ class SharedState(BaseSharedState):
 
     abci_app_cls: Type[AbciApp] = AgentPerformanceSummaryAbciApp
 
+    def __init__(self, *args: Any, skill_context: SkillContext, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, skill_context=skill_context, **kwargs)
+        # the last parsed summary, keyed on the ``(mtime_ns, size)`` of the file it was parsed from
+        self._cached_summary: Optional[
+            Tuple[Tuple[int, int], AgentPerformanceSummary]
+        ] = None
+
     @property
     def params(self) -> AgentPerformanceSummaryParams:
         """Return the params."""
@@ -426,6 +436,33 @@ class SharedState(BaseSharedState):
             )
             return AgentPerformanceSummary()
 
+    def get_performance_summary(self) -> AgentPerformanceSummary:
+        """Get the agent performance summary, parsing the file only if it has changed since the last read.
+
+        The returned summary is shared across the callers and must not be mutated.
+        Use ``read_existing_performance_summary`` to get a copy that can be modified and written back.
+
+        :return: the cached agent performance summary.
+        """
+        file_path = self.params.store_path / AGENT_PERFORMANCE_SUMMARY_FILE
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self._cached_summary = None
+            return self.read_existing_performance_summary()
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._cached_summary is not None and self._cached_summary[0] == key:
+            return self._cached_summary[1]
+
+        summary = self.read_existing_performance_summary()
+        self._cached_summary = key, summary
+        return summary
+
+    def invalidate_performance_summary(self) -> None:
+        """Drop the cached agent performance summary, so that the next read parses the file."""
+        self._cached_summary = None
+
     def read_offchain_deposits_from_disk(self) -> Optional["OffchainDepositState"]:
         """Return the persisted ``offchain_deposits`` sub-field with lenient parsing.
 
@@ -503,6 +540,7 @@ class SharedState(BaseSharedState):
             raw = {}
 
         raw["offchain_deposits"] = asdict(state)
+        self.invalidate_performance_summary()
 
         # tempfile in the same directory so ``os.replace`` is atomic on
         # POSIX (both paths on one filesystem).
@@ -536,6 +574,7 @@ class SharedState(BaseSharedState):
             copy with.
         """
         file_path = self.params.store_path / AGENT_PERFORMANCE_SUMMARY_FILE
+        self.invalidate_performance_summary()
 
         # tempfile in the same directory so ``os.replace`` is atomic on
         # POSIX (both paths on one filesystem).
@@ -19,14 +19,20 @@
 
 """This module contains tests for the PredictionsFetcher abstract base class."""
 
+import hashlib
+import json
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 
 from packages.valory.skills.agent_performance_summary_abci.graph_tooling.base_predictions_helper import (
+    MULTI_BETS_FILENAME,
     PredictionsFetcher,
+    load_multi_bets_data,
 )
+from packages.valory.skills.market_manager_abci.bets_journal import JOURNAL_SUFFIX
 
 
 class ConcretePredictionsFetcher(PredictionsFetcher):
@@ -168,3 +174,40 @@ class TestPredictionsFetcherABC:
     def test_abstract_method_count(self) -> None:
         """Test that there are exactly 19 abstract methods."""
         assert len(PredictionsFetcher.__abstractmethods__) == 19
+
+
+class TestLoadMultiBetsData:
+    """Tests for load_multi_bets_data."""
+
+    @staticmethod
+    def _write(tmp_path: Path, bets: Any, journal_lines: Any = None) -> None:
+        """Write a snapshot and, optionally, a journal."""
+        snapshot = json.dumps(bets)
+        (tmp_path / MULTI_BETS_FILENAME).write_text(snapshot)
+        if journal_lines is None:
+            return
+        header = {"snapshot": hashlib.sha256(snapshot.encode()).hexdigest()}
+        lines = [json.dumps(header)] + list(journal_lines)
+        journal_path = tmp_path / (MULTI_BETS_FILENAME + JOURNAL_SUFFIX)
+        journal_path.write_text("\n".join(lines) + "\n")
+
+    def test_snapshot_only(self, tmp_path: Path) -> None:
+        """Test loading a snapshot without a journal."""
+        self._write(tmp_path, [{"id": "m1"}])
+        assert load_multi_bets_data(str(tmp_path)) == [{"id": "m1"}]
+
+    def test_journal_is_replayed(self, tmp_path: Path) -> None:
+        """Test that the journaled updates are applied to the snapshot."""
+        record = {"size": 2, "updates": {"0": {"id": "m1", "v": 2}, "1": {"id": "m2"}}}
+        self._write(tmp_path, [{"id": "m1", "v": 1}], [json.dumps(record), '{"size'])
+        assert load_multi_bets_data(str(tmp_path)) == [
+            {"id": "m1", "v": 2},
+            {"id": "m2"},
+        ]
+
+    def test_stale_journal_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a journal of a different snapshot is ignored."""
+        record = {"size": 1, "updates": {"0": {"id": "other"}}}
+        self._write(tmp_path, [{"id": "m1"}], [json.dumps(record)])
+        (tmp_path / MULTI_BETS_FILENAME).write_text(json.dumps([{"id": "m3"}]))
+        assert load_multi_bets_data(str(tmp_path)) == [{"id": "m3"}]
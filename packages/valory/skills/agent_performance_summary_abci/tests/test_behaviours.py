@@ -348,7 +348,7 @@ class TestShouldUpdate:
         """Returns True when no existing summary exists."""
         b = self._make()
         ctx, params, synced_data, state = _mock_context()
-        state.read_existing_performance_summary.return_value = None
+        state.get_performance_summary.return_value = None
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
@@ -360,7 +360,7 @@ class TestShouldUpdate:
         """Returns True when period_count is 0."""
         b = self._make()
         ctx, params, synced_data, state = _mock_context(period_count=0)
-        state.read_existing_performance_summary.return_value = _default_summary()
+        state.get_performance_summary.return_value = _default_summary()
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
@@ -373,7 +373,7 @@ class TestShouldUpdate:
         b = self._make()
         ctx, params, synced_data, state = _mock_context(synced_timestamp=1700000000)
         summary = _default_summary(timestamp=1700000000)
-        state.read_existing_performance_summary.return_value = summary
+        state.get_performance_summary.return_value = summary
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
@@ -387,7 +387,7 @@ class TestShouldUpdate:
         b = self._make(_update_interval=1800)
         ctx, params, synced_data, state = _mock_context(synced_timestamp=1700002000)
         summary = _default_summary(timestamp=1700000000)
-        state.read_existing_performance_summary.return_value = summary
+        state.get_performance_summary.return_value = summary
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
@@ -401,7 +401,7 @@ class TestShouldUpdate:
         b = self._make(_update_interval=1800)
         ctx, params, synced_data, state = _mock_context(synced_timestamp=1700000100)
         summary = _default_summary(timestamp=1700000000)
-        state.read_existing_performance_summary.return_value = summary
+        state.get_performance_summary.return_value = summary
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
@@ -415,7 +415,7 @@ class TestShouldUpdate:
         b = self._make(_update_interval=1800)  # type: ignore[arg-type]
         ctx, params, synced_data, state = _mock_context(synced_timestamp=1700002000)
         summary = _default_summary(timestamp=None)  # type: ignore[arg-type]
-        state.read_existing_performance_summary.return_value = summary
+        state.get_performance_summary.return_value = summary
         with (
             _patch_context(b, ctx, synced_data)[0],
             _patch_context(b, ctx, synced_data)[1],
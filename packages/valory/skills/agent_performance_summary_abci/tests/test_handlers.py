@@ -19,9 +19,13 @@
 
 """Tests for agent_performance_summary_abci/handlers.py."""
 
+import asyncio
+import concurrent.futures
 import json
+import threading
 from datetime import datetime, timezone
-from typing import List, Optional
+from http import HTTPStatus
+from typing import Any, Callable, List, Optional
 from unittest.mock import MagicMock, patch
 
 from packages.valory.protocols.http.message import HttpMessage
@@ -50,6 +54,7 @@ from packages.valory.skills.agent_performance_summary_abci.handlers import (
     AgentPerformanceSummaryABCIHandler,
     ContractApiHandler,
     DEFAULT_PAGE_SIZE,
+    HTTP_REQUEST_WORKERS,
     HttpContentType,
     HttpHandler,
     HttpMethod,
@@ -108,9 +113,7 @@ def _make_handler(
     handler.context = context  # type: ignore[assignment]
 
     shared_state = MagicMock()
-    shared_state.read_existing_performance_summary.return_value = (
-        AgentPerformanceSummary()
-    )
+    shared_state.get_performance_summary.return_value = AgentPerformanceSummary()
     handler.shared_state = shared_state  # type: ignore[assignment]
 
     sync_data = MagicMock()
@@ -751,7 +754,7 @@ class TestHandleGetAgentDetails:
             last_active_at="2024-06-01T12:00:00Z",
         )
         summary = AgentPerformanceSummary(agent_details=details)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -766,7 +769,7 @@ class TestHandleGetAgentDetails:
     def test_returns_error_when_details_missing(self) -> None:
         """Test returns 500 error when agent details are not available."""
         summary = AgentPerformanceSummary(agent_details=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -782,7 +785,7 @@ class TestHandleGetAgentDetails:
         """Test logger is called with agent details."""
         details = AgentDetails(id="test-id")
         summary = AgentPerformanceSummary(agent_details=details)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -826,7 +829,7 @@ class TestHandleGetAgentPerformance:
         """Test response always has window='lifetime' and currency='USD'."""
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         summary = self._make_performance_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -842,7 +845,7 @@ class TestHandleGetAgentPerformance:
             url="http://localhost:8080/api/v1/agent/performance?window=7d&currency=EUR"
         )
         summary = self._make_performance_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -856,7 +859,7 @@ class TestHandleGetAgentPerformance:
         """Test returns 500 when performance data is unavailable."""
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         summary = AgentPerformanceSummary(agent_performance=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -870,7 +873,7 @@ class TestHandleGetAgentPerformance:
         """Test response includes the safe_contract_address as agent_id."""
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         summary = self._make_performance_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -885,7 +888,7 @@ class TestHandleGetAgentPerformance:
         metrics = PerformanceMetricsData(all_time_profit=200.0, roi=15.0)
         stats = PerformanceStatsData(predictions_made=100, prediction_accuracy=80.0)
         summary = self._make_performance_summary(metrics=metrics, stats=stats)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -900,7 +903,7 @@ class TestHandleGetAgentPerformance:
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         perf = AgentPerformanceData(metrics=None, stats=None)
         summary = AgentPerformanceSummary(agent_performance=perf)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -915,7 +918,7 @@ class TestHandleGetAgentPerformance:
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         summary = self._make_performance_summary()
         summary.timestamp = 1735776000  # 2025-01-02T00:00:00Z
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -929,7 +932,7 @@ class TestHandleGetAgentPerformance:
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
         summary = self._make_performance_summary()
         summary.timestamp = None
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -942,7 +945,7 @@ class TestHandleGetAgentPerformance:
     def test_exception_returns_internal_error(self) -> None:
         """Test exception in handler returns 500."""
         http_msg = _make_http_msg(url="http://localhost:8080/api/v1/agent/performance")
-        self.handler.shared_state.read_existing_performance_summary.side_effect = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.side_effect = (  # type: ignore[attr-defined]
             RuntimeError("DB error")
         )
 
@@ -1144,7 +1147,7 @@ class TestHandleGetPredictions:
             items=items,
         )
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1172,7 +1175,7 @@ class TestHandleGetPredictions:
             items=items,
         )
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1200,7 +1203,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1232,7 +1235,7 @@ class TestHandleGetPredictions:
             items=[{"id": str(i)} for i in range(5)],
         )
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1257,7 +1260,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history?status=all"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1284,7 +1287,7 @@ class TestHandleGetPredictions:
         )
         history = PredictionHistory(total_predictions=0, stored_count=0, items=[])
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1312,7 +1315,7 @@ class TestHandleGetPredictions:
             last_updated=1735776000,  # 2025-01-02T00:00:00Z
         )
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1327,7 +1330,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1349,7 +1352,7 @@ class TestHandleGetPredictions:
         http_msg = _make_http_msg(
             url="http://localhost:8080/api/v1/agent/prediction-history"
         )
-        self.handler.shared_state.read_existing_performance_summary.side_effect = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.side_effect = (  # type: ignore[attr-defined]
             RuntimeError("unexpected")
         )
 
@@ -1367,7 +1370,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history?page=2&page_size=5"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1395,7 +1398,7 @@ class TestHandleGetPredictions:
         items = [{"id": "1", "status": "won"}]
         history = PredictionHistory(total_predictions=1, stored_count=1, items=items)
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1410,7 +1413,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1434,7 +1437,7 @@ class TestHandleGetPredictions:
             url="http://localhost:8080/api/v1/agent/prediction-history?status=won"
         )
         summary = AgentPerformanceSummary(prediction_history=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1498,7 +1501,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time"
         )
         summary = self._make_profit_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1513,7 +1516,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time?window=7d"
         )
         summary = self._make_profit_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1544,7 +1547,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time"
         )
         summary = AgentPerformanceSummary(profit_over_time=None)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1566,7 +1569,7 @@ class TestHandleGetProfitOverTime:
         )
         profit = ProfitOverTimeData(last_updated=0, total_days=0, data_points=[])
         summary = AgentPerformanceSummary(profit_over_time=profit)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1582,7 +1585,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time"
         )
         summary = self._make_profit_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1601,7 +1604,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time"
         )
         summary = self._make_profit_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1619,7 +1622,7 @@ class TestHandleGetProfitOverTime:
         summary = self._make_profit_summary()
         assert summary.profit_over_time is not None
         summary.profit_over_time.last_updated = 1735776000  # 2025-01-02T00:00:00Z
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -1633,7 +1636,7 @@ class TestHandleGetProfitOverTime:
         http_msg = _make_http_msg(
             url="http://localhost:8080/api/v1/agent/profit-over-time"
         )
-        self.handler.shared_state.read_existing_performance_summary.side_effect = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.side_effect = (  # type: ignore[attr-defined]
             RuntimeError("DB error")
         )
 
@@ -1651,7 +1654,7 @@ class TestHandleGetProfitOverTime:
             url="http://localhost:8080/api/v1/agent/profit-over-time?flagonly&window=7d"
         )
         summary = self._make_profit_summary()
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2157,7 +2160,7 @@ class TestProfitOverTimeTimestampFormatting:
             last_updated=1704067200, total_days=1, data_points=points
         )
         summary = AgentPerformanceSummary(profit_over_time=profit)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2183,7 +2186,7 @@ class TestProfitOverTimeTimestampFormatting:
             last_updated=1704067200, total_days=1, data_points=points
         )
         summary = AgentPerformanceSummary(profit_over_time=profit)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2210,7 +2213,7 @@ class TestEdgeCases:
         """Test agent details with all None fields."""
         details = AgentDetails(id=None, created_at=None, last_active_at=None)
         summary = AgentPerformanceSummary(agent_details=details)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
         http_msg = _make_http_msg()
@@ -2249,7 +2252,7 @@ class TestEdgeCases:
             metrics=PerformanceMetricsData(), stats=PerformanceStatsData()
         )
         summary = AgentPerformanceSummary(agent_performance=perf)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2276,7 +2279,7 @@ class TestEdgeCases:
         ]
         profit = ProfitOverTimeData(last_updated=now, total_days=1, data_points=points)
         summary = AgentPerformanceSummary(profit_over_time=profit)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2301,7 +2304,7 @@ class TestEdgeCases:
         ]
         profit = ProfitOverTimeData(last_updated=now, total_days=1, data_points=points)
         summary = AgentPerformanceSummary(profit_over_time=profit)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2360,7 +2363,7 @@ class TestEdgeCases:
         items = [{"id": str(i), "status": "won"} for i in range(5)]
         history = PredictionHistory(total_predictions=5, stored_count=5, items=items)
         summary = AgentPerformanceSummary(prediction_history=history)
-        self.handler.shared_state.read_existing_performance_summary.return_value = (  # type: ignore[attr-defined]
+        self.handler.shared_state.get_performance_summary.return_value = (  # type: ignore[attr-defined]
             summary
         )
 
@@ -2386,3 +2389,147 @@ class TestEdgeCases:
         result = self.handler._filter_profit_data_by_window([], "7d")
         for point in result:
             assert point.daily_mech_requests == 0
+
+
+# ---------------------------------------------------------------------------
+# Deferred requests
+# ---------------------------------------------------------------------------
+
+
+class TestRunDeferred:
+    """Tests for running the blocking work of a request off the event loop."""
+
+    def setup_method(self) -> None:
+        """Set up a handler with a worker pool."""
+        self.handler = _make_handler()
+        self.handler._request_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=HTTP_REQUEST_WORKERS
+        )
+        self.handler._requests_in_flight = 0
+        self.http_msg = _make_http_msg()
+        self.http_dialogue = MagicMock()
+
+    def teardown_method(self) -> None:
+        """Shut down the worker pool."""
+        self.handler._request_executor.shutdown(wait=True)
+
+    def _run(self, work: Callable[[], Any], wait: float = 1.0) -> MagicMock:
+        """Defer the given work from a running event loop and return the respond callback."""
+        respond = MagicMock()
+
+        async def run() -> None:
+            """Defer the work and let the loop run the callbacks."""
+            self.handler._run_deferred(
+                self.http_msg, self.http_dialogue, work, respond, {"error": "failed"}
+            )
+            await asyncio.sleep(wait)
+
+        asyncio.run(run())
+        return respond
+
+    def test_responds_on_the_event_loop_thread(self) -> None:
+        """The work runs on a worker, and the response is sent from the event loop's thread."""
+        threads = {}
+
+        def work() -> str:
+            """Record the worker's thread."""
+            threads["work"] = threading.current_thread()
+            return "result"
+
+        respond = self._run(work, wait=0.1)
+
+        respond.assert_called_once_with("result")
+        assert threads["work"] is not threading.main_thread()
+        assert self.handler._requests_in_flight == 0
+
+    def test_without_event_loop_runs_inline(self) -> None:
+        """Outside an event loop, the work runs inline."""
+        respond = MagicMock()
+        self.handler._run_deferred(
+            self.http_msg, self.http_dialogue, lambda: 42, respond, {"error": "x"}
+        )
+        respond.assert_called_once_with(42)
+
+    def test_rejects_when_all_workers_are_busy(self) -> None:
+        """A request is rejected with too many requests when the pool is full."""
+        self.handler._requests_in_flight = HTTP_REQUEST_WORKERS
+        with patch.object(
+            self.handler, "_send_too_many_requests_response"
+        ) as mock_reject:
+            respond = self._run(lambda: "result", wait=0.01)
+        mock_reject.assert_called_once()
+        respond.assert_not_called()
+
+    def test_waits_for_a_worker_when_not_rejecting(self) -> None:
+        """A request which should not be rejected waits for a worker when the pool is full."""
+        respond = MagicMock()
+        self.handler._requests_in_flight = HTTP_REQUEST_WORKERS
+
+        async def run() -> None:
+            """Defer the work and let the loop run the callbacks."""
+            self.handler._run_deferred(
+                self.http_msg,
+                self.http_dialogue,
+                lambda: "result",
+                respond,
+                {"error": "failed"},
+                reject_when_busy=False,
+            )
+            await asyncio.sleep(0.1)
+
+        with patch.object(
+            self.handler, "_send_too_many_requests_response"
+        ) as mock_reject:
+            asyncio.run(run())
+        mock_reject.assert_not_called()
+        respond.assert_called_once_with("result")
+        assert self.handler._requests_in_flight == HTTP_REQUEST_WORKERS
+
+    def test_work_error_sends_internal_server_error(self) -> None:
+        """A failing work is answered with an internal server error."""
+
+        def work() -> None:
+            """Fail."""
+            raise RuntimeError("subgraph down")
+
+        with patch.object(
+            self.handler, "_send_internal_server_error_response"
+        ) as mock_err:
+            respond = self._run(work, wait=0.1)
+        respond.assert_not_called()
+        mock_err.assert_called_once_with(
+            self.http_msg, self.http_dialogue, {"error": "failed"}
+        )
+
+    def test_timeout_sends_gateway_timeout_and_drops_late_result(self) -> None:
+        """A slow work is answered with a gateway timeout, and its late result is dropped."""
+        release = threading.Event()
+
+        def work() -> str:
+            """Block until released."""
+            release.wait(1)
+            return "late"
+
+        async def run() -> None:
+            """Time the request out, then release the work."""
+            self.handler._run_deferred(
+                self.http_msg, self.http_dialogue, work, respond, {"error": "failed"}
+            )
+            await asyncio.sleep(0.05)
+            release.set()
+            await asyncio.sleep(0.1)
+
+        respond = MagicMock()
+        with (
+            patch(
+                "packages.valory.skills.agent_performance_summary_abci.handlers.HTTP_REQUEST_TIMEOUT_SECONDS",
+                0.01,
+            ),
+            patch.object(self.handler, "_send_http_response") as mock_send,
+        ):
+            asyncio.run(run())
+
+        respond.assert_not_called()
+        mock_send.assert_called_once()
+        assert mock_send.call_args[0][3] == HTTPStatus.GATEWAY_TIMEOUT.value
+        assert self.handler._requests_in_flight == 0
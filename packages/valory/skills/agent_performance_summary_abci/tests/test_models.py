@@ -20,6 +20,7 @@
 """Tests for agent_performance_summary_abci models."""
 
 import json
+import os
 import platform
 import stat
 from dataclasses import asdict
@@ -724,6 +725,7 @@ class TestSharedState:
         """Create a testable SharedState instance with mocked context."""
         state = object.__new__(_TestableSharedState)
         state.context = MagicMock()  # type: ignore[assignment]
+        state._cached_summary = None
         return state
 
     def test_params_property(self) -> None:
@@ -765,6 +767,67 @@ class TestSharedState:
         assert result.timestamp == 1700000000
         assert result.agent_behavior == "active"
 
+    def _write_summary(self, tmp_path: Path, summary: AgentPerformanceSummary) -> Path:
+        """Write the given summary to the store and return the file's path."""
+        file_path = tmp_path / AGENT_PERFORMANCE_SUMMARY_FILE
+        with open(file_path, "w") as f:
+            json.dump(asdict(summary), f)
+        return file_path
+
+    def test_get_performance_summary_is_cached(self, tmp_path: Path) -> None:
+        """get_performance_summary parses the file once while it is unchanged."""
+        state = self._make_state()
+        state.context.params.store_path = tmp_path  # type: ignore[attr-defined]
+        self._write_summary(tmp_path, AgentPerformanceSummary(timestamp=1))
+
+        with patch.object(
+            state,
+            "read_existing_performance_summary",
+            wraps=state.read_existing_performance_summary,
+        ) as read:
+            first = state.get_performance_summary()
+            second = state.get_performance_summary()
+
+        assert first is second
+        assert first.timestamp == 1
+        read.assert_called_once()
+
+    def test_get_performance_summary_rereads_changed_file(self, tmp_path: Path) -> None:
+        """get_performance_summary parses the file again if its mtime or size changed."""
+        state = self._make_state()
+        state.context.params.store_path = tmp_path  # type: ignore[attr-defined]
+        file_path = self._write_summary(tmp_path, AgentPerformanceSummary(timestamp=1))
+        assert state.get_performance_summary().timestamp == 1
+
+        self._write_summary(tmp_path, AgentPerformanceSummary(timestamp=200))
+        os.utime(file_path, ns=(0, 0))
+
+        assert state.get_performance_summary().timestamp == 200
+
+    def test_overwrite_invalidates_cached_summary(self, tmp_path: Path) -> None:
+        """overwrite_performance_summary drops the cached summary."""
+        state = self._make_state()
+        state.context.params.store_path = tmp_path  # type: ignore[attr-defined]
+        self._write_summary(tmp_path, AgentPerformanceSummary(timestamp=1))
+        cached = state.get_performance_summary()
+
+        state.overwrite_performance_summary(AgentPerformanceSummary(timestamp=2))
+
+        assert state._cached_summary is None
+        result = state.get_performance_summary()
+        assert result is not cached
+        assert result.timestamp == 2
+
+    def test_get_performance_summary_missing_file(self, tmp_path: Path) -> None:
+        """get_performance_summary returns an empty summary without caching it if the file is missing."""
+        state = self._make_state()
+        state.context.params.store_path = tmp_path  # type: ignore[attr-defined]
+
+        result = state.get_performance_summary()
+
+        assert result == AgentPerformanceSummary()
+        assert state._cached_summary is None
+
     def test_read_existing_performance_summary_file_not_found(
         self, tmp_path: Path
     ) -> None:
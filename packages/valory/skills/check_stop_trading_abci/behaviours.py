@@ -161,19 +161,15 @@ class CheckStopTradingBehaviour(StakingInteractBaseBehaviour):
         :return: the activity status tuple.
         :yield: contract-read steps.
         """
-        yield from self.wait_for_condition_with_sleep(self._check_service_staked)
+        # --- single read of every staking input (shared across KPI + activity target) ---
+        yield from self.wait_for_condition_with_sleep(self._get_staking_snapshot)
         self.context.logger.debug(f"{self.service_staking_state=}")
         if self.service_staking_state != StakingState.STAKED:
             return False, False, 0, 0
 
-        # --- single read of every input (shared across KPI + activity target) ---
         yield from self.wait_for_condition_with_sleep(
             self._get_staking_kpi_request_count
         )
-        yield from self.wait_for_condition_with_sleep(self._get_service_info)
-        yield from self.wait_for_condition_with_sleep(self._get_ts_checkpoint)
-        yield from self.wait_for_condition_with_sleep(self._get_liveness_period)
-        yield from self.wait_for_condition_with_sleep(self._get_liveness_ratio)
 
         # ``getServiceInfo()[2]`` is the length-2 ``nonces`` field on both V1 and
         # V2 ⇒ index 1 is the mech-requests count.
@@ -292,6 +292,7 @@ class TestComputeActivityStatus:
         behaviour = self._make_behaviour()
         behaviour.service_staking_state = StakingState.UNSTAKED
         mock_context = MagicMock()
+        mock_wait = MagicMock(side_effect=_noop_gen)
         with (
             patch.object(
                 type(behaviour),
@@ -299,12 +300,14 @@ class TestComputeActivityStatus:
                 new_callable=PropertyMock,
                 return_value=mock_context,
             ),
-            patch.object(behaviour, "wait_for_condition_with_sleep", _noop_gen),
+            patch.object(behaviour, "wait_for_condition_with_sleep", mock_wait),
         ):
             gen = behaviour._compute_activity_status()
             with pytest.raises(StopIteration) as exc_info:
                 next(gen)
             assert exc_info.value.value == (False, False, 0, 0)
+        # only the staking snapshot is read, the mech requests are not counted
+        mock_wait.assert_called_once_with(behaviour._get_staking_snapshot)
 
     def _staked_status(self, new_regime: bool, activity_target: int) -> tuple:
         """Drive _compute_activity_status for a staked service in the given regime."""
@@ -20,11 +20,14 @@
 """This module contains the base behaviour for the 'decision_maker_abci' skill."""
 
 import dataclasses
+import json
 import os
+import tempfile
 from abc import ABC
 from copy import deepcopy
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import partial
 from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, cast
 
 from aea.configurations.data_types import PublicId
@@ -46,10 +49,14 @@ from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.ipfs import IpfsMessage
 from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
+from packages.valory.skills.decision_maker_abci.benchmarking_dataset import (
+    BenchmarkingDataset,
+)
 from packages.valory.skills.decision_maker_abci.io_.loader import ComponentPackageLoader
 from packages.valory.skills.decision_maker_abci.models import (
     AccuracyInfoFields,
     BenchmarkingMockData,
+    CompiledStrategy,
     DecisionMakerParams,
     L0_END_FIELD,
     L0_START_FIELD,
@@ -77,6 +84,8 @@ from packages.valory.skills.transaction_settlement_abci.payload_tools import (
 from packages.valory.skills.transaction_settlement_abci.rounds import TX_HASH_LENGTH
 
 WaitableConditionType = Generator[None, None, bool]
+# the (prices, cumulative costs, cumulative shares) of an order book's asks, sorted from the best price
+OrderbookCurve = Tuple[List[float], List[float], List[float]]
 
 # setting the safe gas to 0 means that all available gas will be used
 # which is what we want in most cases
@@ -89,6 +98,8 @@ USDC_POLYGON = "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
 PUSD_POLYGON = "0xC011a7E12a19f7B1f670d46F03B03f3342E82DFB"  # Polymarket v2 collateral
 BET_AMOUNT_FIELD = "bet_amount"
 SUPPORTED_STRATEGY_LOG_LEVELS = ("info", "warning", "error")
+STRATEGY_MODULE_PREFIX = "trading_strategy_"
+STRATEGIES_CACHE_DIR = "strategies"
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 NEW_LINE = "\n"
 QUOTE = '"'
@@ -123,11 +134,12 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         self.multisend_data = b""
         self._safe_tx_hash = ""
         self._policy: Optional[EGreedyPolicy] = None
-        self._inflight_strategy_req: Optional[str] = None
+        self._inflight_strategy_reqs: Set[str] = set()
 
         self.sell_amount: int = 0
         self.buy_amount: int = 0
         self._last_strategy_result: Dict[str, Any] = {}
+        self._bets_checked_out = False
 
     @property
     def market_maker_contract_address(self) -> str:
@@ -153,6 +165,40 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         """Get the executable strategy file's content."""
         return self.shared_state.strategies_executables.get(strategy, None)
 
+    def _compiled_strategy(
+        self, trading_strategy: str, strategy_exec: str, callable_method: str
+    ) -> Optional[Callable]:
+        """Get the strategy's callable, compiling its executable only the first time that it is needed.
+
+        Each executable is compiled into its own module namespace and cached using the IPFS hash of its file.
+        The cached callable is reused for as long as the executable's source and callable method do not change.
+
+        :param trading_strategy: the name of the trading strategy.
+        :param strategy_exec: the source of the strategy's executable.
+        :param callable_method: the name of the method to call.
+        :return: the strategy's callable, or `None` if the executable does not define it.
+        """
+        shared_state = self.shared_state
+        cache_key = shared_state.strategies_filehashes.get(
+            trading_strategy, trading_strategy
+        )
+        compiled = shared_state.compiled_strategies.get(cache_key, None)
+        if (
+            compiled is None
+            or compiled.source != strategy_exec
+            or compiled.callable_method != callable_method
+        ):
+            code = compile(strategy_exec, f"<{trading_strategy} strategy>", "exec")
+            namespace: Dict[str, Any] = {
+                "__name__": f"{STRATEGY_MODULE_PREFIX}{trading_strategy}"
+            }
+            exec(code, namespace)  # pylint: disable=W0122  # nosec
+            method = namespace.get(callable_method, None)
+            compiled = CompiledStrategy(strategy_exec, callable_method, method)
+            shared_state.compiled_strategies[cache_key] = compiled
+
+        return compiled.method
+
     def execute_strategy(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
         """Execute the strategy and return the results."""
         trading_strategy = kwargs.pop("trading_strategy", None)
@@ -168,11 +214,9 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             return {BET_AMOUNT_FIELD: 0}
 
         strategy_exec, callable_method = strategy
-        if callable_method in globals():
-            del globals()[callable_method]
-
-        exec(strategy_exec, globals())  # pylint: disable=W0122  # nosec
-        method = globals().get(callable_method, None)
+        method = self._compiled_strategy(
+            trading_strategy, strategy_exec, callable_method
+        )
         if method is None:
             self.context.logger.error(
                 f"No {callable_method!r} method was found in {trading_strategy} strategy's executable."
@@ -194,6 +238,24 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             raise ValueError("Attempted to access the mock data while being empty!")
         return mock_data
 
+    @property
+    def benchmarking_dataset(self) -> BenchmarkingDataset:
+        """Return the indexed dataset of the benchmarking mode, indexing it only if it has not been or has changed."""
+        mode = self.benchmarking_mode
+        path = str(self.params.store_path / mode.dataset_filename)
+        dataset = self.shared_state.benchmarking_dataset
+        if not isinstance(dataset, BenchmarkingDataset) or dataset.is_stale(
+            path, mode.sep, mode.question_id_field
+        ):
+            dataset = BenchmarkingDataset(path, mode.sep, mode.question_id_field)
+            dataset.load()
+            self.shared_state.benchmarking_dataset = dataset
+        return dataset
+
+    def initialize_bet_id_row_manager(self) -> Dict[str, List[int]]:
+        """Initialization of the dictionary used to traverse mocked tool responses."""
+        return self.benchmarking_dataset.row_manager()
+
     @property
     def acc_info_fields(self) -> AccuracyInfoFields:
         """Return the accuracy information fieldnames."""
@@ -273,10 +335,16 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
             return self.shared_state.mock_data is None
         return self.synchronized_data.period_count == 0
 
+    def read_bets(self) -> None:
+        """Read the stored bets, discarding any change that has not been stored."""
+        super().read_bets()
+        self._bets_checked_out = True
+
     @property
     def sampled_bet(self) -> Bet:
-        """Get the sampled bet and reset the bets list."""
-        self.read_bets()
+        """Get the sampled bet, reading the bets only the first time that they are needed in the behaviour's act."""
+        if not self._bets_checked_out:
+            self.read_bets()
         bet_index = self.synchronized_data.sampled_bet_index
         return self.bets[bet_index]
 
@@ -470,29 +538,112 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         self.shared_state.req_to_callback[nonce] = callback
         self.shared_state.in_flight_req = True
 
-    def _handle_get_strategy(self, message: IpfsMessage, _: Dialogue) -> None:
-        """Handle get strategy response."""
-        strategy_req = self._inflight_strategy_req
-        if strategy_req is None:
-            self.context.logger.error(f"No strategy request to handle for {message=}.")
+    def _strategy_cache_path(self, file_hash: str) -> str:
+        """Get the path of the on-disk cache entry of the strategy package with the given IPFS hash."""
+        return str(self.params.store_path / STRATEGIES_CACHE_DIR / f"{file_hash}.json")
+
+    def _read_cached_strategy(self, file_hash: str) -> Optional[Dict[str, str]]:
+        """Read the strategy package with the given IPFS hash from the on-disk cache, if present."""
+        path = self._strategy_cache_path(file_hash)
+        try:
+            with open(path) as f:
+                return cast(Dict[str, str], json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.context.logger.warning(
+                f"Could not read the cached strategy package {path!r}: {e}"
+            )
+            return None
+
+    def _write_cached_strategy(self, file_hash: str, files: Dict[str, str]) -> None:
+        """Persist the strategy package with the given IPFS hash to the on-disk cache.
+
+        IPFS hashes are content addresses, so an entry never needs to be invalidated.
+        """
+        path = self._strategy_cache_path(file_hash)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=os.path.basename(path) + ".", dir=directory
+            )
+        except OSError as e:
+            self.context.logger.error(
+                f"Failed to cache the strategy package {path!r}: {e}"
+            )
             return
 
-        # store the executable and remove the hash from the mapping because we have downloaded it
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(files, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            self.context.logger.error(
+                f"Failed to cache the strategy package {path!r}: {e}"
+            )
+
+    def _register_strategy(self, strategy: str, files: Dict[str, str]) -> None:
+        """Store the executable of the given strategy and remove its hash from the pending ones."""
         _component_yaml, strategy_exec, callable_method = ComponentPackageLoader.load(
-            message.files
+            files
         )
 
-        self.shared_state.strategies_executables[strategy_req] = (
+        self.shared_state.strategies_executables[strategy] = (
             strategy_exec,
             callable_method,
         )
-        self.shared_state.strategy_to_filehash.pop(strategy_req)
-        self._inflight_strategy_req = None
+        file_hash = self.shared_state.strategy_to_filehash.pop(strategy)
+        # the strategy's executable may have changed, make sure that it gets recompiled
+        self.shared_state.invalidate_compiled_strategy(strategy)
+        self.shared_state.strategies_filehashes[strategy] = file_hash
+
+    def _handle_get_strategy(
+        self, strategy: str, message: IpfsMessage, _: Dialogue
+    ) -> None:
+        """Handle get strategy response."""
+        if strategy not in self._inflight_strategy_reqs:
+            self.context.logger.error(f"No strategy request to handle for {message=}.")
+            return
+
+        # the strategy is requested again on the next download attempt if it has not been registered
+        self._inflight_strategy_reqs.discard(strategy)
+        if message.performative == IpfsMessage.Performative.ERROR:
+            self.context.logger.error(
+                f"Failed to fetch {strategy} strategy: {message.reason}"
+            )
+            return
+
+        file_hash = self.shared_state.strategy_to_filehash[strategy]
+        self._register_strategy(strategy, message.files)
+        self._write_cached_strategy(file_hash, message.files)
+
+    def load_cached_strategies(self) -> None:
+        """Load the pending strategies which are present in the on-disk cache, without reaching IPFS."""
+        for strategy, file_hash in list(self.shared_state.strategy_to_filehash.items()):
+            if strategy in self._inflight_strategy_reqs:
+                continue
+            files = self._read_cached_strategy(file_hash)
+            if files is None:
+                continue
+            try:
+                self._register_strategy(strategy, files)
+            except Exception as e:  # pylint: disable=broad-except
+                self.context.logger.warning(
+                    f"Ignoring the invalid cached package of {strategy} strategy: {e}"
+                )
+                continue
+            self.context.logger.info(f"Loaded {strategy} strategy from the cache.")
 
     def download_next_strategy(self) -> None:
-        """Download the strategies one by one.
+        """Download all the pending strategies which are not already in flight.
 
-        The next strategy in the list is downloaded each time this method is called.
+        The requests are sent concurrently, so the time it takes to fetch the strategies
+        does not grow with their number.
 
         We download all the strategies,
         because in the future we will perform some complicated logic,
@@ -501,24 +652,22 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
 
         :return: None
         """
-        if self._inflight_strategy_req is not None:
-            # there already is a req in flight
-            return
-        if len(self.shared_state.strategy_to_filehash) == 0:
-            # no strategies pending to be fetched
-            return
         for (
             strategy,
             file_hash,
-        ) in self.shared_state.strategy_to_filehash.items():  # pragma: no branch
+        ) in self.shared_state.strategy_to_filehash.items():
+            if strategy in self._inflight_strategy_reqs:
+                # there already is a req in flight
+                continue
             self.context.logger.info(f"Fetching {strategy} strategy...")
             ipfs_msg, message = self._build_ipfs_get_file_req(file_hash)
-            self._inflight_strategy_req = strategy
-            self.send_message(ipfs_msg, message, self._handle_get_strategy)
-            return
+            self._inflight_strategy_reqs.add(strategy)
+            callback = partial(self._handle_get_strategy, strategy)
+            self.send_message(ipfs_msg, message, callback)
 
     def download_strategies(self) -> Generator:
-        """Download all the strategies, if not yet downloaded."""
+        """Download all the strategies, if not yet downloaded or cached on disk."""
+        self.load_cached_strategies()
         while len(self.shared_state.strategy_to_filehash) > 0:
             self.download_next_strategy()
             yield from self.sleep(self.params.sleep_time)
@@ -565,6 +714,8 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
         price_no: float = 0.0,
         orderbook_asks_yes: Optional[List[Dict[str, str]]] = None,
         orderbook_asks_no: Optional[List[Dict[str, str]]] = None,
+        orderbook_curve_yes: Optional[OrderbookCurve] = None,
+        orderbook_curve_no: Optional[OrderbookCurve] = None,
         min_order_shares: float = 0.0,
     ) -> Generator[None, None, int]:
         """Get the bet amount given a specified trading strategy."""
@@ -611,6 +762,8 @@ class DecisionMakerBaseBehaviour(BetsManagerBehaviour, ABC):
                     "price_no": price_no,
                     "orderbook_asks_yes": orderbook_asks_yes,
                     "orderbook_asks_no": orderbook_asks_no,
+                    "orderbook_curve_yes": orderbook_curve_yes,
+                    "orderbook_curve_no": orderbook_curve_no,
                     "min_order_shares": min_order_shares,
                 }
             )
@@ -152,10 +152,10 @@ class BetPlacementBehaviour(DecisionMakerBaseBehaviour):
             if betting_tx_hex is not None and self.synchronized_data.is_policy_set:
                 self._policy = self.synchronized_data.policy
                 self.policy.tool_used(self.synchronized_data.mech_tool)
-                policy_str = self.policy.serialize()
+                policy_str = self.policy.serialize_compact()
                 policy_path = self.params.store_path / POLICY_STORE
                 with open(policy_path, "w") as f:
-                    f.write(policy_str)
+                    f.write(self.policy.serialize())
 
             payload = BetPlacementPayload(
                 agent,
@@ -72,7 +72,7 @@ class BlacklistingBehaviour(  # type: ignore
             return
         # if the tool selection has not been run for the current period, do not do anything
         if not self.synchronized_data.has_tool_selection_run:
-            policy = self.policy.serialize()
+            policy = self.policy.serialize_compact()
             payload = BlacklistingPayload(self.context.agent_address, None, policy)
             yield from self.finish_behaviour(payload)
             return
@@ -81,9 +81,9 @@ class BlacklistingBehaviour(  # type: ignore
             self.read_bets()
             self._blacklist()
             self.store_bets()
-            bets_hash = (
-                None if self.benchmarking_mode.enabled else self.hash_stored_bets()
-            )
+            bets_hash = None
+            if not self.benchmarking_mode.enabled:
+                bets_hash = yield from self.hash_stored_bets()
             if (
                 self.synchronized_data.tx_submitter
                 != HandleFailedTxRound.auto_round_id()
@@ -92,7 +92,7 @@ class BlacklistingBehaviour(  # type: ignore
                 self.policy.tool_responded(
                     self.synchronized_data.mech_tool, self.synced_timestamp
                 )
-            policy = self.policy.serialize()
+            policy = self.policy.serialize_compact()
             payload = BlacklistingPayload(self.context.agent_address, bets_hash, policy)
 
         yield from self.finish_behaviour(payload)
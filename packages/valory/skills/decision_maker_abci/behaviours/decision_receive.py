@@ -19,7 +19,6 @@
 
 """This module contains the behaviour for the decision-making of the skill."""
 
-import csv
 import json
 from copy import deepcopy
 from datetime import datetime
@@ -27,6 +26,7 @@ from math import prod
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from packages.valory.connections.polymarket_client.request_types import RequestType
+from packages.valory.skills.decision_maker_abci.behaviours.base import OrderbookCurve
 from packages.valory.skills.decision_maker_abci.behaviours.storage_manager import (
     StorageManagerBehaviour,
 )
@@ -56,6 +56,37 @@ WRITE_TEXT_MODE = "w+t"
 COMMA = ","
 
 
+def _ask_curve(book: Optional[Dict[str, List[float]]]) -> Optional[OrderbookCurve]:
+    """Get the asks' curve of an order book pre-parsed by the Polymarket connection, in the strategies' layout.
+
+    :param book: the pre-parsed order book, if the connection sent one.
+    :return: the (prices, cumulative costs, cumulative shares) of the asks, or None.
+    """
+    if not book:
+        return None
+    return book["ask_prices"], book["ask_cum_costs"], book["ask_cum_shares"]
+
+
+def _best_prices(
+    asks: List[Dict[str, str]],
+    bids: List[Dict[str, str]],
+    book: Optional[Dict[str, List[float]]],
+) -> Tuple[float, float]:
+    """Get the best ask and bid prices, from the pre-parsed order book when possible.
+
+    :param asks: the raw ask levels.
+    :param bids: the raw bid levels.
+    :param book: the pre-parsed order book, if the connection sent one.
+    :return: the best ask and the best bid prices.
+    """
+    if book and book["ask_prices"] and book["bid_prices"]:
+        # the pre-parsed levels are sorted from the best price
+        return book["ask_prices"][0], book["bid_prices"][0]
+    best_ask = min(float(a["price"]) for a in asks)
+    best_bid = max(float(b["price"]) for b in bids)
+    return best_ask, best_bid
+
+
 class DecisionReceiveBehaviour(StorageManagerBehaviour):
     """A behaviour in which the agents receive the mech response."""
 
@@ -112,10 +143,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
         :return: a dictionary with the header fields mapped to the values of the first row.
             If no rows are left to process in the file, returns `None`.
         """
-        sep = self.benchmarking_mode.sep
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
         active_sampled_bet = self.get_active_sampled_bet()
         sampled_bet_id = active_sampled_bet.id
 
@@ -132,17 +159,11 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             self._rows_exceeded = True
             return None
 
-        row_with_headers: Optional[Dict[str, str]] = None
-        with open(dataset_filepath) as read_dataset:
-            reader = csv.DictReader(read_dataset, delimiter=sep)
-
-            for _ in range(next_mock_data_row):
-                row_with_headers = next(reader, {})
-
-            if not row_with_headers:
-                # if no rows are in the file, then we finished the benchmarking
-                self._rows_exceeded = True
-                return None
+        row_with_headers = self.benchmarking_dataset.row(next_mock_data_row)
+        if not row_with_headers:
+            # if no rows are in the file, then we finished the benchmarking
+            self._rows_exceeded = True
+            return None
 
         msg = f"Processing question in row with index {next_mock_data_row}: {row_with_headers}"
         self.context.logger.info(msg)
@@ -391,7 +412,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
         :param strategy_vote: the strategy's chosen side (0=YES, 1=NO).
         :return: whether rebetting is allowed.
         """
-        # WARNING: Every time you call self.sampled_bet a reset in self.bets is done so any changes there will be lost
         bet = self.sampled_bet
         previous_response = deepcopy(bet.prediction_response)
         previous_liquidity = bet.position_liquidity
@@ -419,7 +439,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
 
         :param token_id: The CLOB token ID.
         :yield: None
-        :return: Dict with "asks" and "bids" keys, or None on failure.
+        :return: Dict with "asks", "bids" and the pre-parsed "book", or None on failure.
         """
         payload = {
             "request_type": RequestType.FETCH_ORDER_BOOK.value,
@@ -450,7 +470,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             self.context.logger.info(f"Bet used for benchmarking: {bet}")
             self._update_market_liquidity()
         else:
-            # this call is destroying what it was in self.bets
             bet = self.sampled_bet
 
         # Gather market data for both sides
@@ -459,6 +478,8 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
         orderbook_asks_no = None
         orderbook_bids_yes = None
         orderbook_bids_no = None
+        book_yes: Optional[Dict[str, List[float]]] = None
+        book_no: Optional[Dict[str, List[float]]] = None
         min_order_shares = 0.0
 
         prices = bet.outcomeTokenMarginalPrices
@@ -475,6 +496,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
                     if ob_yes is not None:
                         orderbook_asks_yes = ob_yes.get("asks", [])
                         orderbook_bids_yes = ob_yes.get("bids", [])
+                        book_yes = ob_yes.get("book")
                         if ob_yes.get("min_order_size") is not None:
                             min_order_shares = float(ob_yes["min_order_size"])
                 if no_token_id:
@@ -482,6 +504,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
                     if ob_no is not None:
                         orderbook_asks_no = ob_no.get("asks", [])
                         orderbook_bids_no = ob_no.get("bids", [])
+                        book_no = ob_no.get("book")
                         if (
                             min_order_shares == 0.0
                             and ob_no.get("min_order_size") is not None
@@ -507,6 +530,8 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             price_no=price_no,
             orderbook_asks_yes=orderbook_asks_yes,
             orderbook_asks_no=orderbook_asks_no,
+            orderbook_curve_yes=_ask_curve(book_yes),
+            orderbook_curve_no=_ask_curve(book_no),
             min_order_shares=min_order_shares,
         )
 
@@ -533,18 +558,19 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
         # illiquid market the operator wanted caught.
         if market_type == "clob":
             is_yes = strategy_vote == 0
-            spread_asks, spread_bids = (
-                (orderbook_asks_yes, orderbook_bids_yes)
+            spread_asks, spread_bids, spread_book = (
+                (orderbook_asks_yes, orderbook_bids_yes, book_yes)
                 if is_yes
-                else (orderbook_asks_no, orderbook_bids_no)
+                else (orderbook_asks_no, orderbook_bids_no, book_no)
             )
             lo = self.params.polymarket_spread_min
             hi = self.params.polymarket_spread_max
             band_is_default = lo <= 0.0 and hi >= 1.0
             if spread_asks and spread_bids:
                 try:
-                    best_ask = min(float(a["price"]) for a in spread_asks)
-                    best_bid = max(float(b["price"]) for b in spread_bids)
+                    best_ask, best_bid = _best_prices(
+                        spread_asks, spread_bids, spread_book
+                    )
                 except (ValueError, TypeError) as exc:
                     self.context.logger.warning(
                         f"Spread gate bypassed: could not parse order book "
@@ -655,22 +681,6 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
             return True
         return False
 
-    def initialize_bet_id_row_manager(self) -> Dict[str, List[int]]:
-        """Initialization of the dictionary used to traverse mocked tool responses."""
-        bets_mapping: Dict[str, List[int]] = {}
-        dataset_filepath = (
-            self.params.store_path / self.benchmarking_mode.dataset_filename
-        )
-
-        with open(dataset_filepath, mode="r") as file:
-            reader = csv.DictReader(file)
-            for row_number, row in enumerate(reader, start=1):
-                question_id = row[self.benchmarking_mode.question_id_field]
-                if question_id not in bets_mapping:
-                    bets_mapping[question_id] = []
-                bets_mapping[question_id].append(row_number)
-        return bets_mapping
-
     def async_act(self) -> Generator:
         """Do the action."""
 
@@ -707,7 +717,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
                     decision_received_timestamp = self.synced_timestamp
                     bet_amount = self.sell_amount
                     self.store_bets()
-                    bets_hash = self.hash_stored_bets()
+                    bets_hash = yield from self.hash_stored_bets()
 
                 if not should_be_sold and not self.review_bets_for_selling_mode:
                     self.context.logger.info(
@@ -719,7 +729,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
                     decision_received_timestamp = self.synced_timestamp
                     if is_profitable:
                         self.store_bets()
-                        bets_hash = self.hash_stored_bets()
+                        bets_hash = yield from self.hash_stored_bets()
 
             elif (  # pragma: no cover
                 prediction_response is not None
@@ -739,7 +749,7 @@ class DecisionReceiveBehaviour(StorageManagerBehaviour):
                     self.synced_timestamp,
                     self.is_invalid_response,
                 )
-                policy = self.policy.serialize()
+                policy = self.policy.serialize_compact()
 
             # always remove the processed trade from the benchmarking input file
             # now there is one reader pointer per market
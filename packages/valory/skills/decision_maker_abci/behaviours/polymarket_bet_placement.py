@@ -210,7 +210,7 @@ class PolymarketBetPlacementBehaviour(
             condition_id = self.get_active_sampled_bet().condition_id
             if condition_id is not None:
                 self.utilized_tools[condition_id] = self.synchronized_data.mech_tool
-                utilized_tools_json = json.dumps(self.utilized_tools, sort_keys=True)
+                utilized_tools_json = self._serialize_utilized_tools()
                 self.context.logger.info(
                     f"Recorded mech tool {self.synchronized_data.mech_tool!r} "
                     f"for condition_id {condition_id!r} in utilized_tools."
@@ -225,7 +225,7 @@ class PolymarketBetPlacementBehaviour(
             if self.synchronized_data.is_policy_set:
                 self._policy = self.synchronized_data.policy
                 self.policy.tool_used(self.synchronized_data.mech_tool)
-                policy_str = self.policy.serialize()
+                policy_str = self.policy.serialize_compact()
                 self._store_policy()
 
         payload = PolymarketBetPlacementPayload(
@@ -20,12 +20,15 @@
 """This module contains the redeeming state of the decision-making abci app."""
 
 import json
-from typing import Generator, Optional, cast
+from typing import Dict, Generator, List, Optional, cast
 
 from hexbytes import HexBytes
 from web3.constants import HASH_ZERO
 
-from packages.valory.connections.polymarket_client.request_types import RequestType
+from packages.valory.connections.polymarket_client.request_types import (
+    MAX_REDEEMS_PER_TX,
+    RequestType,
+)
 from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 from packages.valory.skills.decision_maker_abci.behaviours.base import MultisendBatch
 from packages.valory.skills.decision_maker_abci.behaviours.storage_manager import (
@@ -120,36 +123,65 @@ class PolymarketRedeemBehaviour(StorageManagerBehaviour):
 
         return redeemable_positions
 
-    def _redeem_position(
-        self,
-        condition_id: str,
-        outcome_index: int,
-        collateral_token: str,
-        is_neg_risk: bool = False,
-    ) -> Generator[None, None, dict]:
-        """Redeem a single position.
-
-        :param condition_id: The condition ID for the position
-        :param outcome_index: The outcome index (0 for Yes, 1 for No typically)
-        :param collateral_token: The collateral token address
-        :param is_neg_risk: Whether this is a negative risk market
+    def _collect_redemptions(self, redeemable_positions: list) -> List[dict]:
+        """Collect the redemptions of the redeemable positions, one per condition.
+
+        :param redeemable_positions: list of position dicts from the Polymarket API.
+        :return: the ``{"condition_id", "index_sets", "collateral_token", "is_neg_risk"}`` redemptions.
+        """
+        redemptions: Dict[str, dict] = {}
+        for position in redeemable_positions:
+            condition_id = position.get("conditionId")
+            outcome_index = position.get("outcomeIndex")
+            outcome = position.get("outcome")
+            size = position.get("size", 0)
+            is_neg_risk = position.get("negativeRisk", False)
+
+            if condition_id is None or outcome_index is None:
+                self.context.logger.error(
+                    f"Skipping malformed position (missing conditionId or "
+                    f"outcomeIndex): {position}"
+                )
+                continue
+
+            market_type = "negative risk" if is_neg_risk else "standard"
+            self.context.logger.info(
+                f"Redeeming {market_type} position: {condition_id} - {outcome} (size: {size})"
+            )
+
+            # Both adapters expose the same 4-arg redeemPositions(IERC20,
+            # bytes32, bytes32, uint256[]) signature; only the destination
+            # contract differs. The deployed adapters ignore the uint256[]
+            # argument — they redeem both sides via CTFHelpers.partition() /
+            # balanceOf regardless. Passing [1 << outcomeIndex] is a
+            # calldata-size choice; it does not limit on-chain redemption.
+            # For the same reason, all the positions of a condition share a
+            # single redemption.
+            redemption = redemptions.setdefault(
+                condition_id,
+                {
+                    "condition_id": condition_id,
+                    "index_sets": [],
+                    "collateral_token": self.params.polymarket_collateral_address,
+                    "is_neg_risk": is_neg_risk,
+                },
+            )
+            index_set = 1 << outcome_index
+            if index_set not in redemption["index_sets"]:
+                redemption["index_sets"].append(index_set)
+
+        return list(redemptions.values())
+
+    def _redeem_positions(self, redemptions: List[dict]) -> Generator[None, None, dict]:
+        """Redeem several positions with a single connection request.
+
+        :param redemptions: the redemptions, as collected by `_collect_redemptions`.
         :return: Redemption result
         :yield: None
         """
-        # The deployed Polymarket collateral adapters ignore the uint256[]
-        # argument — they read both position balances and call the internal
-        # partition themselves. Passing [1 << outcomeIndex] is a calldata-size
-        # choice that documents agent intent; it does not limit on-chain work.
-        index_sets = [1 << outcome_index]
-
         polymarket_redeem_payload = {
-            "request_type": RequestType.REDEEM_POSITIONS.value,
-            "params": {
-                "condition_id": condition_id,
-                "index_sets": index_sets,
-                "collateral_token": collateral_token,
-                "is_neg_risk": is_neg_risk,
-            },
+            "request_type": RequestType.REDEEM_POSITIONS_BATCH.value,
+            "params": {"redemptions": redemptions},
         }
 
         redeem_result = yield from self.send_polymarket_connection_request(
@@ -203,8 +235,8 @@ class PolymarketRedeemBehaviour(StorageManagerBehaviour):
 
             # Re-serialise policy and utilized_tools *after* the accuracy-store update
             # so that the updated values are carried in the payload.
-            current_policy = self.policy.serialize() if is_policy_set else None
-            current_utilized_tools = json.dumps(self.utilized_tools)
+            current_policy = self.policy.serialize_compact() if is_policy_set else None
+            current_utilized_tools = self._serialize_utilized_tools()
 
             if redeemable_positions == []:
                 self.context.logger.info("No redeemable positions found.")
@@ -261,37 +293,18 @@ class PolymarketRedeemBehaviour(StorageManagerBehaviour):
         current_policy: Optional[str] = None,
         current_utilized_tools: Optional[str] = None,
     ) -> Generator:
-        """Redeem positions via builder flow (connection request)."""
-
-        # Redeem each position
-        for position in redeemable_positions:
-            condition_id = position.get("conditionId")
-            outcome_index = position.get("outcomeIndex")
-            outcome = position.get("outcome")
-            size = position.get("size", 0)
-            is_neg_risk = position.get("negativeRisk", False)
-
-            if condition_id is None or outcome_index is None:
-                self.context.logger.error(
-                    f"Skipping malformed position (missing conditionId or "
-                    f"outcomeIndex): {position}"
-                )
-                continue
+        """Redeem positions via builder flow (connection request).
 
-            market_type = "negative risk" if is_neg_risk else "standard"
+        All the positions are redeemed with a single request. The connection packs them into as few relayer
+        transactions as the gas limit allows, instead of relaying a transaction per position.
+        """
+        redemptions = self._collect_redemptions(redeemable_positions)
+        if redemptions:
+            result = yield from self._redeem_positions(redemptions)
             self.context.logger.info(
-                f"Redeeming {market_type} position: {condition_id} - {outcome} (size: {size})"
-            )
-
-            result = yield from self._redeem_position(
-                condition_id=condition_id,
-                outcome_index=outcome_index,
-                collateral_token=self.params.polymarket_collateral_address,
-                is_neg_risk=is_neg_risk,
+                f"Redemption result for {len(redemptions)} condition(s): {result}"
             )
 
-            self.context.logger.info(f"Redemption result for {condition_id}: {result}")
-
         self.payload = PolymarketRedeemPayload(
             sender=self.context.agent_address,
             tx_submitter=None,
@@ -311,38 +324,22 @@ class PolymarketRedeemBehaviour(StorageManagerBehaviour):
             self.context.logger.info("No redeemable positions found")
             return ""
 
-        # Build redemption transactions and add to multisend_batches
-        for position in redeemable_positions:
-            condition_id = position.get("conditionId")
-            outcome_index = position.get("outcomeIndex")
-            outcome = position.get("outcome")
-            size = position.get("size", 0)
-            is_neg_risk = position.get("negativeRisk", False)
-
-            if condition_id is None or outcome_index is None:
-                self.context.logger.error(
-                    f"Skipping malformed position (missing conditionId or "
-                    f"outcomeIndex): {position}"
-                )
-                continue
-
-            market_type = "negative risk" if is_neg_risk else "standard"
+        redemptions = self._collect_redemptions(redeemable_positions)
+        if len(redemptions) > MAX_REDEEMS_PER_TX:
             self.context.logger.info(
-                f"Preparing redeem tx for {market_type} position: {condition_id} - {outcome} (size: {size})"
+                f"Redeeming {MAX_REDEEMS_PER_TX} out of {len(redemptions)} conditions to stay under the gas limit. "
+                "The rest will be redeemed in the next periods."
             )
+            redemptions = redemptions[:MAX_REDEEMS_PER_TX]
 
-            # Both adapters expose the same 4-arg redeemPositions(IERC20,
-            # bytes32, bytes32, uint256[]) signature; only the destination
-            # contract differs. The deployed adapters ignore the uint256[]
-            # argument — they redeem both sides via CTFHelpers.partition() /
-            # balanceOf regardless. Passing [1 << outcomeIndex] is a
-            # calldata-size choice; it does not limit on-chain redemption.
+        # Build redemption transactions and add to multisend_batches
+        for redemption in redemptions:
             redeem_data = self._build_redeem_positions_data(
-                collateral_token=self.params.polymarket_collateral_address,
-                condition_id=condition_id,
-                index_sets=[1 << outcome_index],
+                collateral_token=redemption["collateral_token"],
+                condition_id=redemption["condition_id"],
+                index_sets=redemption["index_sets"],
             )
-            if is_neg_risk:
+            if redemption["is_neg_risk"]:
                 target_address = (
                     self.params.polymarket_neg_risk_ctf_collateral_adapter_address
                 )
@@ -23,7 +23,7 @@ import json
 import time
 from abc import ABC
 from sys import maxsize
-from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Union
+from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
 
 from hexbytes import HexBytes
 from web3.constants import HASH_ZERO
@@ -31,6 +31,9 @@ from web3.constants import HASH_ZERO
 from packages.valory.contracts.conditional_tokens.contract import (
     ConditionalTokensContract,
 )
+from packages.valory.contracts.market_maker.contract import (
+    FixedProductMarketMakerContract,
+)
 from packages.valory.contracts.realitio.contract import RealitioContract
 from packages.valory.contracts.realitio_proxy.contract import RealitioProxyContract
 from packages.valory.protocols.contract_api import ContractApiMessage
@@ -47,6 +50,10 @@ from packages.valory.skills.decision_maker_abci.models import (
     RedeemingProgress,
 )
 from packages.valory.skills.decision_maker_abci.payloads import RedeemPayload
+from packages.valory.skills.decision_maker_abci.redeem_events_index import (
+    REDEEM_EVENTS_INDEX_FILENAME,
+    RedeemEventsIndex,
+)
 from packages.valory.skills.decision_maker_abci.redeem_info import (
     Condition,
     FPMM,
@@ -73,6 +80,8 @@ ZERO_HEX = HASH_ZERO[2:]
 ZERO_BYTES = bytes.fromhex(ZERO_HEX)
 BLOCK_NUMBER_KEY = "number"
 DEFAULT_TO_BLOCK = "latest"
+# the number of markets whose resolution status and history hash are pre-checked with a single aggregate call
+REDEEM_PRE_CHECK_BATCH_SIZE = 100
 
 
 class RedeemInfoBehaviour(StorageManagerBehaviour, QueryingBehaviour, ABC):
@@ -94,6 +103,8 @@ class RedeemInfoBehaviour(StorageManagerBehaviour, QueryingBehaviour, ABC):
         # consequently, the claimable amount must reflect the cumulative sum of claimable amounts
         # from all trades associated with it.
         self.claimable_amounts: Dict[HexBytes, int] = {}
+        # whether the earliest block number should be set from the next winning trade of the current market
+        self._earliest_block_pending: bool = True
 
     def setup(self) -> None:
         """Setup the behaviour"""
@@ -150,7 +161,6 @@ class RedeemInfoBehaviour(StorageManagerBehaviour, QueryingBehaviour, ABC):
             <= self.synced_timestamp
         )
 
-        is_first_update = True
         for update in trades_updates:
             self._update_policy(update)
 
@@ -158,23 +168,20 @@ class RedeemInfoBehaviour(StorageManagerBehaviour, QueryingBehaviour, ABC):
             if not update.is_winning:
                 continue
 
-            if is_first_update:
+            if self._earliest_block_pending:
                 yield from self._set_block_number(update)
-                is_first_update = False
+                self._earliest_block_pending = False
 
             condition_id = update.fpmm.condition.id
-            # If not in the trades, add it as is, along with its claimable amount
-            if update not in self.trades:
-                self.trades.add(update)
-                self.claimable_amounts[condition_id] = update.claimable_amount
+            # the claimable amounts are keyed by condition id, so a trade on an already known condition
+            # only needs its claimable amount combined, without searching the trades
+            if condition_id in self.claimable_amounts:
+                self.claimable_amounts[condition_id] += update.claimable_amount
                 continue
 
-            # Find any matching object and combine them
-            for unique_obj in self.trades:
-                if update == unique_obj:
-                    self.claimable_amounts[condition_id] += update.claimable_amount
-
-        self.context.logger.info(self.policy.stats_report())
+            # otherwise, add it as is, along with its claimable amount
+            self.trades.add(update)
+            self.claimable_amounts[condition_id] = update.claimable_amount
 
 
 class RedeemBehaviour(RedeemInfoBehaviour):
@@ -182,8 +189,6 @@ class RedeemBehaviour(RedeemInfoBehaviour):
 
     matching_round = RedeemRound
 
-    UTILIZED_TOOLS_PATH = "utilized_tools.json"
-
     def __init__(self, **kwargs: Any) -> None:
         """Initialize `RedeemBehaviour`."""
         super().__init__(**kwargs)
@@ -196,6 +201,10 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         self._expected_winnings: int = 0
         self._history_hash: bytes = ZERO_BYTES
         self._claim_winnings_simulation_ok: bool = False
+        self._events_index: Optional[RedeemEventsIndex] = None
+        self._redeem_statuses_batch: list = []
+        # a mapping from the pre-checked condition ids to whether they are resolved and their question's history hash
+        self._redeem_statuses: Dict[HexBytes, Tuple[bool, bytes]] = {}
 
     @property
     def redeeming_progress(self) -> RedeemingProgress:
@@ -316,6 +325,16 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         """Set the current batch of the claim parameters."""
         self._claim_params_batch = claim_params_batch
 
+    @property
+    def redeem_statuses_batch(self) -> list:
+        """Get the current batch of the pre-checked markets' statuses."""
+        return self._redeem_statuses_batch
+
+    @redeem_statuses_batch.setter
+    def redeem_statuses_batch(self, redeem_statuses_batch: list) -> None:
+        """Set the current batch of the pre-checked markets' statuses."""
+        self._redeem_statuses_batch = redeem_statuses_batch
+
     @property
     def built_data(self) -> HexBytes:
         """Get the built transaction's data."""
@@ -336,6 +355,40 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         """Get whether the claim winnings simulation is ok."""
         self._claim_winnings_simulation_ok = claim_winnings_simulation_ok
 
+    @property
+    def events_index(self) -> RedeemEventsIndex:
+        """Get the index of the scanned redeeming events, loading it from the disk on the first access."""
+        if self._events_index is not None:
+            return self._events_index
+
+        scope = ":".join(
+            (
+                self.synchronized_data.safe_contract_address,
+                self.params.conditional_tokens_address,
+                self.params.realitio_address,
+            )
+        ).lower()
+        path = self.params.store_path / REDEEM_EVENTS_INDEX_FILENAME
+        index = RedeemEventsIndex(str(path), scope)
+        try:
+            index.load()
+        except (OSError, ValueError, TypeError, KeyError) as exc:
+            self.context.logger.warning(
+                f"Could not load the redeeming events' index, the events will be scanned from scratch: {exc}"
+            )
+            index = RedeemEventsIndex(str(path), scope)
+        self._events_index = index
+        return index
+
+    def _store_events_index(self) -> None:
+        """Store the index of the scanned redeeming events."""
+        try:
+            self.events_index.store()
+        except OSError as exc:
+            self.context.logger.warning(
+                f"Could not store the redeeming events' index: {exc}"
+            )
+
     def _store_progress(self) -> None:
         """Store the redeeming progress."""
         self.redeeming_progress.trades = self.trades
@@ -361,10 +414,15 @@ class RedeemBehaviour(RedeemInfoBehaviour):
             if not can_proceed:
                 break
 
-            trades_market_chunk = yield from self._fetch_redeem_info()
-            if trades_market_chunk is not None:
+            # the chunks are aggregated as soon as they are fetched, instead of collecting the whole history first
+            self._earliest_block_pending = True
+            trades_market_chunk = yield from self._fetch_redeem_info(
+                self.update_redeem_info
+            )
+            if trades_market_chunk:
                 yield from self.update_redeem_info(trades_market_chunk)
 
+        self.context.logger.info(self.policy.stats_report())
         # truncate the trades, otherwise logs get too big
         trades_str = str(self.trades)[:MAX_LOG_SIZE]
         self.context.logger.info(f"Fetched redeeming information: {trades_str}")
@@ -431,9 +489,19 @@ class RedeemBehaviour(RedeemInfoBehaviour):
             kwargs["condition_ids"].append(trade.fpmm.condition.id)
             kwargs["index_sets"].append(trade.fpmm.condition.index_sets)
 
+        condition_ids = kwargs["condition_ids"]
         if not self.redeeming_progress.check_started:
-            self.redeeming_progress.check_from_block = self.earliest_block_number
+            # only the blocks which have not been scanned for these conditions in previous rounds are scanned
+            index = self.events_index
+            index.retain(
+                condition_ids, (trade.fpmm.question.id for trade in self.trades)
+            )
+            self.redeeming_progress.payouts.update(index.known_payouts(condition_ids))
             yield from self.wait_for_condition_with_sleep(self._get_latest_block)
+            self.redeeming_progress.check_from_block = min(
+                index.redeemed_from_block(condition_ids, self.earliest_block_number),
+                self.latest_block_number,
+            )
             self.redeeming_progress.check_to_block = self.latest_block_number
             self.redeeming_progress.check_started = True
 
@@ -473,6 +541,10 @@ class RedeemBehaviour(RedeemInfoBehaviour):
                 continue
 
             self.redeeming_progress.payouts.update(self.payouts_batch)
+            self.events_index.record_redeemed(
+                condition_ids, from_block, to_block, self.payouts_batch
+            )
+            self._store_events_index()
             self.redeeming_progress.check_from_block = to_block
             from_block += batch_size
 
@@ -583,6 +655,66 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         )
         return result
 
+    def _get_redeem_statuses(self, candidates: List[Trade]) -> WaitableConditionType:
+        """Get whether the candidates' conditions are resolved and their questions' history hashes."""
+        result = yield from self.contract_interact(
+            performative=ContractApiMessage.Performative.GET_RAW_TRANSACTION,  # type: ignore
+            contract_address=self.params.conditional_tokens_address,
+            contract_public_id=FixedProductMarketMakerContract.contract_id,
+            contract_callable="get_redeem_statuses",
+            data_key="statuses",
+            placeholder=get_name(RedeemBehaviour.redeem_statuses_batch),
+            realitio_address=self.params.realitio_address,
+            condition_ids=[
+                candidate.fpmm.condition.id.to_0x_hex() for candidate in candidates
+            ],
+            question_ids=[
+                "0x" + candidate.fpmm.question.id.hex() for candidate in candidates
+            ],
+        )
+        return result
+
+    def _pre_check_candidates(self, candidates: List[Trade]) -> Generator:
+        """Pre-check the resolution status and the history hash of the non-dust candidates in a single batch.
+
+        If the batch cannot be read, the candidates are checked one by one while they are being processed.
+
+        :param candidates: the redeeming candidates to pre-check.
+        :yield: the contract-api request step.
+        """
+        candidates = [
+            candidate
+            for candidate in candidates
+            if self.claimable_amounts.get(candidate.fpmm.condition.id, 0)
+            >= self.params.dust_threshold
+        ]
+        if not candidates:
+            return
+
+        success = yield from self._get_redeem_statuses(candidates)
+        if not success or len(self.redeem_statuses_batch) != len(candidates):
+            self.context.logger.warning(
+                f"Could not pre-check {len(candidates)} redeeming candidate(s). "
+                "They will be checked one by one."
+            )
+            return
+
+        for candidate, (resolved, history_hash) in zip(
+            candidates, self.redeem_statuses_batch
+        ):
+            status = (bool(resolved), bytes(HexBytes(history_hash)))
+            self._redeem_statuses[candidate.fpmm.condition.id] = status
+
+    def _check_redeem_status(self) -> Generator:
+        """Set whether the current market is resolved and its history hash, preferring the pre-checked ones."""
+        status = self._redeem_statuses.get(self.current_condition_id, None)
+        if status is not None:
+            self.already_resolved, self.history_hash = status
+            return
+
+        yield from self.wait_for_condition_with_sleep(self._check_already_resolved)
+        yield from self.wait_for_condition_with_sleep(self._get_history_hash)
+
     def _build_resolve_data(self) -> WaitableConditionType:
         """Prepare the safe tx to resolve the condition."""
         result = yield from self.contract_interact(
@@ -656,10 +788,18 @@ class RedeemBehaviour(RedeemInfoBehaviour):
 
     def _get_claim_params_via_events(self) -> WaitableConditionType:
         """Get claim params using an RPC to get the events."""
+        question_id = self.current_question_id
         if not self.redeeming_progress.claim_started:
-            self.redeeming_progress.claim_from_block = self.earliest_block_number
-            self.redeeming_progress.claim_to_block = (
-                self.redeeming_progress.check_to_block
+            # the answers indexed in previous rounds are reused and only the newer blocks are scanned
+            index = self.events_index
+            claim_to_block = self.redeeming_progress.check_to_block
+            self.redeeming_progress.claim_from_block = min(
+                index.answers_from_block(question_id, self.earliest_block_number),
+                claim_to_block,
+            )
+            self.redeeming_progress.claim_to_block = claim_to_block
+            self.redeeming_progress.answered = index.known_answers(
+                question_id, self.earliest_block_number
             )
             self.redeeming_progress.claim_started = True
 
@@ -675,7 +815,7 @@ class RedeemBehaviour(RedeemInfoBehaviour):
                 placeholder=get_name(RedeemBehaviour.claim_params_batch),
                 from_block=from_block,
                 to_block=to_block,
-                question_id=self.current_question_id,
+                question_id=question_id,
                 timeout=self.params.contract_timeout,
             )
 
@@ -694,7 +834,10 @@ class RedeemBehaviour(RedeemInfoBehaviour):
                 )
                 continue
 
-            self.redeeming_progress.answered.extend(self.claim_params_batch)
+            self.redeeming_progress.answered = self.events_index.record_answers(
+                question_id, from_block, to_block, self.claim_params_batch
+            )
+            self._store_events_index()
             self.redeeming_progress.claim_from_block = to_block
             from_block += batch_size
 
@@ -734,13 +877,12 @@ class RedeemBehaviour(RedeemInfoBehaviour):
 
     def _prepare_single_redeem(self) -> WaitableConditionType:
         """Prepare a multisend transaction for a single redeeming action."""
-        yield from self.wait_for_condition_with_sleep(self._check_already_resolved)
+        yield from self._check_redeem_status()
         steps = []
         if not self.already_resolved:
             # 1. resolve the question if it hasn't been resolved yet
             steps.append(self._build_resolve_data)
 
-        yield from self.wait_for_condition_with_sleep(self._get_history_hash)
         if not self.is_history_hash_null:
             # 2. claim the winnings if claiming has not been done yet
             if not self.redeeming_progress.claim_finished:
@@ -804,6 +946,7 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         Steps:
             1. Get all the trades of the trader.
             2. For each trade, check if the trader has not already redeemed a non-dust winning position.
+            The resolution status and the history hash of the trades' markets are pre-checked in batches.
             3. If so, prepare a multisend transaction like this:
             TXS:
                 1. resolve (optional)
@@ -827,7 +970,13 @@ class RedeemBehaviour(RedeemInfoBehaviour):
 
         winnings_found = 0
 
-        for redeem_candidate in self.trades:
+        # the candidates are pre-checked in batches, only as far as they are needed to fill the redeeming batch
+        candidates = list(self.trades)
+        for i, redeem_candidate in enumerate(candidates):
+            if i % REDEEM_PRE_CHECK_BATCH_SIZE == 0:
+                batch = candidates[i : i + REDEEM_PRE_CHECK_BATCH_SIZE]
+                yield from self._pre_check_candidates(batch)
+
             is_claimable = yield from self._process_candidate(redeem_candidate)
             if not is_claimable:
                 msg = "Not redeeming position. Moving to the next one..."
@@ -867,12 +1016,6 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         self.context.logger.info("Transaction successfully prepared.")
         return self.tx_hex
 
-    def _store_utilized_tools(self) -> None:
-        """Store the tools utilized by the behaviour."""
-        path = self.params.store_path / self.UTILIZED_TOOLS_PATH
-        with path.open("w") as f:
-            json.dump(self.utilized_tools, f)
-
     def finish_behaviour(self, payload: BaseTxPayload) -> Generator:
         """Finish the behaviour."""
         self._store_utilized_tools()
@@ -898,8 +1041,8 @@ class RedeemBehaviour(RedeemInfoBehaviour):
         tx_submitter = self.matching_round.auto_round_id()
         benchmarking_enabled = self.benchmarking_mode.enabled
         serialized_tools = json.dumps(list(self.mech_tools))
-        policy = self.policy.serialize()
-        utilized_tools = json.dumps(self.utilized_tools)
+        policy = self.policy.serialize_compact()
+        utilized_tools = self._serialize_utilized_tools()
         condition_ids = json.dumps(list(self.redeemed_condition_ids))
         payout = self.payout_so_far
         return RedeemPayload(
@@ -19,9 +19,10 @@
 
 """This module contains the behaviour for sampling a bet."""
 
+import heapq
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 from packages.valory.skills.decision_maker_abci.behaviours.base import (
     DecisionMakerBaseBehaviour,
@@ -36,6 +37,54 @@ from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
 WEEKDAYS = 7
 UNIX_DAY = 60 * 60 * 24
 UNIX_WEEK = WEEKDAYS * UNIX_DAY
+# the queues from which the bets are sampled, in the order in which they are exhausted
+SAMPLING_QUEUES = (
+    QueueStatus.TO_PROCESS,
+    QueueStatus.PROCESSED,
+    QueueStatus.REPROCESSED,
+)
+
+
+def _priority_key(bet: Bet) -> Tuple[int, int, float, int]:
+    """Get the key of the priority logic, in decreasing order of priority."""
+    return (
+        bet.invested_amount,
+        -bet.processed_timestamp,  # Increasing order of processed_timestamp
+        bet.scaledLiquidityMeasure,
+        bet.openingTimestamp,
+    )
+
+
+class BetsPriorityQueue:
+    """A priority queue of the bets to sample from, which pops their positions following the priority logic.
+
+    The bets are heapified once, so each sampled bet costs a logarithmic pop, instead of re-bucketing and re-sorting
+    all the remaining candidates. The bets of the first non-empty queue status are popped first,
+    and the ties are broken by the bets' positions, as a stable sort would.
+    """
+
+    def __init__(self, bets: Iterable[Tuple[int, Bet]]) -> None:
+        """Initialize the queue with the given bets and their positions."""
+        self._heap: List[Tuple[int, Tuple[Any, ...], int]] = []
+        for position, bet in bets:
+            if bet.queue_status not in SAMPLING_QUEUES:
+                continue
+            queue = SAMPLING_QUEUES.index(bet.queue_status)
+            inverted_key = tuple(-value for value in _priority_key(bet))
+            self._heap.append((queue, inverted_key, position))
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        """Get the number of bets in the queue."""
+        return len(self._heap)
+
+    def pop(self) -> int:
+        """Pop the position of the bet with the highest priority.
+
+        :return: the position of the bet.
+        :raises: `IndexError` if the queue is empty.
+        """
+        return heapq.heappop(self._heap)[-1]
 
 
 class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
@@ -173,25 +222,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             return "wrong_queue"
         return "processable"
 
-    @staticmethod
-    def _sort_by_priority_logic(bets: List[Bet]) -> List[Bet]:
-        """
-        Sort bets based on the priority logic.
-
-        :param bets: the bets to sort.
-        :return: the sorted list of bets.
-        """
-        return sorted(
-            bets,
-            key=lambda bet: (
-                bet.invested_amount,
-                -bet.processed_timestamp,  # Increasing order of processed_timestamp
-                bet.scaledLiquidityMeasure,
-                bet.openingTimestamp,
-            ),
-            reverse=True,
-        )
-
     @staticmethod
     def _get_bets_queue_wise(bets: List[Bet]) -> Tuple[List[Bet], List[Bet], List[Bet]]:
         """Return a dictionary of bets with queue status as key."""
@@ -207,6 +237,15 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             bets_by_status[QueueStatus.REPROCESSED],
         )
 
+    def _bets_priority_queue(self, bets: List[Bet]) -> BetsPriorityQueue:
+        """Get a priority queue of the given bets, positioned in all the available bets."""
+        candidates = {id(bet) for bet in bets}
+        return BetsPriorityQueue(
+            (position, bet)
+            for position, bet in enumerate(self.bets)
+            if id(bet) in candidates
+        )
+
     def _sampled_bet_idx(self, bets: List[Bet]) -> int:
         """
         Sample a bet and return its index.
@@ -225,17 +264,7 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         :param bets: the bets' values to compare for the sampling.
         :return: the index of the sampled bet, out of all the available bets, not only the given ones.
         """
-
-        to_process_bets, processed_bets, reprocessed_bets = self._get_bets_queue_wise(
-            bets
-        )
-
-        # pick the first queue status that has bets in it
-        bets_to_sort: List[Bet] = to_process_bets or processed_bets or reprocessed_bets
-
-        sorted_bets = self._sort_by_priority_logic(bets_to_sort)
-
-        return self.bets.index(sorted_bets[0])
+        return self._bets_priority_queue(bets).pop()
 
     def _sampling_benchmarking_bet(self, bets: List[Bet]) -> Optional[int]:
         """Sample bet for benchmarking"""
@@ -257,10 +286,7 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         ):
             return None
 
-        bets_to_sort: List[Bet] = to_process_bets or processed_bets or reprocessed_bets
-        sorted_bets = self._sort_by_priority_logic(bets_to_sort)
-
-        return self.bets.index(sorted_bets[0])
+        return self._sampled_bet_idx(bets)
 
     def _sample(self) -> Optional[int]:
         """Sample a bet, mark it as processed, and return its index."""
@@ -413,11 +439,13 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
         in_loop_skew = 0
         in_loop_neg_risk = 0
 
-        # Loop until we find a valid bet or run out of options
-        while available_bets:
+        # Loop until we find a valid bet or run out of options. The candidates are popped from a priority queue,
+        # so that skipping a bet does not require sorting the remaining ones again.
+        candidates = self._bets_priority_queue(available_bets)
+        while candidates:
             in_loop_iterations += 1
             # sample a bet using the priority logic
-            idx = self._sampled_bet_idx(available_bets)
+            idx = candidates.pop()
             sampled_bet = self.bets[idx]
 
             # Check liquidity
@@ -425,7 +453,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             if liquidity == 0:
                 msg = f"Sampled bet {sampled_bet.id} has zero liquidity, skipping"
                 self.context.logger.warning(msg)
-                available_bets.remove(sampled_bet)
                 in_loop_zero_liq += 1
                 continue
 
@@ -439,7 +466,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
                     side > self.params.outcome_side_threshold_filter_threshold
                     for side in sampled_bet.outcomeTokenMarginalPrices
                 ):
-                    available_bets.remove(sampled_bet)
                     in_loop_skew += 1
                     continue
 
@@ -450,7 +476,6 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             ):
                 msg = f"Sampled bet {sampled_bet.id} is a negRisk market, skipping"
                 self.context.logger.info(msg)
-                available_bets.remove(sampled_bet)
                 in_loop_neg_risk += 1
                 continue
 
@@ -532,7 +557,7 @@ class SamplingBehaviour(DecisionMakerBaseBehaviour, QueryingBehaviour):
             if idx is None:
                 bets_hash = None
             else:
-                bets_hash = self.hash_stored_bets()
+                bets_hash = yield from self.hash_stored_bets()
 
             payload = SamplingPayload(
                 self.context.agent_address,
@@ -21,14 +21,19 @@
 
 import csv
 import json
+import os
+import tempfile
 from abc import ABC
 from datetime import datetime
+from functools import partial
 from io import StringIO
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple, cast
 
 from packages.valory.contracts.agent_registry.contract import AgentRegistryContract
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.skills.abstract_round_abci.base import get_name
+from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
+from packages.valory.skills.abstract_round_abci.models import Requests
 from packages.valory.skills.decision_maker_abci.behaviours.base import (
     CID_PREFIX,
     DecisionMakerBaseBehaviour,
@@ -39,16 +44,24 @@ from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
     EGreedyPolicy,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import (
+    UtilizedTools,
+    UtilizedToolsJournal,
+)
 from packages.valory.skills.decision_maker_abci.utils.tool_suitability import (
     is_prediction_tool,
 )
 
 POLICY_STORE = "policy_store_multi_bet_failure_adjusting.json"
 AVAILABLE_TOOLS_STORE = "available_tools_store.json"
+MECH_MANIFESTS_STORE = "mech_manifests_store.json"
 UTILIZED_TOOLS_STORE = "utilized_tools.json"
 GET = "GET"
 OK_CODE = 200
 NO_METADATA_HASH = "0" * 64
+# the maximum number of mech manifests which are requested from IPFS at the same time
+MANIFEST_FETCH_CONCURRENCY = 4
+MANIFEST_FETCH_TIMEOUT = 60.0
 
 
 class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
@@ -59,13 +72,12 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
         super().__init__(**kwargs)
         self._mech_id: int = 0
         self._mech_hash: str = ""
-        self._utilized_tools: Dict[str, str] = {}
+        self._utilized_tools: UtilizedTools = UtilizedTools()
         self._mech_tools: Set[str] = set()
         self._remote_accuracy_information: StringIO = StringIO()
         # Tool-suitability classifier cache, populated per boot by
         # `_fetch_mech_manifests`; keyed by lowercased tool name.
         self._tool_metadata: Dict[str, Dict[str, Any]] = {}
-        self._pending_cid: Optional[str] = None
 
     @property
     def mech_tools(self) -> Set[str]:
@@ -110,15 +122,27 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
         self._mech_hash = mech_hash
 
     @property
-    def utilized_tools(self) -> Dict[str, str]:
+    def utilized_tools(self) -> UtilizedTools:
         """Get the utilized tools."""
         return self._utilized_tools
 
     @utilized_tools.setter
     def utilized_tools(self, utilized_tools: Dict[str, str]) -> None:
         """Get the utilized tools."""
+        if not isinstance(utilized_tools, UtilizedTools):
+            utilized_tools = UtilizedTools(utilized_tools)
         self._utilized_tools = utilized_tools
 
+    @property
+    def utilized_tools_journal(self) -> UtilizedToolsJournal:
+        """Get the journal of the utilized tools, which is shared by the behaviours."""
+        tools_path = str(self.params.store_path / UTILIZED_TOOLS_STORE)
+        journal = self.shared_state.utilized_tools_journal
+        if journal is None or journal.snapshot_path != tools_path:
+            journal = UtilizedToolsJournal(tools_path)
+            self.shared_state.utilized_tools_journal = journal
+        return journal
+
     @property
     def mech_tools_api(self) -> AgentToolsSpecs:
         """Get the mech agent api specs."""
@@ -127,12 +151,12 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
     def setup(self) -> None:
         """Set the behaviour up."""
         try:
-            self.utilized_tools = self.synchronized_data.utilized_tools
+            utilized_tools = self.synchronized_data.utilized_tools
         except Exception:
-            self.utilized_tools = self._try_recover_utilized_tools()
-        else:
-            if self.utilized_tools is None:
-                self.utilized_tools = self._try_recover_utilized_tools()
+            utilized_tools = None
+        if utilized_tools is None:
+            utilized_tools = self._try_recover_utilized_tools()
+        self.utilized_tools = utilized_tools
 
     def set_mech_agent_specs(self) -> None:
         """Set the mech's agent specs."""
@@ -270,66 +294,144 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
             yield from self.wait_for_condition_with_sleep(step)
 
     def _fetch_mech_manifests(self) -> Generator[None, None, None]:
-        """Populate `self._tool_metadata` from each unique mech manifest."""
+        """Populate `self._tool_metadata` from each unique mech manifest.
+
+        Manifests are cached on disk keyed by their CID, which is the mech's metadata hash, so only
+        the manifests of new or updated mechs are fetched from IPFS.
+        """
         self._tool_metadata = {}
         if not self.synchronized_data.is_marketplace_v2:
             return
         if self.benchmarking_mode.enabled:
             return
 
-        seen_cids: Set[str] = set()
+        cids: List[str] = []
         for mech in self.synchronized_data.mechs_info:
             metadata_str = (
                 mech.service.metadata_str if mech.service is not None else None
             )
-            if metadata_str is None or metadata_str in seen_cids:
+            if metadata_str is None or metadata_str in cids:
                 continue
-            seen_cids.add(metadata_str)
-            self._pending_cid = metadata_str
-            yield from self.wait_for_condition_with_sleep(self._fetch_one_manifest)
+            cids.append(metadata_str)
+
+        cached = self._try_recover_mech_manifests()
+        manifests = {cid: cached[cid] for cid in cids if cid in cached}
+        missing = [cid for cid in cids if cid not in manifests]
+        fetched: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        if missing:
+            fetched = yield from self._fetch_manifests(missing)
+            manifests.update(fetched)
+
+        for cid in cids:
+            self._tool_metadata.update(manifests.get(cid, {}))
 
-        self._pending_cid = None
+        # this also drops the manifests of the mechs which are no longer available or whose hash has changed
+        if manifests != cached:
+            self._store_mech_manifests(manifests)
 
-        if seen_cids and not self._tool_metadata:
+        if cids and not self._tool_metadata:
             self.context.logger.warning(
                 "Tool-suitability classifier has no metadata for any of "
-                f"{len(seen_cids)} mech manifest CIDs; the suitability filter "
+                f"{len(cids)} mech manifest CIDs; the suitability filter "
                 "will be skipped and the round will proceed against the raw "
                 "mech_tools set."
             )
-        elif seen_cids:
+        elif cids:
             self.context.logger.info(
-                f"Tool-suitability classifier fetched {len(seen_cids)} unique "
-                f"mech manifest CID(s); {len(self._tool_metadata)} tool entries "
+                f"Tool-suitability classifier fetched {len(fetched)} of {len(missing)} "
+                f"uncached out of {len(cids)} unique mech manifest CID(s); "
+                f"{len(self._tool_metadata)} tool entries "
                 "available for classification."
             )
 
-    def _fetch_one_manifest(self) -> WaitableConditionType:
-        """Fetch the manifest for `self._pending_cid`, with bounded retries."""
-        metadata_str = self._pending_cid
-        if metadata_str is None:
-            return True
+    def _fetch_manifests(
+        self, cids: List[str]
+    ) -> Generator[None, None, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Fetch the manifests of the given CIDs concurrently, with bounded parallelism and retries.
+
+        :param cids: the CIDs of the manifests to fetch.
+        :return: the tool metadata of each successfully fetched manifest, keyed by its CID.
+        :yield: None
+        """
+        manifests: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        attempts: Dict[str, int] = {}
+        pending = list(cids)
+        while pending:
+            wave = pending[:MANIFEST_FETCH_CONCURRENCY]
+            pending = pending[MANIFEST_FETCH_CONCURRENCY:]
+            responses = yield from self._request_manifests(wave)
+
+            to_retry = []
+            for cid in wave:
+                res_raw = responses.get(cid, None)
+                extracted = self._extract_tool_metadata(res_raw)
+                if extracted:
+                    manifests[cid] = extracted
+                    continue
+
+                attempts[cid] = attempts.get(cid, 0) + 1
+                if not self._is_manifest_retriable(cid, res_raw, attempts[cid]):
+                    continue
+                to_retry.append(cid)
+
+            if to_retry:
+                pending.extend(to_retry)
+                sleep_time = self.params.rpc_sleep_time
+                self.context.logger.info(
+                    f"Retrying {len(to_retry)} mech manifest(s) in {sleep_time} seconds."
+                )
+                yield from self.sleep(sleep_time)
+
+        return manifests
+
+    def _request_manifests(
+        self, cids: List[str]
+    ) -> Generator[None, None, Dict[str, Any]]:
+        """Request the manifests of the given CIDs at once and wait for all the responses.
+
+        :param cids: the CIDs of the manifests to request.
+        :return: the raw responses, keyed by CID. A CID whose response did not arrive in time is missing.
+        :yield: None
+        """
+        responses: Dict[str, Any] = {}
+        specs = self.mech_tools_api.get_spec()
+        ctx_requests = cast(Requests, self.context.requests)
+        for cid in cids:
+            specs["url"] = self.params.ipfs_address + CID_PREFIX + cid
+            http_message, http_dialogue = self._build_http_request_message(**specs)
+            self.context.outbox.put_message(message=http_message)
+            request_nonce = self._get_request_nonce_from_dialogue(http_dialogue)
+            ctx_requests.request_id_to_callback[request_nonce] = partial(
+                self._collect_manifest_response, responses, cid
+            )
 
-        self.mech_tools_api.__dict__["_frozen"] = False
         try:
-            self.mech_tools_api.url = (
-                self.params.ipfs_address + CID_PREFIX + metadata_str
+            yield from self.wait_for_condition(
+                lambda: len(responses) == len(cids),
+                timeout=MANIFEST_FETCH_TIMEOUT,
+            )
+        except TimeoutException:
+            missing = [cid for cid in cids if cid not in responses]
+            self.context.logger.warning(
+                f"Timed out while waiting for the mech manifest(s) {missing}."
             )
-        finally:
-            # Restore the freeze even if `url` setting raises, so the shared
-            # `mech_tools_api` on `self.context` stays consistent for the rest
-            # of the round.
-            self.mech_tools_api.__dict__["_frozen"] = True
+        return responses
 
-        specs = self.mech_tools_api.get_spec()
-        res_raw = yield from self.get_http_response(**specs)
-        extracted = self._extract_tool_metadata(res_raw)
+    @staticmethod
+    def _collect_manifest_response(
+        responses: Dict[str, Any], cid: str, message: Any, _behaviour: Any
+    ) -> None:
+        """Collect the response of a manifest request, regardless of the behaviour that is currently active."""
+        responses[cid] = message
 
-        if extracted:
-            self._tool_metadata.update(extracted)
-            self.mech_tools_api.reset_retries()
-            return True
+    def _is_manifest_retriable(self, cid: str, res_raw: Any, attempts: int) -> bool:
+        """Check whether a failed manifest fetch should be retried, logging the manifests which are given up on.
 
+        :param cid: the CID of the manifest.
+        :param res_raw: the raw response, or `None` if it did not arrive.
+        :param attempts: the number of failed attempts for the manifest so far.
+        :return: whether the manifest should be fetched again.
+        """
         # `AgentToolsSpecs` extends `ApiSpecs` directly and does NOT define
         # `is_permanent_error` (only `MechToolsSpecs` does, on the mech-interact
         # side). Inline a minimal status-code classifier: 2xx is permanent
@@ -343,26 +445,66 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
         if is_permanent:
             self.context.logger.warning(
                 f"Tool-suitability classifier could not extract metadata "
-                f"for CID {metadata_str!r} "
+                f"for CID {cid!r} "
                 f"(status={status}, permanent error); this mech manifest "
                 "will not contribute to the suitability filter."
             )
-            self.mech_tools_api.reset_retries()
-            return True
+            return False
 
-        self.mech_tools_api.increment_retries()
-        if self.mech_tools_api.is_retries_exceeded():
+        if attempts > self.mech_tools_api.retries_info.retries:
             self.context.logger.warning(
                 f"Tool-suitability classifier could not extract metadata "
-                f"for CID {metadata_str!r} "
-                f"(status={getattr(res_raw, 'status_code', '?')}); "
+                f"for CID {cid!r} "
+                f"(status={status if status is not None else '?'}); "
                 "retries exhausted, this mech manifest will not contribute "
                 "to the suitability filter."
             )
-            self.mech_tools_api.reset_retries()
-            return True
+            return False
 
-        return False
+        return True
+
+    def _try_recover_mech_manifests(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Try to recover the cached tool metadata of the mech manifests, keyed by CID."""
+        manifests_path = self.params.store_path / MECH_MANIFESTS_STORE
+        try:
+            with open(manifests_path, "r") as f:
+                manifests = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.context.logger.warning(f"Could not recover the mech manifests: {e}.")
+            return {}
+
+        if not isinstance(manifests, dict):
+            self.context.logger.warning(
+                f"Ignoring the invalid mech manifests store {manifests_path}."
+            )
+            return {}
+        return manifests
+
+    def _store_mech_manifests(
+        self, manifests: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> None:
+        """Store the tool metadata of the mech manifests, keyed by CID, atomically."""
+        manifests_path = self.params.store_path / MECH_MANIFESTS_STORE
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=MECH_MANIFESTS_STORE + ".", dir=self.params.store_path
+            )
+        except OSError as e:
+            self.context.logger.warning(f"Could not store the mech manifests: {e}.")
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifests, f)
+            os.replace(tmp_path, manifests_path)
+        except OSError as e:
+            self.context.logger.warning(f"Could not store the mech manifests: {e}.")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     @staticmethod
     def _extract_tool_metadata(res_raw: Any) -> Dict[str, Dict[str, Any]]:
@@ -565,19 +707,17 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
         if self.is_first_period:
             self._update_policy_tools()
 
-    def _try_recover_utilized_tools(self) -> Dict[str, str]:
+    def _try_recover_utilized_tools(self) -> UtilizedTools:
         """Try to recover the utilized tools from the tools store."""
-        tools_path = self.params.store_path / UTILIZED_TOOLS_STORE
         try:
-            with open(tools_path, "r") as tools_file:
-                return json.load(tools_file)
+            return self.utilized_tools_journal.load()
         except FileNotFoundError:
             msg = "No file with pending rewards for the policy were found in the local storage."
             self.context.logger.info(msg)
         except Exception as exc:
             msg = f"Could not recover the pending rewards for the policy: {exc}."
             self.context.logger.warning(msg)
-        return {}
+        return UtilizedTools()
 
     def _try_recover_mech_tools(self) -> Optional[List[str]]:
         """Try to recover the available tools from the tools store."""
@@ -610,9 +750,9 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
 
         V2-only (the classifier needs the mech manifest) and skipped in
         benchmarking mode. It now sits on the redeem path, so a persistent IPFS
-        outage costs up to ``retries`` x ``rpc_sleep_time`` per manifest CID
-        before the redeem behaviour can proceed -- tune ``retries`` if that boot
-        stall matters. On a manifest fetch failure or an all-unsuitable verdict
+        outage costs up to ``retries`` x ``rpc_sleep_time`` per wave of
+        uncached manifest CIDs before the redeem behaviour can proceed -- tune
+        ``retries`` if that boot stall matters. On a manifest fetch failure or an all-unsuitable verdict
         it leaves the field unpublished (both cases logged), so the ChatUI
         degrades to the raw set rather than hiding every tool.
         ``available_mech_tools`` is never narrowed here, so the e-greedy policy
@@ -678,9 +818,17 @@ class StorageManagerBehaviour(DecisionMakerBaseBehaviour, ABC):
 
     def _store_utilized_tools(self) -> None:
         """Store the utilized tools."""
-        tools_path = self.params.store_path / UTILIZED_TOOLS_STORE
-        with open(tools_path, "w") as f:
-            json.dump(self.utilized_tools, f)
+        self.utilized_tools_journal.store(self.utilized_tools)
+
+    def _serialize_utilized_tools(self) -> str:
+        """Evict the expired utilized tools and serialize their changes since the synchronized ones."""
+        self.utilized_tools.evict_expired(self.synced_timestamp)
+        try:
+            synchronized_tools = self.synchronized_data.utilized_tools
+        except Exception:
+            # the utilized tools have not been synchronized yet
+            synchronized_tools = UtilizedTools()
+        return self.utilized_tools.serialize_delta(synchronized_tools)
 
     def _store_all(self) -> None:
         """Store the policy, the available tools and the utilized tools."""
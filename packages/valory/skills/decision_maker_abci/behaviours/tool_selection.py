@@ -197,8 +197,8 @@ class ToolSelectionBehaviour(StorageManagerBehaviour):
                 ):
                     self.policy.tool_used(selected_tool)
                 mech_tools = json.dumps(list(self.mech_tools))
-                policy = self.policy.serialize()
-                utilized_tools = json.dumps(self.utilized_tools, sort_keys=True)
+                policy = self.policy.serialize_compact()
+                utilized_tools = self._serialize_utilized_tools()
                 self._store_all()
 
             payload = ToolSelectionPayload(
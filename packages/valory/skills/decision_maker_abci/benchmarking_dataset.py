@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""An indexed reader of the dataset used during the benchmarking mode."""
+
+import csv
+import os
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+DATASET_ENCODING = "utf-8"
+
+
+class BenchmarkingDataset:
+    """A benchmarking dataset, indexed once so that any of its rows can be read with a single seek.
+
+    The dataset is scanned a single time, recording the byte offset at which each row starts and the numbers of the
+    rows of each question id. Reading a row then seeks directly to it, instead of iterating the file from the top,
+    which makes replaying the whole dataset linear in its size.
+
+    The rows are numbered from 1, following the header, and the empty lines are skipped, as `csv.DictReader` does.
+    """
+
+    def __init__(self, path: str, sep: str, question_id_field: str) -> None:
+        """Initialize the dataset."""
+        self.path = str(path)
+        self.sep = sep
+        self.question_id_field = question_id_field
+        self.fieldnames: List[str] = []
+        self.rows_by_question_id: Dict[str, List[int]] = {}
+        self._offsets: List[int] = []
+        self._signature: Optional[Tuple[int, int]] = None
+        self._consumed = 0
+
+    @property
+    def n_rows(self) -> int:
+        """Get the number of rows in the dataset."""
+        return len(self._offsets)
+
+    def _file_signature(self) -> Tuple[int, int]:
+        """Get the modification time and the size of the dataset's file."""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_stale(self, path: str, sep: str, question_id_field: str) -> bool:
+        """Whether the index does not correspond to the given configuration or to the file's current content."""
+        if (str(path), sep, question_id_field) != (
+            self.path,
+            self.sep,
+            self.question_id_field,
+        ):
+            return True
+        try:
+            return self._file_signature() != self._signature
+        except OSError:
+            return True
+
+    def _lines(self, dataset: BinaryIO) -> Iterator[str]:
+        """Iterate over the decoded lines of the dataset, keeping track of the consumed bytes."""
+        for line in iter(dataset.readline, b""):
+            self._consumed += len(line)
+            yield line.decode(DATASET_ENCODING)
+
+    def load(self) -> None:
+        """Index the dataset.
+
+        :raises: `OSError` if the dataset cannot be read, `KeyError` if the question id field is missing.
+        """
+        self.fieldnames = []
+        self.rows_by_question_id = {}
+        self._offsets = []
+        self._signature = self._file_signature()
+        self._consumed = 0
+
+        with open(self.path, "rb") as dataset:
+            reader = csv.reader(self._lines(dataset), delimiter=self.sep)
+            self.fieldnames = next(reader, [])
+            if not self.fieldnames:
+                return
+            if self.question_id_field not in self.fieldnames:
+                raise KeyError(self.question_id_field)
+            question_id_index = self.fieldnames.index(self.question_id_field)
+
+            row_start = self._consumed
+            for row in reader:
+                if row:
+                    self._offsets.append(row_start)
+                    question_id = (
+                        row[question_id_index] if question_id_index < len(row) else ""
+                    )
+                    self.rows_by_question_id.setdefault(question_id, []).append(
+                        self.n_rows
+                    )
+                row_start = self._consumed
+
+    def row(self, row_number: int) -> Optional[Dict[str, str]]:
+        """Read the row with the given number.
+
+        :param row_number: the number of the row, starting from 1.
+        :return: the header fields mapped to the row's values, or `None` if there is no such row.
+        """
+        if not 1 <= row_number <= self.n_rows:
+            return None
+
+        with open(self.path, "rb") as dataset:
+            dataset.seek(self._offsets[row_number - 1])
+            reader = csv.DictReader(
+                self._lines(dataset), fieldnames=self.fieldnames, delimiter=self.sep
+            )
+            return next(reader, None)
+
+    def row_manager(self) -> Dict[str, List[int]]:
+        """Get a fresh mapping from each question id to the numbers of its rows, to be consumed while benchmarking."""
+        return {
+            question_id: list(rows)
+            for question_id, rows in self.rows_by_question_id.items()
+        }
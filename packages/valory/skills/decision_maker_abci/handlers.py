@@ -81,7 +81,9 @@ class IpfsHandler(AbstractResponseHandler):
 
     SUPPORTED_PROTOCOL = IpfsMessage.protocol_id
     allowed_response_performatives = frozenset({IpfsMessage.Performative.IPFS_HASH})
-    custom_support_performative = IpfsMessage.Performative.FILES
+    custom_support_performatives = frozenset(
+        {IpfsMessage.Performative.FILES, IpfsMessage.Performative.ERROR}
+    )
 
     @property
     def shared_state(self) -> SharedState:
@@ -98,12 +100,16 @@ class IpfsHandler(AbstractResponseHandler):
         self.context.logger.debug(f"Received message: {message}")
         self.shared_state.in_flight_req = False
 
-        if message.performative != self.custom_support_performative:
+        if message.performative not in self.custom_support_performatives:
             return super().handle(message)
 
         dialogue = self.context.ipfs_dialogues.update(message)
         nonce = dialogue.dialogue_label.dialogue_reference[0]
-        callback = self.shared_state.req_to_callback.pop(nonce)
+        callback = self.shared_state.req_to_callback.pop(nonce, None)
+        if callback is None:
+            # e.g., an error response to a request that was not sent with a custom callback
+            self.context.logger.warning(f"No callback defined for {message=}.")
+            return
         callback(message, dialogue)
 
 
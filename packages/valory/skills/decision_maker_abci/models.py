@@ -60,10 +60,18 @@ from packages.valory.skills.agent_performance_summary_abci.models import (
     AgentPerformanceSummaryParams,
 )
 from packages.valory.skills.chatui_abci.models import SharedState as ChatUISharedState
+from packages.valory.skills.decision_maker_abci.benchmarking_dataset import (
+    BenchmarkingDataset,
+)
 from packages.valory.skills.decision_maker_abci.policy import EGreedyPolicy
 from packages.valory.skills.decision_maker_abci.redeem_info import Trade
 from packages.valory.skills.decision_maker_abci.rounds import DecisionMakerAbciApp
+from packages.valory.skills.decision_maker_abci.utilized_tools import (
+    UtilizedTools,
+    UtilizedToolsJournal,
+)
 from packages.valory.skills.market_manager_abci.bets import Bet
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
 from packages.valory.skills.market_manager_abci.models import (
     MarketManagerParams,
     Subgraph,
@@ -74,6 +82,7 @@ from packages.valory.skills.mech_interact_abci.models import (
 from packages.valory.skills.mech_interact_abci.models import (
     SharedState as MechInteractSharedState,
 )
+from packages.valory.skills.staking_abci.models import StakingEpochCache
 
 FromBlockMappingType = Dict[HexBytes, Union[int, str]]
 ClaimParamsType = Tuple[List[bytes], List[str], List[int], List[bytes]]
@@ -148,7 +157,7 @@ class RedeemingProgress:
     """A structure to keep track of the redeeming check progress."""
 
     trades: Set[Trade] = field(default_factory=set)
-    utilized_tools: Dict[str, str] = field(default_factory=dict)
+    utilized_tools: UtilizedTools = field(default_factory=UtilizedTools)
     policy: Optional[EGreedyPolicy] = None
     claimable_amounts: Dict[HexBytes, int] = field(default_factory=dict)
     earliest_block_number: int = 0
@@ -204,6 +213,15 @@ class RedeemingProgress:
         return history_hashes, addresses, bonds, answers
 
 
+@dataclass(frozen=True)
+class CompiledStrategy:
+    """A strategy's executable, compiled once into its own module namespace."""
+
+    source: str
+    callable_method: str
+    method: Optional[Callable]
+
+
 class SharedState(ChatUISharedState, MechInteractSharedState):
     """Keep the current shared state of the skill."""
 
@@ -223,8 +241,19 @@ class SharedState(ChatUISharedState, MechInteractSharedState):
         # there would ``AttributeError`` on the live instance. ``None`` = not yet
         # detected; set once per process (Pearl restarts on a contract switch).
         self.staking_regime_is_new: Optional[bool] = None
+        # the staking values which change at most once per epoch, read by both the staking and the
+        # stop-trading skills; it lives here for the same reason as the regime verdict above
+        self.staking_epoch_cache: StakingEpochCache = StakingEpochCache()
+        # the bets, loaded once and shared by the behaviours of all the skills which manage them
+        self.bets_repository: BetsRepository = BetsRepository()
+        # the journal of the utilized tools, created once the store path is known
+        self.utilized_tools_journal: Optional[UtilizedToolsJournal] = None
         self.strategy_to_filehash: Dict[str, str] = {}
         self.strategies_executables: Dict[str, Tuple[str, str]] = {}
+        # the IPFS hash of the file from which each strategy's executable was downloaded
+        self.strategies_filehashes: Dict[str, str] = {}
+        # the compiled strategies, keyed by the IPFS hash of their executable's file
+        self.compiled_strategies: Dict[str, CompiledStrategy] = {}
         self.in_flight_req: bool = False
         self.req_to_callback: Dict[str, Callable] = {}
         self.mock_data: Optional[BenchmarkingMockData] = None
@@ -242,6 +271,8 @@ class SharedState(ChatUISharedState, MechInteractSharedState):
         # the mapping from bet id to the row number in the dataset
         # the key is the market id/question_id
         self.bet_id_row_manager: Dict[str, List[int]] = {}
+        # the indexed dataset of the benchmarking mode, loaded once and shared by the behaviours
+        self.benchmarking_dataset: Optional[BenchmarkingDataset] = None
         # mech call counter for benchmarking behaviour
         self.benchmarking_mech_calls: int = 0
         # whether the mech response round timed out
@@ -255,6 +286,13 @@ class SharedState(ChatUISharedState, MechInteractSharedState):
         # them twice.
         self.post_bet_update_applied_tx_hash: Optional[str] = None
 
+    def invalidate_compiled_strategy(self, strategy: str) -> None:
+        """Drop the compiled executable of the given strategy, so that it gets recompiled on its next execution."""
+        self.compiled_strategies.pop(strategy, None)
+        file_hash = self.strategies_filehashes.pop(strategy, None)
+        if file_hash is not None:
+            self.compiled_strategies.pop(file_hash, None)
+
     @property
     def mock_question_id(self) -> Any:
         """Get the mock question id."""
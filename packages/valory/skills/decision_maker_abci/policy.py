@@ -19,9 +19,11 @@
 
 """This module contains an Epsilon Greedy Policy implementation."""
 
+import hashlib
 import json
 import random
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, fields, is_dataclass, replace
 from time import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -32,6 +34,11 @@ RandomnessType = Union[int, float, str, bytes, bytearray, None]
 VOLUME_FACTOR_REGULARIZATION = 0.1
 UNSCALED_WEIGHTED_ACCURACY_INTERVAL = (-0.5, 80.5)
 SCALED_WEIGHTED_ACCURACY_INTERVAL = (0, 1)
+# the tag which leads a policy serialized in the compact wire format
+COMPACT_POLICY_TAG = "egp1"
+COMPACT_POLICY_PREFIX = f'["{COMPACT_POLICY_TAG}"'
+# the number of decoded policies to keep, keyed on the digest of their serialized form
+DECODED_POLICIES_CACHE_SIZE = 8
 
 
 class DataclassEncoder(json.JSONEncoder):
@@ -134,8 +141,66 @@ class EGreedyPolicy:
 
     @classmethod
     def deserialize(cls, policy: str) -> "EGreedyPolicy":
-        """Deserialize a string to an `EGreedyPolicy` object."""
-        return json.loads(policy, cls=EGreedyPolicyDecoder)
+        """Deserialize a string, in either the JSON or the compact wire format, to an `EGreedyPolicy` object.
+
+        The decoded policies are memoized on the digest of the string, and every call returns an independent copy,
+        as the callers are free to update the policy that they get.
+        """
+        digest = hashlib.sha256(policy.encode()).hexdigest()
+        decoded = _decoded_policies.get(digest)
+        if decoded is None:
+            if policy.startswith(COMPACT_POLICY_PREFIX):
+                decoded = cls._deserialize_compact(policy)
+            else:
+                decoded = json.loads(policy, cls=EGreedyPolicyDecoder)
+            _decoded_policies[digest] = decoded
+            if len(_decoded_policies) > DECODED_POLICIES_CACHE_SIZE:
+                _decoded_policies.popitem(last=False)
+        else:
+            _decoded_policies.move_to_end(digest)
+        return decoded.copy()
+
+    @classmethod
+    def _deserialize_compact(cls, policy: str) -> "EGreedyPolicy":
+        """Deserialize a string in the compact wire format to an `EGreedyPolicy` object."""
+        (
+            _tag,
+            eps,
+            consecutive_failures_threshold,
+            quarantine_duration,
+            updated_ts,
+            accuracy_store,
+            consecutive_failures,
+        ) = json.loads(policy)
+        return cls(
+            eps=eps,
+            consecutive_failures_threshold=consecutive_failures_threshold,
+            quarantine_duration=quarantine_duration,
+            accuracy_store={
+                tool: AccuracyInfo(*info) for tool, info in accuracy_store.items()
+            },
+            consecutive_failures={
+                tool: ConsecutiveFailures(*failures)
+                for tool, failures in consecutive_failures.items()
+            },
+            updated_ts=updated_ts,
+        )
+
+    def copy(self) -> "EGreedyPolicy":
+        """Get an independent copy of the policy."""
+        return EGreedyPolicy(
+            eps=self.eps,
+            consecutive_failures_threshold=self.consecutive_failures_threshold,
+            quarantine_duration=self.quarantine_duration,
+            accuracy_store={
+                tool: replace(info) for tool, info in self.accuracy_store.items()
+            },
+            consecutive_failures={
+                tool: replace(failures)
+                for tool, failures in self.consecutive_failures.items()
+            },
+            updated_ts=self.updated_ts,
+        )
 
     @property
     def tools(self) -> List[str]:
@@ -273,6 +338,34 @@ class EGreedyPolicy:
         """Return the accuracy policy serialized."""
         return json.dumps(self, cls=DataclassEncoder, sort_keys=True)
 
+    def serialize_compact(self) -> str:
+        """Return the accuracy policy serialized in the compact wire format, which is meant for the payloads.
+
+        The format is a JSON list without the field names and without the weighted accuracy,
+        which is derived from the accuracy store on deserialization:
+        `[tag, eps, consecutive_failures_threshold, quarantine_duration, updated_ts,
+        {tool: [requests, pending, accuracy]}, {tool: [n_failures, timestamp]}]`
+        """
+        return json.dumps(
+            [
+                COMPACT_POLICY_TAG,
+                self.eps,
+                self.consecutive_failures_threshold,
+                self.quarantine_duration,
+                self.updated_ts,
+                {
+                    tool: [info.requests, info.pending, info.accuracy]
+                    for tool, info in self.accuracy_store.items()
+                },
+                {
+                    tool: [failures.n_failures, failures.timestamp]
+                    for tool, failures in self.consecutive_failures.items()
+                },
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
     def stats_report(self) -> str:
         """Report policy statistics."""
         if not self.has_updated:
@@ -289,3 +382,7 @@ class EGreedyPolicy:
         report += "\n".join(stats)
         report += f"\nBest non-quarantined tool so far is {self.best_tool!r}."
         return report
+
+
+# the decoded policies, keyed on the digest of their serialized form, in the order of their last use
+_decoded_policies: "OrderedDict[str, EGreedyPolicy]" = OrderedDict()
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""A persisted index of the events scanned while redeeming."""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from hexbytes import HexBytes
+
+REDEEM_EVENTS_INDEX_FILENAME = "redeem_events_index.json"
+# the blocks before the end of a scanned range which are scanned again, in case they have been reorganized
+RESCAN_MARGIN_BLOCKS = 20
+SCOPE_KEY = "scope"
+REDEEMED_KEY = "redeemed"
+ANSWERS_KEY = "answers"
+RANGE_KEY = "range"
+PAYOUTS_KEY = "payouts"
+EVENTS_KEY = "events"
+BYTES_TAG = "__bytes__"
+
+# a scanned range of blocks, as `(from_block, to_block)`
+BlockRangeType = Tuple[int, int]
+
+
+class _EventsEncoder(json.JSONEncoder):
+    """A JSON encoder for the event logs, which may contain bytes and read-only mappings."""
+
+    def default(self, o: Any) -> Any:
+        """Encode the given object."""
+        if isinstance(o, (bytes, bytearray)):
+            return {BYTES_TAG: HexBytes(o).to_0x_hex()}
+        if isinstance(o, Mapping):
+            return dict(o)
+        return super().default(o)
+
+
+def _events_hook(data: Dict[str, Any]) -> Any:
+    """Decode the bytes encoded by the `_EventsEncoder`."""
+    if len(data) == 1 and BYTES_TAG in data:
+        return HexBytes(data[BYTES_TAG])
+    return data
+
+
+def _event_key(event: Any) -> str:
+    """Get a canonical key of an event log, used to deduplicate the rescanned events."""
+    return json.dumps(event, cls=_EventsEncoder, sort_keys=True)
+
+
+def _hex_id(identifier: Any) -> str:
+    """Get the lowercase `0x` prefixed hex string of a condition or question id."""
+    if isinstance(identifier, (bytes, bytearray)):
+        return HexBytes(identifier).to_0x_hex().lower()
+    identifier = str(identifier).lower()
+    return identifier if identifier.startswith("0x") else f"0x{identifier}"
+
+
+def _resume_block(scanned: Optional[BlockRangeType], earliest_block: int) -> int:
+    """Get the block from which the scan for an id should resume.
+
+    A range which does not go back to the earliest block does not cover the whole period of interest,
+    and the id is scanned again from the earliest block.
+    """
+    if scanned is None or scanned[0] > earliest_block:
+        return earliest_block
+    return max(earliest_block, scanned[1] - RESCAN_MARGIN_BLOCKS)
+
+
+def _is_continuation(scanned: Optional[BlockRangeType], from_block: int) -> bool:
+    """Whether a scan starting from the given block continues the given scanned range."""
+    return scanned is not None and scanned[0] < from_block <= scanned[1]
+
+
+def _extend_range(
+    scanned: Optional[BlockRangeType], from_block: int, to_block: int
+) -> BlockRangeType:
+    """Extend a scanned range with a newly scanned one, or replace it if the new one does not continue it."""
+    if scanned is None or not _is_continuation(scanned, from_block):
+        return from_block, to_block
+    return scanned[0], max(scanned[1], to_block)
+
+
+class RedeemEventsIndex:
+    """The redeeming events which have been scanned so far, with the block ranges they were scanned for.
+
+    Two kinds of events are indexed:
+
+    - the `PayoutRedemption` events of the conditional tokens contract, keyed by condition id,
+    - the realitio `LogNewAnswer` events, keyed by question id.
+
+    For every id, the index remembers the range of blocks which has been scanned and the events found in it,
+    so that later rounds only fetch the blocks produced since. The index is scoped to the redeemer and to the
+    contracts' addresses, and it is pruned to the ids that are still being redeemed, so it stays small.
+    """
+
+    def __init__(self, path: str, scope: str) -> None:
+        """Initialize the index."""
+        self.path = str(path)
+        self.scope = scope
+        self.redeemed_ranges: Dict[str, BlockRangeType] = {}
+        # the payouts are kept under the condition ids exactly as the contract reported them
+        self.payouts: Dict[str, int] = {}
+        self.answer_ranges: Dict[str, BlockRangeType] = {}
+        self.answers: Dict[str, List[Any]] = {}
+
+    def load(self) -> bool:
+        """Load the index from its file.
+
+        :return: whether an index for the same scope was found and loaded.
+        :raises: `OSError` if the file cannot be read, `ValueError`, `TypeError` or `KeyError` if it is malformed.
+        """
+        if not os.path.isfile(self.path):
+            return False
+
+        with open(self.path) as index_file:
+            index = json.load(index_file, object_hook=_events_hook)
+
+        if index[SCOPE_KEY] != self.scope:
+            return False
+
+        self.redeemed_ranges = {}
+        for condition_id, scanned in index[REDEEMED_KEY].items():
+            from_block, to_block = scanned
+            self.redeemed_ranges[condition_id] = int(from_block), int(to_block)
+        self.payouts = {
+            str(condition_id): int(payout)
+            for condition_id, payout in index[PAYOUTS_KEY].items()
+        }
+
+        self.answer_ranges, self.answers = {}, {}
+        for question_id, entry in index[ANSWERS_KEY].items():
+            from_block, to_block = entry[RANGE_KEY]
+            self.answer_ranges[question_id] = int(from_block), int(to_block)
+            self.answers[question_id] = list(entry[EVENTS_KEY])
+
+        return True
+
+    def store(self) -> None:
+        """Store the index to its file atomically.
+
+        :raises: `OSError` if the file cannot be written.
+        """
+        index = {
+            SCOPE_KEY: self.scope,
+            REDEEMED_KEY: self.redeemed_ranges,
+            PAYOUTS_KEY: self.payouts,
+            ANSWERS_KEY: {
+                question_id: {
+                    RANGE_KEY: scanned,
+                    EVENTS_KEY: self.answers.get(question_id, []),
+                }
+                for question_id, scanned in self.answer_ranges.items()
+            },
+        }
+        serialized = json.dumps(index, cls=_EventsEncoder)
+
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.path) + ".", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as index_file:
+                index_file.write(serialized)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def retain(self, condition_ids: Iterable[Any], question_ids: Iterable[Any]) -> None:
+        """Forget the ids which are not being redeemed anymore."""
+        conditions = {_hex_id(condition_id) for condition_id in condition_ids}
+        questions = {_hex_id(question_id) for question_id in question_ids}
+        for condition_id in set(self.redeemed_ranges) - conditions:
+            del self.redeemed_ranges[condition_id]
+        for condition_id in list(self.payouts):
+            if _hex_id(condition_id) not in conditions:
+                del self.payouts[condition_id]
+        for question_id in set(self.answer_ranges) - questions:
+            del self.answer_ranges[question_id]
+            self.answers.pop(question_id, None)
+
+    def redeemed_from_block(
+        self, condition_ids: Iterable[Any], earliest_block: int
+    ) -> int:
+        """Get the block from which the redemptions of the given conditions should be scanned."""
+        return min(
+            (
+                _resume_block(
+                    self.redeemed_ranges.get(_hex_id(condition_id)), earliest_block
+                )
+                for condition_id in condition_ids
+            ),
+            default=earliest_block,
+        )
+
+    def known_payouts(self, condition_ids: Iterable[Any]) -> Dict[str, int]:
+        """Get the indexed payouts of the given conditions."""
+        conditions = {_hex_id(condition_id) for condition_id in condition_ids}
+        return {
+            condition_id: payout
+            for condition_id, payout in self.payouts.items()
+            if _hex_id(condition_id) in conditions
+        }
+
+    def record_redeemed(
+        self,
+        condition_ids: Iterable[Any],
+        from_block: int,
+        to_block: int,
+        payouts: Mapping[str, int],
+    ) -> None:
+        """Record that the redemptions of the given conditions have been scanned in the given range."""
+        for condition_id in condition_ids:
+            hex_id = _hex_id(condition_id)
+            self.redeemed_ranges[hex_id] = _extend_range(
+                self.redeemed_ranges.get(hex_id), from_block, to_block
+            )
+        for condition_id, payout in payouts.items():
+            self.payouts[condition_id] = int(payout)
+
+    def answers_from_block(self, question_id: Any, earliest_block: int) -> int:
+        """Get the block from which the answers of the given question should be scanned."""
+        scanned = self.answer_ranges.get(_hex_id(question_id))
+        return _resume_block(scanned, earliest_block)
+
+    def known_answers(self, question_id: Any, earliest_block: int) -> List[Any]:
+        """Get the indexed answers of the given question, if they cover the period of interest."""
+        hex_id = _hex_id(question_id)
+        scanned = self.answer_ranges.get(hex_id)
+        if scanned is None or scanned[0] > earliest_block:
+            return []
+        return list(self.answers.get(hex_id, []))
+
+    def record_answers(
+        self, question_id: Any, from_block: int, to_block: int, answers: Iterable[Any]
+    ) -> List[Any]:
+        """Record the answers of the given question, found in the given range, skipping the already indexed ones.
+
+        :param question_id: the id of the question.
+        :param from_block: the first scanned block.
+        :param to_block: the last scanned block.
+        :param answers: the answers found in the scanned range.
+        :return: all the indexed answers of the question, in chronological order.
+        """
+        hex_id = _hex_id(question_id)
+        scanned = self.answer_ranges.get(hex_id)
+        if not _is_continuation(scanned, from_block):
+            # the answers are kept in chronological order, so a scan from scratch starts over
+            self.answers[hex_id] = []
+        known = self.answers.setdefault(hex_id, [])
+        known_keys = {_event_key(answer) for answer in known}
+        for answer in answers:
+            key = _event_key(answer)
+            if key not in known_keys:
+                known.append(answer)
+                known_keys.add(key)
+        self.answer_ranges[hex_id] = _extend_range(scanned, from_block, to_block)
+        return list(known)
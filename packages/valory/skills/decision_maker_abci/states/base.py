@@ -20,8 +20,9 @@
 """This module contains the base functionality for the rounds of the decision-making abci app."""
 
 import json
+from abc import ABC
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 from packages.valory.skills.abstract_round_abci.base import (
     BaseSynchronizedData,
@@ -34,6 +35,11 @@ from packages.valory.skills.chatui_abci.rounds import (
 )
 from packages.valory.skills.decision_maker_abci.payloads import MultisigTxPayload
 from packages.valory.skills.decision_maker_abci.policy import EGreedyPolicy
+from packages.valory.skills.decision_maker_abci.utilized_tools import (
+    UtilizedTools,
+    is_utilized_tools_delta,
+    merge_utilized_tools,
+)
 from packages.valory.skills.market_manager_abci.rounds import (
     SynchronizedData as MarketManagerSyncedData,
 )
@@ -141,10 +147,10 @@ class SynchronizedData(
         return str(self.db.get_strict("mech_tool"))
 
     @property
-    def utilized_tools(self) -> Dict[str, str]:
+    def utilized_tools(self) -> UtilizedTools:
         """Get a mapping of the utilized tools' indexes for each transaction."""
         tools = str(self.db.get_strict("utilized_tools"))
-        return json.loads(tools)
+        return UtilizedTools.deserialize(tools)
 
     @property
     def redeemed_condition_ids(self) -> Set[str]:
@@ -376,3 +382,44 @@ class TxPreparationRound(CollectSameUntilThresholdRound):
             return synced_data, Event.MOCK_TX
 
         return res
+
+
+class UtilizedToolsUpdateRound(CollectSameUntilThresholdRound, ABC):
+    """A round in which the payloads carry the changes of the utilized tools, instead of all the tools."""
+
+    def merge_utilized_tools(self, update: Optional[str]) -> Optional[str]:
+        """Apply the utilized tools' update of the most voted payload on the synchronized utilized tools."""
+        if not is_utilized_tools_delta(update):
+            return update
+
+        current = self.synchronized_data.db.get(
+            get_name(SynchronizedData.utilized_tools), None
+        )
+        try:
+            return merge_utilized_tools(current, update)
+        except ValueError as exc:
+            # the proposers diffed against other tools than the synchronized ones;
+            # their changes are still applied, and the behaviours resync their tools from the synchronized ones
+            self.context.logger.warning(
+                f"{exc} The changes will be applied on the synchronized tools as they are."
+            )
+            return merge_utilized_tools(current, update, verify=False)
+
+    @property
+    def most_voted_payload_values(
+        self,
+    ) -> Tuple[Any, ...]:
+        """Get the most voted payload values, with the utilized tools as they should be synchronized."""
+        most_voted_payload_values = super().most_voted_payload_values
+        selection_key = tuple(self.selection_key)
+        utilized_tools_key = get_name(SynchronizedData.utilized_tools)
+        if utilized_tools_key not in selection_key:
+            return most_voted_payload_values
+
+        index = selection_key.index(utilized_tools_key)
+        utilized_tools = self.merge_utilized_tools(most_voted_payload_values[index])
+        return (
+            most_voted_payload_values[:index]
+            + (utilized_tools,)
+            + most_voted_payload_values[index + 1 :]
+        )
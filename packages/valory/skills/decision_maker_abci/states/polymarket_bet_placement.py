@@ -30,10 +30,11 @@ from packages.valory.skills.decision_maker_abci.states.base import (
     Event,
     SynchronizedData,
     TxPreparationRound,
+    UtilizedToolsUpdateRound,
 )
 
 
-class PolymarketBetPlacementRound(TxPreparationRound):
+class PolymarketBetPlacementRound(UtilizedToolsUpdateRound, TxPreparationRound):
     """A round for placing a bet."""
 
     payload_class = PolymarketBetPlacementPayload
@@ -53,7 +54,9 @@ class PolymarketBetPlacementRound(TxPreparationRound):
         # Payload: sender(0), tx_submitter(1), tx_hash(2), mocking_mode(3), event(4), cached_signed_orders(5), utilized_tools(6), policy(7)
         event = Event(self.most_voted_payload_values[-4])
         cached_orders = self.most_voted_payload_values[-3]
-        utilized_tools_update = self.most_voted_payload_values[-2]
+        utilized_tools_update = self.merge_utilized_tools(
+            self.most_voted_payload_values[-2]
+        )
         policy_update = self.most_voted_payload_values[-1]
 
         # Persist cached orders to synchronized data
@@ -34,13 +34,14 @@ from packages.valory.skills.decision_maker_abci.states.base import (
     Event,
     SynchronizedData,
     TxPreparationRound,
+    UtilizedToolsUpdateRound,
 )
 
 IGNORED = "ignored"
 MECH_TOOLS_FIELD = "mech_tools"
 
 
-class PolymarketRedeemRound(TxPreparationRound):
+class PolymarketRedeemRound(UtilizedToolsUpdateRound, TxPreparationRound):
     """PolymarketRedeemRound"""
 
     payload_class: Type[MultisigTxPayload] = PolymarketRedeemPayload
@@ -34,13 +34,14 @@ from packages.valory.skills.decision_maker_abci.states.base import (
     Event,
     SynchronizedData,
     TxPreparationRound,
+    UtilizedToolsUpdateRound,
 )
 
 IGNORED = "ignored"
 MECH_TOOLS_FIELD = "mech_tools"
 
 
-class RedeemRound(TxPreparationRound):
+class RedeemRound(UtilizedToolsUpdateRound, TxPreparationRound):
     """A round in which the agents prepare a tx to redeem the winnings."""
 
     payload_class: Type[MultisigTxPayload] = RedeemPayload
@@ -19,18 +19,16 @@
 
 """This module contains the tool selection state of the decision-making abci app."""
 
-from packages.valory.skills.abstract_round_abci.base import (
-    CollectSameUntilThresholdRound,
-    get_name,
-)
+from packages.valory.skills.abstract_round_abci.base import get_name
 from packages.valory.skills.decision_maker_abci.payloads import ToolSelectionPayload
 from packages.valory.skills.decision_maker_abci.states.base import (
     Event,
     SynchronizedData,
+    UtilizedToolsUpdateRound,
 )
 
 
-class ToolSelectionRound(CollectSameUntilThresholdRound):
+class ToolSelectionRound(UtilizedToolsUpdateRound):
     """A round for selecting a Mech tool."""
 
     payload_class = ToolSelectionPayload
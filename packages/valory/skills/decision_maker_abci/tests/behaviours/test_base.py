@@ -20,7 +20,9 @@
 """This module contains the tests for valory/decision_maker_abci's base behaviour."""
 
 import re
+import sys
 import tempfile
+import timeit
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -36,6 +38,7 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from packages.valory.protocols.contract_api import ContractApiMessage
+from packages.valory.protocols.ipfs import IpfsMessage
 from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
 from packages.valory.skills.abstract_round_abci.test_tools.base import (
     FSMBehaviourBaseCase,
@@ -43,6 +46,8 @@ from packages.valory.skills.abstract_round_abci.test_tools.base import (
 from packages.valory.skills.decision_maker_abci.behaviours.base import (
     BET_AMOUNT_FIELD,
     DecisionMakerBaseBehaviour,
+    STRATEGIES_CACHE_DIR,
+    STRATEGY_MODULE_PREFIX,
     MultisendBatch,
     PUSD_POLYGON,
     TradingOperation,
@@ -57,10 +62,14 @@ from packages.valory.skills.decision_maker_abci.behaviours.blacklisting import (
 from packages.valory.skills.decision_maker_abci.io_.loader import ComponentPackageLoader
 from packages.valory.skills.decision_maker_abci.models import (
     BenchmarkingMockData,
+    CompiledStrategy,
     LiquidityInfo,
 )
 from packages.valory.skills.decision_maker_abci.tests.conftest import profile_name
-from packages.valory.skills.market_manager_abci.behaviours.base import READ_MODE
+from packages.valory.skills.market_manager_abci.behaviours.base import (
+    BetsManagerBehaviour,
+    READ_MODE,
+)
 from packages.valory.skills.transaction_settlement_abci.rounds import TX_HASH_LENGTH
 
 settings.load_profile(profile_name)
@@ -504,6 +513,86 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
         result = behaviour.execute_strategy(trading_strategy="nonexistent_strategy")
         assert result == {BET_AMOUNT_FIELD: 0}
 
+    def test_execute_strategy_compiles_once(self) -> None:
+        """Test that `execute_strategy` compiles each executable once, in an isolated namespace."""
+        behaviour = self.behaviour
+        strategy_exec = DUMMY_STRATEGY_PATH.read_text()
+        behaviour.shared_state.strategies_executables = {
+            "test": (strategy_exec, "dummy")
+        }
+        behaviour.shared_state.strategies_filehashes = {"test": "test_hash"}
+        behaviour.shared_state.compiled_strategies = {}
+
+        with mock.patch("builtins.compile", wraps=compile) as compile_mock:
+            for _ in range(3):
+                assert behaviour.execute_strategy(trading_strategy="test") == "dummy"
+
+        compile_mock.assert_called_once()
+        compiled = behaviour.shared_state.compiled_strategies["test_hash"]
+        assert compiled.source is strategy_exec
+        assert compiled.method is not None
+        assert compiled.method.__module__ == f"{STRATEGY_MODULE_PREFIX}test"
+        # the executable must not leak into the behaviour module's globals
+        assert "dummy" not in vars(sys.modules[DecisionMakerBaseBehaviour.__module__])
+
+    def test_execute_strategy_recompiles_on_change(self) -> None:
+        """Test that `execute_strategy` recompiles a cached executable whose source has changed."""
+        behaviour = self.behaviour
+        behaviour.shared_state.strategies_filehashes = {}
+        behaviour.shared_state.compiled_strategies = {
+            "test": CompiledStrategy("def run(): return 'old'", "run", lambda: "old")
+        }
+        behaviour.shared_state.strategies_executables = {
+            "test": ("def run(): return 'new'", "run")
+        }
+
+        assert behaviour.execute_strategy(trading_strategy="test") == "new"
+        assert behaviour.shared_state.compiled_strategies["test"].method() == "new"
+
+    def test_execute_strategy_caches_missing_method(self) -> None:
+        """Test that `execute_strategy` returns no bet when the compiled executable lacks the method."""
+        behaviour = self.behaviour
+        behaviour.shared_state.strategies_filehashes = {}
+        behaviour.shared_state.compiled_strategies = {}
+        behaviour.shared_state.strategies_executables = {
+            "test": ("def run(): pass", "missing")
+        }
+
+        assert behaviour.execute_strategy(trading_strategy="test") == {
+            BET_AMOUNT_FIELD: 0
+        }
+        assert behaviour.shared_state.compiled_strategies["test"].method is None
+        behaviour.context.logger.error.assert_called()
+
+    def test_execute_strategy_microbenchmark(self) -> None:
+        """Compare the per-decision overhead of re-executing the strategy against the cached callable."""
+        behaviour = self.behaviour
+        strategies_executables = get_strategy_executables()
+        strategy_exec, callable_method = strategies_executables["kelly_criterion"]
+        behaviour.shared_state.strategies_executables = strategies_executables
+        behaviour.shared_state.strategies_filehashes = {}
+        behaviour.shared_state.compiled_strategies = {}
+
+        def exec_every_time() -> None:
+            """The previous approach, which executed the source on every decision."""
+            namespace: Dict[str, Any] = {}
+            exec(strategy_exec, namespace)  # pylint: disable=W0122  # nosec
+            namespace[callable_method]
+
+        def cached() -> None:
+            """The current approach, which reuses the compiled callable."""
+            behaviour._compiled_strategy(
+                "kelly_criterion", strategy_exec, callable_method
+            )
+
+        n_runs = 50
+        before = min(timeit.repeat(exec_every_time, number=n_runs, repeat=3)) / n_runs
+        after = min(timeit.repeat(cached, number=n_runs, repeat=3)) / n_runs
+        assert after < before, (
+            f"Strategy lookup overhead per decision: "
+            f"{before * 1e6:.1f}us before, {after * 1e6:.1f}us after."
+        )
+
     def test_mock_data_property(self) -> None:
         """Test the `mock_data` property."""
         behaviour = self.behaviour  # type: ignore[method-assign]
@@ -758,6 +847,28 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
             result = behaviour.get_token_name()
         assert result == "USDC"
 
+    def test_sampled_bet_reads_the_bets_once(self) -> None:
+        """Test that `sampled_bet` reads the bets only if they have not been read in the behaviour's act."""
+        behaviour = self.behaviour
+        mock_bet = MagicMock()
+        behaviour.synchronized_data.db.get_strict = lambda key: 0  # type: ignore[method-assign]
+
+        def set_bets(instance: BlacklistingBehaviour) -> None:
+            """Set bets."""
+            instance.bets = [mock_bet]
+
+        with mock.patch.object(
+            BetsManagerBehaviour, "read_bets", autospec=True, side_effect=set_bets
+        ) as mock_read:
+            assert behaviour.sampled_bet is mock_bet
+            assert behaviour.sampled_bet is mock_bet
+            mock_read.assert_called_once()
+
+            # an explicit read checks out the bets again
+            behaviour.read_bets()
+            assert behaviour.sampled_bet is mock_bet
+            assert mock_read.call_count == 2
+
     def test_get_active_sampled_bet_with_bets(self) -> None:
         """Test `get_active_sampled_bet` when bets are already loaded."""
         behaviour = self.behaviour
@@ -1024,19 +1135,20 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
     def test_handle_get_strategy_no_inflight_req(self) -> None:
         """Test `_handle_get_strategy` when there is no inflight strategy request."""
         behaviour = self.behaviour
-        behaviour._inflight_strategy_req = None
+        behaviour._inflight_strategy_reqs = set()
         message = MagicMock()
         dialogue = MagicMock()
 
-        behaviour._handle_get_strategy(message, dialogue)
+        behaviour._handle_get_strategy("test_strategy", message, dialogue)
         behaviour.context.logger.error.assert_called()
 
     def test_handle_get_strategy_success(self) -> None:
         """Test `_handle_get_strategy` with a successful response."""
         behaviour = self.behaviour
-        behaviour._inflight_strategy_req = "test_strategy"
+        behaviour._inflight_strategy_reqs = {"test_strategy", "other_strategy"}
         behaviour.shared_state.strategy_to_filehash = {"test_strategy": "some_hash"}
         behaviour.shared_state.strategies_executables = {}
+        behaviour.shared_state.strategies_filehashes = {}
 
         message = MagicMock()
         message.files = {
@@ -1044,48 +1156,179 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
             "script.py": "def run(): pass",
         }
 
-        with mock.patch.object(
-            ComponentPackageLoader,
-            "load",
-            return_value=({}, "def run(): pass", "run"),
-        ):
-            behaviour._handle_get_strategy(message, MagicMock())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            behaviour.params.store_path = Path(tmpdir)
+            with mock.patch.object(
+                ComponentPackageLoader,
+                "load",
+                return_value=({}, "def run(): pass", "run"),
+            ):
+                behaviour._handle_get_strategy("test_strategy", message, MagicMock())
+
+            assert behaviour._read_cached_strategy("some_hash") == message.files
 
         assert "test_strategy" in behaviour.shared_state.strategies_executables
-        assert behaviour._inflight_strategy_req is None
+        assert behaviour._inflight_strategy_reqs == {"other_strategy"}
         assert "test_strategy" not in behaviour.shared_state.strategy_to_filehash
+        behaviour.shared_state.invalidate_compiled_strategy.assert_called_once_with(
+            "test_strategy"
+        )
+        assert behaviour.shared_state.strategies_filehashes["test_strategy"] == (
+            "some_hash"
+        )
+
+    def test_handle_get_strategy_error(self) -> None:
+        """Test `_handle_get_strategy` with an error response, which is retried by the next download."""
+        behaviour = self.behaviour
+        behaviour._inflight_strategy_reqs = {"test_strategy"}
+        behaviour.shared_state.strategy_to_filehash = {"test_strategy": "some_hash"}
+        behaviour.shared_state.strategies_executables = {}
+        message = MagicMock(
+            performative=IpfsMessage.Performative.ERROR, reason="timed out"
+        )
+
+        behaviour._handle_get_strategy("test_strategy", message, MagicMock())
+
+        assert behaviour._inflight_strategy_reqs == set()
+        assert behaviour.shared_state.strategy_to_filehash == {
+            "test_strategy": "some_hash"
+        }
+        assert behaviour.shared_state.strategies_executables == {}
+        behaviour.context.logger.error.assert_called_once()
+        with (
+            mock.patch.object(
+                behaviour,
+                "_build_ipfs_get_file_req",
+                return_value=(MagicMock(), MagicMock()),
+            ),
+            mock.patch.object(behaviour, "send_message") as mock_send,
+        ):
+            behaviour.download_next_strategy()
+        mock_send.assert_called_once()
+
+    def test_write_cached_strategy_failure(self) -> None:
+        """Test that a failed write of a cached strategy leaves no temporary file behind."""
+        behaviour = self.behaviour
+        with tempfile.TemporaryDirectory() as tmpdir:
+            behaviour.params.store_path = Path(tmpdir)
+            with mock.patch(
+                "packages.valory.skills.decision_maker_abci.behaviours.base.os.replace",
+                side_effect=OSError("disk full"),
+            ):
+                behaviour._write_cached_strategy("some_hash", {"script.py": "x"})
+
+            assert list((Path(tmpdir) / STRATEGIES_CACHE_DIR).iterdir()) == []
+            assert behaviour._read_cached_strategy("some_hash") is None
+        behaviour.context.logger.error.assert_called_once()
+
+    def test_read_cached_strategy_missing(self) -> None:
+        """Test `_read_cached_strategy` when the package has not been cached."""
+        behaviour = self.behaviour
+        with tempfile.TemporaryDirectory() as tmpdir:
+            behaviour.params.store_path = Path(tmpdir)
+            assert behaviour._read_cached_strategy("missing_hash") is None
+        behaviour.context.logger.warning.assert_not_called()
+
+    def test_read_cached_strategy_corrupted(self) -> None:
+        """Test `_read_cached_strategy` when the cached package cannot be parsed."""
+        behaviour = self.behaviour
+        with tempfile.TemporaryDirectory() as tmpdir:
+            behaviour.params.store_path = Path(tmpdir)
+            cache_dir = Path(tmpdir) / STRATEGIES_CACHE_DIR
+            cache_dir.mkdir()
+            (cache_dir / "bad_hash.json").write_text("{not json")
+            assert behaviour._read_cached_strategy("bad_hash") is None
+        behaviour.context.logger.warning.assert_called_once()
+
+    def test_load_cached_strategies(self) -> None:
+        """Test `load_cached_strategies` registers only the cached, valid and not in-flight strategies."""
+        behaviour = self.behaviour
+        behaviour._inflight_strategy_reqs = {"inflight"}
+        behaviour.shared_state.strategy_to_filehash = {
+            "cached": "h_cached",
+            "uncached": "h_uncached",
+            "invalid": "h_invalid",
+            "inflight": "h_inflight",
+        }
+        behaviour.shared_state.strategies_executables = {}
+        behaviour.shared_state.strategies_filehashes = {}
+        valid_files = {"component.yaml": "valid", "script.py": "def run(): pass"}
+
+        def mock_load(files: Dict[str, str]) -> Tuple[Dict, str, str]:
+            """Mock the loader, rejecting the invalid package."""
+            if files != valid_files:
+                raise ValueError("invalid package")
+            return {}, "def run(): pass", "run"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            behaviour.params.store_path = Path(tmpdir)
+            behaviour._write_cached_strategy("h_cached", valid_files)
+            behaviour._write_cached_strategy("h_invalid", {"component.yaml": "bad"})
+            behaviour._write_cached_strategy("h_inflight", valid_files)
+            with mock.patch.object(
+                ComponentPackageLoader, "load", side_effect=mock_load
+            ):
+                behaviour.load_cached_strategies()
+
+        assert behaviour.shared_state.strategy_to_filehash == {
+            "uncached": "h_uncached",
+            "invalid": "h_invalid",
+            "inflight": "h_inflight",
+        }
+        assert set(behaviour.shared_state.strategies_executables) == {"cached"}
+        assert behaviour.shared_state.strategies_filehashes == {"cached": "h_cached"}
+        behaviour.context.logger.warning.assert_called_once()
 
     def test_download_next_strategy_inflight_request(self) -> None:
-        """Test `download_next_strategy` when there is already a request in flight."""
+        """Test `download_next_strategy` when the pending strategy is already in flight."""
         behaviour = self.behaviour
-        behaviour._inflight_strategy_req = "existing_strategy"
-        behaviour.download_next_strategy()
-        # Should return early without doing anything
+        behaviour._inflight_strategy_reqs = {"existing_strategy"}
+        behaviour.shared_state.strategy_to_filehash = {"existing_strategy": "hash"}
+
+        with mock.patch.object(behaviour, "send_message") as mock_send:
+            behaviour.download_next_strategy()
+
+        mock_send.assert_not_called()
 
     def test_download_next_strategy_no_pending(self) -> None:
         """Test `download_next_strategy` when no strategies are pending."""
         behaviour = self.behaviour
-        behaviour._inflight_strategy_req = None
+        behaviour._inflight_strategy_reqs = set()
         behaviour.shared_state.strategy_to_filehash = {}
-        behaviour.download_next_strategy()
-        # Should return early without doing anything
+
+        with mock.patch.object(behaviour, "send_message") as mock_send:
+            behaviour.download_next_strategy()
+
+        mock_send.assert_not_called()
 
     def test_download_next_strategy_success(self) -> None:
-        """Test `download_next_strategy` when strategies are pending."""
+        """Test `download_next_strategy` requests all the pending strategies concurrently."""
         behaviour = self.behaviour
-        behaviour._inflight_strategy_req = None
-        behaviour.shared_state.strategy_to_filehash = {"my_strategy": "hash123"}
+        behaviour._inflight_strategy_reqs = set()
+        behaviour.shared_state.strategy_to_filehash = {
+            "my_strategy": "hash123",
+            "other_strategy": "hash456",
+        }
 
         with mock.patch.object(
             behaviour,
             "_build_ipfs_get_file_req",
             return_value=(MagicMock(), MagicMock()),
-        ):
+        ) as mock_build:
             with mock.patch.object(behaviour, "send_message") as mock_send:
                 behaviour.download_next_strategy()
 
-        assert behaviour._inflight_strategy_req == "my_strategy"
-        mock_send.assert_called_once()
+        assert behaviour._inflight_strategy_reqs == {"my_strategy", "other_strategy"}
+        assert [call.args[0] for call in mock_build.call_args_list] == [
+            "hash123",
+            "hash456",
+        ]
+        assert mock_send.call_count == 2
+        callbacks = [call.args[2] for call in mock_send.call_args_list]
+        assert [callback.args for callback in callbacks] == [
+            ("my_strategy",),
+            ("other_strategy",),
+        ]
 
     def test_download_strategies(self) -> None:
         """Test `download_strategies` generator."""
@@ -1100,6 +1343,7 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
             call_count += 1
             behaviour.shared_state.strategy_to_filehash = {}
 
+        behaviour.load_cached_strategies = MagicMock()  # type: ignore[method-assign]
         behaviour.download_next_strategy = mock_download  # type: ignore[method-assign]
         behaviour.sleep = lambda t: (yield)  # type: ignore[assignment, method-assign]
 
@@ -1110,6 +1354,24 @@ class TestDecisionMakerBaseBehaviour(FSMBehaviourBaseCase):
         except StopIteration:
             pass
         assert call_count == 1
+        behaviour.load_cached_strategies.assert_called_once()
+
+    def test_download_strategies_all_cached(self) -> None:
+        """Test `download_strategies` does not reach IPFS when all the strategies are cached."""
+        behaviour = self.behaviour
+        behaviour.shared_state.strategy_to_filehash = {"s1": "h1"}
+
+        def mock_load_cached() -> None:
+            """Mock load_cached_strategies that loads all the pending entries."""
+            behaviour.shared_state.strategy_to_filehash = {}
+
+        behaviour.load_cached_strategies = mock_load_cached  # type: ignore[method-assign]
+        behaviour.download_next_strategy = MagicMock()  # type: ignore[method-assign]
+
+        gen = behaviour.download_strategies()
+        with pytest.raises(StopIteration):
+            next(gen)
+        behaviour.download_next_strategy.assert_not_called()
 
     def test_update_with_values_from_chatui_max_bet(self) -> None:  # type: ignore[no-untyped-def]
         """Test `_update_with_values_from_chatui` with max_bet_size set."""
@@ -430,6 +430,7 @@ class TestBetPlacementBehaviour:
         behaviour._prepare_safe_tx = mock_prepare  # type: ignore[method-assign]
 
         mock_policy = MagicMock()
+        mock_policy.serialize_compact.return_value = '["compact", "policy"]'
         mock_policy.serialize.return_value = '{"serialized": "policy"}'
 
         mock_sd = MagicMock(
@@ -478,9 +479,9 @@ class TestBetPlacementBehaviour:
         assert payload.tx_hash == "0xsafetxhash"
         # Verify policy was incremented and serialized
         mock_policy.tool_used.assert_called_once_with("tool1")
-        mock_policy.serialize.assert_called_once()
-        assert payload.policy == '{"serialized": "policy"}'
-        # Verify file was written
+        mock_policy.serialize_compact.assert_called_once()
+        assert payload.policy == '["compact", "policy"]'
+        # Verify the store was written in the verbose format
         mocked_file.assert_called_once()
         mocked_file().write.assert_called_once_with('{"serialized": "policy"}')
 
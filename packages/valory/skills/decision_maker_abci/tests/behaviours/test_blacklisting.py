@@ -167,7 +167,7 @@ class TestBlacklistingAsyncAct:
         behaviour = _make_behaviour()
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"test": true}'
+        mock_policy.serialize_compact.return_value = '{"test": true}'
         behaviour.__dict__["_policy"] = mock_policy
 
         payloads_sent = []
@@ -214,7 +214,7 @@ class TestBlacklistingAsyncAct:
         behaviour = _make_behaviour()
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"test": true}'
+        mock_policy.serialize_compact.return_value = '{"test": true}'
         behaviour.__dict__["_policy"] = mock_policy
 
         payloads_sent = []
@@ -270,7 +270,7 @@ class TestBlacklistingAsyncAct:
         behaviour = _make_behaviour()
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"test": true}'
+        mock_policy.serialize_compact.return_value = '{"test": true}'
         behaviour.__dict__["_policy"] = mock_policy
 
         payloads_sent = []
@@ -286,7 +286,7 @@ class TestBlacklistingAsyncAct:
 
         behaviour.read_bets = MagicMock()  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash456")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=lambda: _return_gen("hash456"))  # type: ignore[method-assign]
         behaviour.bets = [mock_bet]
 
         with patch.object(
@@ -342,7 +342,7 @@ class TestBlacklistingAsyncAct:
         behaviour = _make_behaviour()
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"test": true}'
+        mock_policy.serialize_compact.return_value = '{"test": true}'
         behaviour.__dict__["_policy"] = mock_policy
 
         payloads_sent = []
@@ -358,7 +358,7 @@ class TestBlacklistingAsyncAct:
 
         behaviour.read_bets = MagicMock()  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash789")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=lambda: _return_gen("hash789"))  # type: ignore[method-assign]
         behaviour.bets = [mock_bet]
 
         with patch.object(
@@ -409,7 +409,7 @@ class TestBlacklistingAsyncAct:
         behaviour = _make_behaviour()
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"test": true}'
+        mock_policy.serialize_compact.return_value = '{"test": true}'
         behaviour.__dict__["_policy"] = mock_policy
 
         payloads_sent = []
@@ -425,7 +425,7 @@ class TestBlacklistingAsyncAct:
 
         behaviour.read_bets = MagicMock()  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash123")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=lambda: _return_gen("hash123"))  # type: ignore[method-assign]
         behaviour.bets = [mock_bet]
 
         with patch.object(
@@ -22,7 +22,7 @@
 import json
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, Generator, Optional, Tuple
+from typing import Any, Dict, Generator, Optional, Tuple, cast
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from packages.valory.skills.decision_maker_abci.behaviours.decision_receive import (
@@ -1296,6 +1296,35 @@ class TestIsProfitable:
         is_profitable, _, _ = result
         assert is_profitable is True
 
+    def test_pre_parsed_book_is_used(self) -> None:
+        """The connection's pre-parsed book drives the spread gate and the strategy's curves."""
+        ob = {
+            # the raw levels are not parsed again when the pre-parsed book is present
+            "asks": [{"price": "unparseable", "size": "10"}],
+            "bids": [{"price": "unparseable", "size": "10"}],
+            "book": {
+                "ask_prices": [0.60],
+                "ask_sizes": [10.0],
+                "ask_cum_costs": [6.0],
+                "ask_cum_shares": [10.0],
+                "bid_prices": [0.50],
+                "bid_sizes": [10.0],
+            },  # spread = 0.10
+        }
+        behaviour, pred = self._setup_clob_with_book(
+            ob, spread_min=0.02, spread_max=0.05
+        )
+        result = self._run_is_profitable(behaviour, pred)
+        get_bet_amount = cast(MagicMock, behaviour.get_bet_amount)
+        patch.stopall()
+
+        is_profitable, _, _ = result
+        assert is_profitable is False
+        expected_curve = ([0.60], [6.0], [10.0])
+        kwargs = get_bet_amount.call_args.kwargs
+        assert kwargs["orderbook_curve_yes"] == expected_curve
+        assert kwargs["orderbook_curve_no"] == expected_curve
+
     def test_spread_gate_empty_book_default_band_passes(self) -> None:
         """Empty book under the default band passes through (no bypass log)."""
         ob = {"asks": [{"price": "0.55", "size": "10"}], "bids": []}
@@ -1511,7 +1540,9 @@ class TestNextDatasetRow:
                 type(behaviour), "benchmarking_mode", new_callable=PropertyMock
             ) as mock_bm:
                 mock_bm.return_value = MagicMock(
-                    sep=",", dataset_filename="dataset.csv"
+                    sep=",",
+                    dataset_filename="dataset.csv",
+                    question_id_field="question_id",
                 )
                 with patch.object(
                     type(behaviour), "params", new_callable=PropertyMock
@@ -1584,7 +1615,9 @@ class TestNextDatasetRow:
                 type(behaviour), "benchmarking_mode", new_callable=PropertyMock
             ) as mock_bm:
                 mock_bm.return_value = MagicMock(
-                    sep=",", dataset_filename="dataset.csv"
+                    sep=",",
+                    dataset_filename="dataset.csv",
+                    question_id_field="question_id",
                 )
                 with patch.object(
                     type(behaviour), "params", new_callable=PropertyMock
@@ -1760,6 +1793,7 @@ class TestInitializeBetIdRowManager:
                 type(behaviour), "benchmarking_mode", new_callable=PropertyMock
             ) as mock_bm:
                 mock_bm.return_value = MagicMock(
+                    sep=",",
                     dataset_filename="dataset.csv",
                     question_id_field="question_id",
                 )
@@ -1876,7 +1910,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
             with patch.object(behaviour, "_get_decision", return_value=pred):
@@ -1900,7 +1934,7 @@ class TestAsyncAct:
                                     with patch.object(
                                         behaviour,
                                         "hash_stored_bets",
-                                        return_value="hash123",
+                                        side_effect=lambda: _return_gen("hash123"),
                                     ):  # type: ignore[return-value]
                                         with patch.object(
                                             type(behaviour),
@@ -1966,7 +2000,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
         mock_bet = _make_bet()
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
@@ -1993,7 +2027,7 @@ class TestAsyncAct:
                                     with patch.object(
                                         behaviour,  # type: ignore[return-value]
                                         "hash_stored_bets",
-                                        return_value="hash123",
+                                        side_effect=lambda: _return_gen("hash123"),
                                     ):
                                         with patch.object(
                                             type(behaviour),
@@ -2072,7 +2106,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
             with patch.object(behaviour, "_get_decision", return_value=pred):
@@ -2159,7 +2193,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         shared_state = MagicMock()
         shared_state.bet_id_row_manager = {"q1": [1, 2]}
@@ -2267,7 +2301,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
         mock_bet = _make_bet()
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
@@ -2294,7 +2328,7 @@ class TestAsyncAct:
                                     with patch.object(
                                         behaviour,  # type: ignore[return-value]
                                         "hash_stored_bets",
-                                        return_value="hash123",
+                                        side_effect=lambda: _return_gen("hash123"),
                                     ):
                                         with patch.object(
                                             type(behaviour),
@@ -2374,7 +2408,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
             with patch.object(behaviour, "_get_decision", return_value=pred):
@@ -2461,7 +2495,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         shared_state = MagicMock()
         shared_state.bet_id_row_manager = {"q1": []}
@@ -2566,7 +2600,7 @@ class TestAsyncAct:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = "policy_data"
+        mock_policy.serialize_compact.return_value = "policy_data"
 
         with patch.object(behaviour, "_setup_policy_and_tools", side_effect=mock_setup):
             with patch.object(behaviour, "_get_decision", return_value=pred):
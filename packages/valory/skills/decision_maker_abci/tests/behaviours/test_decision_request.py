@@ -455,6 +455,7 @@ class TestDecisionRequestBehaviour:
                     type(behaviour), "benchmarking_mode", new_callable=PropertyMock
                 ) as mock_bm:
                     mock_bm.return_value = MagicMock(
+                        sep=",",
                         dataset_filename=tmp_path.name,
                         question_id_field="question_id",
                     )
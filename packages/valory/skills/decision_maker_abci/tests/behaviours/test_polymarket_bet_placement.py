@@ -29,6 +29,7 @@ from packages.valory.skills.decision_maker_abci.payloads import (
     PolymarketBetPlacementPayload,
 )
 from packages.valory.skills.decision_maker_abci.states.base import Event
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -52,7 +53,7 @@ def _make_behaviour():  # type: ignore[no-untyped-def]
     behaviour.buy_amount = 0
     behaviour._mech_id = 0
     behaviour._mech_hash = ""
-    behaviour._utilized_tools = {}
+    behaviour._utilized_tools = UtilizedTools()
     behaviour._mech_tools = set()
 
     context = MagicMock()
@@ -922,7 +923,7 @@ class TestPolymarketBetPlacementBehaviour:
         )
 
         mock_policy = MagicMock()
-        mock_policy.serialize.return_value = '{"serialized": "policy"}'
+        mock_policy.serialize_compact.return_value = '{"serialized": "policy"}'
 
         with patch.object(
             type(behaviour), "sampled_bet", new_callable=PropertyMock
@@ -970,7 +971,7 @@ class TestPolymarketBetPlacementBehaviour:
         assert payloads_sent[0].event == Event.BET_PLACEMENT_DONE.value
         # Verify policy was incremented
         mock_policy.tool_used.assert_called_once_with("tool1")
-        mock_policy.serialize.assert_called_once()
+        mock_policy.serialize_compact.assert_called_once()
         behaviour._store_policy.assert_called_once()
         assert payloads_sent[0].policy == '{"serialized": "policy"}'
 
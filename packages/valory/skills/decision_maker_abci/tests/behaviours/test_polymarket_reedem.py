@@ -27,6 +27,7 @@ from eth_abi import decode as abi_decode
 from packages.valory.skills.decision_maker_abci.behaviours.polymarket_reedem import (
     BLOCK_NUMBER_KEY,
     DEFAULT_TO_BLOCK,
+    MAX_REDEEMS_PER_TX,
     PolymarketRedeemBehaviour,
     ZERO_BYTES,
     ZERO_HEX,
@@ -36,6 +37,7 @@ from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
     EGreedyPolicy,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -69,7 +71,7 @@ def _make_behaviour():  # type: ignore[no-untyped-def]
     """Return a PolymarketRedeemBehaviour with mocked dependencies."""
     behaviour = object.__new__(PolymarketRedeemBehaviour)  # type: ignore[no-untyped-def]
     behaviour._policy = None
-    behaviour._utilized_tools = {}
+    behaviour._utilized_tools = UtilizedTools()
     behaviour._mech_tools = set()
     behaviour._mech_id = 0
     behaviour._mech_hash = ""
@@ -180,7 +182,7 @@ class TestUpdatePolicyForRedeemablePositions:
         behaviour = _make_behaviour()
         policy = _make_policy()
         behaviour._policy = policy
-        behaviour._utilized_tools = {"cond1": "tool1"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "tool1"})
 
         positions = [{"conditionId": "cond1", "curPrice": 1.0}]
 
@@ -197,7 +199,7 @@ class TestUpdatePolicyForRedeemablePositions:
     def test_skips_position_without_condition_id(self) -> None:
         """Should skip positions without conditionId."""
         behaviour = _make_behaviour()
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         positions = [{"curPrice": 1.0}]
 
@@ -206,7 +208,7 @@ class TestUpdatePolicyForRedeemablePositions:
     def test_skips_position_without_tool(self) -> None:
         """Should skip positions where tool is not in utilized_tools."""
         behaviour = _make_behaviour()
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         positions = [{"conditionId": "cond_unknown", "curPrice": 1.0}]
 
@@ -215,7 +217,7 @@ class TestUpdatePolicyForRedeemablePositions:
     def test_skips_position_without_cur_price(self) -> None:
         """Should skip positions without curPrice."""
         behaviour = _make_behaviour()
-        behaviour._utilized_tools = {"cond1": "tool1"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "tool1"})
 
         positions = [{"conditionId": "cond1"}]
 
@@ -228,7 +230,7 @@ class TestUpdatePolicyForRedeemablePositions:
         behaviour = _make_behaviour()
         policy = _make_policy()
         behaviour._policy = policy
-        behaviour._utilized_tools = {"cond1": "tool1"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "tool1"})
 
         positions = [{"conditionId": "cond1", "curPrice": 0.0}]
 
@@ -246,7 +248,7 @@ class TestUpdatePolicyForRedeemablePositions:
         behaviour = _make_behaviour()
         policy = _make_policy(tools={})
         behaviour._policy = policy
-        behaviour._utilized_tools = {"cond1": "unknown_tool"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "unknown_tool"})
 
         positions = [{"conditionId": "cond1", "curPrice": 1.0}]
 
@@ -287,62 +289,81 @@ class TestFetchRedeemablePositions:
 
 
 # ---------------------------------------------------------------------------
-# Tests for redeem_position
+# Tests for collect_redemptions
 
 
-class TestRedeemPosition:
-    """Tests for _redeem_position."""
+class TestCollectRedemptions:
+    """Tests for _collect_redemptions."""
 
-    def test_redeems_standard_position(self) -> None:
-        """Standard position payload contains 1<<outcomeIndex and is_neg_risk=False."""
+    def test_merges_the_positions_of_a_condition(self) -> None:
+        """The positions of a condition share a redemption; malformed ones are skipped."""
         behaviour = _make_behaviour()
 
-        sent_payloads = []
+        positions = [
+            {"conditionId": "0xcond1", "outcomeIndex": 0, "negativeRisk": False},
+            {"conditionId": "0xmalformed", "negativeRisk": False},
+            {"conditionId": "0xcond2", "outcomeIndex": 1, "negativeRisk": True},
+            {"conditionId": "0xcond1", "outcomeIndex": 1, "negativeRisk": False},
+            {"conditionId": "0xcond1", "outcomeIndex": 1, "negativeRisk": False},
+        ]
 
-        def capture(payload):  # type: ignore[no-untyped-def]
-            sent_payloads.append(payload)
-            return _return_gen({"success": True})
+        with patch.object(
+            type(behaviour), "params", new_callable=PropertyMock
+        ) as mock_params:
+            mock_params.return_value = MagicMock(polymarket_collateral_address="0xusdc")
+            redemptions = behaviour._collect_redemptions(positions)
 
-        behaviour.send_polymarket_connection_request = capture  # type: ignore[method-assign]
+        assert redemptions == [
+            {
+                "condition_id": "0xcond1",
+                "index_sets": [1, 2],
+                "collateral_token": "0xusdc",
+                "is_neg_risk": False,
+            },
+            {
+                "condition_id": "0xcond2",
+                "index_sets": [2],
+                "collateral_token": "0xusdc",
+                "is_neg_risk": True,
+            },
+        ]
+        behaviour.context.logger.error.assert_called_once()
 
-        gen = behaviour._redeem_position(
-            condition_id="0xcond1",
-            outcome_index=0,
-            collateral_token="0xusdc",  # nosec B106
-            is_neg_risk=False,
-        )
-        try:
-            while True:
-                next(gen)
-        except StopIteration:
-            pass
 
-        assert len(sent_payloads) == 1
-        params = sent_payloads[0]["params"]
-        assert params["condition_id"] == "0xcond1"
-        assert params["index_sets"] == [1]  # 1 << 0
-        assert params["collateral_token"] == "0xusdc"
-        assert params["is_neg_risk"] is False
-        assert "size" not in params
-
-    def test_redeems_neg_risk_position(self) -> None:
-        """Neg-risk position payload contains 1<<outcomeIndex and is_neg_risk=True."""
+# ---------------------------------------------------------------------------
+# Tests for redeem_positions
+
+
+class TestRedeemPositions:
+    """Tests for _redeem_positions."""
+
+    def test_redeems_in_a_single_request(self) -> None:
+        """All the redemptions are sent with a single batched request."""
         behaviour = _make_behaviour()
 
         sent_payloads = []
 
         def capture(payload):  # type: ignore[no-untyped-def]
             sent_payloads.append(payload)
-            return _return_gen({"success": True})
+            return _return_gen({"transactions": [], "submitted": [], "failed": []})
 
         behaviour.send_polymarket_connection_request = capture  # type: ignore[method-assign]
 
-        gen = behaviour._redeem_position(
-            condition_id="0xcond2",
-            outcome_index=1,
-            collateral_token="0xusdc",  # nosec B106
-            is_neg_risk=True,
-        )
+        redemptions = [
+            {
+                "condition_id": "0xcond1",
+                "index_sets": [1],
+                "collateral_token": "0xusdc",
+                "is_neg_risk": False,
+            },
+            {
+                "condition_id": "0xcond2",
+                "index_sets": [2],
+                "collateral_token": "0xusdc",
+                "is_neg_risk": True,
+            },
+        ]
+        gen = behaviour._redeem_positions(redemptions)
         try:
             while True:
                 next(gen)
@@ -350,11 +371,8 @@ class TestRedeemPosition:
             pass
 
         assert len(sent_payloads) == 1
-        params = sent_payloads[0]["params"]
-        assert params["condition_id"] == "0xcond2"
-        assert params["index_sets"] == [2]  # 1 << 1
-        assert params["is_neg_risk"] is True
-        assert "size" not in params
+        assert sent_payloads[0]["request_type"] == "redeem_positions_batch"
+        assert sent_payloads[0]["params"] == {"redemptions": redemptions}
 
 
 # ---------------------------------------------------------------------------
@@ -515,21 +533,22 @@ class TestRedeemViaBuilder:
 
         redeem_calls = []
 
-        def mock_redeem(  # type: ignore[no-untyped-def]
-            condition_id, outcome_index, collateral_token, is_neg_risk=False
-        ):
-            """Mock redeem position."""
+        def mock_redeem(redemptions):  # type: ignore[no-untyped-def]
+            """Mock redeem positions."""
             redeem_calls.append(
-                {
-                    "condition_id": condition_id,
-                    "outcome_index": outcome_index,
-                    "is_neg_risk": is_neg_risk,
-                }
+                [
+                    (
+                        redemption["condition_id"],
+                        redemption["index_sets"],
+                        redemption["is_neg_risk"],
+                    )
+                    for redemption in redemptions
+                ]
             )
             yield
             return {"success": True}
 
-        behaviour._redeem_position = mock_redeem  # type: ignore[method-assign]
+        behaviour._redeem_positions = mock_redeem  # type: ignore[method-assign]
 
         positions = [
             {
@@ -558,13 +577,11 @@ class TestRedeemViaBuilder:
             except StopIteration:
                 pass
 
-        assert redeem_calls == [
-            {"condition_id": "0xcond1", "outcome_index": 0, "is_neg_risk": False}
-        ]
+        assert redeem_calls == [[("0xcond1", [1], False)]]
         assert isinstance(behaviour.payload, PolymarketRedeemPayload)
 
     def test_redeem_neg_risk_position_passes_flag_through(self) -> None:
-        """Neg-risk positions are forwarded to _redeem_position with is_neg_risk=True.
+        """Neg-risk positions are forwarded to _redeem_positions with is_neg_risk=True.
 
         Why: under CLOB v2 the collateral adapter discovers the Safe's ERC1155
         balance itself via balanceOf, so the agent must not pre-fetch balances
@@ -574,21 +591,22 @@ class TestRedeemViaBuilder:
 
         redeem_calls = []
 
-        def mock_redeem(  # type: ignore[no-untyped-def]
-            condition_id, outcome_index, collateral_token, is_neg_risk=False
-        ):
-            """Mock redeem position."""
+        def mock_redeem(redemptions):  # type: ignore[no-untyped-def]
+            """Mock redeem positions."""
             redeem_calls.append(
-                {
-                    "condition_id": condition_id,
-                    "outcome_index": outcome_index,
-                    "is_neg_risk": is_neg_risk,
-                }
+                [
+                    (
+                        redemption["condition_id"],
+                        redemption["index_sets"],
+                        redemption["is_neg_risk"],
+                    )
+                    for redemption in redemptions
+                ]
             )
             yield
             return {"success": True}
 
-        behaviour._redeem_position = mock_redeem  # type: ignore[method-assign]
+        behaviour._redeem_positions = mock_redeem  # type: ignore[method-assign]
 
         positions = [
             {
@@ -617,9 +635,7 @@ class TestRedeemViaBuilder:
             except StopIteration:
                 pass
 
-        assert redeem_calls == [
-            {"condition_id": "0xcond1", "outcome_index": 1, "is_neg_risk": True}
-        ]
+        assert redeem_calls == [[("0xcond1", [2], True)]]
 
     def test_malformed_position_skipped_others_processed(self) -> None:
         """Position missing outcomeIndex is skipped; remaining valid positions still routed.
@@ -632,21 +648,22 @@ class TestRedeemViaBuilder:
 
         redeem_calls = []
 
-        def mock_redeem(  # type: ignore[no-untyped-def]
-            condition_id, outcome_index, collateral_token, is_neg_risk=False
-        ):
-            """Mock redeem position."""
+        def mock_redeem(redemptions):  # type: ignore[no-untyped-def]
+            """Mock redeem positions."""
             redeem_calls.append(
-                {
-                    "condition_id": condition_id,
-                    "outcome_index": outcome_index,
-                    "is_neg_risk": is_neg_risk,
-                }
+                [
+                    (
+                        redemption["condition_id"],
+                        redemption["index_sets"],
+                        redemption["is_neg_risk"],
+                    )
+                    for redemption in redemptions
+                ]
             )
             yield
             return {"success": True}
 
-        behaviour._redeem_position = mock_redeem  # type: ignore[method-assign]
+        behaviour._redeem_positions = mock_redeem  # type: ignore[method-assign]
 
         positions = [
             {
@@ -682,10 +699,8 @@ class TestRedeemViaBuilder:
             except StopIteration:
                 pass
 
-        # Only the valid position was forwarded to _redeem_position.
-        assert redeem_calls == [
-            {"condition_id": "0xcond1", "outcome_index": 0, "is_neg_risk": False}
-        ]
+        # Only the valid position was forwarded to _redeem_positions.
+        assert redeem_calls == [[("0xcond1", [1], False)]]
 
 
 # ---------------------------------------------------------------------------
@@ -778,6 +793,62 @@ class TestPrepareRedeemTx:
         assert "aabbccdd" in calldata
         assert "malformed" not in calldata
 
+    def test_batches_are_capped_under_the_gas_limit(self) -> None:
+        """The positions of a condition share a batch and the batches are capped to fit in a transaction."""
+        behaviour = _make_behaviour()
+        behaviour.multisend_batches = []
+
+        def mock_build_multisend_data() -> None:  # type: ignore[no-untyped-def, misc]
+            """Mock build multisend data."""
+            yield  # type: ignore[no-untyped-def]
+            return True
+
+        def mock_build_multisend_safe_tx_hash() -> None:  # type: ignore[no-untyped-def, misc]
+            """Mock build multisend safe tx hash."""
+            yield  # type: ignore[no-untyped-def]
+            return True
+
+        behaviour._build_multisend_data = mock_build_multisend_data  # type: ignore[method-assign]
+        behaviour._build_multisend_safe_tx_hash = mock_build_multisend_safe_tx_hash  # type: ignore[method-assign]
+
+        positions = [
+            {
+                "conditionId": f"0x{i:064x}",
+                "outcomeIndex": outcome_index,
+                "negativeRisk": False,
+            }
+            for i in range(MAX_REDEEMS_PER_TX + 5)
+            for outcome_index in (0, 1)
+        ]
+
+        with patch.object(
+            type(behaviour), "params", new_callable=PropertyMock
+        ) as mock_params:
+            mock_params.return_value = MagicMock(
+                polymarket_collateral_address="0x1234567890123456789012345678901234567890",
+                polymarket_ctf_collateral_adapter_address="0x6234567890123456789012345678901234567890",
+            )
+            with patch.object(
+                type(behaviour), "tx_hex", new_callable=PropertyMock
+            ) as mock_tx:
+                mock_tx.return_value = "0xfinalHash"
+
+                gen = behaviour._prepare_redeem_tx(positions)
+                result = None
+                try:
+                    while True:
+                        next(gen)
+                except StopIteration as e:
+                    result = e.value
+
+        assert result == "0xfinalHash"
+        assert len(behaviour.multisend_batches) == MAX_REDEEMS_PER_TX
+        *_, index_sets = abi_decode(
+            ["address", "bytes32", "bytes32", "uint256[]"],
+            bytes.fromhex(behaviour.multisend_batches[0].data.hex()[8:]),
+        )
+        assert list(index_sets) == [1, 2]
+
     def test_standard_position_builds_batch(self) -> None:
         """Should build multisend batch for standard positions."""
         behaviour = _make_behaviour()
@@ -1162,7 +1233,7 @@ class TestAsyncAct:
         policy = _make_policy()
         behaviour._policy = policy
         behaviour._mech_tools = {"tool1"}
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         def mock_setup() -> None:  # type: ignore[no-untyped-def, misc]
             """Mock setup policy and tools."""
@@ -1238,7 +1309,7 @@ class TestAsyncAct:
         policy = _make_policy()
         behaviour._policy = policy
         behaviour._mech_tools = {"tool1"}
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         def mock_setup() -> None:  # type: ignore[no-untyped-def, misc]
             """Mock setup policy and tools."""
@@ -1320,7 +1391,7 @@ class TestAsyncAct:
         policy = _make_policy()
         behaviour._policy = policy
         behaviour._mech_tools = {"tool1"}
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         def mock_setup() -> None:  # type: ignore[no-untyped-def, misc]
             """Mock setup policy and tools."""
@@ -22,6 +22,7 @@
 import json
 from io import StringIO
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
@@ -38,6 +39,11 @@ from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
     EGreedyPolicy,
 )
+from packages.valory.skills.decision_maker_abci.redeem_events_index import (
+    REDEEM_EVENTS_INDEX_FILENAME,
+    RESCAN_MARGIN_BLOCKS,
+    RedeemEventsIndex,
+)
 from packages.valory.skills.decision_maker_abci.redeem_info import (
     Condition,
     FPMM,
@@ -50,6 +56,7 @@ from packages.valory.skills.decision_maker_abci.states.bet_placement import (
 from packages.valory.skills.decision_maker_abci.states.sell_outcome_tokens import (
     SellOutcomeTokensRound,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
     FetchStatus,
 )
@@ -104,6 +111,13 @@ def _make_trade(  # type: ignore[no-untyped-def]
     )
 
 
+class _UnstoredEventsIndex(RedeemEventsIndex):
+    """An index of the redeeming events which is never written to the disk."""
+
+    def store(self) -> None:
+        """Do not store the index."""
+
+
 def _make_redeem_behaviour() -> RedeemBehaviour:
     """Return a RedeemBehaviour with mocked dependencies."""
     behaviour = object.__new__(RedeemBehaviour)
@@ -116,22 +130,26 @@ def _make_redeem_behaviour() -> RedeemBehaviour:
     behaviour._expected_winnings = 0
     behaviour._history_hash = ZERO_BYTES
     behaviour._claim_winnings_simulation_ok = False
+    behaviour._events_index = _UnstoredEventsIndex(REDEEM_EVENTS_INDEX_FILENAME, "")
+    behaviour._redeem_statuses_batch = []
+    behaviour._redeem_statuses = {}
     behaviour.utilized_tools = {}
     behaviour.redeemed_condition_ids = set()
     behaviour.payout_so_far = 0
     behaviour.trades = set()
     behaviour.earliest_block_number = 0
     behaviour.claimable_amounts = {}
+    behaviour._earliest_block_pending = True
     behaviour._mech_id = 0
     behaviour._mech_hash = ""
-    behaviour._utilized_tools = {}
+    behaviour._utilized_tools = UtilizedTools()
     behaviour._mech_tools = set()
     behaviour._remote_accuracy_information = StringIO()
     behaviour._policy = None
     behaviour.multisend_batches = []
     behaviour.multisend_data = b""
     behaviour._safe_tx_hash = ""
-    behaviour._inflight_strategy_req = None
+    behaviour._inflight_strategy_reqs = set()
     behaviour.token_balance = 0
     behaviour.wallet_balance = 0
     behaviour.sell_amount = 0
@@ -1224,7 +1242,7 @@ class TestGetRedeemInfo:
             call_count[0] += 1
             return call_count[0] <= 1
 
-        def mock_fetch_redeem_info():  # type: ignore[no-untyped-def]
+        def mock_fetch_redeem_info(process_chunk):  # type: ignore[no-untyped-def]
             """Mock _fetch_redeem_info returning None."""
             yield
             return None
@@ -1247,7 +1265,7 @@ class TestGetRedeemInfo:
             call_count[0] += 1
             return call_count[0] <= 1
 
-        def mock_fetch_redeem_info():  # type: ignore[no-untyped-def]
+        def mock_fetch_redeem_info(process_chunk):  # type: ignore[no-untyped-def]
             """Mock _fetch_redeem_info returning a chunk."""
             yield
             return [{"data": "test"}]
@@ -1263,6 +1281,74 @@ class TestGetRedeemInfo:
         gen = behaviour._get_redeem_info()
         _exhaust_gen(gen)
 
+    def test_get_redeem_info_aggregates_streamed_chunks(self) -> None:
+        """Should aggregate the chunks as they are fetched, setting the block number once per market."""
+        behaviour = _make_redeem_behaviour()
+        behaviour._policy = _make_policy()
+
+        condition_ids = [f"0x{i:064x}" for i in range(1, 4)]
+
+        def trade_data(condition_id: str, amount: int) -> dict:
+            """Build the data of a winning trade on the given condition."""
+            return {
+                "fpmm": {
+                    "answerFinalizedTimestamp": "2000000",
+                    "collateralToken": "0xcollateral",
+                    "condition": {"id": condition_id, "outcomeSlotCount": "2"},
+                    "creator": "0xcreator",
+                    "creationTimestamp": "1000000",
+                    "currentAnswer": f"0x{0:064x}",
+                    "question": {"id": condition_id, "data": "question"},
+                    "templateId": "2",
+                },
+                "outcomeIndex": "0",
+                "outcomeTokenMarginalPrice": "0.5",
+                "outcomeTokensTraded": str(amount),
+                "transactionHash": f"0xtx{amount}",
+            }
+
+        chunks = [
+            [trade_data(condition_ids[0], 100), trade_data(condition_ids[1], 10)],
+            [trade_data(condition_ids[0], 200), trade_data(condition_ids[2], 1)],
+            [trade_data(condition_ids[1], 20), trade_data(condition_ids[0], 300)],
+        ]
+        call_count = [0]
+        set_block_call_count = [0]
+
+        def mock_prepare_fetching() -> bool:
+            """Mock _prepare_fetching returning True once then False."""
+            call_count[0] += 1
+            return call_count[0] <= 1
+
+        def mock_fetch_redeem_info(process_chunk):  # type: ignore[no-untyped-def]
+            """Mock _fetch_redeem_info streaming the chunks."""
+            for chunk in chunks:
+                yield from process_chunk(chunk)
+            return []
+
+        def mock_set_block_number(trade):  # type: ignore[no-untyped-def]
+            """Mock _set_block_number."""
+            set_block_call_count[0] += 1
+            yield
+
+        behaviour._prepare_fetching = mock_prepare_fetching  # type: ignore[method-assign]
+        behaviour._fetch_redeem_info = mock_fetch_redeem_info  # type: ignore[method-assign]
+        behaviour._set_block_number = mock_set_block_number  # type: ignore[method-assign]
+
+        with patch.object(
+            type(behaviour), "synced_timestamp", new_callable=PropertyMock
+        ) as mock_ts:
+            mock_ts.return_value = 3000000
+            _exhaust_gen(behaviour._get_redeem_info())
+
+        assert set_block_call_count[0] == 1
+        assert len(behaviour.trades) == 3
+        assert behaviour.claimable_amounts == {
+            HexBytes(condition_ids[0]): 600,
+            HexBytes(condition_ids[1]): 30,
+            HexBytes(condition_ids[2]): 1,
+        }
+
 
 # type: ignore[no-untyped-def]
 
@@ -1530,6 +1616,125 @@ class TestCheckAlreadyRedeemedViaEvents:
         # type: ignore[no-untyped-def]
         assert result is True
 
+    def test_check_resumes_from_events_index(self) -> None:
+        """Should scan only the blocks not yet indexed and reuse the indexed payouts."""
+        behaviour = _make_redeem_behaviour()
+        trade = _make_trade()
+        behaviour.trades = {trade}
+        behaviour.earliest_block_number = 100
+        index = behaviour._events_index
+        index.record_redeemed([trade.fpmm.condition.id], 100, 150, {"0xaa": 7})
+
+        progress = RedeemingProgress()
+        progress.event_filtering_batch_size = 1000
+        scanned_ranges = []
+
+        def mock_get_latest_block():  # type: ignore[no-untyped-def]
+            """Mock _get_latest_block."""
+            behaviour._latest_block_number = 200
+            yield
+            return True
+
+        def mock_conditional_tokens_interact(**kwargs):  # type: ignore[no-untyped-def]
+            """Mock _conditional_tokens_interact."""
+            scanned_ranges.append((kwargs["from_block"], kwargs["to_block"]))
+            behaviour._payouts = {}
+            yield
+            return True
+
+        behaviour.wait_for_condition_with_sleep = lambda gen_fn: gen_fn()  # type: ignore[assignment, method-assign, misc]
+        behaviour._get_latest_block = mock_get_latest_block  # type: ignore[method-assign]
+        behaviour._conditional_tokens_interact = mock_conditional_tokens_interact  # type: ignore[assignment, method-assign]
+
+        with (
+            patch.object(
+                type(behaviour), "redeeming_progress", new_callable=PropertyMock
+            ) as mock_rp,
+            patch.object(
+                type(behaviour), "synchronized_data", new_callable=PropertyMock
+            ) as mock_sd,
+            patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params,
+        ):
+            mock_rp.return_value = progress
+            mock_sd.return_value = MagicMock(safe_contract_address="0xsafe")
+            mock_params.return_value = MagicMock(max_filtering_retries=3)
+
+            result = _exhaust_gen(behaviour._check_already_redeemed_via_events())
+
+        assert result is True
+        assert scanned_ranges == [(150 - RESCAN_MARGIN_BLOCKS, 200)]
+        assert progress.payouts == {"0xaa": 7}
+        assert progress.check_finished
+        assert index.redeemed_ranges == {"0xaa": (100, 200)}
+
+
+class TestEventsIndex:
+    """Tests for the events_index property."""
+
+    def test_loads_and_stores_index(self, tmp_path: Path) -> None:
+        """Should load the index of the redeemer from the store path, and store it back."""
+        behaviour = _make_redeem_behaviour()
+        behaviour._events_index = None
+        params = MagicMock(
+            store_path=tmp_path,
+            conditional_tokens_address="0xCT",
+            realitio_address="0xRealitio",
+        )
+        scope = "0xsafe:0xct:0xrealitio"
+        stored = RedeemEventsIndex(str(tmp_path / REDEEM_EVENTS_INDEX_FILENAME), scope)
+        stored.record_redeemed(["0xaa"], 0, 10, {"0xaa": 1})
+        stored.store()
+
+        with (
+            patch.object(
+                type(behaviour), "synchronized_data", new_callable=PropertyMock
+            ) as mock_sd,
+            patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params,
+        ):
+            mock_sd.return_value = MagicMock(safe_contract_address="0xSafe")
+            mock_params.return_value = params
+
+            index = behaviour.events_index
+            assert index is behaviour.events_index
+            assert index.payouts == {"0xaa": 1}
+
+            index.record_redeemed(["0xaa"], 10, 20, {})
+            behaviour._store_events_index()
+
+        reloaded = RedeemEventsIndex(stored.path, scope)
+        assert reloaded.load() is True
+        assert reloaded.redeemed_ranges == {"0xaa": (0, 20)}
+
+    def test_corrupted_index_is_reset(self, tmp_path: Path) -> None:
+        """Should start from an empty index if the stored one cannot be loaded."""
+        behaviour = _make_redeem_behaviour()
+        behaviour._events_index = None
+        (tmp_path / REDEEM_EVENTS_INDEX_FILENAME).write_text("{")
+
+        with (
+            patch.object(
+                type(behaviour), "synchronized_data", new_callable=PropertyMock
+            ) as mock_sd,
+            patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params,
+        ):
+            mock_sd.return_value = MagicMock(safe_contract_address="0xsafe")
+            mock_params.return_value = MagicMock(
+                store_path=tmp_path,
+                conditional_tokens_address="0xct",
+                realitio_address="0xrealitio",
+            )
+
+            index = behaviour.events_index
+
+        assert index.redeemed_ranges == {}
+        behaviour.context.logger.warning.assert_called_once()
+
 
 class TestCheckAlreadyRedeemedViaSubgraph:
     """Tests for _check_already_redeemed_via_subgraph."""
@@ -2285,6 +2490,49 @@ class TestGetClaimParamsViaEvents:
 
         assert result is True
 
+    def test_reuses_indexed_answers(self) -> None:
+        """Should resume from the indexed answers and skip the rescanned ones."""
+        behaviour = _make_redeem_behaviour()
+        trade = _make_trade()
+        behaviour._current_redeem_info = trade
+        behaviour.earliest_block_number = 100
+        first_answer = {"args": {"answer": b"\x01", "history_hash": b"\x00"}}
+        second_answer = {"args": {"answer": b"\x02", "history_hash": b"\x01"}}
+        index = behaviour._events_index
+        index.record_answers(trade.fpmm.question.id, 100, 150, [first_answer])
+
+        progress = RedeemingProgress()
+        progress.check_to_block = 200
+        progress.event_filtering_batch_size = 1000
+        scanned_ranges = []
+
+        def mock_realitio_interact(**kwargs):  # type: ignore[no-untyped-def]
+            """Mock _realitio_interact, which finds the indexed answer again."""
+            scanned_ranges.append((kwargs["from_block"], kwargs["to_block"]))
+            behaviour._claim_params_batch = [first_answer, second_answer]
+            yield
+            return True
+
+        behaviour._realitio_interact = mock_realitio_interact  # type: ignore[assignment, method-assign]
+
+        with (
+            patch.object(
+                type(behaviour), "redeeming_progress", new_callable=PropertyMock
+            ) as mock_rp,
+            patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params,
+        ):
+            mock_rp.return_value = progress
+            mock_params.return_value = MagicMock(max_filtering_retries=3)
+
+            result = _exhaust_gen(behaviour._get_claim_params_via_events())
+
+        assert result is True
+        assert scanned_ranges == [(150 - RESCAN_MARGIN_BLOCKS, 200)]
+        assert progress.answered == [first_answer, second_answer]
+        assert progress.claim_finished
+
 
 class TestGetClaimParamsViaSubgraph:
     """Tests for _get_claim_params_via_subgraph."""
@@ -2392,6 +2640,7 @@ class TestPrepareSingleRedeem:
     def test_prepare_single_redeem_not_resolved_with_history(self) -> None:
         """Should build resolve, claim, and redeem when not resolved and history exists."""
         behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
         behaviour._already_resolved = False
         behaviour._history_hash = b"\x01" * 32  # non-null
 
@@ -2475,6 +2724,7 @@ class TestPrepareSingleRedeem:
     def test_prepare_single_redeem_already_resolved_null_history(self) -> None:
         """Should skip resolve and claim steps when resolved and history is null."""
         behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
         behaviour._already_resolved = True
         behaviour._history_hash = b"\x00" * 32  # null
 
@@ -2519,6 +2769,7 @@ class TestPrepareSingleRedeem:
     def test_prepare_single_redeem_get_claim_params_fails(self) -> None:
         """Should return False when get_claim_params fails."""
         behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
         behaviour._already_resolved = True
         behaviour._history_hash = b"\x01" * 32
 
@@ -2564,6 +2815,7 @@ class TestPrepareSingleRedeem:
     def test_prepare_single_redeem_simulate_claiming_fails(self) -> None:
         """Should return False when _simulate_claiming fails."""  # type: ignore[no-untyped-def]
         behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
         behaviour._already_resolved = True
         behaviour._history_hash = b"\x01" * 32
 
@@ -2615,6 +2867,7 @@ class TestPrepareSingleRedeem:
     def test_prepare_single_redeem_claim_finished(self) -> None:
         """Should skip get_claim_params when claim is already finished."""
         behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
         behaviour._already_resolved = True
         behaviour._history_hash = b"\x01" * 32
         behaviour._claim_winnings_simulation_ok = False  # sim not ok so no claim
@@ -2667,6 +2920,128 @@ class TestPrepareSingleRedeem:
         assert "redeem" in steps_called
 
 
+class TestPreCheckCandidates:
+    """Tests for _pre_check_candidates and _check_redeem_status."""
+
+    @staticmethod
+    def _make_candidates() -> list:
+        """Return a dust and two non-dust candidates."""
+        return [
+            _make_trade(condition_id="0xaa" + "11" * 31, question_id="0x" + "01" * 32),
+            _make_trade(condition_id="0xbb" + "22" * 31, question_id="0x" + "02" * 32),
+            _make_trade(condition_id="0xcc" + "33" * 31, question_id="0x" + "03" * 32),
+        ]
+
+    def _pre_check(
+        self, behaviour: RedeemBehaviour, candidates: list, statuses: Any
+    ) -> dict:
+        """Pre-check the candidates, responding with the given statuses, and return the contract call's kwargs."""
+        calls = []
+
+        def mock_contract_interact(**kwargs):  # type: ignore[no-untyped-def]
+            """Mock contract_interact."""
+            calls.append(kwargs)
+            yield
+            if statuses is None:
+                return False
+            behaviour.redeem_statuses_batch = statuses
+            return True
+
+        behaviour.contract_interact = mock_contract_interact  # type: ignore[assignment, method-assign]
+        with patch.object(
+            type(behaviour), "params", new_callable=PropertyMock
+        ) as mock_params:
+            mock_params.return_value.dust_threshold = 10
+            _exhaust_gen(behaviour._pre_check_candidates(candidates))
+
+        assert len(calls) <= 1
+        return calls[0] if calls else {}
+
+    def test_pre_check_candidates(self) -> None:
+        """Should read the statuses of the non-dust candidates in a single call."""
+        behaviour = _make_redeem_behaviour()
+        dust, first, second = candidates = self._make_candidates()
+        behaviour.claimable_amounts = {
+            dust.fpmm.condition.id: 1,
+            first.fpmm.condition.id: 100,
+            second.fpmm.condition.id: 100,
+        }
+
+        kwargs = self._pre_check(
+            behaviour,
+            candidates,
+            [[True, "0x" + "00" * 32], [False, "0x" + "ff" * 32]],
+        )
+
+        assert kwargs["contract_callable"] == "get_redeem_statuses"
+        assert kwargs["condition_ids"] == [
+            first.fpmm.condition.id.to_0x_hex(),
+            second.fpmm.condition.id.to_0x_hex(),
+        ]
+        assert kwargs["question_ids"] == ["0x" + "02" * 32, "0x" + "03" * 32]
+        assert behaviour._redeem_statuses == {
+            first.fpmm.condition.id: (True, b"\x00" * 32),
+            second.fpmm.condition.id: (False, b"\xff" * 32),
+        }
+
+    def test_pre_check_only_dust(self) -> None:
+        """Should not read anything if all the candidates are dust."""
+        behaviour = _make_redeem_behaviour()
+
+        kwargs = self._pre_check(behaviour, self._make_candidates(), [])
+
+        assert kwargs == {}
+        assert behaviour._redeem_statuses == {}
+
+    @pytest.mark.parametrize("statuses", (None, [[True, "0x" + "00" * 32]]))
+    def test_pre_check_fails(self, statuses: Any) -> None:
+        """Should leave the candidates to be checked one by one if the statuses cannot be read."""
+        behaviour = _make_redeem_behaviour()
+        candidates = self._make_candidates()
+        behaviour.claimable_amounts = {
+            candidate.fpmm.condition.id: 100 for candidate in candidates
+        }
+
+        self._pre_check(behaviour, candidates, statuses)
+
+        assert behaviour._redeem_statuses == {}
+        behaviour.context.logger.warning.assert_called_once()
+
+    def test_check_redeem_status_pre_checked(self) -> None:
+        """Should use the pre-checked status without any further calls."""
+        behaviour = _make_redeem_behaviour()
+        trade = _make_trade()
+        behaviour._current_redeem_info = trade
+        behaviour._redeem_statuses = {trade.fpmm.condition.id: (True, b"\x01" * 32)}
+        behaviour.wait_for_condition_with_sleep = MagicMock()  # type: ignore[method-assign]
+
+        _exhaust_gen(behaviour._check_redeem_status())
+
+        assert behaviour.already_resolved is True
+        assert behaviour.history_hash == b"\x01" * 32
+        behaviour.wait_for_condition_with_sleep.assert_not_called()
+
+    def test_check_redeem_status_not_pre_checked(self) -> None:
+        """Should read the status of a market which has not been pre-checked."""
+        behaviour = _make_redeem_behaviour()
+        behaviour._current_redeem_info = _make_trade()
+        waited = []
+
+        def mock_wait(condition_gen):  # type: ignore[no-untyped-def]
+            """Mock wait_for_condition_with_sleep."""
+            waited.append(condition_gen)
+            yield
+
+        behaviour.wait_for_condition_with_sleep = mock_wait  # type: ignore[assignment, method-assign]
+
+        _exhaust_gen(behaviour._check_redeem_status())
+
+        assert waited == [
+            behaviour._check_already_resolved,
+            behaviour._get_history_hash,
+        ]
+
+
 class TestProcessCandidate:
     """Tests for _process_candidate."""
 
@@ -2853,6 +3228,18 @@ class TestProcessCandidate:
 class TestPrepareSafeTx:
     """Tests for _prepare_safe_tx."""
 
+    @staticmethod
+    def _make_behaviour() -> RedeemBehaviour:
+        """Return a RedeemBehaviour which skips the pre-checks of the candidates."""
+        behaviour = _make_redeem_behaviour()
+
+        def mock_pre_check_candidates(candidates):  # type: ignore[no-untyped-def]
+            """Mock _pre_check_candidates."""
+            yield
+
+        behaviour._pre_check_candidates = mock_pre_check_candidates  # type: ignore[method-assign]
+        return behaviour
+
     def test_no_trades(self) -> None:
         """Should return None with no trades."""
         behaviour = _make_redeem_behaviour()
@@ -2865,7 +3252,7 @@ class TestPrepareSafeTx:
 
     def test_no_winnings(self) -> None:  # type: ignore[no-untyped-def]
         """Should return None when no winnings found."""
-        behaviour = _make_redeem_behaviour()
+        behaviour = self._make_behaviour()
         trade = _make_trade()
         behaviour.trades = {trade}
 
@@ -2883,7 +3270,7 @@ class TestPrepareSafeTx:
 
     def test_with_winnings(self) -> None:
         """Should prepare multisend tx when winnings are found."""
-        behaviour = _make_redeem_behaviour()
+        behaviour = self._make_behaviour()
         trade = _make_trade()
         behaviour.trades = {trade}
         behaviour._expected_winnings = 0
@@ -2945,7 +3332,7 @@ class TestPrepareSafeTx:
 
     def test_batch_size_limit(self) -> None:
         """Should stop at redeeming_batch_size."""
-        behaviour = _make_redeem_behaviour()
+        behaviour = self._make_behaviour()
         trade1 = _make_trade(condition_id="0xaa" + "11" * 31)
         trade2 = _make_trade(
             condition_id="0xbb" + "22" * 31,
@@ -3010,9 +3397,57 @@ class TestPrepareSafeTx:
         assert len(processed) == 1
         assert result == "0xresult"
 
+    def test_pre_checks_in_batches(self) -> None:
+        """Should pre-check the candidates in batches, only as far as they are processed."""
+        behaviour = _make_redeem_behaviour()
+        trades = [_make_trade(condition_id=f"0x{i:02x}" + "11" * 31) for i in range(5)]
+        behaviour.trades = set(trades)
+        pre_checked = []
+        processed = []
+
+        def mock_pre_check_candidates(candidates):  # type: ignore[no-untyped-def]
+            """Mock _pre_check_candidates."""
+            pre_checked.append(candidates)
+            yield
+
+        def mock_process_candidate(candidate):  # type: ignore[no-untyped-def]
+            """Mock _process_candidate, finding winnings only for the third candidate."""
+            processed.append(candidate)
+            yield
+            return len(processed) == 3
+
+        behaviour._pre_check_candidates = mock_pre_check_candidates  # type: ignore[method-assign]
+        behaviour._process_candidate = mock_process_candidate  # type: ignore[method-assign]
+        behaviour.wait_for_condition_with_sleep = MagicMock()  # type: ignore[method-assign]
+
+        with (
+            patch(
+                "packages.valory.skills.decision_maker_abci.behaviours.reedem.REDEEM_PRE_CHECK_BATCH_SIZE",
+                2,
+            ),
+            patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params,
+            patch.object(
+                type(behaviour), "redeeming_progress", new_callable=PropertyMock
+            ) as mock_rp,
+            patch.object(
+                type(behaviour), "tx_hex", new_callable=PropertyMock
+            ) as mock_tx_hex,
+        ):
+            mock_params.return_value.redeeming_batch_size = 1
+            mock_rp.return_value = RedeemingProgress()
+            mock_tx_hex.return_value = "0xresult"
+
+            result = _exhaust_gen(behaviour._prepare_safe_tx())
+
+        assert result == "0xresult"
+        assert processed == list(behaviour.trades)[:3]
+        assert pre_checked == [processed[:2], list(behaviour.trades)[2:4]]
+
     def test_batch_size_larger_than_one_logs(self) -> None:
         """Should log about adding to batch when batch size > 1."""
-        behaviour = _make_redeem_behaviour()
+        behaviour = self._make_behaviour()
         trade = _make_trade()
         behaviour.trades = {trade}
 
@@ -22,7 +22,10 @@
 import time
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import pytest
+
 from packages.valory.skills.decision_maker_abci.behaviours.sampling import (
+    BetsPriorityQueue,
     SamplingBehaviour,
     UNIX_DAY,
     UNIX_WEEK,
@@ -501,21 +504,6 @@ class TestClassifyProcessableBet:
         )
 
 
-class TestSortByPriorityLogic:
-    """Tests for _sort_by_priority_logic."""
-
-    def test_sort_by_invested_amount(self) -> None:
-        """Bets should be sorted by invested_amount (descending)."""
-        bet1 = _make_mock_bet(bet_id="a", invested_amount=100)
-        bet2 = _make_mock_bet(bet_id="b", invested_amount=200)
-        bet3 = _make_mock_bet(bet_id="c", invested_amount=50)
-
-        sorted_bets = SamplingBehaviour._sort_by_priority_logic([bet1, bet2, bet3])
-        assert sorted_bets[0].id == "b"
-        assert sorted_bets[1].id == "a"
-        assert sorted_bets[2].id == "c"
-
-
 class TestGetBetsQueueWise:
     """Tests for _get_bets_queue_wise."""
 
@@ -594,6 +582,50 @@ class TestSampledBetIdx:
         assert idx == 0
 
 
+class TestBetsPriorityQueue:
+    """Tests for BetsPriorityQueue."""
+
+    def test_pops_in_sorting_order(self) -> None:
+        """The queue should pop the bets as the priority logic sorts them, exhausting the queues in order."""
+        bets = [
+            _make_mock_bet(queue_status=QueueStatus.PROCESSED, invested_amount=500),
+            _make_mock_bet(invested_amount=100, processed_timestamp=20),
+            _make_mock_bet(invested_amount=100, processed_timestamp=10),
+            _make_mock_bet(invested_amount=100, processed_timestamp=10),
+            _make_mock_bet(invested_amount=100, liquidity=200.0),
+            _make_mock_bet(queue_status=QueueStatus.REPROCESSED, invested_amount=900),
+            _make_mock_bet(queue_status=QueueStatus.EXPIRED, invested_amount=1000),
+        ]
+        for bet in bets:
+            bet.openingTimestamp = 1000
+        queue = BetsPriorityQueue(enumerate(bets))
+
+        popped = [queue.pop() for _ in range(len(queue))]
+
+        assert popped == [4, 2, 3, 1, 0, 5]
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_pops_by_invested_amount(self) -> None:
+        """The bets of a queue should be popped by invested_amount (descending)."""
+        bet1 = _make_mock_bet(bet_id="a", invested_amount=100)
+        bet2 = _make_mock_bet(bet_id="b", invested_amount=200)
+        bet3 = _make_mock_bet(bet_id="c", invested_amount=50)
+        queue = BetsPriorityQueue(enumerate([bet1, bet2, bet3]))
+
+        assert [queue.pop() for _ in range(len(queue))] == [1, 0, 2]
+
+    def test_sampled_bet_idx_uses_positions(self) -> None:
+        """_sampled_bet_idx should return the position of the sampled bet in all the bets."""
+        behaviour = _make_behaviour()
+        bet1 = _make_mock_bet(bet_id="a", invested_amount=100)
+        bet2 = _make_mock_bet(bet_id="b", invested_amount=200)
+        bet3 = _make_mock_bet(bet_id="c", invested_amount=300)
+        behaviour.bets = [bet1, bet2, bet3]
+
+        assert behaviour._sampled_bet_idx([bet1, bet2]) == 1
+
+
 class TestSamplingBenchmarkingBet:
     """Tests for _sampling_benchmarking_bet."""
 
@@ -1712,14 +1744,13 @@ class TestSample:
     def test_sample_prefilters_banned_bets_before_loop(self) -> None:
         """Banned bets are dropped from available_bets before the loop starts.
 
-        Dropping them before the while-loop avoids re-sorting the candidate
-        pool each time a banned bet is skipped.
+        Dropping them before the while-loop avoids queueing candidates
+        which have already been decided to be skipped.
 
-        Discriminating assertion: wrap `_sampled_bet_idx` and assert it is
-        called once (the pre-filter reduced 5 banned + 1 ok to [bet_ok],
-        so one sort call returns index immediately). If the filter still
-        lived inside the loop, `_sampled_bet_idx` would be called 6 times —
-        once per banned bet + once for the final ok pick.
+        Discriminating assertion: wrap `_bets_priority_queue` and assert the
+        queue it built holds a single bet (the pre-filter reduced 5 banned +
+        1 ok to [bet_ok]). If the filter still lived inside the loop, all 6
+        bets would have been queued.
         """
         now = int(time.time())
         banned_bets = [
@@ -1750,10 +1781,17 @@ class TestSample:
             disabled_polymarket_tags=["hide-from-new"],
         )
 
-        # Wrap _sampled_bet_idx so we can count how many times it ran.
-        real_sampler = behaviour._sampled_bet_idx
-        call_counter = MagicMock(side_effect=real_sampler)
-        behaviour._sampled_bet_idx = call_counter  # type: ignore[method-assign]
+        # Wrap _bets_priority_queue so we can inspect the queued candidates.
+        queue_sizes = []
+        real_queue = behaviour._bets_priority_queue
+
+        def queue_spy(bets):  # type: ignore[no-untyped-def]
+            """Record the size of the built queue."""
+            queue = real_queue(bets)
+            queue_sizes.append(len(queue))
+            return queue
+
+        behaviour._bets_priority_queue = queue_spy  # type: ignore[method-assign]
 
         with patch.object(
             type(behaviour), "params", new_callable=PropertyMock, return_value=params
@@ -1792,8 +1830,8 @@ class TestSample:
 
         # bet_ok is at index 5 in self.bets (5 banned bets precede it).
         assert result == 5
-        # Pre-filter collapsed candidates to [bet_ok] → single sort call.
-        assert call_counter.call_count == 1
+        # Pre-filter collapsed candidates to [bet_ok] → single queued bet.
+        assert queue_sizes == [1]
 
 
 class TestBenchmarkingIncDay:
@@ -1852,7 +1890,9 @@ class TestAsyncAct:
         with patch.object(behaviour, "_sample", return_value=0):
             with patch.object(behaviour, "store_bets"):
                 with patch.object(
-                    behaviour, "hash_stored_bets", return_value="hash123"
+                    behaviour,
+                    "hash_stored_bets",
+                    side_effect=lambda: _return_gen("hash123"),
                 ):
                     with patch.object(
                         type(behaviour),
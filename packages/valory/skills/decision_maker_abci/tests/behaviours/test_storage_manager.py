@@ -39,6 +39,11 @@ from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
     EGreedyPolicy,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import (
+    UTILIZED_TOOLS_TTL,
+    UtilizedTools,
+    merge_utilized_tools,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -76,7 +81,7 @@ def _make_behaviour():  # type: ignore[no-untyped-def]
     behaviour = object.__new__(BlacklistingBehaviour)
     behaviour._mech_id = 0
     behaviour._mech_hash = ""
-    behaviour._utilized_tools = {}
+    behaviour._utilized_tools = UtilizedTools()
     behaviour._mech_tools = set()
     behaviour._remote_accuracy_information = StringIO()
     behaviour._policy = None
@@ -1627,7 +1632,7 @@ class TestStoreMethods:
     def test_store_utilized_tools(self) -> None:
         """_store_utilized_tools should write tools to file."""
         behaviour = _make_behaviour()
-        behaviour._utilized_tools = {"cond1": "tool1"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "tool1"})
 
         with tempfile.TemporaryDirectory() as tmpdir:
             with patch.object(
@@ -1641,6 +1646,44 @@ class TestStoreMethods:
                 tools = json.load(f)
             assert tools == {"cond1": "tool1"}
 
+    def test_utilized_tools_journal_is_shared(self) -> None:
+        """The journal of the utilized tools should be kept in the shared state and reused."""
+        behaviour = _make_behaviour()
+        behaviour.__dict__["_context"].state.utilized_tools_journal = None
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params:
+                mock_params.return_value = MagicMock(store_path=Path(tmpdir))
+                journal = behaviour.utilized_tools_journal
+                assert behaviour.utilized_tools_journal is journal
+
+                mock_params.return_value = MagicMock(store_path=Path(tmpdir) / "other")
+                assert behaviour.utilized_tools_journal is not journal
+
+        assert journal.snapshot_path == str(Path(tmpdir) / UTILIZED_TOOLS_STORE)
+
+    def test_store_utilized_tools_appends_the_changes(self) -> None:
+        """_store_utilized_tools should only append the changes after the first store."""
+        behaviour = _make_behaviour()
+        behaviour.__dict__["_context"].state.utilized_tools_journal = None
+        behaviour.utilized_tools = {"cond1": "tool1"}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(
+                type(behaviour), "params", new_callable=PropertyMock
+            ) as mock_params:
+                mock_params.return_value = MagicMock(store_path=Path(tmpdir))
+                behaviour._store_utilized_tools()
+                behaviour.utilized_tools["cond2"] = "tool2"
+                behaviour._store_utilized_tools()
+                recovered = behaviour._try_recover_utilized_tools()
+
+            with open(Path(tmpdir) / UTILIZED_TOOLS_STORE) as f:
+                assert json.load(f) == {"cond1": "tool1"}
+        assert recovered == {"cond1": "tool1", "cond2": "tool2"}
+
     def test_store_all(self) -> None:
         """_store_all should call all store methods."""
         behaviour = _make_behaviour()
@@ -1653,3 +1696,62 @@ class TestStoreMethods:
         behaviour._store_policy.assert_called_once()
         behaviour._store_available_mech_tools.assert_called_once()
         behaviour._store_utilized_tools.assert_called_once()
+
+
+class TestSerializeUtilizedTools:
+    """Tests for _serialize_utilized_tools."""
+
+    def test_serializes_the_changes_since_the_synchronized_tools(self) -> None:
+        """Only the changes since the synchronized tools should be serialized."""
+        behaviour = _make_behaviour()
+        synchronized = UtilizedTools({"cond1": "tool1", "cond2": "tool2"})
+        behaviour.utilized_tools = UtilizedTools(synchronized)
+        del behaviour.utilized_tools["cond1"]
+
+        with (
+            patch.object(
+                type(behaviour), "synchronized_data", new_callable=PropertyMock
+            ) as mock_sd,
+            patch.object(
+                type(behaviour),
+                "synced_timestamp",
+                new_callable=PropertyMock,
+                return_value=1000,
+            ),
+        ):
+            mock_sd.return_value = MagicMock(utilized_tools=synchronized)
+            serialized = behaviour._serialize_utilized_tools()
+
+        _tag, _digest, updates, removed = json.loads(serialized)
+        assert updates == {"cond2": ["tool2", 1000]}
+        assert removed == ["cond1"]
+        assert merge_utilized_tools(synchronized.serialize(), serialized) == (
+            behaviour.utilized_tools.serialize()
+        )
+
+    def test_evicts_the_expired_tools(self) -> None:
+        """The expired tools should be evicted before serializing the changes."""
+        behaviour = _make_behaviour()
+        now = 2 * UTILIZED_TOOLS_TTL
+        behaviour.utilized_tools = UtilizedTools(
+            {"cond1": "tool1"}, recorded={"cond1": 0}
+        )
+
+        with (
+            patch.object(
+                type(behaviour), "synchronized_data", new_callable=PropertyMock
+            ) as mock_sd,
+            patch.object(
+                type(behaviour),
+                "synced_timestamp",
+                new_callable=PropertyMock,
+                return_value=now,
+            ),
+        ):
+            type(mock_sd.return_value).utilized_tools = PropertyMock(
+                side_effect=ValueError("not synchronized")
+            )
+            serialized = behaviour._serialize_utilized_tools()
+
+        assert behaviour.utilized_tools == {}
+        assert merge_utilized_tools(None, serialized) == "{}"
@@ -20,10 +20,16 @@
 """Tests for ToolSelectionBehaviour._select_tool and async_act."""
 
 import json
-from typing import Any, Callable, Dict, Generator, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 from unittest.mock import MagicMock, patch
 
+from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
 from packages.valory.skills.decision_maker_abci.behaviours.base import CID_PREFIX
+from packages.valory.skills.decision_maker_abci.behaviours.storage_manager import (
+    MANIFEST_FETCH_CONCURRENCY,
+    MECH_MANIFESTS_STORE,
+)
 from packages.valory.skills.decision_maker_abci.behaviours.tool_selection import (
     ToolSelectionBehaviour,
 )
@@ -32,6 +38,7 @@ from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
     EGreedyPolicy,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -575,7 +582,7 @@ class TestAsyncActSelectedToolNotNone:
         """When a tool is selected, payload should contain serialized data."""
         policy = _make_policy("tool-a", "tool-b")
         behaviour = _make_behaviour(policy, {"tool-a", "tool-b"})
-        behaviour._utilized_tools = {"cond1": "tool-a"}
+        behaviour._utilized_tools = UtilizedTools({"cond1": "tool-a"})
 
         benchmark_ctx = MagicMock()
         behaviour.context.benchmark_tool.measure.return_value = benchmark_ctx  # type: ignore[attr-defined]
@@ -613,7 +620,7 @@ class TestAsyncActSelectedToolNotNone:
         """Should call policy.tool_used during benchmarking mode."""
         policy = _make_policy("tool-a")
         behaviour = _make_behaviour(policy, {"tool-a"})
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         benchmark_ctx = MagicMock()
         behaviour.context.benchmark_tool.measure.return_value = benchmark_ctx  # type: ignore[attr-defined]
@@ -645,7 +652,7 @@ class TestAsyncActSelectedToolNotNone:
         """Should not call policy.tool_used when period_count is not 0."""
         policy = _make_policy("tool-a")
         behaviour = _make_behaviour(policy, {"tool-a"})
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         benchmark_ctx = MagicMock()
         behaviour.context.benchmark_tool.measure.return_value = benchmark_ctx  # type: ignore[attr-defined]
@@ -676,7 +683,7 @@ class TestAsyncActSelectedToolNotNone:
         """Should not call policy.tool_used when last_benchmarking_has_run is True."""
         policy = _make_policy("tool-a")
         behaviour = _make_behaviour(policy, {"tool-a"})
-        behaviour._utilized_tools = {}
+        behaviour._utilized_tools = UtilizedTools()
 
         benchmark_ctx = MagicMock()
         behaviour.context.benchmark_tool.measure.return_value = benchmark_ctx  # type: ignore[attr-defined]
@@ -835,10 +842,64 @@ def _attach_mech_tools_api(behaviour: "_TestableBehaviour") -> MagicMock:
     api = MagicMock()
     api.__dict__["_frozen"] = True
     api.get_spec.return_value = {"method": "GET", "url": "x"}
+    api.retries_info.retries = 2
     behaviour.mech_tools_api = api  # type: ignore[attr-defined,assignment]
     return api
 
 
+def _attach_ipfs(
+    behaviour: "_TestableBehaviour",
+    respond: Callable[[str], Any],
+    store_path: Path,
+) -> List[str]:
+    """Serve the concurrent manifest requests with `respond`, which maps a url to a raw response.
+
+    A `None` raw response is never delivered, so the request times out.
+
+    :param behaviour: the behaviour to wire.
+    :param respond: the url to raw response mapping.
+    :param store_path: the store path of the behaviour.
+    :return: the requested urls, in order, across all the waves.
+    """
+    behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
+        ipfs_address="https://ipfs.example/",
+        store_path=store_path,
+        rpc_sleep_time=0,
+    )
+    requested: List[str] = []
+    callbacks: Dict[str, Callable] = {}
+    behaviour.context.requests.request_id_to_callback = callbacks  # type: ignore[attr-defined]
+
+    def _build(**specs: Any) -> Tuple[MagicMock, MagicMock]:
+        requested.append(specs["url"])
+        dialogue = MagicMock()
+        dialogue.dialogue_label.dialogue_reference = (specs["url"], "")
+        return MagicMock(), dialogue
+
+    def _wait(
+        condition: Callable[[], bool], timeout: Optional[float] = None
+    ) -> Generator[None, None, None]:
+        for url in list(callbacks):
+            res_raw = respond(url)
+            callback = callbacks.pop(url)
+            if res_raw is not None:
+                callback(res_raw, behaviour)
+        yield
+        if not condition():
+            raise TimeoutException()
+
+    behaviour._build_http_request_message = _build  # type: ignore[method-assign,assignment]
+    behaviour.wait_for_condition = _wait  # type: ignore[method-assign,assignment]
+    behaviour.sleep = lambda _seconds: (yield)  # type: ignore[method-assign,assignment]
+    return requested
+
+
+def _manifest(*tools: str) -> MagicMock:
+    """Return a raw manifest response whose tools all pass the classifier."""
+    body = {"toolMetadata": {tool: _PredictionMetadata.predictor() for tool in tools}}
+    return MagicMock(body=json.dumps(body).encode(), status_code=200)
+
+
 def _drive_fetch(behaviour: "_TestableBehaviour") -> None:
     """Run _fetch_mech_manifests to completion."""
     gen = behaviour._fetch_mech_manifests()
@@ -852,7 +913,7 @@ def _drive_fetch(behaviour: "_TestableBehaviour") -> None:
 class TestFetchMechManifests:
     """_fetch_mech_manifests populates the cache and short-circuits as needed."""
 
-    def test_short_circuits_when_v1(self) -> None:
+    def test_short_circuits_when_v1(self, tmp_path: Path) -> None:
         """V1 marketplace path never fetches and leaves the cache empty."""
         behaviour = _make_behaviour(_make_policy("t"), {"t"})
         behaviour.synchronized_data.is_marketplace_v2 = False  # type: ignore[attr-defined]
@@ -860,23 +921,15 @@ class TestFetchMechManifests:
             _StubManifestMech("0xa", "cid-1"),
         ]
         _attach_mech_tools_api(behaviour)
+        requested = _attach_ipfs(behaviour, lambda _url: _manifest("t"), tmp_path)
         behaviour._tool_metadata = {"stale": {"description": "x"}}
 
-        called = {"n": 0}
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            called["n"] += 1
-            return MagicMock(body=b"{}")
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
         _drive_fetch(behaviour)
 
         assert behaviour._tool_metadata == {}
-        assert called["n"] == 0
+        assert requested == []
 
-    def test_short_circuits_when_benchmarking_enabled(self) -> None:
+    def test_short_circuits_when_benchmarking_enabled(self, tmp_path: Path) -> None:
         """Benchmark mode never hits IPFS."""
         behaviour = _make_behaviour(_make_policy("t"), {"t"})
         behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
@@ -884,23 +937,15 @@ class TestFetchMechManifests:
             _StubManifestMech("0xa", "cid-1"),
         ]
         _attach_mech_tools_api(behaviour)
+        requested = _attach_ipfs(behaviour, lambda _url: _manifest("t"), tmp_path)
         behaviour.benchmarking_mode.enabled = True  # type: ignore[attr-defined]
 
-        called = {"n": 0}
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            called["n"] += 1
-            return MagicMock(body=b"{}")
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
         _drive_fetch(behaviour)
 
         assert behaviour._tool_metadata == {}
-        assert called["n"] == 0
+        assert requested == []
 
-    def test_fetches_each_unique_cid_once(self) -> None:
+    def test_fetches_each_unique_cid_once(self, tmp_path: Path) -> None:
         """Mechs that share a CID resolve to a single HTTP fetch."""
         policy = _make_policy("good", "bad")
         behaviour = _make_behaviour(policy, {"good", "bad"})
@@ -911,7 +956,7 @@ class TestFetchMechManifests:
             _StubManifestMech("0xc", "cid-2"),
             _StubManifestMech("0xd", None),  # no CID, skipped
         ]
-        api = _attach_mech_tools_api(behaviour)
+        _attach_mech_tools_api(behaviour)
 
         body = {
             "toolMetadata": {
@@ -919,30 +964,127 @@ class TestFetchMechManifests:
                 "bad": _PredictionMetadata.resolver(),
             }
         }
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
+        requested = _attach_ipfs(
+            behaviour,
+            lambda _url: MagicMock(body=json.dumps(body).encode()),
+            tmp_path,
         )
 
-        call_count = {"n": 0}
+        _drive_fetch(behaviour)
 
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            call_count["n"] += 1
-            return MagicMock(body=json.dumps(body).encode())
-            yield  # generator function
+        # 2 unique CIDs -> 2 HTTP calls (the dup CID and the None one are skipped).
+        # The urls must reflect ipfs_address + CID_PREFIX + CID so a refactor
+        # that drops CID_PREFIX or swaps the concat order trips the test.
+        assert requested == [
+            "https://ipfs.example/" + CID_PREFIX + "cid-1",
+            "https://ipfs.example/" + CID_PREFIX + "cid-2",
+        ]
+        assert set(behaviour._tool_metadata) == {"good", "bad"}
 
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
+    def test_fetches_missing_manifests_concurrently(self, tmp_path: Path) -> None:
+        """All the missing manifests are requested before any response is awaited, in bounded waves."""
+        n_mechs = MANIFEST_FETCH_CONCURRENCY + 1
+        behaviour = _make_behaviour(_make_policy("t"), {"t"})
+        behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
+        behaviour.synchronized_data.mechs_info = [  # type: ignore[attr-defined]
+            _StubManifestMech(f"0x{i}", f"cid-{i}") for i in range(n_mechs)
+        ]
+        _attach_mech_tools_api(behaviour)
+        waves: List[int] = []
+
+        def _respond(url: str) -> MagicMock:
+            return _manifest(url.rsplit("-", 1)[-1])
+
+        requested = _attach_ipfs(behaviour, _respond, tmp_path)
+        wait = behaviour.wait_for_condition
+
+        def _counting_wait(
+            condition: Callable[[], bool], timeout: Optional[float] = None
+        ) -> Generator[None, None, None]:
+            waves.append(len(requested) - sum(waves))
+            yield from wait(condition, timeout)
+
+        behaviour.wait_for_condition = _counting_wait  # type: ignore[method-assign,assignment]
 
         _drive_fetch(behaviour)
 
-        # 2 unique CIDs -> 2 HTTP calls (the dup CID and the None one are skipped).
-        assert call_count["n"] == 2
-        assert set(behaviour._tool_metadata) == {"good", "bad"}
-        # Final URL must reflect ipfs_address + CID_PREFIX + last CID so a refactor
-        # that drops CID_PREFIX or swaps the concat order trips the test.
-        assert api.url == "https://ipfs.example/" + CID_PREFIX + "cid-2"
-        api.reset_retries.assert_called()
+        assert waves == [MANIFEST_FETCH_CONCURRENCY, 1]
+        assert set(behaviour._tool_metadata) == {str(i) for i in range(n_mechs)}
+
+    def test_cached_manifests_are_not_fetched(self, tmp_path: Path) -> None:
+        """Manifests cached on disk are reused, only the missing ones are fetched."""
+        behaviour = _make_behaviour(_make_policy("t"), {"t"})
+        behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
+        behaviour.synchronized_data.mechs_info = [  # type: ignore[attr-defined]
+            _StubManifestMech("0xa", "cid-cached"),
+            _StubManifestMech("0xb", "cid-new"),
+        ]
+        _attach_mech_tools_api(behaviour)
+        requested = _attach_ipfs(behaviour, lambda _url: _manifest("new"), tmp_path)
+        cached = {"cached": _PredictionMetadata.predictor()}
+        (tmp_path / MECH_MANIFESTS_STORE).write_text(
+            json.dumps({"cid-cached": cached, "cid-gone": cached})
+        )
+
+        _drive_fetch(behaviour)
+
+        assert requested == ["https://ipfs.example/" + CID_PREFIX + "cid-new"]
+        assert set(behaviour._tool_metadata) == {"cached", "new"}
+        # the manifest of the mech which is no longer available is dropped
+        stored = json.loads((tmp_path / MECH_MANIFESTS_STORE).read_text())
+        assert set(stored) == {"cid-cached", "cid-new"}
+
+        # a subsequent run is served entirely from the cache
+        requested.clear()
+        behaviour._tool_metadata = {}
+        _drive_fetch(behaviour)
+
+        assert requested == []
+        assert set(behaviour._tool_metadata) == {"cached", "new"}
 
-    def test_extraction_failure_leaves_cache_partially_populated(self) -> None:
+    def test_failed_store_keeps_the_previous_manifests(self, tmp_path: Path) -> None:
+        """A failed write leaves the previous store intact and no temporary file behind."""
+        behaviour = _make_behaviour(_make_policy("t"), {"t"})
+        behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
+        behaviour.synchronized_data.mechs_info = [  # type: ignore[attr-defined]
+            _StubManifestMech("0xa", "cid-new"),
+        ]
+        _attach_mech_tools_api(behaviour)
+        _attach_ipfs(behaviour, lambda _url: _manifest("new"), tmp_path)
+        previous = json.dumps({"cid-old": {"old": _PredictionMetadata.predictor()}})
+        (tmp_path / MECH_MANIFESTS_STORE).write_text(previous)
+
+        with patch(
+            "packages.valory.skills.decision_maker_abci.behaviours.storage_manager.json.dump",
+            side_effect=OSError("disk full"),
+        ):
+            _drive_fetch(behaviour)
+
+        assert set(behaviour._tool_metadata) == {"new"}
+        assert (tmp_path / MECH_MANIFESTS_STORE).read_text() == previous
+        assert [p.name for p in tmp_path.iterdir()] == [MECH_MANIFESTS_STORE]
+
+    def test_corrupted_store_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable manifests store falls back to fetching and is overwritten."""
+        behaviour = _make_behaviour(_make_policy("t"), {"t"})
+        behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
+        behaviour.synchronized_data.mechs_info = [  # type: ignore[attr-defined]
+            _StubManifestMech("0xa", "cid-1"),
+        ]
+        _attach_mech_tools_api(behaviour)
+        requested = _attach_ipfs(behaviour, lambda _url: _manifest("t"), tmp_path)
+        (tmp_path / MECH_MANIFESTS_STORE).write_text("{not json")
+
+        _drive_fetch(behaviour)
+
+        assert len(requested) == 1
+        assert set(behaviour._tool_metadata) == {"t"}
+        stored = json.loads((tmp_path / MECH_MANIFESTS_STORE).read_text())
+        assert set(stored) == {"cid-1"}
+
+    def test_extraction_failure_leaves_cache_partially_populated(
+        self, tmp_path: Path
+    ) -> None:
         """A manifest with no toolMetadata is silently skipped, others still land."""
         policy = _make_policy("tool")
         behaviour = _make_behaviour(policy, {"tool"})
@@ -952,28 +1094,19 @@ class TestFetchMechManifests:
             _StubManifestMech("0xbad", "cid-bad"),
         ]
         _attach_mech_tools_api(behaviour)
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
-        )
-
-        bodies = [
-            MagicMock(
-                body=json.dumps(
-                    {"toolMetadata": {"tool": _PredictionMetadata.predictor()}}
-                ).encode()
-            ),
-            MagicMock(body=b"not-json", status_code=404),  # extraction failure
-        ]
 
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return bodies.pop(0)
-            yield  # generator function
+        def _respond(url: str) -> MagicMock:
+            if url.endswith("cid-good"):
+                return _manifest("tool")
+            return MagicMock(body=b"not-json", status_code=404)  # extraction failure
 
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
+        requested = _attach_ipfs(behaviour, _respond, tmp_path)
 
         _drive_fetch(behaviour)
 
         assert set(behaviour._tool_metadata) == {"tool"}
+        # permanent errors are not retried
+        assert len(requested) == 2
         # Per-CID warning fires for the failing manifest so the silent skip is
         # visible in logs.
         warnings = [
@@ -981,8 +1114,41 @@ class TestFetchMechManifests:
             for call in behaviour.context.logger.warning.call_args_list  # type: ignore[attr-defined]
         ]
         assert any("cid-bad" in msg for msg in warnings)
+        # only the manifests which were actually fetched are reported
+        info = behaviour.context.logger.info.call_args_list[-1].args[0]  # type: ignore[attr-defined]
+        assert "fetched 1 of 2 uncached" in info
+        # failed manifests are not cached, so they are fetched again on the next run
+        stored = json.loads((tmp_path / MECH_MANIFESTS_STORE).read_text())
+        assert set(stored) == {"cid-good"}
+
+    def test_transient_errors_are_retried(self, tmp_path: Path) -> None:
+        """A transient error or a timeout is retried in a subsequent wave."""
+        behaviour = _make_behaviour(_make_policy("t"), {"t"})
+        behaviour.synchronized_data.is_marketplace_v2 = True  # type: ignore[attr-defined]
+        behaviour.synchronized_data.mechs_info = [  # type: ignore[attr-defined]
+            _StubManifestMech("0xa", "cid-flaky"),
+            _StubManifestMech("0xb", "cid-slow"),
+        ]
+        _attach_mech_tools_api(behaviour)
+        failures = {"cid-flaky": 1, "cid-slow": 1}
+
+        def _respond(url: str) -> Optional[MagicMock]:
+            cid = url.rsplit("/", 1)[-1][len(CID_PREFIX) :]
+            if failures[cid]:
+                failures[cid] -= 1
+                if cid == "cid-slow":
+                    return None  # never delivered, times out
+                return MagicMock(body=b"not-json", status_code=503)
+            return _manifest(cid)
 
-    def test_warns_when_every_manifest_fails(self) -> None:
+        requested = _attach_ipfs(behaviour, _respond, tmp_path)
+
+        _drive_fetch(behaviour)
+
+        assert len(requested) == 4
+        assert set(behaviour._tool_metadata) == {"cid-flaky", "cid-slow"}
+
+    def test_warns_when_every_manifest_fails(self, tmp_path: Path) -> None:
         """A summary warning fires when every CID extraction fails.
 
         Without this warning the classifier-bypass case is silent.
@@ -995,16 +1161,12 @@ class TestFetchMechManifests:
             _StubManifestMech("0xb", "cid-b"),
         ]
         _attach_mech_tools_api(behaviour)
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
+        _attach_ipfs(
+            behaviour,
+            lambda _url: MagicMock(body=b"not-json", status_code=404),
+            tmp_path,
         )
 
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return MagicMock(body=b"not-json", status_code=404)
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
         _drive_fetch(behaviour)
 
         assert behaviour._tool_metadata == {}
@@ -1018,147 +1180,49 @@ class TestFetchMechManifests:
         )
 
 
-def _drive_fetch_one(behaviour: "_TestableBehaviour") -> bool:
-    """Drive _fetch_one_manifest to completion and return its bool value."""
-    gen = behaviour._fetch_one_manifest()
-    try:
-        while True:
-            next(gen)
-    except StopIteration as exc:
-        return bool(exc.value)
-    return False  # unreachable; keeps mypy happy
-
+class TestIsManifestRetriable:
+    """_is_manifest_retriable implements the canonical retry contract."""
 
-class TestFetchOneManifest:
-    """_fetch_one_manifest implements the canonical retry contract."""
-
-    def test_success_resets_retries_and_returns_true(self) -> None:
-        """A valid manifest updates the cache, resets retries, returns True."""
+    def test_permanent_error_is_not_retried(self) -> None:
+        """A permanent error skips retries and logs a warning."""
         behaviour = _make_behaviour(_make_policy("t"), {"t"})
-        behaviour._pending_cid = "cid-ok"
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
-        )
-        api = _attach_mech_tools_api(behaviour)
-        body = {"toolMetadata": {"t": _PredictionMetadata.predictor()}}
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return MagicMock(body=json.dumps(body).encode())
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
-        done = _drive_fetch_one(behaviour)
-
-        assert done is True
-        assert behaviour._tool_metadata == {"t": _PredictionMetadata.predictor()}
-        api.reset_retries.assert_called()
-        api.increment_retries.assert_not_called()
-
-    def test_permanent_error_resets_and_returns_true(self) -> None:
-        """A permanent error skips retries, logs a warning, returns True."""
-        behaviour = _make_behaviour(_make_policy("t"), {"t"})
-        behaviour._pending_cid = "cid-bad"
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
-        )
-        api = _attach_mech_tools_api(behaviour)
-        api.is_permanent_error.return_value = True
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return MagicMock(body=b"not-json", status_code=404)
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
+        _attach_mech_tools_api(behaviour)
+        res_raw = MagicMock(body=b"not-json", status_code=404)
 
-        done = _drive_fetch_one(behaviour)
+        assert behaviour._is_manifest_retriable("cid-bad", res_raw, 1) is False
 
-        assert done is True
-        assert behaviour._tool_metadata == {}
-        api.reset_retries.assert_called()
-        api.increment_retries.assert_not_called()
         warnings = [
             call.args[0]
             for call in behaviour.context.logger.warning.call_args_list  # type: ignore[attr-defined]
         ]
         assert any("permanent error" in msg for msg in warnings)
 
-    def test_transient_error_within_budget_returns_false(self) -> None:
-        """A transient error increments retries and yields a re-invoke.
-
-        The outer driver re-invokes on False until the budget burns.
-        """
+    def test_transient_error_within_budget_is_retried(self) -> None:
+        """A transient error is retried while the budget lasts, without warnings."""
         behaviour = _make_behaviour(_make_policy("t"), {"t"})
-        behaviour._pending_cid = "cid-flaky"
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
-        )
         api = _attach_mech_tools_api(behaviour)
-        api.is_permanent_error.return_value = False
-        api.is_retries_exceeded.return_value = False
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return MagicMock(body=b"not-json", status_code=503)
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
+        res_raw = MagicMock(body=b"not-json", status_code=503)
 
-        done = _drive_fetch_one(behaviour)
-
-        assert done is False
-        assert behaviour._tool_metadata == {}
-        api.increment_retries.assert_called_once()
-        api.reset_retries.assert_not_called()
+        attempts = api.retries_info.retries
+        assert behaviour._is_manifest_retriable("cid-flaky", res_raw, attempts)
+        assert behaviour._is_manifest_retriable("cid-slow", None, attempts)
+        behaviour.context.logger.warning.assert_not_called()  # type: ignore[attr-defined]
 
-    def test_transient_error_when_retries_exceeded_returns_true(self) -> None:
+    def test_transient_error_when_retries_exceeded_is_not_retried(self) -> None:
         """When the retry budget is burned, the warning fires and we give up."""
         behaviour = _make_behaviour(_make_policy("t"), {"t"})
-        behaviour._pending_cid = "cid-dead"
-        behaviour.params = MagicMock(  # type: ignore[attr-defined,assignment]
-            ipfs_address="https://ipfs.example/"
-        )
         api = _attach_mech_tools_api(behaviour)
-        api.is_permanent_error.return_value = False
-        api.is_retries_exceeded.return_value = True
+        res_raw = MagicMock(body=b"not-json", status_code=503)
 
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            return MagicMock(body=b"not-json", status_code=503)
-            yield  # generator function
+        attempts = api.retries_info.retries + 1
+        assert not behaviour._is_manifest_retriable("cid-dead", res_raw, attempts)
 
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
-        done = _drive_fetch_one(behaviour)
-
-        assert done is True
-        assert behaviour._tool_metadata == {}
-        api.increment_retries.assert_called_once()
-        api.reset_retries.assert_called()
         warnings = [
             call.args[0]
             for call in behaviour.context.logger.warning.call_args_list  # type: ignore[attr-defined]
         ]
         assert any("retries exhausted" in msg for msg in warnings)
 
-    def test_returns_true_when_no_pending_cid(self) -> None:
-        """A None pending_cid short-circuits without hitting the network."""
-        behaviour = _make_behaviour(_make_policy("t"), {"t"})
-        behaviour._pending_cid = None
-        _attach_mech_tools_api(behaviour)
-
-        called = {"n": 0}
-
-        def _http_gen(**_kw: Any) -> Generator[None, None, Any]:
-            called["n"] += 1
-            return MagicMock(body=b"{}")
-            yield  # generator function
-
-        behaviour.get_http_response = _http_gen  # type: ignore[method-assign,assignment]
-
-        done = _drive_fetch_one(behaviour)
-
-        assert done is True
-        assert called["n"] == 0
-
 
 class TestCandidateToolsSuitability:
     """_candidate_tools applies the suitability classifier when metadata exists."""
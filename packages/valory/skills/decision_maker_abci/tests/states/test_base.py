@@ -20,7 +20,7 @@
 """This package contains the tests for Decision Maker"""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -36,6 +36,10 @@ from packages.valory.skills.decision_maker_abci.states.base import (
     SynchronizedData,
     TxPreparationRound,
 )
+from packages.valory.skills.decision_maker_abci.states.tool_selection import (
+    ToolSelectionRound,
+)
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 
 
 class MechMetadata:
@@ -112,6 +116,16 @@ def test_utilized_tools(sync_data: SynchronizedData, mocked_db: MagicMock) -> No
     mocked_db.get_strict.assert_called_once_with("utilized_tools")
 
 
+def test_utilized_tools_timestamped(
+    sync_data: SynchronizedData, mocked_db: MagicMock
+) -> None:
+    """Test that the utilized_tools property keeps the timestamps of the tools."""
+    mocked_db.get_strict.return_value = '{"tx1": ["tool1", 100], "tx2": "tool2"}'
+    utilized_tools = sync_data.utilized_tools
+    assert utilized_tools == {"tx1": "tool1", "tx2": "tool2"}
+    assert utilized_tools.recorded == {"tx1": 100}
+
+
 def test_redeemed_condition_ids(
     sync_data: SynchronizedData, mocked_db: MagicMock
 ) -> None:
@@ -633,3 +647,75 @@ def test_participant_to_handle_failed_tx(
     ):
         result = sync_data.participant_to_handle_failed_tx
     assert result == {"agent_0": "failed_0"}
+
+
+def _make_tool_selection_round(current_tools: str) -> ToolSelectionRound:
+    """Create a tool selection round, with the given utilized tools synchronized."""
+    mock_synced_data = MagicMock(spec=SynchronizedData)
+    mock_synced_data.db.get.return_value = current_tools
+    return ToolSelectionRound(synchronized_data=mock_synced_data, context=MagicMock())
+
+
+def test_utilized_tools_update_round_merges_the_delta() -> None:
+    """Test that the changes of the utilized tools are applied on the synchronized ones."""
+    synchronized = UtilizedTools({"tx1": "tool1", "tx2": "tool2"})
+    tools = UtilizedTools(synchronized)
+    del tools["tx1"]
+    tools["tx3"] = "tool3"
+    round_instance = _make_tool_selection_round(synchronized.serialize())
+
+    most_voted = ("mech_tools", "policy", tools.serialize_delta(synchronized), "tool")
+    with patch.object(
+        CollectSameUntilThresholdRound,
+        "most_voted_payload_values",
+        new_callable=PropertyMock,
+        return_value=most_voted,
+    ):
+        values = round_instance.most_voted_payload_values
+
+    assert values == ("mech_tools", "policy", tools.serialize(), "tool")
+    round_instance.synchronized_data.db.get.assert_called_once_with(
+        "utilized_tools", None
+    )
+
+
+def test_utilized_tools_update_round_applies_a_mismatching_delta() -> None:
+    """Test that the changes are still applied if they were made against other tools than the synchronized ones."""
+    current = '{"tx8": "tool8", "tx9": "tool9"}'
+    round_instance = _make_tool_selection_round(current)
+    delta = UtilizedTools({"tx1": "tool1"}).serialize_delta({"tx9": "tool9"})
+
+    most_voted = ("mech_tools", "policy", delta, "tool")
+    with patch.object(
+        CollectSameUntilThresholdRound,
+        "most_voted_payload_values",
+        new_callable=PropertyMock,
+        return_value=most_voted,
+    ):
+        values = round_instance.most_voted_payload_values
+
+    assert values == (
+        "mech_tools",
+        "policy",
+        '{"tx1": "tool1", "tx8": "tool8"}',
+        "tool",
+    )
+    round_instance.context.logger.warning.assert_called_once()
+
+
+@pytest.mark.parametrize("update", (None, '{"tx1": "tool1"}'))
+def test_utilized_tools_update_round_passes_through(update: str) -> None:
+    """Test that a missing update or one carrying all the tools is synchronized as is."""
+    round_instance = _make_tool_selection_round('{"tx9": "tool9"}')
+
+    most_voted = ("mech_tools", "policy", update, "tool")
+    with patch.object(
+        CollectSameUntilThresholdRound,
+        "most_voted_payload_values",
+        new_callable=PropertyMock,
+        return_value=most_voted,
+    ):
+        values = round_instance.most_voted_payload_values
+
+    assert values == most_voted
+    round_instance.synchronized_data.db.get.assert_not_called()
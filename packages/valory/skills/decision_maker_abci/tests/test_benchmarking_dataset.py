@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the indexed benchmarking dataset."""
+
+import csv
+import os
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.decision_maker_abci.benchmarking_dataset import (
+    BenchmarkingDataset,
+)
+
+DATASET = (
+    "question_id,question,answer,p_yes_tool1\n"
+    "q1,Will it rain?,yes,0.8\n"
+    "\n"
+    'q2,"Will it\nsnow, or ""hail""?",no,0.3\n'
+    "q1,Will it rain again?,yes,0.7\n"
+)
+
+
+def _write(path: Path, content: str) -> str:
+    """Write the dataset and return its path."""
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> str:
+    """Get the path of a dataset."""
+    return _write(tmp_path / "dataset.csv", DATASET)
+
+
+class TestBenchmarkingDataset:
+    """Tests for the BenchmarkingDataset."""
+
+    def test_rows_match_dict_reader(self, dataset_path: str) -> None:
+        """Test that every row is read as `csv.DictReader` reads it, including the quoted multi-line fields."""
+        dataset = BenchmarkingDataset(dataset_path, ",", "question_id")
+        dataset.load()
+
+        with open(dataset_path, newline="") as dataset_file:
+            expected = list(csv.DictReader(dataset_file))
+
+        assert dataset.n_rows == len(expected) == 3
+        assert [dataset.row(i) for i in range(1, 4)] == expected
+        assert dataset.row(0) is None
+        assert dataset.row(4) is None
+
+    def test_rows_by_question_id(self, dataset_path: str) -> None:
+        """Test that the row numbers are grouped per question id and handed out as copies."""
+        dataset = BenchmarkingDataset(dataset_path, ",", "question_id")
+        dataset.load()
+
+        assert dataset.rows_by_question_id == {"q1": [1, 3], "q2": [2]}
+        manager = dataset.row_manager()
+        manager["q1"].pop(0)
+        assert dataset.row_manager() == {"q1": [1, 3], "q2": [2]}
+
+    def test_custom_separator(self, tmp_path: Path) -> None:
+        """Test that the configured separator is used."""
+        path = _write(tmp_path / "dataset.csv", "question_id;answer\nq1;yes\n")
+        dataset = BenchmarkingDataset(path, ";", "question_id")
+        dataset.load()
+
+        assert dataset.row(1) == {"question_id": "q1", "answer": "yes"}
+
+    def test_empty_dataset(self, tmp_path: Path) -> None:
+        """Test that an empty dataset has no rows."""
+        dataset = BenchmarkingDataset(_write(tmp_path / "d.csv", ""), ",", "id")
+        dataset.load()
+
+        assert dataset.n_rows == 0
+        assert dataset.row(1) is None
+
+    def test_missing_question_id_field(self, dataset_path: str) -> None:
+        """Test that a missing question id field raises."""
+        with pytest.raises(KeyError):
+            BenchmarkingDataset(dataset_path, ",", "market_id").load()
+
+    def test_is_stale(self, dataset_path: str) -> None:
+        """Test that the index is stale if the configuration or the file changes."""
+        dataset = BenchmarkingDataset(dataset_path, ",", "question_id")
+        dataset.load()
+
+        assert not dataset.is_stale(dataset_path, ",", "question_id")
+        assert dataset.is_stale(dataset_path, ";", "question_id")
+        assert dataset.is_stale(dataset_path, ",", "id")
+
+        with open(dataset_path, "a", encoding="utf-8") as dataset_file:
+            dataset_file.write("q3,Will it shine?,yes,0.9\n")
+        assert dataset.is_stale(dataset_path, ",", "question_id")
+
+        os.remove(dataset_path)
+        assert dataset.is_stale(dataset_path, ",", "question_id")
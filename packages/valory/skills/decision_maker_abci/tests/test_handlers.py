@@ -136,6 +136,34 @@ class TestIpfsHandler:
 
         callback.assert_called_once_with(mock_message, mock_dialogue)
 
+    def test_handle_error(self) -> None:
+        """Test that an error response is passed to the callback of its request."""
+        callback = MagicMock()
+        self.handler.shared_state.req_to_callback = {"reference": callback}
+        mock_dialogue = MagicMock()
+        mock_dialogue.dialogue_label.dialogue_reference = ["reference"]
+
+        with mock.patch.object(
+            self.handler.context.ipfs_dialogues, "update", return_value=mock_dialogue
+        ):
+            mock_message = MagicMock(performative=IpfsMessage.Performative.ERROR)
+            self.handler.handle(mock_message)
+
+        callback.assert_called_once_with(mock_message, mock_dialogue)
+
+    def test_handle_without_callback(self) -> None:
+        """Test that a response without a callback is dropped."""
+        self.handler.shared_state.req_to_callback = {}
+        mock_dialogue = MagicMock()
+        mock_dialogue.dialogue_label.dialogue_reference = ["reference"]
+
+        with mock.patch.object(
+            self.handler.context.ipfs_dialogues, "update", return_value=mock_dialogue
+        ):
+            self.handler.handle(MagicMock(performative=IpfsMessage.Performative.ERROR))
+
+        self.context.logger.warning.assert_called_once()
+
     def test_handle_negative_performative_not_allowed(self) -> None:
         """Test the 'handle' method, negative case (performative not allowed)."""
         self.handler.handle(MagicMock())
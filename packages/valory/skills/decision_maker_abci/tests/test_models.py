@@ -30,6 +30,7 @@ from web3.constants import HASH_ZERO
 from packages.valory.skills.decision_maker_abci.models import (
     AccuracyInfoFields,
     BenchmarkingMockData,
+    CompiledStrategy,
     DecisionMakerParams,
     LiquidityInfo,
     MultisendBatch,
@@ -43,6 +44,8 @@ from packages.valory.skills.decision_maker_abci.models import (
     check_prompt_template,
     extract_keys_from_template,
 )
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
+from packages.valory.skills.staking_abci.models import StakingEpochCache
 
 
 class TestPromptTemplate:
@@ -372,6 +375,8 @@ class TestSharedStateInit:
         assert isinstance(state.redeeming_progress, RedeemingProgress)
         assert state.strategy_to_filehash == {}
         assert state.strategies_executables == {}
+        assert state.strategies_filehashes == {}
+        assert state.compiled_strategies == {}
         assert state.in_flight_req is False
         assert state.req_to_callback == {}
         assert state.mock_data is None
@@ -382,12 +387,16 @@ class TestSharedStateInit:
         assert state.liquidity_prices == {}
         assert state.last_benchmarking_has_run is False
         assert state.bet_id_row_manager == {}
+        assert state.benchmarking_dataset is None
         assert state.benchmarking_mech_calls == 0
         assert state.mech_timed_out is False
         # Must default to None, not False: the staking-regime cache distinguishes
         # "never computed" (None ⇒ read on-chain) from a computed OLD verdict
         # (False ⇒ cache hit). A False default would suppress the first read.
         assert state.staking_regime_is_new is None
+        assert state.staking_epoch_cache == StakingEpochCache()
+        assert isinstance(state.bets_repository, BetsRepository)
+        assert not state.bets_repository.loaded
 
 
 class TestSharedState:
@@ -405,6 +414,31 @@ class TestSharedState:
         self.state.redeeming_progress = MagicMock()
         self.state.strategy_to_filehash = {}
         self.state.strategies_executables = {}
+        self.state.strategies_filehashes = {}
+        self.state.compiled_strategies = {}
+
+    def test_invalidate_compiled_strategy(self) -> None:
+        """Test invalidate_compiled_strategy drops the strategy's compiled executable."""
+        compiled = CompiledStrategy("def run(): pass", "run", None)
+        self.state.strategies_filehashes = {"kelly": "hash_kelly"}
+        self.state.compiled_strategies = {
+            "hash_kelly": compiled,
+            "hash_other": compiled,
+        }
+
+        self.state.invalidate_compiled_strategy("kelly")
+
+        assert self.state.strategies_filehashes == {}
+        assert self.state.compiled_strategies == {"hash_other": compiled}
+
+    def test_invalidate_compiled_strategy_without_filehash(self) -> None:
+        """Test invalidate_compiled_strategy for a strategy cached under its name."""
+        compiled = CompiledStrategy("def run(): pass", "run", None)
+        self.state.compiled_strategies = {"kelly": compiled}
+
+        self.state.invalidate_compiled_strategy("kelly")
+
+        assert self.state.compiled_strategies == {}
 
     def test_mock_question_id_raises_when_no_mock_data(self) -> None:
         """Test mock_question_id raises ValueError when mock_data is None."""
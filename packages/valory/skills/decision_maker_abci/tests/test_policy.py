@@ -21,15 +21,19 @@
 
 import json
 from time import time
+from unittest.mock import patch
 
 import pytest
 
 from packages.valory.skills.decision_maker_abci.policy import (
     AccuracyInfo,
+    COMPACT_POLICY_PREFIX,
     ConsecutiveFailures,
+    DECODED_POLICIES_CACHE_SIZE,
     DataclassEncoder,
     EGreedyPolicy,
     EGreedyPolicyDecoder,
+    _decoded_policies,
     argmax,
 )
 
@@ -277,6 +281,59 @@ def test_e_greedy_policy_serialize_deserialize(
     assert set(deserialized.tools) == set(e_greedy_policy_mock.tools)
 
 
+def test_e_greedy_policy_compact_serialization(
+    e_greedy_policy_mock: EGreedyPolicy,
+) -> None:
+    """Test that the compact wire format round-trips and is smaller than the JSON one."""
+    compact = e_greedy_policy_mock.serialize_compact()
+
+    assert compact.startswith(COMPACT_POLICY_PREFIX)
+    assert len(compact) < len(e_greedy_policy_mock.serialize()) / 2
+    deserialized = EGreedyPolicy.deserialize(compact)
+    assert deserialized == e_greedy_policy_mock
+    assert deserialized.serialize() == e_greedy_policy_mock.serialize()
+    assert deserialized.serialize_compact() == compact
+
+
+def test_e_greedy_policy_deserialize_is_memoized(
+    e_greedy_policy_mock: EGreedyPolicy,
+) -> None:
+    """Test that a serialized policy is decoded once and that every call gets an independent copy."""
+    for serialized in (
+        e_greedy_policy_mock.serialize(),
+        e_greedy_policy_mock.serialize_compact(),
+    ):
+        _decoded_policies.clear()
+        with patch(
+            "packages.valory.skills.decision_maker_abci.policy.json.loads",
+            side_effect=json.loads,
+        ) as loads:
+            first = EGreedyPolicy.deserialize(serialized)
+            first.tool_used("prediction-online")
+            first.tool_responded("prediction-online", 1, True)
+            second = EGreedyPolicy.deserialize(serialized)
+
+        loads.assert_called_once()
+        assert second == e_greedy_policy_mock
+        assert second != first
+
+
+def test_e_greedy_policy_decoded_cache_is_bounded() -> None:
+    """Test that only the most recently used decoded policies are kept."""
+    _decoded_policies.clear()
+    for quarantine_duration in range(DECODED_POLICIES_CACHE_SIZE + 1):
+        EGreedyPolicy.deserialize(
+            EGreedyPolicy(
+                eps=0.1,
+                consecutive_failures_threshold=1,
+                quarantine_duration=quarantine_duration,
+            ).serialize_compact()
+        )
+
+    assert len(_decoded_policies) == DECODED_POLICIES_CACHE_SIZE
+    assert all(policy.quarantine_duration > 0 for policy in _decoded_policies.values())
+
+
 def test_e_greedy_policy_tools_property(
     e_greedy_policy_mock: EGreedyPolicy,
 ) -> None:
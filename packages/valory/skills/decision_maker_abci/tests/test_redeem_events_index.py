@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the index of the redeeming events."""
+
+from pathlib import Path
+
+import pytest
+from hexbytes import HexBytes
+
+from packages.valory.skills.decision_maker_abci.redeem_events_index import (
+    REDEEM_EVENTS_INDEX_FILENAME,
+    RESCAN_MARGIN_BLOCKS,
+    RedeemEventsIndex,
+)
+
+SCOPE = "0xsafe:0xct:0xrealitio"
+CONDITION_ID = HexBytes("0xaa")
+QUESTION_ID = bytes.fromhex("bb")
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> RedeemEventsIndex:
+    """Get an empty index."""
+    return RedeemEventsIndex(str(tmp_path / REDEEM_EVENTS_INDEX_FILENAME), SCOPE)
+
+
+class TestRedeemedConditions:
+    """Tests for the indexing of the redeemed conditions."""
+
+    def test_unknown_conditions_start_from_earliest_block(
+        self, index: RedeemEventsIndex
+    ) -> None:
+        """Test that the conditions which have never been scanned are scanned from the earliest block."""
+        assert index.redeemed_from_block([CONDITION_ID], 100) == 100
+        assert index.redeemed_from_block([], 100) == 100
+
+    def test_resume_from_scanned_block(self, index: RedeemEventsIndex) -> None:
+        """Test that the scan resumes shortly before the end of the scanned range."""
+        index.record_redeemed([CONDITION_ID], 100, 1000, {})
+
+        assert index.redeemed_from_block([CONDITION_ID], 100) == (
+            1000 - RESCAN_MARGIN_BLOCKS
+        )
+        # a new condition must be scanned from the beginning
+        assert index.redeemed_from_block([CONDITION_ID, "0xcc"], 100) == 100
+        # the scanned range does not go back to an earlier block of interest
+        assert index.redeemed_from_block([CONDITION_ID], 50) == 50
+
+    def test_ranges_are_extended_or_replaced(self, index: RedeemEventsIndex) -> None:
+        """Test that contiguous scans extend the range and the others replace it."""
+        index.record_redeemed([CONDITION_ID], 100, 200, {})
+        index.record_redeemed([CONDITION_ID], 180, 300, {})
+        assert index.redeemed_ranges == {"0xaa": (100, 300)}
+
+        index.record_redeemed([CONDITION_ID], 500, 600, {})
+        assert index.redeemed_ranges == {"0xaa": (500, 600)}
+
+    def test_known_payouts_keep_reported_keys(self, index: RedeemEventsIndex) -> None:
+        """Test that the payouts are returned under the ids reported by the contract."""
+        index.record_redeemed([CONDITION_ID, "0xcc"], 0, 10, {"0xAA": 5})
+
+        assert index.known_payouts([CONDITION_ID]) == {"0xAA": 5}
+        assert index.known_payouts(["0xcc"]) == {}
+
+    def test_retain(self, index: RedeemEventsIndex) -> None:
+        """Test that the ids which are not redeemed anymore are forgotten."""
+        index.record_redeemed([CONDITION_ID, "0xcc"], 0, 10, {"0xaa": 5, "0xcc": 1})
+        index.record_answers(QUESTION_ID, 0, 10, [{"args": {}}])
+        index.record_answers("0xdd", 0, 10, [])
+
+        index.retain(["0xCC"], [QUESTION_ID])
+
+        assert index.redeemed_ranges == {"0xcc": (0, 10)}
+        assert index.payouts == {"0xcc": 1}
+        assert list(index.answer_ranges) == ["0xbb"]
+
+
+class TestAnswers:
+    """Tests for the indexing of the answers."""
+
+    def test_answers_are_deduplicated_in_order(self, index: RedeemEventsIndex) -> None:
+        """Test that the rescanned answers are not duplicated and the order is kept."""
+        first = {"args": {"answer": HexBytes("0x01"), "bond": 1}}
+        second = {"args": {"answer": HexBytes("0x02"), "bond": 2}}
+
+        assert index.record_answers(QUESTION_ID, 100, 200, [first]) == [first]
+        assert index.answers_from_block(QUESTION_ID, 100) == 200 - RESCAN_MARGIN_BLOCKS
+        assert index.record_answers(QUESTION_ID, 180, 300, [first, second]) == [
+            first,
+            second,
+        ]
+        assert index.known_answers(QUESTION_ID, 100) == [first, second]
+        assert index.known_answers(QUESTION_ID, 50) == []
+
+    def test_scan_from_scratch_restarts_answers(self, index: RedeemEventsIndex) -> None:
+        """Test that scanning a question from scratch drops the previously indexed answers."""
+        first = {"args": {"answer": "0x01"}}
+        index.record_answers(QUESTION_ID, 100, 200, [first])
+
+        assert index.record_answers(QUESTION_ID, 50, 150, []) == []
+        assert index.answer_ranges == {"0xbb": (50, 150)}
+
+
+class TestPersistence:
+    """Tests for the persistence of the index."""
+
+    def test_store_and_load_roundtrip(self, index: RedeemEventsIndex) -> None:
+        """Test that a stored index is loaded back, including the bytes of the events."""
+        answer = {"args": {"answer": HexBytes("0x01"), "user": "0xuser", "bond": 3}}
+        index.record_redeemed([CONDITION_ID], 0, 10, {"0xaa": 5})
+        index.record_answers(QUESTION_ID, 0, 10, [answer])
+        index.store()
+
+        loaded = RedeemEventsIndex(index.path, SCOPE)
+        assert loaded.load() is True
+        assert loaded.redeemed_ranges == {"0xaa": (0, 10)}
+        assert loaded.payouts == {"0xaa": 5}
+        assert loaded.known_answers(QUESTION_ID, 0) == [answer]
+        assert isinstance(loaded.answers["0xbb"][0]["args"]["answer"], HexBytes)
+
+    def test_other_scope_is_ignored(self, index: RedeemEventsIndex) -> None:
+        """Test that an index stored for another redeemer is not loaded."""
+        index.record_redeemed([CONDITION_ID], 0, 10, {"0xaa": 5})
+        index.store()
+
+        other = RedeemEventsIndex(index.path, "0xother:0xct:0xrealitio")
+        assert other.load() is False
+        assert other.payouts == {}
+
+    def test_missing_index(self, index: RedeemEventsIndex) -> None:
+        """Test that a missing index is not loaded."""
+        assert index.load() is False
+
+    @pytest.mark.parametrize("content", ["{", "{}", '{"scope": "' + SCOPE + '"}'])
+    def test_malformed_index(self, index: RedeemEventsIndex, content: str) -> None:
+        """Test that a malformed index raises."""
+        Path(index.path).write_text(content)
+
+        with pytest.raises((ValueError, KeyError)):
+            index.load()
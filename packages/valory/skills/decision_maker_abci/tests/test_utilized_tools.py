@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the utilized tools' ledger."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.decision_maker_abci.utilized_tools import (
+    JOURNAL_SUFFIX,
+    MIN_COMPACTION_RECORDS,
+    UTILIZED_TOOLS_DELTA_TAG,
+    UTILIZED_TOOLS_TTL,
+    UtilizedTools,
+    UtilizedToolsJournal,
+    is_utilized_tools_delta,
+    merge_utilized_tools,
+)
+
+
+class TestUtilizedTools:
+    """Tests for the UtilizedTools mapping."""
+
+    def test_plain_serialization(self) -> None:
+        """Test that tools which have not been timestamped serialize as a plain mapping."""
+        tools = UtilizedTools({"b": "tool2", "a": "tool1"})
+
+        assert tools.serialize() == json.dumps(tools, sort_keys=True)
+        assert UtilizedTools.deserialize(tools.serialize()) == tools
+
+    def test_timestamped_serialization(self) -> None:
+        """Test that the timestamps survive a serialization roundtrip."""
+        tools = UtilizedTools({"a": "tool1", "b": "tool2"}, recorded={"a": 100})
+
+        assert json.loads(tools.serialize()) == {"a": ["tool1", 100], "b": "tool2"}
+        restored = UtilizedTools.deserialize(tools.serialize())
+        assert restored == {"a": "tool1", "b": "tool2"}
+        assert restored.recorded == {"a": 100}
+
+    def test_copy_keeps_the_timestamps(self) -> None:
+        """Test that copying utilized tools keeps their timestamps."""
+        tools = UtilizedTools({"a": "tool1"}, recorded={"a": 100})
+
+        assert UtilizedTools(tools).recorded == {"a": 100}
+        assert UtilizedTools({"a": "tool1"}).recorded == {}
+
+    def test_mutations_reset_the_timestamps(self) -> None:
+        """Test that recording or removing a tool drops its timestamp."""
+        tools = UtilizedTools(
+            {"a": "tool1", "b": "tool2", "c": "tool3"},
+            recorded={"a": 1, "b": 2, "c": 3},
+        )
+
+        tools["a"] = "tool4"
+        del tools["b"]
+        assert tools.pop("c") == "tool3"
+        assert tools.pop("missing", None) is None
+
+        assert tools == {"a": "tool4"}
+        assert tools.recorded == {}
+
+    def test_evict_expired(self) -> None:
+        """Test that the new tools are timestamped and the expired ones are evicted."""
+        now = 10 * UTILIZED_TOOLS_TTL
+        tools = UtilizedTools(
+            {"expired": "tool1", "recent": "tool2", "new": "tool3"},
+            recorded={"expired": now - UTILIZED_TOOLS_TTL - 1, "recent": now - 1},
+        )
+
+        evicted = tools.evict_expired(now)
+
+        assert evicted == ["expired"]
+        assert tools == {"recent": "tool2", "new": "tool3"}
+        assert tools.recorded == {"recent": now - 1, "new": now}
+
+    def test_delta_roundtrip(self) -> None:
+        """Test that the changes since the synchronized tools can be merged back into them."""
+        synchronized = UtilizedTools({"a": "tool1", "b": "tool2"})
+        tools = UtilizedTools(synchronized)
+        del tools["a"]
+        tools["c"] = "tool3"
+        tools.evict_expired(1000)
+
+        delta = tools.serialize_delta(synchronized)
+
+        assert is_utilized_tools_delta(delta)
+        tag, _digest, updates, removed = json.loads(delta)
+        assert tag == UTILIZED_TOOLS_DELTA_TAG
+        assert updates == {"b": ["tool2", 1000], "c": ["tool3", 1000]}
+        assert removed == ["a"]
+        assert (
+            merge_utilized_tools(synchronized.serialize(), delta) == tools.serialize()
+        )
+
+    def test_delta_size_does_not_depend_on_the_tools(self) -> None:
+        """Test that the changes of a period do not grow with the number of synchronized tools."""
+        synchronized = UtilizedTools({f"0x{i}": "tool" for i in range(1000)})
+        tools = UtilizedTools(synchronized)
+        tools["0xnew"] = "tool"
+
+        delta = tools.serialize_delta(synchronized)
+
+        assert len(delta) < 200
+        assert json.loads(merge_utilized_tools(synchronized.serialize(), delta)) == {
+            **synchronized,
+            "0xnew": "tool",
+        }
+
+    def test_merge_without_synchronized_tools(self) -> None:
+        """Test that the changes apply to empty tools when none have been synchronized."""
+        tools = UtilizedTools({"a": "tool1"})
+
+        merged = merge_utilized_tools(None, tools.serialize_delta({}))
+
+        assert merged == tools.serialize()
+
+    @pytest.mark.parametrize("update", (None, '{"a": "tool1"}'))
+    def test_merge_passes_through(self, update: str) -> None:
+        """Test that a missing update or one carrying all the tools is synchronized as is."""
+        assert not is_utilized_tools_delta(update)
+        assert merge_utilized_tools('{"b": "tool2"}', update) == update
+
+    def test_merge_mismatch(self) -> None:
+        """Test that changes which do not apply to the synchronized tools are rejected."""
+        delta = UtilizedTools({"a": "tool1"}).serialize_delta({})
+
+        with pytest.raises(ValueError):
+            merge_utilized_tools('{"b": "tool2"}', delta)
+
+    def test_merge_mismatch_unverified(self) -> None:
+        """Test that the changes are applied on the synchronized tools if they are not verified."""
+        delta = UtilizedTools({"a": "tool1"}).serialize_delta({"c": "tool3"})
+
+        merged = merge_utilized_tools(
+            '{"b": "tool2", "c": "tool3"}', delta, verify=False
+        )
+
+        assert merged == '{"a": "tool1", "b": "tool2"}'
+
+
+class TestUtilizedToolsJournal:
+    """Tests for the UtilizedToolsJournal."""
+
+    def test_store_and_load(self, tmp_path: Path) -> None:
+        """Test that the stored tools are loaded back, along with their timestamps."""
+        path = tmp_path / "utilized_tools.json"
+        tools = UtilizedTools({"a": "tool1", "b": "tool2"}, recorded={"a": 100})
+
+        UtilizedToolsJournal(str(path)).store(tools)
+
+        loaded = UtilizedToolsJournal(str(path)).load()
+        assert loaded == tools
+        assert loaded.recorded == {"a": 100}
+
+    def test_loads_a_plain_store(self, tmp_path: Path) -> None:
+        """Test that a store of a plain mapping is loaded."""
+        path = tmp_path / "utilized_tools.json"
+        path.write_text(json.dumps({"a": "tool1"}))
+
+        assert UtilizedToolsJournal(str(path)).load() == {"a": "tool1"}
+
+    def test_appends_only_the_changes(self, tmp_path: Path) -> None:
+        """Test that the stores after the first one only append the changes to the journal."""
+        path = tmp_path / "utilized_tools.json"
+        journal = UtilizedToolsJournal(str(path))
+        tools = UtilizedTools({"a": "tool1", "b": "tool2"})
+        journal.store(tools)
+        snapshot = path.read_text()
+
+        tools["c"] = "tool3"
+        del tools["a"]
+        journal.store(tools)
+        journal.store(tools)
+
+        assert path.read_text() == snapshot
+        journal_lines = Path(f"{path}{JOURNAL_SUFFIX}").read_text().splitlines()
+        assert len(journal_lines) == 2
+        assert json.loads(journal_lines[1]) == {"set": {"c": "tool3"}, "del": ["a"]}
+        assert journal.n_journaled == 2
+        assert UtilizedToolsJournal(str(path)).load() == tools
+
+    def test_compaction(self, tmp_path: Path) -> None:
+        """Test that the journal is folded back into the snapshot once it grows enough."""
+        path = tmp_path / "utilized_tools.json"
+        journal = UtilizedToolsJournal(str(path))
+        tools = UtilizedTools()
+        journal.store(tools)
+
+        for i in range(MIN_COMPACTION_RECORDS):
+            tools[f"0x{i}"] = "tool"
+        journal.store(tools)
+        assert journal.n_journaled == MIN_COMPACTION_RECORDS
+
+        del tools["0x0"]
+        journal.store(tools)
+
+        assert journal.n_journaled == 0
+        assert not Path(f"{path}{JOURNAL_SUFFIX}").exists()
+        assert json.loads(path.read_text()) == tools
+
+    def test_stale_journal_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a journal which belongs to a different snapshot is not replayed."""
+        path = tmp_path / "utilized_tools.json"
+        journal = UtilizedToolsJournal(str(path))
+        tools = UtilizedTools({"a": "tool1"})
+        journal.store(tools)
+        tools["b"] = "tool2"
+        journal.store(tools)
+        path.write_text(json.dumps({"c": "tool3"}))
+
+        reloaded = UtilizedToolsJournal(str(path))
+        assert reloaded.load() == {"c": "tool3"}
+
+        # the next store rewrites the snapshot and drops the stale journal
+        reloaded.store(UtilizedTools({"d": "tool4"}))
+        assert not Path(f"{path}{JOURNAL_SUFFIX}").exists()
+        assert UtilizedToolsJournal(str(path)).load() == {"d": "tool4"}
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains a bounded ledger of the tools utilized for the placed bets."""
+
+import hashlib
+import json
+import os
+import tempfile
+from json import JSONDecodeError
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+
+# the tag which leads the serialized changes of the utilized tools
+UTILIZED_TOOLS_DELTA_TAG = "utd1"
+UTILIZED_TOOLS_DELTA_PREFIX = f'["{UTILIZED_TOOLS_DELTA_TAG}"'
+# the tools of the bets which have not been resolved within this many seconds are evicted
+UTILIZED_TOOLS_TTL = 90 * 24 * 60 * 60
+JOURNAL_SUFFIX = ".journal"
+# the journal is folded back into the snapshot once it holds at least as many changes as there are tools,
+# but never before it holds this many
+MIN_COMPACTION_RECORDS = 100
+SNAPSHOT_KEY = "snapshot"
+UPDATES_KEY = "set"
+REMOVED_KEY = "del"
+
+# a tool, or a tool along with the timestamp at which it was recorded
+UtilizedToolEntry = Union[str, List[Any]]
+
+
+def _digest(serialized: str) -> str:
+    """Get the digest of a serialized string."""
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _serialize_entries(entries: Mapping[str, UtilizedToolEntry]) -> str:
+    """Serialize the entries of the utilized tools in their canonical form."""
+    return json.dumps(entries, sort_keys=True)
+
+
+class UtilizedTools(Dict[str, str]):
+    """A mapping of the placed bets' transaction hashes or condition ids to the tools utilized for them.
+
+    Besides being removed when their bet is resolved, the tools expire after a TTL, so that the tools of bets
+    which are never redeemed do not accumulate forever. A tool is timestamped the first time that the expired
+    tools are evicted after it was recorded, using the timestamp that the agents have synchronized on,
+    so that all the agents agree on its age. The tools which have not been timestamped yet are serialized
+    exactly as a plain mapping would be.
+    """
+
+    def __init__(
+        self,
+        tools: Optional[Mapping[str, str]] = None,
+        recorded: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        """Initialize the utilized tools, keeping the timestamps of the given tools if they are `UtilizedTools`."""
+        super().__init__(tools or {})
+        if recorded is None:
+            recorded = tools.recorded if isinstance(tools, UtilizedTools) else {}
+        self.recorded: Dict[str, int] = {
+            key: int(timestamp) for key, timestamp in recorded.items() if key in self
+        }
+
+    def __setitem__(self, key: str, tool: str) -> None:
+        """Record the tool utilized for a bet, which will be timestamped anew."""
+        super().__setitem__(key, tool)
+        self.recorded.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove the tool utilized for a bet."""
+        super().__delitem__(key)
+        self.recorded.pop(key, None)
+
+    def pop(self, key: str, *default: Any) -> Any:  # type: ignore[override]
+        """Remove the tool utilized for a bet and return it."""
+        self.recorded.pop(key, None)
+        return super().pop(key, *default)
+
+    def entries(self) -> Dict[str, UtilizedToolEntry]:
+        """Get the tools, along with their timestamps if they have been timestamped."""
+        return {
+            key: [tool, self.recorded[key]] if key in self.recorded else tool
+            for key, tool in self.items()
+        }
+
+    @classmethod
+    def from_entries(cls, entries: Mapping[str, UtilizedToolEntry]) -> "UtilizedTools":
+        """Create the utilized tools from their entries."""
+        tools = cls()
+        for key, entry in entries.items():
+            if isinstance(entry, list):
+                tool, timestamp = entry
+                tools[key] = tool
+                tools.recorded[key] = int(timestamp)
+            else:
+                tools[key] = entry
+        return tools
+
+    def serialize(self) -> str:
+        """Serialize the utilized tools."""
+        return _serialize_entries(self.entries())
+
+    @classmethod
+    def deserialize(cls, serialized: str) -> "UtilizedTools":
+        """Deserialize the utilized tools."""
+        return cls.from_entries(json.loads(serialized))
+
+    def evict_expired(self, now: int, ttl: int = UTILIZED_TOOLS_TTL) -> List[str]:
+        """Timestamp the newly recorded tools and evict the ones which have expired.
+
+        :param now: the synchronized timestamp.
+        :param ttl: the number of seconds after which a tool expires.
+        :return: the keys of the evicted tools.
+        """
+        expired = [
+            key for key in self if now - self.recorded.setdefault(key, now) > ttl
+        ]
+        for key in expired:
+            del self[key]
+        return expired
+
+    def serialize_delta(self, base: Mapping[str, str]) -> str:
+        """Serialize the changes of the utilized tools since the given ones, along with the resulting tools' digest.
+
+        :param base: the utilized tools that the changes apply to.
+        :return: the serialized changes.
+        """
+        entries = self.entries()
+        base_entries = UtilizedTools(base).entries()
+        updates = {
+            key: entry
+            for key, entry in entries.items()
+            if base_entries.get(key) != entry
+        }
+        removed = sorted(key for key in base_entries if key not in entries)
+        digest = _digest(_serialize_entries(entries))
+        return json.dumps(
+            [UTILIZED_TOOLS_DELTA_TAG, digest, updates, removed],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+
+def is_utilized_tools_delta(update: Optional[str]) -> bool:
+    """Whether the given utilized tools' update carries their changes, instead of all the tools."""
+    return update is not None and update.startswith(UTILIZED_TOOLS_DELTA_PREFIX)
+
+
+def merge_utilized_tools(
+    current: Optional[str], update: Optional[str], verify: bool = True
+) -> Optional[str]:
+    """Apply the utilized tools' update of a payload on the synchronized ones.
+
+    :param current: the serialized utilized tools which are currently synchronized, if any.
+    :param update: the update of the payload, i.e., either the serialized changes of the tools or all the tools.
+    :param verify: whether to check that the changes result in the tools of their digest.
+    :return: the serialized utilized tools to synchronize, or `None` if there is no update.
+    :raises: `ValueError` if verified and the changes do not result in the tools of their digest.
+    """
+    if update is None or not is_utilized_tools_delta(update):
+        return update
+
+    _tag, digest, updates, removed = json.loads(update)
+    entries = UtilizedTools.deserialize(current).entries() if current else {}
+    for key in removed:
+        entries.pop(key, None)
+    entries.update(updates)
+    merged = _serialize_entries(entries)
+    if verify and _digest(merged) != digest:
+        raise ValueError(
+            "The changes of the utilized tools do not apply to the synchronized ones."
+        )
+    return merged
+
+
+class UtilizedToolsJournal:
+    """Persist the utilized tools as a JSON snapshot plus an append-only journal of their changes.
+
+    The snapshot keeps the format of the `utilized_tools.json` file. Every store appends a single line
+    with the tools recorded and removed since the last load or store:
+
+        {"set": {"<key>": <entry>, ...}, "del": ["<key>", ...]}
+
+    The first line of the journal records the digest of the snapshot that it applies to,
+    and a journal which cannot be fully replayed forces a compaction on the next store.
+    """
+
+    def __init__(self, snapshot_path: str) -> None:
+        """Initialize the journal."""
+        self.snapshot_path = str(snapshot_path)
+        self.journal_path = f"{self.snapshot_path}{JOURNAL_SUFFIX}"
+        self._snapshot_digest: Optional[str] = None
+        # the persisted entries; `None` if the persisted state is unknown
+        self._entries: Optional[Dict[str, UtilizedToolEntry]] = None
+        self._n_journaled = 0
+
+    @property
+    def n_journaled(self) -> int:
+        """Get the number of changes currently held in the journal."""
+        return self._n_journaled
+
+    def _needs_compaction(self, n_tools: int) -> bool:
+        """Whether the next store should rewrite the snapshot instead of appending to the journal."""
+        return (
+            self._entries is None
+            or self._snapshot_digest is None
+            or self._n_journaled >= max(MIN_COMPACTION_RECORDS, n_tools)
+        )
+
+    def _read_journal(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the valid records of the journal, stopping at the first invalid one."""
+        if not os.path.isfile(self.journal_path):
+            return
+
+        with open(self.journal_path) as journal_file:
+            try:
+                snapshot_digest = json.loads(journal_file.readline()).get(SNAPSHOT_KEY)
+            except (JSONDecodeError, AttributeError):
+                snapshot_digest = None
+            if snapshot_digest != self._snapshot_digest:
+                self._entries = None
+                return
+
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                    dict(record[UPDATES_KEY])
+                    list(record[REMOVED_KEY])
+                except (JSONDecodeError, KeyError, TypeError, ValueError):
+                    self._entries = None
+                    return
+                yield record
+
+    def load(self) -> UtilizedTools:
+        """Load the utilized tools from the snapshot and replay the journal on top of it.
+
+        :return: the loaded utilized tools.
+        :raises: `OSError` if the snapshot cannot be read, `JSONDecodeError` or `ValueError` if it cannot be decoded.
+        """
+        self._entries = None
+        self._n_journaled = 0
+
+        with open(self.snapshot_path) as snapshot_file:
+            snapshot = snapshot_file.read()
+        entries = UtilizedTools.deserialize(snapshot).entries()
+        self._snapshot_digest = _digest(snapshot)
+        self._entries = entries
+
+        for record in self._read_journal():
+            for key in record[REMOVED_KEY]:
+                entries.pop(key, None)
+            entries.update(record[UPDATES_KEY])
+            self._n_journaled += len(record[UPDATES_KEY]) + len(record[REMOVED_KEY])
+
+        return UtilizedTools.from_entries(entries)
+
+    def _compact(self, entries: Dict[str, UtilizedToolEntry]) -> None:
+        """Rewrite the snapshot atomically and drop the journal."""
+        snapshot = _serialize_entries(entries)
+        directory = os.path.dirname(self.snapshot_path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.snapshot_path) + ".", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as snapshot_file:
+                snapshot_file.write(snapshot)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._snapshot_digest = _digest(snapshot)
+        self._n_journaled = 0
+        if os.path.isfile(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _append(self, entries: Dict[str, UtilizedToolEntry]) -> None:
+        """Append the changes since the last persisted state to the journal."""
+        previous = self._entries or {}
+        updates = {
+            key: entry for key, entry in entries.items() if previous.get(key) != entry
+        }
+        removed = sorted(key for key in previous if key not in entries)
+        if not updates and not removed:
+            return
+
+        new_journal = self._n_journaled == 0
+        lines = []
+        if new_journal:
+            lines.append(json.dumps({SNAPSHOT_KEY: self._snapshot_digest}))
+        lines.append(
+            json.dumps({UPDATES_KEY: updates, REMOVED_KEY: removed}, sort_keys=True)
+        )
+        with open(self.journal_path, "w" if new_journal else "a") as journal_file:
+            journal_file.write("".join(f"{line}\n" for line in lines))
+        self._n_journaled += len(updates) + len(removed)
+
+    def store(self, tools: Mapping[str, str]) -> None:
+        """Persist the utilized tools, appending only their changes since the last load or store.
+
+        :param tools: the utilized tools to persist.
+        :raises: `OSError` if the snapshot or the journal cannot be written.
+        """
+        entries = UtilizedTools(tools).entries()
+        try:
+            if self._needs_compaction(len(entries)):
+                self._compact(entries)
+            else:
+                self._append(entries)
+        except Exception:
+            # the persisted state is unknown, make sure that the next store rewrites everything
+            self._entries = None
+            raise
+
+        self._entries = entries
@@ -26,7 +26,6 @@ from abc import ABC
 from json import JSONDecodeError
 from typing import Any, Dict, Generator, List, Optional, cast
 
-from aea.helpers.ipfs.base import IPFSHashOnly
 from aea.protocols.base import Message
 
 from packages.valory.connections.polymarket_client.connection import (
@@ -38,9 +37,11 @@ from packages.valory.skills.abstract_round_abci.behaviour_utils import BaseBehav
 from packages.valory.skills.abstract_round_abci.models import Requests
 from packages.valory.skills.market_manager_abci.bets import (
     Bet,
+    BetsCollection,
     BetsDecoder,
-    serialize_bets,
 )
+from packages.valory.skills.market_manager_abci.bets_journal import BetsJournal
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
 from packages.valory.skills.market_manager_abci.models import (
     BenchmarkingMode,
     SharedState,
@@ -49,7 +50,6 @@ from packages.valory.skills.market_manager_abci.models import (
 BETS_FILENAME = "bets.json"
 MULTI_BETS_FILENAME = "multi_bets.json"
 READ_MODE = "r"
-WRITE_MODE = "w"
 
 
 class BetsManagerBehaviour(BaseBehaviour, ABC):
@@ -58,15 +58,41 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize `BetsManagerBehaviour`."""
         super().__init__(**kwargs)
-        self.bets: List[Bet] = []
+        self._bets: BetsCollection = BetsCollection()
         self.multi_bets_filepath: str = self.params.store_path / MULTI_BETS_FILENAME
         self.bets_filepath: str = self.params.store_path / BETS_FILENAME
 
+    @property
+    def bets(self) -> BetsCollection:
+        """Get the bets."""
+        return self._bets
+
+    @bets.setter
+    def bets(self, bets: List[Bet]) -> None:
+        """Set the bets, indexing them if they are not already in a `BetsCollection`."""
+        self._bets = bets if isinstance(bets, BetsCollection) else BetsCollection(bets)
+
+    def get_bet_idx(self, bet_id: str) -> Optional[int]:
+        """Get the index of the bet with the given id, if it exists, otherwise `None`."""
+        return self.bets.get_idx(bet_id)
+
     @property
     def shared_state(self) -> SharedState:
         """Get the shared state."""
         return cast(SharedState, self.context.state)
 
+    @property
+    def bets_repository(self) -> BetsRepository:
+        """Get the repository of the bets, which is shared by all the behaviours."""
+        repository = self.shared_state.bets_repository
+        repository.bind(self.multi_bets_filepath)
+        return repository
+
+    @property
+    def bets_journal(self) -> BetsJournal:
+        """Get the journal of the stored bets."""
+        return self.shared_state.bets_repository.bind(self.multi_bets_filepath)
+
     @property
     def benchmarking_mode(self) -> BenchmarkingMode:
         """Return the benchmarking mode configurations."""
@@ -125,40 +151,68 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
         return response_json
 
     def store_bets(self) -> None:
-        """Store the bets to the agent's data dir as JSON."""
-        serialized = serialize_bets(self.bets)
-        if serialized is None:
+        """Store the bets, committing them to the shared repository.
+
+        Only the bets that changed are committed, and they are journaled to the agent's data dir
+        at the end of the round, or earlier if the hash of the stored bets is requested.
+        """
+        if len(self.bets) == 0:
             self.context.logger.warning("No bets to store.")
             return
 
-        try:
-            with open(self.multi_bets_filepath, WRITE_MODE) as bets_file:
-                try:
-                    bets_file.write(serialized)
-                    return
-                except (IOError, OSError):
-                    err = f"Error writing to file {self.multi_bets_filepath!r}!"
-        except (FileNotFoundError, PermissionError, OSError):
-            err = f"Error opening file {self.multi_bets_filepath!r} in write mode!"
+        self.bets_repository.commit(self.bets)
 
-        self.context.logger.error(err)
+    def _flush_bets(self) -> bool:
+        """Journal the stored bets that have not been written to the agent's data dir yet.
+
+        :return: whether the stored bets have been written.
+        """
+        try:
+            self.bets_repository.flush()
+        except (IOError, OSError):
+            self.context.logger.error(
+                f"Error writing the bets to {self.multi_bets_filepath!r}!"
+            )
+            return False
+        return True
 
     def read_bets(self) -> None:
-        """Read the bets from the agent's data dir as JSON."""
+        """Read the stored bets, discarding any change that has not been stored.
+
+        The bets are loaded from the agent's data dir, replaying the journal of the stored changes,
+        only the first time. Afterwards, they are checked out from the shared repository.
+        """
+        repository = self.bets_repository
+        if repository.loaded:
+            self.bets = repository.checkout()
+            return
+
         self.bets = []
-        read_path = self.multi_bets_filepath
 
-        if not os.path.isfile(read_path):
-            self.context.logger.warning(
-                f"No stored bets file was detected in {read_path}. "
-                "Assuming trader is being run for the first time in multi-bets mode."
-            )
-            read_path = self.bets_filepath
+        if os.path.isfile(self.multi_bets_filepath):
+            try:
+                self.bets = self.bets_journal.load()
+                self._normalize_polymarket_collateral()
+                self.bets = repository.reset(self.bets)
+                return
+            except (JSONDecodeError, TypeError):
+                err = f"Error decoding file {self.multi_bets_filepath!r} to a list of bets!"
+            except (FileNotFoundError, PermissionError, OSError):
+                err = f"Error opening file {self.multi_bets_filepath!r} in read mode!"
+            self.context.logger.error(err)
+            return
+
+        self.context.logger.warning(
+            f"No stored bets file was detected in {self.multi_bets_filepath}. "
+            "Assuming trader is being run for the first time in multi-bets mode."
+        )
+        read_path = self.bets_filepath
 
         if not os.path.isfile(read_path):
             self.context.logger.warning(
                 f"No stored bets file was detected in {read_path}. Assuming bets are empty."
             )
+            self.bets = repository.reset(self.bets)
             return
 
         try:
@@ -166,6 +220,7 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
                 try:
                     self.bets = json.load(bets_file, cls=BetsDecoder)
                     self._normalize_polymarket_collateral()
+                    self.bets = repository.reset(self.bets)
                     return
                 except (JSONDecodeError, TypeError):
                     err = f"Error decoding file {read_path!r} to a list of bets!"
@@ -189,6 +244,23 @@ class BetsManagerBehaviour(BaseBehaviour, ABC):
             if getattr(bet, "collateralToken", ""):
                 bet.collateralToken = ""
 
-    def hash_stored_bets(self) -> str:
-        """Get the hash of the stored bets' file."""
-        return IPFSHashOnly.hash_file(self.multi_bets_filepath)
+    def hash_stored_bets(self) -> Generator[None, None, str]:
+        """Get a deterministic hash of the stored bets' content, without re-reading the stored file.
+
+        The stored bets are written first, retrying until they are,
+        so that the agents never vote on the hash of a stale or unknown state.
+
+        :return: the hash of the stored bets.
+        :yield: None
+        """
+        while True:
+            bets_hash = self.bets_journal.content_hash if self._flush_bets() else None
+            if bets_hash is not None:
+                return bets_hash
+            yield from self.sleep(self.params.sleep_time)
+
+    def clean_up(self) -> None:
+        """Journal the stored bets at the end of the round."""
+        super().clean_up()
+        if self.bets_repository.pending_flush:
+            self._flush_bets()
@@ -23,7 +23,7 @@ import json
 import sys
 from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Set
 
 from dateutil import parser as date_parser
 
@@ -40,12 +40,16 @@ from packages.valory.skills.market_manager_abci.payloads import UpdateBetsPayloa
 from packages.valory.skills.market_manager_abci.states.polymarket_fetch_market import (
     PolymarketFetchMarketRound,
 )
+from packages.valory.skills.market_manager_abci.trades_ledger import (
+    InvestmentsType,
+    TRADES_LEDGER_FILENAME,
+    TradesLedger,
+    USDC_DECIMALS,
+)
 
 USDC_E_POLYGON = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
 PUSD_POLYGON = "0xC011a7E12a19f7B1f670d46F03B03f3342E82DFB"
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
-# USDC has 6 decimals on Polymarket
-USDC_DECIMALS = 10**6
 # Threshold for extreme outcome prices indicating resolved/over markets
 EXTREME_PRICE_THRESHOLD = 0.99
 
@@ -345,10 +349,6 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         if self.bets:
             self._blacklist_expired_bets()
 
-    def get_bet_idx(self, bet_id: str) -> Optional[int]:
-        """Get the index of the bet with the given id, if it exists, otherwise `None`."""
-        return next((i for i, bet in enumerate(self.bets) if bet.id == bet_id), None)
-
     @staticmethod
     def _is_null_or_mismatch_violation(raw_bet: Dict[str, Any]) -> bool:
         """Whether the raw bet would trip ``Bet._validate`` (null/mismatch).
@@ -706,12 +706,32 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         """Update the investments of the bets from Polymarket trades."""
         self.context.logger.info("Updating bets investments from Polymarket trades.")
 
-        trades = yield from self._fetch_polymarket_trades()
+        ledger = TradesLedger(str(self.params.store_path / TRADES_LEDGER_FILENAME))
+        try:
+            ledger.load()
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            self.context.logger.warning(
+                f"Could not load the trades ledger, performing a full trades sync: {e}"
+            )
+            ledger = TradesLedger(ledger.path)
+
+        since_timestamp = ledger.since_timestamp
+        trades = yield from self._fetch_polymarket_trades(since_timestamp)
         if trades is None:
             return
 
-        trades_by_condition_outcome = self._process_and_group_trades(trades)
-        self._update_all_bets_investments(trades_by_condition_outcome)
+        new_trades = ledger.record(trades)
+        changed = ledger.add_investments(self._process_and_group_trades(new_trades))
+        self.context.logger.info(
+            f"Synced {len(new_trades)} new trades since {since_timestamp}, "
+            f"changing the investments of {len(changed)} market(s)."
+        )
+        self._update_all_bets_investments(ledger.investments, changed)
+
+        try:
+            ledger.store()
+        except OSError as e:
+            self.context.logger.error(f"Could not store the trades ledger: {e}")
 
         self.context.logger.info(
             "Finished updating bets investments from Polymarket trades"
@@ -719,11 +739,14 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
     def _fetch_polymarket_trades(
         self,
+        since_timestamp: Optional[int] = None,
     ) -> Generator[None, None, Optional[List[Dict[str, Any]]]]:
-        """Fetch all trades from Polymarket"""
-        polymarket_trades_payload = {
+        """Fetch all trades from Polymarket, or only the ones at or after `since_timestamp` if given."""
+        polymarket_trades_payload: Dict[str, Any] = {
             "request_type": RequestType.FETCH_ALL_TRADES.value,
         }
+        if since_timestamp is not None:
+            polymarket_trades_payload["params"] = {"since_timestamp": since_timestamp}
 
         trades = yield from self.send_polymarket_connection_request(
             polymarket_trades_payload
@@ -838,62 +861,19 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
         return False
 
-    def _convert_usdc_to_base_units(self, usdc_amount: float) -> Optional[int]:
-        """Convert USDC amount to base units.
-
-        :param usdc_amount: Amount in USDC
-        :return: Amount in base units or None if conversion failed
-        """
-        try:
-            return int(usdc_amount * USDC_DECIMALS)
-        except (ValueError, TypeError) as e:
-            self.context.logger.warning(
-                f"Could not convert investment to base units: "
-                f"total_investment_usdc={usdc_amount}, error: {e}"
-            )
-            return None
-
-    def _calculate_outcome_investment(self, trade_list: List[Dict[str, Any]]) -> float:
-        """Calculate total investment for an outcome from trade list.
-
-        :param trade_list: List of trades for an outcome
-        :return: Total investment in USDC (sum of BUY trades only)
-        """
-        return sum(
-            trade["usdc_amount"] for trade in trade_list if trade["side"] == "BUY"
-        )
-
     def _update_single_bet_investments(
         self,
         bet: Bet,
-        trades_by_condition_outcome: Dict[str, Dict[int, List[Dict[str, Any]]]],
+        amounts_by_outcome: Dict[int, int],
     ) -> None:
         """Update investments for a single bet.
 
         :param bet: Bet to update
-        :param trades_by_condition_outcome: Grouped trades dictionary
+        :param amounts_by_outcome: the invested totals of the bet's market, by outcome index, in USDC base units
         """
         existing_investments = deepcopy(bet.investments)
         bet.reset_investments()
 
-        # Extract condition_id and validate (mypy type narrowing)
-        condition_id = bet.condition_id
-        if condition_id is None:
-            self.context.logger.debug(f"Bet {bet.id} has no condition_id, skipping")
-            self._replace_with_existing_investments_if_empty(bet, existing_investments)
-            return
-
-        matching_trades_by_outcome: Dict[int, List[Dict[str, Any]]] = (
-            trades_by_condition_outcome.get(condition_id, {})
-        )
-
-        if not matching_trades_by_outcome:
-            self.context.logger.debug(
-                f"No trades found for bet {bet.id} with condition_id {condition_id}"
-            )
-            self._replace_with_existing_investments_if_empty(bet, existing_investments)
-            return
-
         if bet.outcomes is None:
             self.context.logger.warning(
                 f"Bet {bet.id} has no outcomes list, cannot map outcome indices"
@@ -901,7 +881,7 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
             self._replace_with_existing_investments_if_empty(bet, existing_investments)
             return
 
-        for outcome_index, trade_list in matching_trades_by_outcome.items():
+        for outcome_index, investment_amount in amounts_by_outcome.items():
             if outcome_index < 0 or outcome_index >= len(bet.outcomes):
                 self.context.logger.warning(
                     f"Outcome index {outcome_index} out of bounds for bet {bet.id} "
@@ -909,19 +889,10 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
                 )
                 continue
 
-            total_investment_usdc = self._calculate_outcome_investment(trade_list)
-
-            if total_investment_usdc > 0:
-                investment_amount = self._convert_usdc_to_base_units(
-                    total_investment_usdc
-                )
-                if investment_amount is None:
-                    continue
-
+            if investment_amount > 0:
                 bet.append_investment_amount(outcome_index, investment_amount)
                 self.context.logger.debug(
                     f"Updated bet {bet.id}: outcome_index={outcome_index}, "
-                    f"total_investment_usdc={total_investment_usdc}, "
                     f"amount={investment_amount}, investments={bet.investments}"
                 )
 
@@ -941,17 +912,25 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
     def _update_all_bets_investments(
         self,
-        trades_by_condition_outcome: Dict[str, Dict[int, List[Dict[str, Any]]]],
+        investments: InvestmentsType,
+        changed: Set[str],
     ) -> None:
-        """Update investments for all bets.
+        """Update the investments of the bets of the traded markets.
+
+        Only the bets whose invested totals changed are updated, along with the ones which have no investments
+        yet, e.g., a traded market which has been discovered again. The rest of the bets are not visited.
 
-        :param trades_by_condition_outcome: Grouped trades dictionary
+        :param investments: the invested totals, by condition id and outcome index, in USDC base units
+        :param changed: the condition ids whose invested totals changed
         """
-        for bet in self.bets:
-            if self._should_skip_bet(bet):
+        for condition_id, amounts_by_outcome in investments.items():
+            bet = self.bets.get_by_condition_id(condition_id)
+            if bet is None or self._should_skip_bet(bet):
+                continue
+            if condition_id not in changed and any(bet.investments.values()):
                 continue
 
-            self._update_single_bet_investments(bet, trades_by_condition_outcome)
+            self._update_single_bet_investments(bet, amounts_by_outcome)
 
     def _bet_freshness_check_and_update(self) -> None:
         """Check the freshness of the bets."""
@@ -993,7 +972,9 @@ class PolymarketFetchMarketBehaviour(BetsManagerBehaviour, QueryingBehaviour):
             # Store the bets to the agent's data dir as JSON
             self.store_bets()
 
-            bets_hash = self.hash_stored_bets() if self.bets else None
+            bets_hash = None
+            if self.bets:
+                bets_hash = yield from self.hash_stored_bets()
             payload = UpdateBetsPayload(self.context.agent_address, bets_hash)
 
         with self.context.benchmark_tool.measure(self.behaviour_id).consensus():
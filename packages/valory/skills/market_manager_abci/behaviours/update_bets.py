@@ -19,6 +19,7 @@
 
 """This module contains the update bets behaviour for the MarketManager ABCI app."""
 
+import dataclasses
 import time
 from copy import deepcopy
 from typing import Any, Dict, Generator, List, Optional
@@ -35,6 +36,12 @@ from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
 from packages.valory.skills.market_manager_abci.graph_tooling.utils import (
     get_bet_id_to_balance,
 )
+from packages.valory.skills.market_manager_abci.markets_cursors import (
+    CREATION_TIMESTAMP_KEY,
+    MARKETS_CURSORS_FILENAME,
+    MarketsCursors,
+    markets_scope,
+)
 from packages.valory.skills.market_manager_abci.payloads import UpdateBetsPayload
 from packages.valory.skills.market_manager_abci.states.update_bets import (
     UpdateBetsRound,
@@ -49,6 +56,8 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize `UpdateBetsBehaviour`."""
         super().__init__(**kwargs)
+        # the discovery cursors to store along with the bets, set only if all the markets have been fetched
+        self._markets_cursors: Optional[MarketsCursors] = None
 
     def _requeue_all_bets(self) -> None:
         """Requeue all bets."""
@@ -163,27 +172,68 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
         if self.bets:
             self._blacklist_expired_bets()
 
-    def get_bet_idx(self, bet_id: str) -> Optional[int]:
-        """Get the index of the bet with the given id, if it exists, otherwise `None`."""
-        return next((i for i, bet in enumerate(self.bets) if bet.id == bet_id), None)
-
     def _process_chunk(self, chunk: Optional[List[Dict[str, Any]]]) -> None:
         """Process a chunk of bets."""
         if chunk is None:
             return
 
         for raw_bet in chunk:
+            raw_bet = {
+                key: value
+                for key, value in raw_bet.items()
+                if key != CREATION_TIMESTAMP_KEY
+            }
             bet = Bet(**raw_bet, market=self._current_market)
-            index = self.get_bet_idx(bet.id)
-            if index is None:
-                self.bets.append(bet)
-            else:
-                self.bets[index].update_market_info(bet)
+            self.bets.merge(bet)
+
+    def _process_market_info_chunk(self, chunk: List[Dict[str, Any]]) -> None:
+        """Process a chunk of the tracked bets' refreshed market information."""
+        for market_info in chunk:
+            bet = self.bets.get(market_info["id"])
+            if bet is None:
+                continue
+            # the refreshed bet is validated as a fetched one would be, before being merged
+            refreshed = dataclasses.replace(bet, **market_info)
+            self.bets.merge(refreshed)
+
+    def _tracked_bet_ids(self) -> List[str]:
+        """Get the ids of the current market's bets whose market information should be refreshed."""
+        return [
+            bet.id
+            for bet in self.bets
+            if bet.market == self._current_market and not bet.queue_status.is_expired()
+        ]
+
+    def _load_markets_cursors(self) -> MarketsCursors:
+        """Load the cursors of the markets' discovery, falling back to a full discovery if they cannot be loaded."""
+        cursors = MarketsCursors(self.params.store_path / MARKETS_CURSORS_FILENAME)
+        try:
+            cursors.load()
+        except (OSError, ValueError, TypeError) as e:
+            self.context.logger.warning(
+                f"Could not load the markets' cursors, discovering all the markets: {e}"
+            )
+            cursors = MarketsCursors(cursors.path)
+        return cursors
+
+    def _store_markets_cursors(self) -> None:
+        """Store the cursors of the markets' discovery, if all the markets have been fetched."""
+        if self._markets_cursors is None:
+            return
+        try:
+            self._markets_cursors.store()
+        except OSError as e:
+            self.context.logger.error(f"Could not store the markets' cursors: {e}")
 
     def _update_bets(
         self,
     ) -> Generator:
-        """Fetch the questions from all the prediction markets and update the local copy of the bets."""
+        """Fetch the questions from all the prediction markets and update the local copy of the bets.
+
+        For each market, only the questions created after the discovery's cursor are fetched in full,
+        while the tracked questions only get their volatile market information refreshed.
+        """
+        cursors = self._load_markets_cursors()
 
         # Fetching bets from the prediction markets
         while True:
@@ -191,12 +241,33 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
             if not can_proceed:
                 break
 
-            bets_market_chunk = yield from self._fetch_bets()
+            scope = markets_scope(
+                self._current_market,
+                self._current_creators,
+                self.params.slot_count,
+                self.params.opening_margin,
+                self.params.languages,
+            )
+            tracked_ids = self._tracked_bet_ids()
+            # if none of the market's bets is tracked, e.g., because the stored bets were lost, discover them all again
+            created_after = cursors.get(scope) if tracked_ids else 0
+
+            bets_market_chunk = yield from self._fetch_bets(created_after)
+            if bets_market_chunk is None:
+                continue
+            market_info_chunk = yield from self._fetch_bets_market_info(tracked_ids)
+            if market_info_chunk is None:
+                continue
+
             self._process_chunk(bets_market_chunk)
+            self._process_market_info_chunk(market_info_chunk)
+            cursors.advance(scope, bets_market_chunk)
 
         if self._fetch_status != FetchStatus.SUCCESS:
             # this won't wipe the bets as the `store_bets` of the `BetsManagerBehaviour` takes this into consideration
             self.bets = []
+        else:
+            self._markets_cursors = cursors
 
         # truncate the bets, otherwise logs get too big
         bets_str = str(self.bets)[:MAX_LOG_SIZE]
@@ -243,8 +314,14 @@ class UpdateBetsBehaviour(BetsManagerBehaviour, QueryingBehaviour):
 
             # Store the bets to the agent's data dir as JSON
             self.store_bets()
+            # the cursors may only move past the discovered bets once these have been written,
+            # otherwise the bets would never be discovered again after a restart
+            if self._flush_bets():
+                self._store_markets_cursors()
 
-            bets_hash = self.hash_stored_bets() if self.bets else None
+            bets_hash = None
+            if self.bets:
+                bets_hash = yield from self.hash_stored_bets()
             payload = UpdateBetsPayload(self.context.agent_address, bets_hash)
 
         with self.context.benchmark_tool.measure(self.behaviour_id).consensus():
@@ -25,9 +25,20 @@ import dataclasses
 import json
 import math
 import sys
+from copy import deepcopy
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, get_type_hints
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    SupportsIndex,
+    Union,
+    cast,
+    get_type_hints,
+)
 
 P_YES_FIELD = "p_yes"
 P_NO_FIELD = "p_no"
@@ -45,6 +56,8 @@ MARKET_TO_PLATFORM = {
     "omen_subgraph": "omen",
     "polymarket_client": "polymarket",
 }
+# the types of the bets' values which can be shared between copies of a bet
+IMMUTABLE_TYPES = (str, int, float, Enum, type(None))
 
 
 class BinaryOutcome(Enum):
@@ -202,6 +215,15 @@ class Bet:
         """Implements less than operator."""
         return self.scaledLiquidityMeasure < other.scaledLiquidityMeasure
 
+    def copy(self) -> "Bet":
+        """Get a copy of the bet which does not share any mutable state with it."""
+        bet = object.__new__(type(self))
+        bet.__dict__.update(
+            (name, value if isinstance(value, IMMUTABLE_TYPES) else deepcopy(value))
+            for name, value in self.__dict__.items()
+        )
+        return bet
+
     @property
     def yes_investments(self) -> List[int]:
         """Get the yes investments."""
@@ -494,6 +516,155 @@ class Bet:
         return {k: v for k, v in context.items() if v is not None}
 
 
+class BetsCollection(List[Bet]):
+    """An ordered collection of bets with O(1) lookups by id and condition id.
+
+    The collection behaves exactly like the list the behaviours have always used
+    (ordering, indexing, iteration and JSON serialization are unchanged), but it
+    also maintains an ``id -> position`` index. Appending keeps the index up to
+    date incrementally, so merging a fetched chunk into the store is linear.
+    Any other structural mutation invalidates the index, which is then lazily
+    rebuilt on the next lookup.
+    """
+
+    def __init__(self, bets: Iterable[Bet] = ()) -> None:
+        """Initialize the collection."""
+        super().__init__(bets)
+        self._id_to_idx: Optional[Dict[str, int]] = None
+        self._condition_id_to_idx: Optional[Dict[str, int]] = None
+
+    def _invalidate(self) -> None:
+        """Invalidate the lookup indexes."""
+        self._id_to_idx = None
+        self._condition_id_to_idx = None
+
+    def _build_indexes(self) -> None:
+        """Build the lookup indexes, keeping the first occurrence of each key."""
+        self._id_to_idx = {}
+        self._condition_id_to_idx = {}
+        for idx, bet in enumerate(self):
+            self._index_bet(idx, bet)
+
+    def _index_bet(self, idx: int, bet: Bet) -> None:
+        """Add a bet to the lookup indexes."""
+        if self._id_to_idx is None or self._condition_id_to_idx is None:
+            return
+        self._id_to_idx.setdefault(bet.id, idx)
+        if bet.condition_id is not None:
+            self._condition_id_to_idx.setdefault(bet.condition_id, idx)
+
+    @property
+    def id_to_idx(self) -> Dict[str, int]:
+        """Get the mapping of the bets' ids to their positions."""
+        if self._id_to_idx is None:
+            self._build_indexes()
+        return cast(Dict[str, int], self._id_to_idx)
+
+    @property
+    def condition_id_to_idx(self) -> Dict[str, int]:
+        """Get the mapping of the bets' condition ids to their positions."""
+        if self._condition_id_to_idx is None:
+            self._build_indexes()
+        return cast(Dict[str, int], self._condition_id_to_idx)
+
+    def get_idx(self, bet_id: str) -> Optional[int]:
+        """Get the index of the bet with the given id, if it exists, otherwise `None`."""
+        return self.id_to_idx.get(bet_id)
+
+    def get(self, bet_id: str) -> Optional[Bet]:
+        """Get the bet with the given id, if it exists, otherwise `None`."""
+        idx = self.get_idx(bet_id)
+        return None if idx is None else self[idx]
+
+    def get_by_condition_id(self, condition_id: str) -> Optional[Bet]:
+        """Get the bet with the given condition id, if it exists, otherwise `None`."""
+        idx = self.condition_id_to_idx.get(condition_id)
+        return None if idx is None else self[idx]
+
+    def by_queue_status(self) -> Dict[QueueStatus, List[Bet]]:
+        """Group the bets by their queue status in a single pass, preserving their order."""
+        grouped: Dict[QueueStatus, List[Bet]] = {}
+        for bet in self:
+            grouped.setdefault(bet.queue_status, []).append(bet)
+        return grouped
+
+    def with_queue_status(self, status: QueueStatus) -> List[Bet]:
+        """Get the bets with the given queue status, preserving their order."""
+        return [bet for bet in self if bet.queue_status == status]
+
+    def merge(self, bet: Bet) -> Optional[Bet]:
+        """Merge a bet into the collection.
+
+        If a bet with the same id already exists, its market information is updated from the given bet,
+        otherwise the bet is appended to the collection.
+
+        :param bet: the bet to merge.
+        :return: the stored bet that was updated, or `None` if the bet was appended.
+        """
+        existing = self.get(bet.id)
+        if existing is None:
+            self.append(bet)
+            return None
+        existing.update_market_info(bet)
+        return existing
+
+    def append(self, bet: Bet) -> None:
+        """Append a bet, updating the indexes incrementally."""
+        super().append(bet)
+        self._index_bet(len(self) - 1, bet)
+
+    def extend(self, bets: Iterable[Bet]) -> None:
+        """Extend the collection, updating the indexes incrementally."""
+        for bet in bets:
+            self.append(bet)
+
+    def __iadd__(self, bets: Iterable[Bet]) -> "BetsCollection":  # type: ignore
+        """Extend the collection in place."""
+        self.extend(bets)
+        return self
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set an item and invalidate the indexes."""
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete an item and invalidate the indexes."""
+        super().__delitem__(key)
+        self._invalidate()
+
+    def insert(self, index: SupportsIndex, bet: Bet) -> None:
+        """Insert a bet and invalidate the indexes."""
+        super().insert(index, bet)
+        self._invalidate()
+
+    def remove(self, bet: Bet) -> None:
+        """Remove a bet and invalidate the indexes."""
+        super().remove(bet)
+        self._invalidate()
+
+    def pop(self, index: SupportsIndex = -1) -> Bet:
+        """Pop a bet and invalidate the indexes."""
+        bet = super().pop(index)
+        self._invalidate()
+        return bet
+
+    def clear(self) -> None:
+        """Clear the collection and its indexes."""
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort the collection in place and invalidate the indexes."""
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        """Reverse the collection in place and invalidate the indexes."""
+        super().reverse()
+        self._invalidate()
+
+
 class BetsEncoder(json.JSONEncoder):
     """JSON encoder for bets."""
 
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Journaled, incremental persistence for the bets."""
+
+import hashlib
+import json
+import os
+import tempfile
+from json import JSONDecodeError
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from packages.valory.skills.market_manager_abci.bets import (
+    Bet,
+    BetsDecoder,
+    BetsEncoder,
+)
+
+JOURNAL_SUFFIX = ".journal"
+# the journal is folded back into the snapshot once it holds at least as many bet records as there are bets,
+# but never before it holds this many, so that small stores are not compacted on every write
+MIN_COMPACTION_RECORDS = 100
+SNAPSHOT_KEY = "snapshot"
+SIZE_KEY = "size"
+UPDATES_KEY = "updates"
+
+
+def _digest(serialized: str) -> str:
+    """Get the digest of a serialized string."""
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _apply_record(bets: List[Any], record: Dict[str, Any]) -> Iterator[Tuple[int, Any]]:
+    """Apply a record of the journal to the given bets, in place, yielding the position and the bet of every update."""
+    del bets[int(record[SIZE_KEY]) :]
+    for position_str, bet in sorted(
+        record[UPDATES_KEY].items(), key=lambda item: int(item[0])
+    ):
+        position = int(position_str)
+        if position < len(bets):
+            bets[position] = bet
+        else:
+            bets.append(bet)
+        yield position, bet
+
+
+class BetsJournal:
+    """Persist the bets as a JSON snapshot plus an append-only journal of the changed bets.
+
+    The snapshot keeps the exact format of the `multi_bets.json` file, i.e., a JSON list of the serialized bets,
+    but it only reflects the changes up to the last compaction. Readers of the bets must replay the journal on top
+    of it, e.g., via `load_raw_bets`. On every store, the bets are compared against the digests of the
+    last persisted state and only the positions that changed are appended to the journal as a single JSON line:
+
+        {"size": <number of bets>, "updates": {"<position>": <serialized bet>, ...}}
+
+    The first line of the journal records the digest of the snapshot it applies to, so a journal left behind
+    by an interrupted compaction is never replayed on top of a newer snapshot. A truncated trailing line
+    (e.g., a crash mid-append) stops the replay and forces a compaction on the next store.
+
+    The digests of the persisted bets are also used to derive a deterministic content hash,
+    which avoids re-reading and re-hashing the whole file on every round.
+    """
+
+    def __init__(self, snapshot_path: str) -> None:
+        """Initialize the journal."""
+        self.snapshot_path = str(snapshot_path)
+        self.journal_path = f"{self.snapshot_path}{JOURNAL_SUFFIX}"
+        self._snapshot_digest: Optional[str] = None
+        # the digests of the persisted bets, by position; `None` if the persisted state is unknown
+        self._digests: Optional[List[str]] = None
+        self._n_journaled = 0
+
+    @property
+    def n_journaled(self) -> int:
+        """Get the number of bet records currently held in the journal."""
+        return self._n_journaled
+
+    @property
+    def persisted(self) -> bool:
+        """Whether the persisted state is known, i.e., the bets have been loaded or stored successfully."""
+        return self._digests is not None
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """Get a deterministic hash of the last loaded or stored bets' content; `None` if the persisted state is unknown."""
+        if self._digests is None:
+            return None
+        return _digest("".join(self._digests))
+
+    def _needs_compaction(self, n_bets: int) -> bool:
+        """Whether the next store should rewrite the snapshot instead of appending to the journal."""
+        return (
+            self._digests is None
+            or self._snapshot_digest is None
+            or self._n_journaled >= max(MIN_COMPACTION_RECORDS, n_bets)
+        )
+
+    def _read_journal(
+        self, decoder: Optional[Type[json.JSONDecoder]] = BetsDecoder
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the valid records of the journal, stopping at the first invalid one."""
+        if not os.path.isfile(self.journal_path):
+            return
+
+        with open(self.journal_path) as journal_file:
+            header = journal_file.readline()
+            try:
+                snapshot_digest = json.loads(header).get(SNAPSHOT_KEY)
+            except (JSONDecodeError, AttributeError):
+                snapshot_digest = None
+            if snapshot_digest != self._snapshot_digest:
+                # the journal belongs to a different snapshot, it must not be replayed
+                self._digests = None
+                return
+
+            for line in journal_file:
+                try:
+                    record = json.loads(line, cls=decoder)
+                    int(record[SIZE_KEY])
+                    dict(record[UPDATES_KEY])
+                except (JSONDecodeError, KeyError, TypeError, ValueError):
+                    self._digests = None
+                    return
+                yield record
+
+    def load(self) -> List[Bet]:
+        """Load the bets from the snapshot and replay the journal on top of it.
+
+        :return: the loaded bets.
+        :raises: `OSError` if the snapshot cannot be read, `JSONDecodeError` or `TypeError` if it cannot be decoded.
+        """
+        self._digests = None
+        self._n_journaled = 0
+
+        with open(self.snapshot_path) as snapshot_file:
+            snapshot = snapshot_file.read()
+        bets: List[Bet] = json.loads(snapshot, cls=BetsDecoder)
+        self._snapshot_digest = _digest(snapshot)
+        digests = [_digest(json.dumps(bet, cls=BetsEncoder)) for bet in bets]
+        self._digests = digests
+
+        for record in self._read_journal():
+            del digests[int(record[SIZE_KEY]) :]
+            for position, bet in _apply_record(bets, record):
+                serialized_digest = _digest(json.dumps(bet, cls=BetsEncoder))
+                if position < len(digests):
+                    digests[position] = serialized_digest
+                else:
+                    digests.append(serialized_digest)
+                self._n_journaled += 1
+
+        return bets
+
+    def _compact(self, serialized: List[str]) -> None:
+        """Rewrite the snapshot atomically and drop the journal."""
+        # identical to `serialize_bets`, without serializing the bets a second time
+        snapshot = "[" + ", ".join(serialized) + "]"
+
+        directory = os.path.dirname(self.snapshot_path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.snapshot_path) + ".", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as snapshot_file:
+                snapshot_file.write(snapshot)
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._snapshot_digest = _digest(snapshot)
+        self._n_journaled = 0
+        if os.path.isfile(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _diff(
+        self, bets: List[Bet], changed: Optional[Iterable[int]]
+    ) -> Tuple[List[str], Dict[int, str]]:
+        """Get the digests of the bets and the serialized bets that differ from the last persisted state."""
+        previous = self._digests or []
+        n_bets = len(bets)
+        if changed is None:
+            positions: Iterable[int] = range(n_bets)
+        else:
+            positions = sorted(
+                {position for position in changed if position < n_bets}
+                | set(range(len(previous), n_bets))
+            )
+
+        digests = previous[:n_bets]
+        digests.extend("" for _ in range(n_bets - len(digests)))
+        updates = {}
+        for position in positions:
+            serialized = json.dumps(bets[position], cls=BetsEncoder)
+            digest = _digest(serialized)
+            if position >= len(previous) or previous[position] != digest:
+                updates[position] = serialized
+            digests[position] = digest
+        return digests, updates
+
+    def _append(self, updates: Dict[int, str], n_bets: int) -> None:
+        """Append the bets that changed since the last persisted state to the journal."""
+        if not updates and len(self._digests or []) == n_bets:
+            return
+
+        new_journal = self._n_journaled == 0
+        lines = []
+        if new_journal:
+            lines.append(json.dumps({SNAPSHOT_KEY: self._snapshot_digest}))
+        updates_str = ", ".join(
+            f'"{position}": {serialized}' for position, serialized in updates.items()
+        )
+        lines.append(f'{{"{SIZE_KEY}": {n_bets}, "{UPDATES_KEY}": {{{updates_str}}}}}')
+        with open(self.journal_path, "w" if new_journal else "a") as journal_file:
+            journal_file.write("".join(f"{line}\n" for line in lines))
+        self._n_journaled += len(updates)
+
+    def store(self, bets: List[Bet], changed: Optional[Iterable[int]] = None) -> None:
+        """Persist the bets, writing only the ones that changed since the last load or store.
+
+        :param bets: the bets to persist.
+        :param changed: the positions of the bets that may have changed since the last load or store, if known.
+            Only these and any appended bets are serialized, unless the snapshot has to be rewritten.
+        :raises: `OSError` if the snapshot or the journal cannot be written.
+        """
+        try:
+            if self._needs_compaction(len(bets)):
+                serialized = [json.dumps(bet, cls=BetsEncoder) for bet in bets]
+                digests = [_digest(bet) for bet in serialized]
+                self._compact(serialized)
+            else:
+                digests, updates = self._diff(bets, changed)
+                self._append(updates, len(bets))
+        except Exception:
+            # the persisted state is unknown, make sure that the next store rewrites everything
+            self._digests = None
+            raise
+
+        self._digests = digests
+
+
+def load_raw_bets(snapshot_path: str) -> List[Dict[str, Any]]:
+    """Load the raw bets of a store, i.e., without decoding them, replaying the journal on top of the snapshot.
+
+    This is how the bets must be read outside the market manager, since the snapshot alone is stale
+    until the journal is compacted into it.
+
+    :param snapshot_path: the path of the bets' snapshot.
+    :return: the raw bets.
+    :raises: `OSError` if the snapshot cannot be read, `JSONDecodeError` if it cannot be decoded.
+    """
+    journal = BetsJournal(snapshot_path)
+    with open(journal.snapshot_path) as snapshot_file:
+        snapshot = snapshot_file.read()
+    bets: List[Dict[str, Any]] = json.loads(snapshot)
+    # pylint: disable=protected-access
+    journal._snapshot_digest = _digest(snapshot)
+    for record in journal._read_journal(decoder=None):
+        for _ in _apply_record(bets, record):
+            pass
+    return bets
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""An in-memory repository of the bets, shared by all the behaviours."""
+
+from typing import List, Optional, Set
+
+from packages.valory.skills.market_manager_abci.bets import Bet, BetsCollection
+from packages.valory.skills.market_manager_abci.bets_journal import BetsJournal
+
+
+class BetsRepository:
+    """Keep the bets in memory for the whole lifetime of the agent's process.
+
+    The bets are loaded from the journaled store only once. Afterwards, every behaviour checks out a copy
+    of the committed bets, instead of decoding the whole store again, and commits its changes back when it stores
+    the bets. The repository never hands out its own bets, so checking out again discards any change that has not
+    been committed, and reading the bets still reverts the in-memory updates, as it always has.
+
+    The committed changes are tracked per position and flushed to the journal lazily, i.e., at the end of the round
+    or when the hash of the stored bets is needed, so that several commits in a round result in a single write.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the repository."""
+        self.journal: Optional[BetsJournal] = None
+        # the committed bets, which are owned by the repository
+        self.bets: BetsCollection = BetsCollection()
+        self.loaded = False
+        # the positions of the committed bets that have not been flushed yet; `None` if they are unknown
+        self._unflushed: Optional[Set[int]] = set()
+        self._pending_flush = False
+
+    @property
+    def pending_flush(self) -> bool:
+        """Whether there are committed changes that have not been flushed to the journal yet."""
+        return self._pending_flush
+
+    def bind(self, snapshot_path: str) -> BetsJournal:
+        """Bind the repository to the store at the given path, resetting it if it was bound to a different one.
+
+        :param snapshot_path: the path of the bets' snapshot.
+        :return: the journal of the store.
+        """
+        if self.journal is None or self.journal.snapshot_path != str(snapshot_path):
+            self.journal = BetsJournal(snapshot_path)
+            self.bets = BetsCollection()
+            self.loaded = False
+            self._unflushed = set()
+            self._pending_flush = False
+        return self.journal
+
+    def reset(self, bets: List[Bet]) -> BetsCollection:
+        """Reset the repository to the given bets, as they have been loaded from the store.
+
+        :param bets: the loaded bets.
+        :return: the loaded bets, while the repository keeps a copy of them.
+        """
+        self.bets = BetsCollection(bet.copy() for bet in bets)
+        self._unflushed = set()
+        self._pending_flush = False
+        self.loaded = True
+        return bets if isinstance(bets, BetsCollection) else BetsCollection(bets)
+
+    def checkout(self) -> BetsCollection:
+        """Get a copy of the committed bets, which can be changed without affecting the repository.
+
+        :return: a copy of the committed bets.
+        """
+        return BetsCollection(bet.copy() for bet in self.bets)
+
+    def _changed_positions(self, bets: List[Bet]) -> Set[int]:
+        """Get the positions of the bets that differ from the committed ones."""
+        committed = self.bets
+        n_committed = len(committed)
+        return {
+            position
+            for position, bet in enumerate(bets)
+            if position >= n_committed or bet.__dict__ != committed[position].__dict__
+        }
+
+    def commit(self, bets: List[Bet]) -> None:
+        """Commit a copy of the given bets, to be flushed to the journal later.
+
+        :param bets: the bets to commit.
+        """
+        changed = self._changed_positions(bets)
+        if changed or len(bets) != len(self.bets):
+            self._pending_flush = True
+            if self._unflushed is not None:
+                self._unflushed |= changed
+
+        committed = self.bets
+        self.bets = BetsCollection(
+            bet.copy() if position in changed else committed[position]
+            for position, bet in enumerate(bets)
+        )
+        self.loaded = True
+
+    def flush(self) -> None:
+        """Write the committed changes to the journal, if there are any or if the persisted state is unknown.
+
+        :raises: `OSError` if the store cannot be written, in which case the changes are kept pending.
+        """
+        if self.journal is None or (not self._pending_flush and self.journal.persisted):
+            return
+
+        try:
+            self.journal.store(self.bets, self._unflushed)
+        except Exception:
+            # the journal will rewrite everything on the next store
+            self._unflushed = None
+            raise
+
+        self._unflushed = set()
+        self._pending_flush = False
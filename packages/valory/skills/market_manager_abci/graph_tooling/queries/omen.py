@@ -29,16 +29,18 @@ questions = Template("""
           outcomeSlotCount: ${slot_count},
           openingTimestamp_gt: ${opening_threshold},
           language_in: ${languages},
-          isPendingArbitration: false
+          isPendingArbitration: false,
+          creationTimestamp_gte: ${creationTimestamp_gte}
         },
         orderBy: creationTimestamp
-        orderDirection: desc
-        first: 1000
+        orderDirection: asc
+        first: ${first}
       ){
         id
         title
         collateralToken
         creator
+        creationTimestamp
         fee
         openingTimestamp
         outcomeSlotCount
@@ -50,6 +52,27 @@ questions = Template("""
     }
     """)
 
+questions_market_info = Template("""
+    {
+      fixedProductMarketMakers(
+        where: {
+          id_in: ${ids},
+          creator_in: ${creators},
+          outcomeSlotCount: ${slot_count},
+          openingTimestamp_gt: ${opening_threshold},
+          language_in: ${languages},
+          isPendingArbitration: false
+        },
+        first: ${first}
+      ){
+        id
+        outcomeTokenAmounts
+        outcomeTokenMarginalPrices
+        scaledLiquidityMeasure
+      }
+    }
+    """)
+
 trades = Template("""
     {
       fpmmTrades (
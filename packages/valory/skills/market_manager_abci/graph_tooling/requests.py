@@ -23,7 +23,18 @@
 import json
 from abc import ABC
 from enum import Enum, auto
-from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from web3 import Web3
 
@@ -37,6 +48,7 @@ from packages.valory.skills.market_manager_abci.graph_tooling.queries.network im
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.omen import (
     questions,
+    questions_market_info,
     trades,
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.realitio import (
@@ -181,33 +193,144 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         self._fetch_status = FetchStatus.SUCCESS
         return res
 
-    def _fetch_bets(self) -> Generator[None, None, Optional[list]]:
-        """Fetch questions from the current subgraph, for the current creators."""
+    def _fetch_bets(
+        self, created_after: int = 0
+    ) -> Generator[None, None, Optional[list]]:
+        """Fetch the questions created after the given timestamp from the current subgraph, for the current creators.
+
+        The questions are paginated over their creation timestamp, so that their number is not limited to a single
+        batch. Several questions may share a creation timestamp, e.g., when they are created in the same block,
+        so each batch starts from the last creation timestamp of the previous one, dropping the questions which have
+        already been fetched.
+
+        :param created_after: the creation timestamp after which the questions should be fetched.
+        :return: the questions, in increasing order of creation, or `None` if any of the requests failed.
+        :yield: None
+        """
         self._fetch_status = FetchStatus.IN_PROGRESS
 
-        query = questions.substitute(
-            creators=to_graphql_list(self._current_creators),
-            slot_count=self.params.slot_count,
-            opening_threshold=self.synced_time + self.params.opening_margin,
-            languages=to_graphql_list(self.params.languages),
-        )
+        opening_threshold = self.synced_time + self.params.opening_margin
+        creation_timestamp_gte = created_after + 1
+        # the ids of the fetched questions which were created at `creation_timestamp_gte`
+        boundary_ids: Set[str] = set()
+        all_bets: List[Dict[str, Any]] = []
+        while True:
+            query = questions.substitute(
+                creators=to_graphql_list(self._current_creators),
+                slot_count=self.params.slot_count,
+                opening_threshold=opening_threshold,
+                languages=to_graphql_list(self.params.languages),
+                creationTimestamp_gte=creation_timestamp_gte,
+                first=QUERY_BATCH_SIZE,
+            )
 
-        res_raw = yield from self.get_http_response(
-            content=to_content(query),
-            **self.current_subgraph.get_spec(),
-        )
-        res = self.current_subgraph.process_response(res_raw)
+            res_raw = yield from self.get_http_response(
+                content=to_content(query),
+                **self.current_subgraph.get_spec(),
+            )
+            res = self.current_subgraph.process_response(res_raw)
 
-        bets = yield from self._handle_response(
-            self.current_subgraph,
-            res,
-            res_context="questions",
-        )
+            bets = yield from self._handle_response(
+                self.current_subgraph,
+                res,
+                res_context="questions",
+            )
+            if bets is None:
+                return None
+
+            bets = cast(List[Dict[str, Any]], bets)
+            new_bets = [bet for bet in bets if bet.get("id") not in boundary_ids]
+            all_bets.extend(new_bets)
+            if len(bets) < QUERY_BATCH_SIZE:
+                # no more questions to fetch
+                return all_bets
+
+            if not new_bets:
+                self.context.logger.error(
+                    f"More than {QUERY_BATCH_SIZE} questions were created at {creation_timestamp_gte}, "
+                    "they cannot be paginated."
+                )
+                return None
+
+            # the questions are sorted by creation timestamp in ascending order,
+            # so the last question's creation timestamp is used to fetch the next batch
+            try:
+                last_timestamp = int(bets[-1]["creationTimestamp"])
+                if last_timestamp != creation_timestamp_gte:
+                    boundary_ids = set()
+                boundary_ids.update(
+                    bet["id"]
+                    for bet in bets
+                    if int(bet["creationTimestamp"]) == last_timestamp
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                self.context.logger.error(
+                    f"Malformed question data, missing pagination key: {e}"
+                )
+                return all_bets
+            creation_timestamp_gte = last_timestamp
+
+    def _fetch_bets_market_info(
+        self, bet_ids: List[str]
+    ) -> Generator[None, None, Optional[list]]:
+        """Fetch the volatile market information of the given questions from the current subgraph.
+
+        Only the outcome token amounts, the marginal prices and the liquidity are fetched,
+        in batches of `QUERY_BATCH_SIZE` ids.
+
+        :param bet_ids: the ids of the questions.
+        :return: the market information of the questions which still match the filters, or `None` if any of the
+            requests failed.
+        :yield: None
+        """
+        if not bet_ids:
+            return []
+
+        self._fetch_status = FetchStatus.IN_PROGRESS
+
+        opening_threshold = self.synced_time + self.params.opening_margin
+        all_market_info: List[Dict[str, Any]] = []
+        for start in range(0, len(bet_ids), QUERY_BATCH_SIZE):
+            ids_batch = bet_ids[start : start + QUERY_BATCH_SIZE]
+            query = questions_market_info.substitute(
+                ids=to_graphql_list(ids_batch),
+                creators=to_graphql_list(self._current_creators),
+                slot_count=self.params.slot_count,
+                opening_threshold=opening_threshold,
+                languages=to_graphql_list(self.params.languages),
+                first=len(ids_batch),
+            )
 
-        return bets
+            res_raw = yield from self.get_http_response(
+                content=to_content(query),
+                **self.current_subgraph.get_spec(),
+            )
+            res = self.current_subgraph.process_response(res_raw)
+
+            market_info = yield from self._handle_response(
+                self.current_subgraph,
+                res,
+                res_context="questions' market information",
+            )
+            if market_info is None:
+                return None
+            all_market_info.extend(market_info)
 
-    def _fetch_redeem_info(self) -> Generator[None, None, Optional[list]]:
-        """Fetch redeeming information from the current subgraph."""
+        return all_market_info
+
+    def _fetch_redeem_info(
+        self,
+        process_chunk: Optional[
+            Callable[[List[Dict[str, Any]]], Generator[None, None, None]]
+        ] = None,
+    ) -> Generator[None, None, Optional[list]]:
+        """Fetch redeeming information from the current subgraph.
+
+        :param process_chunk: an optional generator function to which each fetched chunk is handed as soon as it is
+            received. If given, the chunks are not accumulated, so that the whole trading history is never kept in memory.
+        :return: the fetched trades, or an empty list if the chunks have been processed as they were received.
+        :yield: None
+        """
         self._fetch_status = FetchStatus.IN_PROGRESS
 
         current_subgraph = self.context.trades_subgraph
@@ -253,9 +376,23 @@ class QueryingBehaviour(BaseBehaviour, ABC):
                 self.context.logger.error(
                     f"Malformed trade data, missing pagination key: {e}"
                 )
-                all_trades.extend(trades_chunk)
+                yield from self._collect_chunk(trades_chunk, all_trades, process_chunk)
                 return all_trades
-            all_trades.extend(trades_chunk)
+            yield from self._collect_chunk(trades_chunk, all_trades, process_chunk)
+
+    @staticmethod
+    def _collect_chunk(
+        chunk: List[Dict[str, Any]],
+        collected: List[Dict[str, Any]],
+        process_chunk: Optional[
+            Callable[[List[Dict[str, Any]]], Generator[None, None, None]]
+        ],
+    ) -> Generator[None, None, None]:
+        """Hand the given chunk to the processing function if there is one, otherwise collect it."""
+        if process_chunk is None:
+            collected.extend(chunk)
+            return
+        yield from process_chunk(chunk)
 
     def _fetch_block_number(
         self, timestamp: int
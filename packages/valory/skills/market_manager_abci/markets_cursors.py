@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""The persisted cursors of the markets' discovery."""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List
+
+MARKETS_CURSORS_FILENAME = "markets_cursors.json"
+CREATION_TIMESTAMP_KEY = "creationTimestamp"
+
+
+def markets_scope(
+    market: str,
+    creators: Iterable[str],
+    slot_count: int,
+    opening_margin: int,
+    languages: Iterable[str],
+) -> str:
+    """Get the scope of a discovery, i.e., the subgraph and the filters that the discovered markets satisfy."""
+    return json.dumps(
+        [
+            market,
+            sorted(creator.lower() for creator in creators),
+            slot_count,
+            opening_margin,
+            sorted(languages),
+        ]
+    )
+
+
+class MarketsCursors:
+    """The creation timestamp of the newest market discovered for each scope.
+
+    The markets created up to a scope's cursor have already been discovered, so the next discovery only needs to fetch
+    the ones created after it. The cursors are keyed by the scope of the discovery, so that a change of its filters
+    triggers a full discovery again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cursors."""
+        self.path = str(path)
+        self.cursors: Dict[str, int] = {}
+
+    def load(self) -> bool:
+        """Load the cursors from their file.
+
+        :return: whether the cursors were found and loaded.
+        :raises: `OSError` if the file cannot be read, `ValueError` or `TypeError` if it is malformed.
+        """
+        if not os.path.isfile(self.path):
+            return False
+
+        with open(self.path) as cursors_file:
+            cursors = json.load(cursors_file)
+
+        if not isinstance(cursors, dict):
+            raise TypeError(f"Expected a mapping of cursors, got {type(cursors)}.")
+        self.cursors = {str(scope): int(cursor) for scope, cursor in cursors.items()}
+        return True
+
+    def store(self) -> None:
+        """Store the cursors to their file atomically.
+
+        :raises: `OSError` if the file cannot be written.
+        """
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.path) + ".", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as cursors_file:
+                json.dump(self.cursors, cursors_file)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, scope: str) -> int:
+        """Get the creation timestamp after which the markets of the given scope should be discovered."""
+        return self.cursors.get(scope, 0)
+
+    def advance(self, scope: str, raw_bets: List[Dict[str, Any]]) -> None:
+        """Advance the cursor of the given scope to the newest of the given discovered markets."""
+        cursor = self.get(scope)
+        for raw_bet in raw_bets:
+            try:
+                cursor = max(cursor, int(raw_bet[CREATION_TIMESTAMP_KEY]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.cursors[scope] = cursor
@@ -24,7 +24,7 @@ import builtins
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Tuple, Type
 
-from aea.skills.base import Model
+from aea.skills.base import Model, SkillContext
 
 from packages.valory.protocols.http import HttpMessage
 from packages.valory.skills.abstract_round_abci.base import AbciApp
@@ -43,6 +43,7 @@ from packages.valory.skills.abstract_round_abci.models import (
     TypeCheckMixin,
 )
 from packages.valory.skills.market_manager_abci.bets import BINARY_N_SLOTS
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
 from packages.valory.skills.market_manager_abci.rounds import MarketManagerAbciApp
 
 Requests = BaseRequests
@@ -54,6 +55,12 @@ class SharedState(BaseSharedState):
 
     abci_app_cls: Type[AbciApp[Any]] = MarketManagerAbciApp
 
+    def __init__(self, *args: Any, skill_context: SkillContext, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, skill_context=skill_context, **kwargs)
+        # the bets, loaded once and shared by the behaviours
+        self.bets_repository: BetsRepository = BetsRepository()
+
 
 class Subgraph(ApiSpecs):
     """Specifies `ApiSpecs` with common functionality for subgraphs."""
@@ -22,7 +22,7 @@
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from packages.valory.skills.market_manager_abci.behaviours.base import (
     BETS_FILENAME,
@@ -32,6 +32,9 @@ from packages.valory.skills.market_manager_abci.behaviours.base import (
 from packages.valory.skills.market_manager_abci.behaviours.fetch_markets_router import (
     FetchMarketsRouterBehaviour,
 )
+from packages.valory.skills.market_manager_abci.bets import Bet, serialize_bets
+from packages.valory.skills.market_manager_abci.bets_journal import BetsJournal
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -67,6 +70,24 @@ def _exhaust(gen: Any) -> Any:
     return result
 
 
+def _make_bet(bet_id: str = "bet1") -> Bet:
+    """Create a valid binary bet."""
+    return Bet(
+        id=bet_id,
+        market="omen_subgraph",
+        title="Will it rain tomorrow?",
+        collateralToken="0xtoken",
+        creator="0xcreator",
+        fee=0,
+        openingTimestamp=1700000000,
+        outcomeSlotCount=2,
+        outcomeTokenAmounts=[10, 20],
+        outcomeTokenMarginalPrices=[0.4, 0.6],
+        outcomes=["Yes", "No"],
+        scaledLiquidityMeasure=5.0,
+    )
+
+
 class _ConcreteBetsManager(BetsManagerBehaviour):
     """Concrete subclass of BetsManagerBehaviour for testing."""
 
@@ -94,6 +115,8 @@ def _make_behaviour(tmp_path: Any = None, **overrides: Any) -> _ConcreteBetsMana
     ctx = MagicMock()
     store_path = Path(tmp_path) if tmp_path else Path("/tmp/test_store")  # nosec B108
     ctx.params.store_path = store_path
+    ctx.params.is_running_on_polymarket = False
+    ctx.state.bets_repository = BetsRepository()
     b._context = ctx
 
     # -- internal state --
@@ -282,127 +305,82 @@ class TestStoreBets:
         b = _make_behaviour()
         b.bets = []
 
-        with patch(
-            "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-            return_value=None,
-        ):
+        with patch.object(b.bets_journal, "store") as store:
             b.store_bets()
+            b.clean_up()
 
         b.context.logger.warning.assert_called_once_with("No bets to store.")
+        store.assert_not_called()
 
     def test_store_bets_success(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
-        """Test that store_bets writes serialized bets to file."""
+        """Test that the stored bets are written to the file at the end of the round."""
         b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
-        b.bets = [MagicMock()]
+        b.bets = [_make_bet()]
 
-        serialized = '{"bets": "data"}'
-        with patch(
-            "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-            return_value=serialized,
-        ):
-            b.store_bets()
+        b.store_bets()
+        b.clean_up()
 
         with open(b.multi_bets_filepath, "r") as f:
             content = f.read()
-        assert content == serialized
+        assert content == serialize_bets(b.bets)
 
-    def test_store_bets_ioerror_writing(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
-        """Test that store_bets handles IOError during write."""
-        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
-        b.bets = [MagicMock()]
-
-        serialized = '{"bets": "data"}'
-        mock_file = MagicMock()
-        mock_file.write.side_effect = IOError("disk full")
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
+    def test_store_bets_delegates_to_journal(self) -> None:
+        """Test that store_bets persists only the changed bets through the journal, once per round."""
+        b = _make_behaviour()
+        b.bets = [_make_bet("bet1"), _make_bet("bet2")]
 
-        with (
-            patch(
-                "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-                return_value=serialized,
-            ),
-            patch("builtins.open", return_value=mock_file),
-        ):
+        with patch.object(b.bets_journal, "store") as store:
             b.store_bets()
+            b.bets[1].scaledLiquidityMeasure = 7.0
+            b.store_bets()
+            store.assert_not_called()
+            b.clean_up()
 
-        b.context.logger.error.assert_called_once()
-        assert "Error writing" in b.context.logger.error.call_args[0][0]
-
-    def test_store_bets_error_opening_file(self) -> None:
-        """Test that store_bets handles error when opening file."""
-        b = _make_behaviour()
-        b.multi_bets_filepath = "/nonexistent/path/bets.json"
-        b.bets = [MagicMock()]
+        store.assert_called_once_with(b.bets, {0, 1})
 
-        serialized = '{"bets": "data"}'
-        with (
-            patch(
-                "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-                return_value=serialized,
-            ),
-            patch("builtins.open", side_effect=FileNotFoundError("no such dir")),
-        ):
-            b.store_bets()
+        b.bets[1].scaledLiquidityMeasure = 8.0
+        b.store_bets()
+        with patch.object(b.bets_journal, "store") as store:
+            b.clean_up()
 
-        b.context.logger.error.assert_called_once()
-        assert "Error opening" in b.context.logger.error.call_args[0][0]
+        store.assert_called_once_with(b.bets, {1})
 
-    def test_store_bets_permission_error_opening(self) -> None:
-        """Test that store_bets handles PermissionError when opening file."""
+    def test_store_bets_ioerror_writing(self) -> None:
+        """Test that an IOError while journaling the stored bets is logged."""
         b = _make_behaviour()
-        b.bets = [MagicMock()]
+        b.bets = [_make_bet()]
 
-        serialized = '{"bets": "data"}'
-        with (
-            patch(
-                "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-                return_value=serialized,
-            ),
-            patch("builtins.open", side_effect=PermissionError("forbidden")),
-        ):
-            b.store_bets()
+        b.store_bets()
+        with patch.object(b.bets_journal, "store", side_effect=IOError("disk full")):
+            b.clean_up()
 
         b.context.logger.error.assert_called_once()
-        assert "Error opening" in b.context.logger.error.call_args[0][0]
+        assert "Error writing" in b.context.logger.error.call_args[0][0]
+        assert b.bets_repository.pending_flush
 
-    def test_store_bets_os_error_opening(self) -> None:
-        """Test that store_bets handles OSError when opening file."""
+    def test_store_bets_error_opening_file(self) -> None:
+        """Test that store_bets handles error when opening file."""
         b = _make_behaviour()
-        b.bets = [MagicMock()]
+        b.multi_bets_filepath = "/nonexistent/path/bets.json"
+        b.bets = [_make_bet()]
 
-        serialized = '{"bets": "data"}'
-        with (
-            patch(
-                "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-                return_value=serialized,
-            ),
-            patch("builtins.open", side_effect=OSError("generic os error")),
-        ):
-            b.store_bets()
+        b.store_bets()
+        b.clean_up()
 
         b.context.logger.error.assert_called_once()
-        assert "Error opening" in b.context.logger.error.call_args[0][0]
-
-    def test_store_bets_os_error_writing(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
-        """Test that store_bets handles OSError during write."""
-        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
-        b.bets = [MagicMock()]
+        assert "Error writing" in b.context.logger.error.call_args[0][0]
 
-        serialized = '{"bets": "data"}'
-        mock_file = MagicMock()
-        mock_file.write.side_effect = OSError("write os error")
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
+    def test_store_bets_permission_error(self) -> None:
+        """Test that store_bets handles PermissionError."""
+        b = _make_behaviour()
+        b.bets = [_make_bet()]
+        b.sleep = _noop_gen  # type: ignore[method-assign]
 
-        with (
-            patch(
-                "packages.valory.skills.market_manager_abci.behaviours.base.serialize_bets",
-                return_value=serialized,
-            ),
-            patch("builtins.open", return_value=mock_file),
+        b.store_bets()
+        with patch.object(
+            b.bets_journal, "store", side_effect=PermissionError("forbidden")
         ):
-            b.store_bets()
+            next(b.hash_stored_bets())
 
         b.context.logger.error.assert_called_once()
         assert "Error writing" in b.context.logger.error.call_args[0][0]
@@ -430,30 +408,37 @@ class TestReadBets:
         """Test reading from multi_bets file when it exists."""
         b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
 
-        # Write a valid bets file
-        bets_data = [{"id": "bet1", "market": "test"}]
+        bets = [_make_bet("bet1"), _make_bet("bet2")]
         multi_path = tmp_path / MULTI_BETS_FILENAME
-        multi_path.write_text(json.dumps(bets_data))
+        multi_path.write_text(serialize_bets(bets))
 
-        with patch(
-            "packages.valory.skills.market_manager_abci.behaviours.base.BetsDecoder",
-        ):
-            # json.load with BetsDecoder will be called; mock it at the json.load level
-            with patch(
-                "json.load",
-                return_value=bets_data,
-            ):
-                b.read_bets()
+        b.read_bets()
 
-        assert b.bets == bets_data
+        assert b.bets == bets
+
+    def test_read_bets_replays_journal(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the journaled changes are visible after reading the bets."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.bets = [_make_bet("bet1")]
+        b.store_bets()
+        b.bets[0].scaledLiquidityMeasure = 7.0
+        b.bets.append(_make_bet("bet2"))
+        b.store_bets()
+        b.clean_up()
+
+        reader = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        reader.read_bets()
+
+        assert reader.bets == b.bets
+        assert _exhaust(reader.hash_stored_bets()) == _exhaust(b.hash_stored_bets())
 
     def test_read_bets_only_bets_file_exists(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
         """Test fallback to bets.json when multi_bets.json does not exist."""
         b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
 
-        bets_data = [{"id": "bet_fallback"}]
+        bets_data = [_make_bet("bet_fallback")]
         bets_path = tmp_path / BETS_FILENAME
-        bets_path.write_text(json.dumps(bets_data))
+        bets_path.write_text(serialize_bets(bets_data))
 
         # multi_bets does NOT exist, but bets does
         def isfile_side_effect(path: Any) -> bool:
@@ -465,8 +450,7 @@ class TestReadBets:
             return False
 
         with patch("os.path.isfile", side_effect=isfile_side_effect):
-            with patch("json.load", return_value=bets_data):
-                b.read_bets()
+            b.read_bets()
 
         assert b.bets == bets_data
         # First warning for missing multi_bets
@@ -479,11 +463,7 @@ class TestReadBets:
         multi_path = tmp_path / MULTI_BETS_FILENAME
         multi_path.write_text("not valid json {{{")
 
-        with patch(
-            "json.load",
-            side_effect=json.JSONDecodeError("err", "doc", 0),
-        ):
-            b.read_bets()
+        b.read_bets()
 
         assert b.bets == []
         b.context.logger.error.assert_called_once()
@@ -496,10 +476,7 @@ class TestReadBets:
         multi_path = tmp_path / MULTI_BETS_FILENAME
         multi_path.write_text("[]")
 
-        with patch(
-            "json.load",
-            side_effect=TypeError("bad type"),
-        ):
+        with patch.object(b.bets_journal, "load", side_effect=TypeError("bad type")):
             b.read_bets()
 
         assert b.bets == []
@@ -569,7 +546,7 @@ class TestReadBets:
         multi_path = tmp_path / MULTI_BETS_FILENAME
         multi_path.write_text("[]")
 
-        with patch("json.load", return_value=loaded):
+        with patch.object(b.bets_journal, "load", return_value=loaded):
             b.read_bets()
 
         assert [bet.collateralToken for bet in b.bets] == ["", ""]
@@ -587,11 +564,55 @@ class TestReadBets:
         multi_path = tmp_path / MULTI_BETS_FILENAME
         multi_path.write_text("[]")
 
-        with patch("json.load", return_value=loaded):
+        with patch.object(b.bets_journal, "load", return_value=loaded):
             b.read_bets()
 
         assert b.bets[0].collateralToken == wxdai
 
+    def test_read_bets_loads_once(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the behaviours sharing the state load the bets from the file only once."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        multi_path = tmp_path / MULTI_BETS_FILENAME
+        multi_path.write_text(serialize_bets([_make_bet("bet1")]))
+        other = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        other._context = b.context
+
+        with patch.object(
+            BetsJournal, "load", autospec=True, side_effect=BetsJournal.load
+        ) as load:
+            b.read_bets()
+            other.read_bets()
+            b.read_bets()
+
+        load.assert_called_once()
+        assert other.bets == b.bets
+        assert other.bets[0] is not b.bets[0]
+
+    def test_read_bets_discards_unstored_changes(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that reading the bets reverts the changes which have not been stored."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.bets = [_make_bet("bet1"), _make_bet("bet2")]
+        b.store_bets()
+        bet = b.bets[0]
+
+        bet.scaledLiquidityMeasure = 7.0
+        bet.append_investment_amount(0, 10)
+        b.bets[1] = _make_bet("bet3")
+        b.bets.append(_make_bet("bet4"))
+        b.read_bets()
+
+        assert b.bets[0] is not bet
+        assert b.bets[0].scaledLiquidityMeasure == 5.0
+        assert b.bets[0].invested_amount == 0
+        assert [bet.id for bet in b.bets] == ["bet1", "bet2"]
+        assert b.get_bet_idx("bet3") is None
+
+        b.bets[0].scaledLiquidityMeasure = 7.0
+        b.store_bets()
+        b.read_bets()
+
+        assert b.bets[0].scaledLiquidityMeasure == 7.0
+
 
 # ===========================================================================
 # Tests for hash_stored_bets
@@ -601,18 +622,111 @@ class TestReadBets:
 class TestHashStoredBets:
     """Tests for hash_stored_bets."""
 
-    def test_hash_stored_bets_delegates_to_ipfs(self) -> None:
-        """Test that hash_stored_bets calls IPFSHashOnly.hash_file."""
+    def test_hash_stored_bets_delegates_to_journal(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that hash_stored_bets returns the journal's content hash."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+
+        with patch.object(
+            BetsJournal, "content_hash", new_callable=PropertyMock
+        ) as content_hash:
+            content_hash.return_value = "hash123"
+            assert _exhaust(b.hash_stored_bets()) == "hash123"
+
+    def test_hash_stored_bets_flushes_the_stored_bets(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the hash reflects the bets stored in the current round."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.bets = [_make_bet("bet1")]
+        b.store_bets()
+
+        bets_hash = _exhaust(b.hash_stored_bets())
+
+        assert not b.bets_repository.pending_flush
+        reader = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        reader.read_bets()
+        assert reader.bets == b.bets
+        assert _exhaust(reader.hash_stored_bets()) == bets_hash
+
+    def test_hash_stored_bets_retries_a_failed_flush(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that no hash is returned until the stored bets have been written."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.sleep = _noop_gen  # type: ignore[method-assign]
+        b.bets = [_make_bet("bet1")]
+        b.store_bets()
+
+        gen = b.hash_stored_bets()
+        with patch.object(b.bets_journal, "store", side_effect=OSError("disk full")):
+            next(gen)
+            next(gen)
+        bets_hash = _exhaust(gen)
+
+        assert b.context.logger.error.call_count == 2
+        assert not b.bets_repository.pending_flush
+        reader = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        reader.read_bets()
+        assert _exhaust(reader.hash_stored_bets()) == bets_hash
+
+    def test_hash_stored_bets_writes_the_bets_of_a_legacy_store(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the hash of bets read from the legacy store describes them, not an empty store."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        (tmp_path / BETS_FILENAME).write_text(serialize_bets([_make_bet("bet1")]))
+        b.read_bets()
+
+        bets_hash = _exhaust(b.hash_stored_bets())
+
+        other = _make_behaviour(tmp_path=tmp_path / "other")  # type: ignore[no-untyped-def]
+        (tmp_path / "other").mkdir()
+        other.bets = [_make_bet("bet1")]
+        other.store_bets()
+        assert _exhaust(other.hash_stored_bets()) == bets_hash
+
+    def test_hash_stored_bets_tracks_content(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the hash changes with the stored content and is deterministic."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.bets = [_make_bet("bet1")]
+        b.store_bets()
+        first_hash = _exhaust(b.hash_stored_bets())
+
+        other = _make_behaviour(tmp_path=tmp_path / "other")  # type: ignore[no-untyped-def]
+        (tmp_path / "other").mkdir()
+        other.bets = [_make_bet("bet1")]
+        other.store_bets()
+        assert _exhaust(other.hash_stored_bets()) == first_hash
+
+        b.bets[0].scaledLiquidityMeasure = 7.0
+        b.store_bets()
+        assert _exhaust(b.hash_stored_bets()) != first_hash
+
+
+# ===========================================================================
+# Tests for clean_up
+# ===========================================================================
+
+
+class TestCleanUp:
+    """Tests for clean_up."""
+
+    def test_clean_up_flushes_only_the_stored_changes(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test that the changes which have not been stored are not written at the end of the round."""
+        b = _make_behaviour(tmp_path=tmp_path)  # type: ignore[no-untyped-def]
+        b.bets = [_make_bet("bet1")]
+        b.store_bets()
+        b.bets[0].scaledLiquidityMeasure = 7.0
+
+        b.clean_up()
+
+        with open(b.multi_bets_filepath, "r") as f:
+            content = f.read()
+        assert content == serialize_bets([_make_bet("bet1")])
+        assert not b.bets_repository.pending_flush
+
+    def test_clean_up_without_stored_changes(self) -> None:
+        """Test that nothing is written when no bets have been stored in the round."""
         b = _make_behaviour()
 
-        with patch(
-            "packages.valory.skills.market_manager_abci.behaviours.base.IPFSHashOnly.hash_file",
-            return_value="QmHash123",
-        ) as mock_hash:
-            result = b.hash_stored_bets()
+        with patch.object(b.bets_journal, "store") as store:
+            b.clean_up()
 
-        mock_hash.assert_called_once_with(b.multi_bets_filepath)
-        assert result == "QmHash123"
+        store.assert_not_called()
 
 
 # ===========================================================================
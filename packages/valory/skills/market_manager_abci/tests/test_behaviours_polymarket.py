@@ -25,6 +25,7 @@ from pathlib import Path
 from typing import Any, Dict, Generator, List
 from unittest.mock import MagicMock, PropertyMock, patch
 
+from packages.valory.connections.polymarket_client.request_types import RequestType
 from packages.valory.skills.market_manager_abci.behaviours.polymarket_fetch_market import (
     EXTREME_PRICE_THRESHOLD,
     POLYMARKET_CATEGORY_KEYWORDS,
@@ -38,6 +39,10 @@ from packages.valory.skills.market_manager_abci.bets import Bet, QueueStatus
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
     FetchStatus,
 )
+from packages.valory.skills.market_manager_abci.trades_ledger import (
+    TRADES_LEDGER_FILENAME,
+    TRADES_SYNC_LOOKBACK,
+)
 
 # ---------------------------------------------------------------------------
 # Helper utilities
@@ -1329,70 +1334,6 @@ class TestShouldSkipBet:
         assert behaviour._should_skip_bet(bet) is False
 
 
-# ===========================================================================
-# Tests for _convert_usdc_to_base_units
-# ===========================================================================
-
-
-class TestConvertUsdcToBaseUnits:
-    """Tests for _convert_usdc_to_base_units."""
-
-    def test_valid_conversion(self) -> None:
-        """Test valid conversion."""
-        behaviour = _make_behaviour()
-        result = behaviour._convert_usdc_to_base_units(1.5)
-        assert result == int(1.5 * USDC_DECIMALS)
-
-    def test_zero(self) -> None:
-        """Test zero conversion."""
-        behaviour = _make_behaviour()
-        result = behaviour._convert_usdc_to_base_units(0.0)
-        assert result == 0
-
-    def test_invalid_input(self) -> None:
-        """Test with invalid input that causes TypeError."""
-        behaviour = _make_behaviour()
-        result = behaviour._convert_usdc_to_base_units("not_a_number")  # type: ignore[arg-type]
-        # float * int should still work for strings, but int() of result might fail
-        # Actually "not_a_number" * USDC_DECIMALS will raise TypeError
-        assert result is None
-
-
-# ===========================================================================
-# Tests for _calculate_outcome_investment
-# ===========================================================================
-
-
-class TestCalculateOutcomeInvestment:
-    """Tests for _calculate_outcome_investment."""
-
-    def test_sum_buy_trades(self) -> None:
-        """Test summing only BUY trades."""
-        behaviour = _make_behaviour()
-        trades = [
-            {"side": "BUY", "usdc_amount": 10.0},
-            {"side": "BUY", "usdc_amount": 20.0},
-            {"side": "SELL", "usdc_amount": 5.0},
-        ]
-        result = behaviour._calculate_outcome_investment(trades)
-        assert result == 30.0
-
-    def test_no_buy_trades(self) -> None:
-        """Test with no BUY trades."""
-        behaviour = _make_behaviour()
-        trades = [
-            {"side": "SELL", "usdc_amount": 5.0},
-        ]
-        result = behaviour._calculate_outcome_investment(trades)
-        assert result == 0.0
-
-    def test_empty_trade_list(self) -> None:
-        """Test with empty trade list."""
-        behaviour = _make_behaviour()
-        result = behaviour._calculate_outcome_investment([])
-        assert result == 0.0
-
-
 # ===========================================================================
 # Tests for _replace_with_existing_investments_if_empty
 # ===========================================================================
@@ -1437,37 +1378,12 @@ class TestReplaceWithExistingInvestmentsIfEmpty:
 class TestUpdateSingleBetInvestments:
     """Tests for _update_single_bet_investments."""
 
-    def test_no_condition_id(self) -> None:
-        """Test when bet has no condition_id."""
-        behaviour = _make_behaviour()
-        bet = _make_bet(id="b1")
-        bet.condition_id = None
-        bet.investments = {"Yes": [100], "No": [200]}
-        behaviour._update_single_bet_investments(bet, {})
-        # Should retain existing investments since new ones are empty
-        assert bet.investments == {"Yes": [100], "No": [200]}
-
-    def test_no_matching_trades(self) -> None:
-        """Test when there are no matching trades for the bet."""
-        behaviour = _make_behaviour()
-        bet = _make_bet(id="b1")
-        bet.condition_id = "0xmissing"
-        bet.investments = {"Yes": [100], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xother": {0: [{"side": "BUY", "usdc_amount": 10.0}]}
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
-        assert bet.investments == {"Yes": [100], "No": []}
-
     def test_bet_with_no_outcomes(self) -> None:
         """Test when bet outcomes is None, the method logs and calls replace fallback."""
         behaviour = _make_behaviour()
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [100], "No": [200]}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {0: [{"side": "BUY", "usdc_amount": 10.0}]}
-        }
         # Set outcomes to None after construction so existing_investments is captured
         # before reset_investments is called. We must mock reset_investments and
         # _replace_with_existing_investments_if_empty to avoid the ValueError.
@@ -1478,7 +1394,7 @@ class TestUpdateSingleBetInvestments:
         # Mock the methods that would fail when outcomes is None
         behaviour._replace_with_existing_investments_if_empty = MagicMock()  # type: ignore[method-assign]
 
-        behaviour._update_single_bet_investments(bet, trades_map)
+        behaviour._update_single_bet_investments(bet, {0: 10 * USDC_DECIMALS})
         # Verify the warning was logged and replace fallback was called  # type: ignore[method-assign]
         behaviour.context.logger.warning.assert_called()
         behaviour._replace_with_existing_investments_if_empty.assert_called_once()  # type: ignore[attr-defined]
@@ -1489,10 +1405,7 @@ class TestUpdateSingleBetInvestments:
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [100], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {5: [{"side": "BUY", "usdc_amount": 10.0}]}  # out of bounds
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
+        behaviour._update_single_bet_investments(bet, {5: 10 * USDC_DECIMALS})
         # Should retain existing investments since new are empty
         assert bet.investments == {"Yes": [100], "No": []}
 
@@ -1502,31 +1415,17 @@ class TestUpdateSingleBetInvestments:
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [100], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {-1: [{"side": "BUY", "usdc_amount": 10.0}]}
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
+        behaviour._update_single_bet_investments(bet, {-1: 10 * USDC_DECIMALS})
         assert bet.investments == {"Yes": [100], "No": []}
 
     def test_successful_update(self) -> None:
-        """Test a successful investment update."""
+        """Test that the invested total replaces the bet's investments."""
         behaviour = _make_behaviour()
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [100], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {
-                0: [
-                    {"side": "BUY", "usdc_amount": 10.0},
-                    {"side": "BUY", "usdc_amount": 5.0},
-                    {"side": "SELL", "usdc_amount": 3.0},
-                ],
-            }
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
-        # Total BUY = 15.0 USDC -> 15_000_000 base units
-        assert len(bet.investments["Yes"]) == 1
-        assert bet.investments["Yes"][0] == int(15.0 * USDC_DECIMALS)
+        behaviour._update_single_bet_investments(bet, {0: 15 * USDC_DECIMALS})
+        assert bet.investments["Yes"] == [15 * USDC_DECIMALS]
 
     def test_zero_investment_not_appended(self) -> None:
         """Test that zero total investment is not appended."""
@@ -1534,35 +1433,8 @@ class TestUpdateSingleBetInvestments:
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [100], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {
-                0: [
-                    {"side": "SELL", "usdc_amount": 10.0},  # only SELL trades
-                ],
-            }
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
-        # Total BUY = 0, so nothing appended, new investments are empty
-        # Should retain existing
-        assert bet.investments == {"Yes": [100], "No": []}
-
-    def test_convert_usdc_fails_continues(self) -> None:
-        """Test that when _convert_usdc_to_base_units returns None, we continue."""
-        behaviour = _make_behaviour()
-        bet = _make_bet(id="b1")
-        bet.condition_id = "0xcond"
-        bet.investments = {"Yes": [100], "No": []}
-
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {
-                0: [{"side": "BUY", "usdc_amount": 10.0}],
-            }
-        }
-
-        with patch.object(behaviour, "_convert_usdc_to_base_units", return_value=None):
-            behaviour._update_single_bet_investments(bet, trades_map)
-
-        # Conversion failed, no new investments appended, should retain existing
+        behaviour._update_single_bet_investments(bet, {0: 0})
+        # nothing appended, new investments are empty, should retain existing
         assert bet.investments == {"Yes": [100], "No": []}
 
 
@@ -1578,24 +1450,55 @@ class TestUpdateAllBetsInvestments:
         """Test that skip and update logic works together."""
         behaviour = _make_behaviour()
         bet1 = _make_bet(id="b1")
+        bet1.condition_id = "0xcond1"
         bet1.queue_status = QueueStatus.EXPIRED  # should be skipped
         bet2 = _make_bet(id="b2")
         bet2.condition_id = "0xcond2"
         behaviour.bets = [bet1, bet2]
 
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond2": {
-                0: [{"side": "BUY", "usdc_amount": 10.0}],
-            }
+        investments = {"0xcond1": {0: USDC_DECIMALS}, "0xcond2": {0: USDC_DECIMALS}}
+        behaviour._update_all_bets_investments(investments, {"0xcond1", "0xcond2"})
+
+        assert bet1.investments == {"Yes": [], "No": []}
+        assert bet2.investments["Yes"] == [USDC_DECIMALS]
+
+    def test_only_changed_markets_are_updated(self) -> None:
+        """Test that the bets of unchanged markets keep their investments and untraded ones are not visited."""
+        behaviour = _make_behaviour()
+        changed_bet = _make_bet(id="b1")
+        changed_bet.condition_id = "0xchanged"
+        unchanged_bet = _make_bet(id="b2")
+        unchanged_bet.condition_id = "0xunchanged"
+        unchanged_bet.investments = {"Yes": [7], "No": []}
+        rediscovered_bet = _make_bet(id="b3")
+        rediscovered_bet.condition_id = "0xrediscovered"
+        untraded_bet = _make_bet(id="b4")
+        untraded_bet.condition_id = "0xuntraded"
+        behaviour.bets = [changed_bet, unchanged_bet, rediscovered_bet, untraded_bet]
+        behaviour._update_single_bet_investments = MagicMock(  # type: ignore[method-assign]
+            wraps=behaviour._update_single_bet_investments
+        )
+
+        investments = {
+            "0xchanged": {0: 2},
+            "0xunchanged": {0: 9},
+            "0xrediscovered": {1: 3},
         }
-        behaviour._update_all_bets_investments(trades_map)
-        # bet2 should have been updated
-        assert len(bet2.investments["Yes"]) == 1
+        behaviour._update_all_bets_investments(investments, {"0xchanged"})
+
+        assert changed_bet.investments["Yes"] == [2]
+        assert unchanged_bet.investments["Yes"] == [7]
+        assert rediscovered_bet.investments["No"] == [3]
+        updated = [
+            call.args[0]
+            for call in behaviour._update_single_bet_investments.call_args_list  # type: ignore[attr-defined]
+        ]
+        assert updated == [changed_bet, rediscovered_bet]
 
-    def test_empty_bets_list(self) -> None:
-        """Test with empty bets list."""
+    def test_unknown_market(self) -> None:
+        """Test that the investments of a market without a bet are ignored."""
         behaviour = _make_behaviour()
-        behaviour._update_all_bets_investments({})
+        behaviour._update_all_bets_investments({"0xmissing": {0: 1}}, {"0xmissing"})
         assert behaviour.bets == []
 
 
@@ -2243,6 +2146,21 @@ class TestFetchPolymarketTrades:
 
         assert result is None
 
+    def test_since_timestamp_is_sent(self) -> None:
+        """Test that the cursor is sent to the connection when given."""
+        behaviour = _make_behaviour()
+        request = MagicMock(side_effect=_return_gen([]))
+        behaviour.send_polymarket_connection_request = request  # type: ignore[method-assign]
+
+        _exhaust_gen(behaviour._fetch_polymarket_trades(1700000000))
+
+        request.assert_called_once_with(
+            {
+                "request_type": RequestType.FETCH_ALL_TRADES.value,
+                "params": {"since_timestamp": 1700000000},
+            }
+        )
+
     # type: ignore[arg-type]
     def test_error_response(self) -> None:
         """Test error dict response returns None."""
@@ -2276,9 +2194,10 @@ class TestUpdateBetsInvestments:
 
         behaviour._process_and_group_trades.assert_not_called()  # type: ignore[attr-defined]
 
-    def test_successful_update(self) -> None:
+    def test_successful_update(self, tmp_path: Path) -> None:
         """Test successful investment update flow."""
         behaviour = _make_behaviour()
+        behaviour.context.params.store_path = tmp_path
         trades_data = [
             {
                 "conditionId": "c1",
@@ -2286,6 +2205,7 @@ class TestUpdateBetsInvestments:
                 "side": "BUY",
                 "size": "10",
                 "price": "0.5",
+                "timestamp": 1700000000,
             }
         ]
         behaviour._fetch_polymarket_trades = _return_gen(trades_data)  # type: ignore[method-assign]
@@ -2298,6 +2218,63 @@ class TestUpdateBetsInvestments:
         behaviour._process_and_group_trades.assert_called_once_with(trades_data)  # type: ignore[attr-defined]
         behaviour._update_all_bets_investments.assert_called_once()  # type: ignore[attr-defined]
 
+    def test_incremental_sync(self, tmp_path: Path) -> None:
+        """Test that the trades are synced from the persisted cursor and accumulated."""
+        behaviour = _make_behaviour()
+        behaviour.context.params.store_path = tmp_path
+        first_trade = {
+            "transactionHash": "0x1",
+            "conditionId": "c1",
+            "outcomeIndex": 0,
+            "side": "BUY",
+            "size": "10",
+            "price": "0.5",
+            "timestamp": 1700000000,
+        }
+        second_trade = {
+            **first_trade,
+            "transactionHash": "0x2",
+            "timestamp": 1700000100,
+        }
+        behaviour._update_all_bets_investments = MagicMock()  # type: ignore[method-assign]
+
+        requested_since = []
+
+        def fetch(since_timestamp: Any = None) -> Generator:
+            """Mock the trades' fetch, returning the trades at or after the given timestamp."""
+            requested_since.append(since_timestamp)
+            yield
+            return [
+                trade
+                for trade in (second_trade, first_trade)
+                if since_timestamp is None or trade["timestamp"] >= since_timestamp
+            ]
+
+        behaviour._fetch_polymarket_trades = fetch  # type: ignore[method-assign]
+
+        _exhaust_gen(behaviour.update_bets_investments())
+        _exhaust_gen(behaviour.update_bets_investments())
+
+        assert requested_since == [None, 1700000100 - TRADES_SYNC_LOOKBACK]
+        # the re-fetched trades are not counted twice
+        behaviour._update_all_bets_investments.assert_called_with(  # type: ignore[attr-defined]
+            {"c1": {0: 10 * USDC_DECIMALS}}, set()
+        )
+
+    def test_corrupted_ledger_triggers_full_sync(self, tmp_path: Path) -> None:
+        """Test that an unreadable ledger falls back to a full trades sync."""
+        behaviour = _make_behaviour()
+        behaviour.context.params.store_path = tmp_path
+        (tmp_path / TRADES_LEDGER_FILENAME).write_text("{not json")
+        fetch = MagicMock(side_effect=_return_gen([]))
+        behaviour._fetch_polymarket_trades = fetch  # type: ignore[method-assign]
+        behaviour._update_all_bets_investments = MagicMock()  # type: ignore[method-assign]
+
+        _exhaust_gen(behaviour.update_bets_investments())
+
+        fetch.assert_called_once_with(None)
+        behaviour.context.logger.warning.assert_called()  # type: ignore[attr-defined]
+
 
 # ===========================================================================
 # Tests for async_act (generator)
@@ -2335,7 +2312,7 @@ class TestAsyncAct:
         behaviour._requeue_bets_for_selling = MagicMock()  # type: ignore[method-assign]
         behaviour._bet_freshness_check_and_update = MagicMock()  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash123")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=_return_gen("hash123"))  # type: ignore[method-assign]
         behaviour.send_a2a_transaction = _noop_gen  # type: ignore[method-assign]
         behaviour.wait_until_round_end = _noop_gen  # type: ignore[method-assign]
         behaviour.set_done = MagicMock()  # type: ignore[method-assign]
@@ -2485,17 +2462,11 @@ class TestEdgeCases:
         bet = _make_bet(id="b1")
         bet.condition_id = "0xcond"
         bet.investments = {"Yes": [], "No": []}
-        trades_map: Dict[str, Dict[int, List[Dict[str, Any]]]] = {
-            "0xcond": {
-                0: [{"side": "BUY", "usdc_amount": 10.0}],
-                1: [{"side": "BUY", "usdc_amount": 5.0}],
-            }
-        }
-        behaviour._update_single_bet_investments(bet, trades_map)
-        assert len(bet.investments["Yes"]) == 1
-        assert len(bet.investments["No"]) == 1
-        assert bet.investments["Yes"][0] == int(10.0 * USDC_DECIMALS)
-        assert bet.investments["No"][0] == int(5.0 * USDC_DECIMALS)
+        behaviour._update_single_bet_investments(
+            bet, {0: 10 * USDC_DECIMALS, 1: 5 * USDC_DECIMALS}
+        )
+        assert bet.investments["Yes"] == [10 * USDC_DECIMALS]
+        assert bet.investments["No"] == [5 * USDC_DECIMALS]
 
     def test_deduplicate_single_market_no_dedup_needed(self) -> None:
         """Test deduplicate with single market per category."""
@@ -2635,12 +2606,6 @@ class TestEdgeCases:
         # EXPIRED.move_to_process() returns self
         assert bet1.queue_status == QueueStatus.EXPIRED
 
-    def test_convert_usdc_large_value(self) -> None:
-        """Test _convert_usdc_to_base_units with a large value."""
-        behaviour = _make_behaviour()
-        result = behaviour._convert_usdc_to_base_units(999999999.99)
-        assert result == int(999999999.99 * USDC_DECIMALS)
-
     def test_process_chunk_empty_list(self) -> None:
         """Test _process_chunk with empty list."""
         behaviour = _make_behaviour()
@@ -20,9 +20,12 @@
 """Tests for the update_bets behaviour of the MarketManager ABCI application."""
 
 from copy import deepcopy
-from typing import Any, Dict, Generator
+from pathlib import Path
+from typing import Any, Dict, Generator, List
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from packages.valory.skills.market_manager_abci.behaviours.update_bets import (
     UpdateBetsBehaviour,
 )
@@ -30,6 +33,11 @@ from packages.valory.skills.market_manager_abci.bets import Bet, QueueStatus
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
     FetchStatus,
 )
+from packages.valory.skills.market_manager_abci.markets_cursors import (
+    MARKETS_CURSORS_FILENAME,
+    MarketsCursors,
+    markets_scope,
+)
 
 # ---------------------------------------------------------------------------
 # Generator helpers for mocking `yield from` calls
@@ -100,6 +108,7 @@ def _make_behaviour(**overrides: Any) -> UpdateBetsBehaviour:
     behaviour._creators_iterator = iter([])
     behaviour._current_market = ""
     behaviour._current_creators = []
+    behaviour._markets_cursors = None
 
     for key, val in overrides.items():
         setattr(behaviour, key, val)
@@ -782,9 +791,145 @@ class TestProcessChunk:
         assert behaviour.bets[0].scaledLiquidityMeasure == 20.0
 
 
+class TestProcessMarketInfoChunk:
+    """Tests for _process_market_info_chunk."""
+
+    def test_tracked_bet_refreshed(self) -> None:
+        """Test that the market information of a tracked bet is refreshed."""
+        bet = _make_bet(id="bet1", scaledLiquidityMeasure=5.0)
+        behaviour = _make_behaviour(bets=[bet])
+
+        behaviour._process_market_info_chunk(
+            [
+                dict(
+                    id="bet1",
+                    outcomeTokenAmounts=["300", "400"],
+                    outcomeTokenMarginalPrices=["0.3", "0.7"],
+                    scaledLiquidityMeasure="20.0",
+                ),
+                dict(id="unknown", scaledLiquidityMeasure="1.0"),
+            ]
+        )
+
+        assert len(behaviour.bets) == 1
+        assert behaviour.bets[0] is bet
+        assert bet.outcomeTokenAmounts == [300, 400]
+        assert bet.outcomeTokenMarginalPrices == [0.3, 0.7]
+        assert bet.scaledLiquidityMeasure == 20.0
+
+    def test_zero_liquidity_blacklists(self) -> None:
+        """Test that a tracked bet whose liquidity dropped to zero is blacklisted, as a fetched one would be."""
+        bet = _make_bet(id="bet1")
+        behaviour = _make_behaviour(bets=[bet])
+
+        behaviour._process_market_info_chunk(
+            [dict(id="bet1", scaledLiquidityMeasure=0)]
+        )
+
+        assert bet.queue_status.is_expired()
+
+
 class TestUpdateBets:
     """Tests for _update_bets."""
 
+    @staticmethod
+    def _setup_discovery(
+        behaviour: UpdateBetsBehaviour, store_path: Path, cursor: int
+    ) -> str:
+        """Set up a single market to discover, with a stored cursor, and return the discovery's scope."""
+        behaviour.context.params.store_path = store_path
+        behaviour.context.params.slot_count = 2
+        behaviour.context.params.opening_margin = 100
+        behaviour.context.params.languages = ["en_US"]
+        prepare_results = iter([True, False])
+        behaviour._prepare_fetching = lambda: next(prepare_results)  # type: ignore[method-assign]
+        behaviour._current_market = "omen_subgraph"
+        behaviour._current_creators = ["0xcreator"]
+
+        scope = markets_scope("omen_subgraph", ["0xcreator"], 2, 100, ["en_US"])
+        cursors = MarketsCursors(str(store_path / MARKETS_CURSORS_FILENAME))
+        cursors.cursors[scope] = cursor
+        cursors.store()
+        return scope
+
+    def test_discovers_after_cursor_and_refreshes_tracked(self, tmp_path: Path) -> None:
+        """Test that only the markets created after the cursor are fetched, and the tracked ones are refreshed."""
+        tracked = _make_bet(id="bet1", scaledLiquidityMeasure=5.0)
+        expired = _make_bet(id="bet2")
+        expired.blacklist_forever()
+        behaviour = _make_behaviour(bets=[tracked, expired])
+        scope = self._setup_discovery(behaviour, tmp_path, cursor=500)
+
+        fetched_after: List[int] = []
+        refreshed_ids: List[List[str]] = []
+
+        def mock_fetch_bets(created_after: int) -> Generator:
+            fetched_after.append(created_after)
+            behaviour._fetch_status = FetchStatus.SUCCESS
+            yield
+            return [
+                dict(
+                    id="new1",
+                    title="Q?",
+                    collateralToken="0x",
+                    creator="0xcreator",
+                    creationTimestamp="700",
+                    fee=0,
+                    openingTimestamp=9999999999,
+                    outcomeSlotCount=2,
+                    outcomeTokenAmounts=[100, 200],
+                    outcomeTokenMarginalPrices=[0.5, 0.5],
+                    outcomes=["Yes", "No"],
+                    scaledLiquidityMeasure=10.0,
+                )
+            ]
+
+        def mock_fetch_market_info(bet_ids: List[str]) -> Generator:
+            refreshed_ids.append(bet_ids)
+            yield
+            return [dict(id="bet1", scaledLiquidityMeasure=20.0)]
+
+        behaviour._fetch_bets = mock_fetch_bets  # type: ignore[method-assign]
+        behaviour._fetch_bets_market_info = mock_fetch_market_info  # type: ignore[method-assign]
+
+        gen = behaviour._update_bets()
+        try:
+            while True:
+                next(gen)
+        except StopIteration:
+            pass
+
+        assert fetched_after == [500]
+        assert refreshed_ids == [["bet1"]]
+        assert [bet.id for bet in behaviour.bets] == ["bet1", "bet2", "new1"]
+        assert tracked.scaledLiquidityMeasure == 20.0
+        assert behaviour._markets_cursors is not None
+        assert behaviour._markets_cursors.get(scope) == 700
+
+    def test_discovers_all_without_tracked_bets(self, tmp_path: Path) -> None:
+        """Test that all the markets are discovered again if none of them is tracked."""
+        behaviour = _make_behaviour(bets=[])
+        self._setup_discovery(behaviour, tmp_path, cursor=500)
+
+        fetched_after: List[int] = []
+
+        def mock_fetch_bets(created_after: int) -> Generator:
+            fetched_after.append(created_after)
+            behaviour._fetch_status = FetchStatus.SUCCESS
+            yield
+            return []
+
+        behaviour._fetch_bets = mock_fetch_bets  # type: ignore[method-assign]
+
+        gen = behaviour._update_bets()
+        try:
+            while True:
+                next(gen)
+        except StopIteration:
+            pass
+
+        assert fetched_after == [0]
+
     def test_fetching_succeeds(self) -> None:
         """Test successful fetching loop."""
         behaviour = _make_behaviour(bets=[])
@@ -799,6 +944,9 @@ class TestUpdateBets:
 
         behaviour._prepare_fetching = mock_prepare  # type: ignore[method-assign, no-untyped-def]
         behaviour._fetch_status = FetchStatus.SUCCESS
+        behaviour.context.params.slot_count = 2
+        behaviour.context.params.opening_margin = 100
+        behaviour.context.params.languages = ["en_US"]
 
         raw_bet = dict(
             id="bet1",
@@ -1009,7 +1157,7 @@ class TestAsyncAct:
         behaviour._update_bets = mock_update_bets  # type: ignore[method-assign]
         behaviour.update_bets_investments = _noop_gen  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign, no-untyped-def]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash123")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=_return_gen("hash123"))  # type: ignore[method-assign]
         behaviour.send_a2a_transaction = _noop_gen  # type: ignore[method-assign]
         behaviour.wait_until_round_end = _noop_gen  # type: ignore[method-assign]
         behaviour.set_done = MagicMock()  # type: ignore[method-assign]
@@ -1045,7 +1193,7 @@ class TestAsyncAct:
         behaviour._update_bets = _noop_gen  # type: ignore[method-assign]
         behaviour.update_bets_investments = _noop_gen  # type: ignore[assignment, method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash123")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=_return_gen("hash123"))  # type: ignore[method-assign]
         behaviour.send_a2a_transaction = _noop_gen  # type: ignore[method-assign]
         behaviour.wait_until_round_end = _noop_gen  # type: ignore[method-assign]
         behaviour.set_done = MagicMock()  # type: ignore[method-assign]
@@ -1095,7 +1243,7 @@ class TestAsyncAct:
         behaviour._update_bets = mock_update_bets  # type: ignore[assignment, method-assign]
         behaviour.update_bets_investments = _noop_gen  # type: ignore[method-assign]
         behaviour.store_bets = MagicMock()  # type: ignore[method-assign, no-untyped-def]
-        behaviour.hash_stored_bets = MagicMock(return_value="hash123")  # type: ignore[method-assign]
+        behaviour.hash_stored_bets = MagicMock(side_effect=_return_gen("hash123"))  # type: ignore[method-assign]
         behaviour.send_a2a_transaction = _noop_gen  # type: ignore[method-assign]
         behaviour.wait_until_round_end = _noop_gen  # type: ignore[method-assign]
         behaviour.set_done = MagicMock()  # type: ignore[method-assign]
@@ -1107,3 +1255,30 @@ class TestAsyncAct:
         # After _requeue_bets_for_selling, then _bet_freshness_check_and_update  # type: ignore[method-assign]
         # moves FRESH to TO_PROCESS (single-bet mode)
         assert bet.queue_status == QueueStatus.TO_PROCESS
+
+    @pytest.mark.parametrize("flushed", (True, False))
+    def test_cursors_are_stored_after_the_bets(self, flushed: bool) -> None:
+        """Test that the cursors are only stored once the discovered bets have been written."""
+        behaviour = _make_behaviour(bets=[])
+
+        mock_benchmark = MagicMock()
+        behaviour.context.benchmark_tool = mock_benchmark
+
+        mock_sync_data = MagicMock()
+        mock_sync_data.review_bets_for_selling = False
+        type(behaviour).synchronized_data = property(lambda self: mock_sync_data)  # type: ignore[assignment, method-assign]
+
+        behaviour._update_bets = _noop_gen  # type: ignore[method-assign]
+        behaviour.update_bets_investments = _noop_gen  # type: ignore[method-assign]
+        behaviour.store_bets = MagicMock()  # type: ignore[method-assign]
+        behaviour._flush_bets = MagicMock(return_value=flushed)  # type: ignore[method-assign]
+        behaviour._store_markets_cursors = MagicMock()  # type: ignore[method-assign]
+        behaviour.send_a2a_transaction = _noop_gen  # type: ignore[method-assign]
+        behaviour.wait_until_round_end = _noop_gen  # type: ignore[method-assign]
+        behaviour.set_done = MagicMock()  # type: ignore[method-assign]
+        behaviour.context.agent_address = "0xagent"
+
+        self._run_generator(behaviour.async_act())
+
+        behaviour._flush_bets.assert_called_once()  # type: ignore[attr-defined]
+        assert behaviour._store_markets_cursors.called is flushed  # type: ignore[attr-defined]
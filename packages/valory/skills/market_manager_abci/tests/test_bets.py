@@ -27,6 +27,7 @@ import pytest
 
 from packages.valory.skills.market_manager_abci.bets import (
     Bet,
+    BetsCollection,
     BetsDecoder,
     BetsEncoder,
     BinaryOutcome,
@@ -748,6 +749,34 @@ class TestBetSetProcessedSellCheck:
         assert bet.last_processed_sell_check == 123456  # type: ignore[attr-defined]
 
 
+class TestBetCopy:
+    """Tests for Bet.copy."""
+
+    def test_copy(self) -> None:
+        """Test that a copy equals the bet, including its in-memory attributes."""
+        bet = _make_bet(investments={"Yes": [100], "No": []}, strategy_vote=0)
+        bet.set_processed_sell_check(123456)
+
+        copied = bet.copy()
+
+        assert copied == bet
+        assert copied.__dict__ == bet.__dict__
+
+    def test_copy_does_not_share_mutable_state(self) -> None:
+        """Test that changing the copy in place, including its nested fields, does not affect the bet."""
+        bet = _make_bet(investments={"Yes": [100], "No": []}, strategy_vote=0)
+        original = _make_bet(investments={"Yes": [100], "No": []}, strategy_vote=0)
+
+        copied = bet.copy()
+        copied.append_investment_amount(0, 200)
+        copied.outcomeTokenAmounts.append(30)
+        copied.prediction_response.p_yes = 0.9
+        copied.scaledLiquidityMeasure = 9.0
+
+        assert bet == original
+        assert copied != original
+
+
 class TestBetRebetAllowed:
     """Tests for Bet.rebet_allowed."""
 
@@ -1409,3 +1438,96 @@ class TestBetToRequestContext:
         serialized = json.dumps(ctx)
         deserialized = json.loads(serialized)
         assert deserialized == ctx
+
+
+# ===========================================================================
+# 11. BetsCollection
+# ===========================================================================
+
+
+class TestBetsCollection:
+    """Tests for the BetsCollection."""
+
+    def test_behaves_like_a_list(self) -> None:
+        """Test that the collection keeps ordering and serializes like a list."""
+        bets = [_make_bet(id="a"), _make_bet(id="b")]
+        collection = BetsCollection(bets)
+        assert isinstance(collection, list)
+        assert list(collection) == bets
+        assert collection[1].id == "b"
+        assert serialize_bets(collection) == serialize_bets(bets)
+
+    def test_get_idx(self) -> None:
+        """Test looking up bets by id."""
+        collection = BetsCollection([_make_bet(id="a"), _make_bet(id="b")])
+        assert collection.get_idx("b") == 1
+        assert collection.get_idx("missing") is None
+        assert collection.get("a") is collection[0]
+        assert collection.get("missing") is None
+
+    def test_duplicate_ids_resolve_to_first(self) -> None:
+        """Test that duplicated ids resolve to their first occurrence, as a linear scan would."""
+        collection = BetsCollection([_make_bet(id="a"), _make_bet(id="a")])
+        assert collection.get_idx("a") == 0
+
+    def test_get_by_condition_id(self) -> None:
+        """Test looking up bets by condition id."""
+        collection = BetsCollection(
+            [_make_bet(id="a", condition_id="0xc1"), _make_bet(id="b")]
+        )
+        assert collection.get_by_condition_id("0xc1") is collection[0]
+        assert collection.get_by_condition_id("0xc2") is None
+
+    def test_append_updates_index(self) -> None:
+        """Test that appending keeps the index in sync."""
+        collection = BetsCollection([_make_bet(id="a")])
+        assert collection.get_idx("a") == 0
+        collection.append(_make_bet(id="b"))
+        collection += [_make_bet(id="c")]
+        assert collection.get_idx("b") == 1
+        assert collection.get_idx("c") == 2
+
+    @pytest.mark.parametrize(
+        "mutate",
+        (
+            lambda c: c.remove(c[0]),
+            lambda c: c.pop(0),
+            lambda c: c.insert(0, _make_bet(id="z")),
+            lambda c: c.reverse(),
+            lambda c: c.sort(key=lambda bet: bet.id, reverse=True),
+            lambda c: c.__delitem__(0),
+        ),
+    )
+    def test_mutations_invalidate_index(self, mutate: Any) -> None:
+        """Test that structural mutations keep lookups consistent with positions."""
+        collection = BetsCollection([_make_bet(id="a"), _make_bet(id="b")])
+        assert collection.get_idx("b") == 1
+        mutate(collection)
+        for idx, bet in enumerate(collection):
+            assert collection.get_idx(bet.id) == idx
+
+    def test_clear(self) -> None:
+        """Test that clearing empties the index."""
+        collection = BetsCollection([_make_bet(id="a")])
+        assert collection.get_idx("a") == 0
+        collection.clear()
+        assert collection.get_idx("a") is None
+
+    def test_merge(self) -> None:
+        """Test merging new and existing bets."""
+        collection = BetsCollection([_make_bet(id="a", scaledLiquidityMeasure=5.0)])
+        updated = collection.merge(_make_bet(id="a", scaledLiquidityMeasure=7.0))
+        assert updated is collection[0]
+        assert collection[0].scaledLiquidityMeasure == 7.0
+        assert collection.merge(_make_bet(id="b")) is None
+        assert [bet.id for bet in collection] == ["a", "b"]
+
+    def test_queue_status_lookups(self) -> None:
+        """Test grouping and filtering by queue status."""
+        fresh = _make_bet(id="a")
+        processed = _make_bet(id="b", queue_status=QueueStatus.PROCESSED)
+        collection = BetsCollection([fresh, processed])
+        grouped = collection.by_queue_status()
+        assert grouped[QueueStatus.FRESH] == [fresh]
+        assert grouped[QueueStatus.PROCESSED] == [processed]
+        assert collection.with_queue_status(QueueStatus.PROCESSED) == [processed]
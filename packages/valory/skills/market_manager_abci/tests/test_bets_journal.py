@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the bets journal of the MarketManager ABCI application."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from packages.valory.skills.market_manager_abci import bets_journal
+from packages.valory.skills.market_manager_abci.bets import (
+    Bet,
+    BetsDecoder,
+    BetsEncoder,
+    serialize_bets,
+)
+from packages.valory.skills.market_manager_abci.bets_journal import (
+    BetsJournal,
+    JOURNAL_SUFFIX,
+    load_raw_bets,
+)
+
+
+def _make_bet(bet_id: str, **overrides: Any) -> Bet:
+    """Create a valid binary bet."""
+    defaults: Dict[str, Any] = dict(
+        id=bet_id,
+        market="omen_subgraph",
+        title="Will it rain tomorrow?",
+        collateralToken="0xtoken",
+        creator="0xcreator",
+        fee=0,
+        openingTimestamp=1700000000,
+        outcomeSlotCount=2,
+        outcomeTokenAmounts=[10, 20],
+        outcomeTokenMarginalPrices=[0.4, 0.6],
+        outcomes=["Yes", "No"],
+        scaledLiquidityMeasure=5.0,
+    )
+    defaults.update(overrides)
+    return Bet(**defaults)
+
+
+def _journal_lines(journal: BetsJournal) -> List[str]:
+    """Read the lines of the journal file."""
+    if not os.path.isfile(journal.journal_path):
+        return []
+    with open(journal.journal_path) as journal_file:
+        return journal_file.read().splitlines()
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> str:
+    """Get the path of the snapshot."""
+    return str(tmp_path / "multi_bets.json")
+
+
+class TestBetsJournal:
+    """Tests for the BetsJournal."""
+
+    def test_first_store_writes_snapshot(self, snapshot_path: str) -> None:
+        """Test that the first store writes a snapshot in the `multi_bets.json` format."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+
+        journal.store(bets)
+
+        with open(snapshot_path) as snapshot_file:
+            assert snapshot_file.read() == serialize_bets(bets)
+        assert not os.path.isfile(snapshot_path + JOURNAL_SUFFIX)
+
+    def test_store_appends_only_changed_bets(self, snapshot_path: str) -> None:
+        """Test that subsequent stores journal only the changed bets."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+        journal.store(bets)
+
+        bets[1].scaledLiquidityMeasure = 9.0
+        journal.store(bets)
+
+        lines = _journal_lines(journal)
+        assert len(lines) == 2
+        record = json.loads(lines[1])
+        assert record["size"] == 2
+        assert list(record["updates"]) == ["1"]
+        assert journal.n_journaled == 1
+
+        # storing the same state again does not touch the journal
+        journal.store(bets)
+        assert len(_journal_lines(journal)) == 2
+
+    def test_store_serializes_only_the_given_positions(
+        self, snapshot_path: str
+    ) -> None:
+        """Test that the known changed positions and the appended bets are the only ones journaled."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b"), _make_bet("c")]
+        journal.store(bets)
+
+        bets[0].scaledLiquidityMeasure = 8.0
+        bets[1].scaledLiquidityMeasure = 9.0
+        bets.append(_make_bet("d"))
+        journal.store(bets, changed={1})
+
+        record = json.loads(_journal_lines(journal)[1])
+        assert record["size"] == 4
+        assert list(record["updates"]) == ["1", "3"]
+        loaded = BetsJournal(snapshot_path).load()
+        assert loaded[0].scaledLiquidityMeasure == 5.0
+        assert loaded[1:] == bets[1:]
+
+    def test_load_replays_journal(self, snapshot_path: str) -> None:
+        """Test that loading applies the journaled changes on top of the snapshot."""
+        writer = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+        writer.store(bets)
+        bets[0].scaledLiquidityMeasure = 3.0
+        bets.append(_make_bet("c"))
+        writer.store(bets)
+
+        reader = BetsJournal(snapshot_path)
+        loaded = reader.load()
+
+        assert loaded == bets
+        assert reader.content_hash == writer.content_hash
+        assert reader.n_journaled == 2
+
+    def test_load_handles_shrinking(self, snapshot_path: str) -> None:
+        """Test that a journaled shrink truncates the loaded bets."""
+        writer = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+        writer.store(bets)
+        writer.store(bets[:1])
+
+        assert BetsJournal(snapshot_path).load() == bets[:1]
+
+    def test_compaction(self, snapshot_path: str) -> None:
+        """Test that the journal is folded into the snapshot once it grows large enough."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a")]
+        with patch.object(bets_journal, "MIN_COMPACTION_RECORDS", 2):
+            journal.store(bets)
+            bets[0].scaledLiquidityMeasure = 1.0
+            journal.store(bets)
+            bets[0].scaledLiquidityMeasure = 2.0
+            journal.store(bets)
+            assert journal.n_journaled == 2
+            bets[0].scaledLiquidityMeasure = 3.0
+            journal.store(bets)
+
+        assert journal.n_journaled == 0
+        assert not os.path.isfile(journal.journal_path)
+        with open(snapshot_path) as snapshot_file:
+            assert json.load(snapshot_file, cls=BetsDecoder) == bets
+
+    def test_stale_journal_is_ignored(self, snapshot_path: str) -> None:
+        """Test that a journal which belongs to another snapshot is not replayed."""
+        writer = BetsJournal(snapshot_path)
+        bets = [_make_bet("a")]
+        writer.store(bets)
+        bets[0].scaledLiquidityMeasure = 8.0
+        writer.store(bets)
+
+        # simulate a compaction interrupted after the snapshot was replaced
+        with open(snapshot_path, "w") as snapshot_file:
+            snapshot_file.write(serialize_bets([_make_bet("z")]))
+
+        reader = BetsJournal(snapshot_path)
+        assert [bet.id for bet in reader.load()] == ["z"]
+
+        # the next store rewrites the snapshot and drops the stale journal
+        reader.store([_make_bet("z")])
+        assert not os.path.isfile(reader.journal_path)
+
+    def test_truncated_journal_line(self, snapshot_path: str) -> None:
+        """Test that a truncated trailing record stops the replay and forces a compaction."""
+        writer = BetsJournal(snapshot_path)
+        bets = [_make_bet("a")]
+        writer.store(bets)
+        bets[0].scaledLiquidityMeasure = 8.0
+        writer.store(bets)
+        with open(writer.journal_path, "a") as journal_file:
+            journal_file.write('{"size": 1, "upd')
+
+        reader = BetsJournal(snapshot_path)
+        loaded = reader.load()
+        assert loaded == bets
+
+        reader.store(loaded)
+        assert not os.path.isfile(reader.journal_path)
+        assert BetsJournal(snapshot_path).load() == bets
+
+    def test_content_hash_is_order_aware(self, snapshot_path: str) -> None:
+        """Test that the content hash depends on the bets and their order."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+        journal.store(bets)
+        first_hash = journal.content_hash
+
+        journal.store(list(reversed(bets)))
+        assert journal.content_hash != first_hash
+
+        journal.store(bets)
+        assert journal.content_hash == first_hash
+
+    def test_content_hash_is_unknown_after_a_failed_store(
+        self, snapshot_path: str
+    ) -> None:
+        """Test that there is no content hash while the persisted state is unknown."""
+        journal = BetsJournal(snapshot_path)
+        assert not journal.persisted
+        assert journal.content_hash is None
+
+        bets = [_make_bet("a")]
+        journal.store(bets)
+        assert journal.persisted
+        assert journal.content_hash is not None
+
+        bets[0].scaledLiquidityMeasure = 8.0
+        with patch("builtins.open", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                journal.store(bets)
+        assert not journal.persisted
+        assert journal.content_hash is None
+
+    def test_load_raw_bets_replays_journal(self, snapshot_path: str) -> None:
+        """Test that the raw bets include the journaled changes that the snapshot misses."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a"), _make_bet("b")]
+        journal.store(bets)
+        bets[1].scaledLiquidityMeasure = 3.0
+        del bets[0]
+        journal.store(bets)
+        assert os.path.isfile(journal.journal_path)
+
+        raw_bets = load_raw_bets(snapshot_path)
+
+        assert raw_bets == json.loads(json.dumps(bets, cls=BetsEncoder))
+
+    def test_failed_store_forces_compaction(self, snapshot_path: str) -> None:
+        """Test that a failed write makes the next store rewrite the snapshot."""
+        journal = BetsJournal(snapshot_path)
+        bets = [_make_bet("a")]
+        journal.store(bets)
+
+        bets[0].scaledLiquidityMeasure = 8.0
+        with patch("builtins.open", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                journal.store(bets)
+
+        journal.store(bets)
+        assert not os.path.isfile(journal.journal_path)
+        assert BetsJournal(snapshot_path).load() == bets
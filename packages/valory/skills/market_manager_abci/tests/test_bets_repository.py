@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the bets repository of the MarketManager ABCI application."""
+
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from packages.valory.skills.market_manager_abci.bets import Bet, BetsCollection
+from packages.valory.skills.market_manager_abci.bets_journal import BetsJournal
+from packages.valory.skills.market_manager_abci.bets_repository import BetsRepository
+
+
+def _make_bet(bet_id: str, **overrides: Any) -> Bet:
+    """Create a valid binary bet."""
+    defaults: Dict[str, Any] = dict(
+        id=bet_id,
+        market="omen_subgraph",
+        title="Will it rain tomorrow?",
+        collateralToken="0xtoken",
+        creator="0xcreator",
+        fee=0,
+        openingTimestamp=1700000000,
+        outcomeSlotCount=2,
+        outcomeTokenAmounts=[10, 20],
+        outcomeTokenMarginalPrices=[0.4, 0.6],
+        outcomes=["Yes", "No"],
+        scaledLiquidityMeasure=5.0,
+    )
+    defaults.update(overrides)
+    return Bet(**defaults)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> BetsRepository:
+    """Get a repository bound to a temporary store."""
+    bets_repository = BetsRepository()
+    bets_repository.bind(str(tmp_path / "multi_bets.json"))
+    return bets_repository
+
+
+class TestBetsRepository:
+    """Tests for the BetsRepository."""
+
+    def test_bind(self, tmp_path: Path) -> None:
+        """Test that the repository is reset only when it is bound to a different store."""
+        repository = BetsRepository()
+        journal = repository.bind(str(tmp_path / "multi_bets.json"))
+        repository.reset([_make_bet("a")])
+
+        assert repository.bind(str(tmp_path / "multi_bets.json")) is journal
+        assert repository.loaded
+
+        other = repository.bind(str(tmp_path / "other.json"))
+        assert other is not journal
+        assert not repository.loaded
+        assert repository.bets == []
+
+    def test_reset(self, repository: BetsRepository) -> None:
+        """Test that the loaded bets are handed out, while the repository keeps a copy of them."""
+        bets = [_make_bet("a"), _make_bet("b")]
+
+        result = repository.reset(bets)
+
+        assert isinstance(result, BetsCollection)
+        assert result == bets == repository.bets
+        assert not any(bet is kept for bet, kept in zip(bets, repository.bets))
+        assert result.get_idx("b") == 1
+        assert repository.loaded
+        assert not repository.pending_flush
+
+    def test_checkout_discards_uncommitted_changes(
+        self, repository: BetsRepository
+    ) -> None:
+        """Test that checking out discards the uncommitted changes, including the in-place ones."""
+        bets = repository.reset(
+            [_make_bet("a", investments={"Yes": [100], "No": []}), _make_bet("b")]
+        )
+        first, second = bets
+
+        first.scaledLiquidityMeasure = 9.0
+        first.investments["Yes"].append(200)
+        first.prediction_response.p_yes = 0.9
+        bets.append(_make_bet("c"))
+        bets.pop(1)
+        second.queue_status = second.queue_status.next_status()
+        checked_out = repository.checkout()
+
+        assert checked_out == [
+            _make_bet("a", investments={"Yes": [100], "No": []}),
+            _make_bet("b"),
+        ]
+        assert checked_out.get_idx("c") is None
+
+    def test_checkout_is_a_copy(self, repository: BetsRepository) -> None:
+        """Test that every checkout is an independent copy of the committed bets."""
+        repository.reset([_make_bet("a")])
+
+        first = repository.checkout()
+        second = repository.checkout()
+        first[0].outcomeTokenAmounts.append(30)
+
+        assert first[0] is not second[0]
+        assert second == [_make_bet("a")]
+
+    def test_commit_tracks_the_changed_positions(
+        self, repository: BetsRepository
+    ) -> None:
+        """Test that only the changed, replaced and appended bets are flushed."""
+        bets = repository.reset([_make_bet("a"), _make_bet("b"), _make_bet("c")])
+
+        bets[0].scaledLiquidityMeasure = 9.0
+        bets[2] = _make_bet("d")
+        bets.append(_make_bet("e"))
+        repository.commit(bets)
+
+        assert repository.pending_flush
+        with patch.object(BetsJournal, "store", autospec=True) as store:
+            repository.flush()
+        store.assert_called_once_with(repository.journal, bets, {0, 2, 3})
+        assert not repository.pending_flush
+
+        # the committed changes survive a checkout, while the later changes of the committed bets do not
+        bets[0].scaledLiquidityMeasure = 10.0
+        bets[3].investments["Yes"].append(100)
+        assert repository.checkout() == [
+            _make_bet("a", scaledLiquidityMeasure=9.0),
+            _make_bet("b"),
+            _make_bet("d"),
+            _make_bet("e"),
+        ]
+
+    def test_commit_tracks_the_in_place_changes(
+        self, repository: BetsRepository
+    ) -> None:
+        """Test that the in-place changes of the nested fields and the in-memory attributes are committed."""
+        bets = repository.reset([_make_bet("a"), _make_bet("b"), _make_bet("c")])
+
+        bets[0].investments["Yes"].append(100)
+        bets[1].prediction_response.p_yes = 0.9
+        bets[2].set_processed_sell_check(123456)
+        repository.commit(bets)
+
+        with patch.object(BetsJournal, "store", autospec=True) as store:
+            repository.flush()
+        store.assert_called_once_with(repository.journal, bets, {0, 1, 2})
+        checked_out = repository.checkout()
+        assert checked_out == bets
+        assert checked_out[2].last_processed_sell_check == 123456  # type: ignore[attr-defined]
+
+    def test_commit_without_changes(self, repository: BetsRepository) -> None:
+        """Test that committing unchanged bets does not require a flush."""
+        bets = repository.reset([_make_bet("a")])
+
+        repository.commit(bets)
+
+        assert not repository.pending_flush
+
+    def test_commit_shrinking(self, repository: BetsRepository) -> None:
+        """Test that removing bets requires a flush."""
+        bets = repository.reset([_make_bet("a"), _make_bet("b")])
+
+        repository.commit(bets[:1])
+
+        assert repository.pending_flush
+        assert repository.checkout() == [_make_bet("a")]
+
+    def test_flush_persists_the_committed_bets(
+        self, repository: BetsRepository
+    ) -> None:
+        """Test that several commits result in a single, loadable write."""
+        repository.commit([_make_bet("a")])
+        bets = repository.checkout()
+        bets[0].scaledLiquidityMeasure = 9.0
+        repository.commit(bets)
+
+        repository.flush()
+
+        assert repository.journal is not None
+        loaded = BetsJournal(repository.journal.snapshot_path).load()
+        assert loaded == [_make_bet("a", scaledLiquidityMeasure=9.0)]
+
+    def test_failed_flush(self, repository: BetsRepository) -> None:
+        """Test that a failed flush keeps the changes pending and rewrites everything on the next one."""
+        bets = repository.reset([_make_bet("a"), _make_bet("b")])
+        bets[1].scaledLiquidityMeasure = 9.0
+        repository.commit(bets)
+
+        with patch.object(BetsJournal, "store", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                repository.flush()
+        assert repository.pending_flush
+
+        with patch.object(BetsJournal, "store", autospec=True) as store:
+            repository.flush()
+        store.assert_called_once_with(repository.journal, bets, None)
+        assert not repository.pending_flush
@@ -29,6 +29,7 @@ from packages.valory.skills.market_manager_abci.graph_tooling.queries.network im
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.omen import (
     questions,
+    questions_market_info,
 )
 from packages.valory.skills.market_manager_abci.graph_tooling.queries.omen import (
     trades as omen_trades,
@@ -117,11 +118,16 @@ class TestOmenQueries:
             slot_count=2,
             opening_threshold=1700000000,
             languages='["en"]',
+            creationTimestamp_gte=1600000000,
+            first=1000,
         )
         assert '["0xabc", "0xdef"]' in result
         assert "2" in result
         assert "1700000000" in result
         assert '["en"]' in result
+        assert "creationTimestamp_gte: 1600000000" in result
+        assert "first: 1000" in result
+        assert "orderDirection: asc" in result
 
     def test_questions_contains_expected_fields(self) -> None:
         """Test that the questions template contains expected GraphQL fields."""
@@ -130,8 +136,11 @@ class TestOmenQueries:
             slot_count=2,
             opening_threshold=0,
             languages="[]",
+            creationTimestamp_gte=0,
+            first=1000,
         )
         assert "fixedProductMarketMakers" in result
+        assert "creationTimestamp\n" in result
         assert "title" in result
         assert "collateralToken" in result
         assert "outcomeSlotCount" in result
@@ -140,6 +149,24 @@ class TestOmenQueries:
         assert "outcomes" in result
         assert "scaledLiquidityMeasure" in result
 
+    def test_questions_market_info_substitution(self) -> None:
+        """Test that the market information query only requests the volatile fields of the given ids."""
+        result = questions_market_info.substitute(
+            ids='["0x1", "0x2"]',
+            creators='["0xabc"]',
+            slot_count=2,
+            opening_threshold=1700000000,
+            languages='["en"]',
+            first=2,
+        )
+        assert 'id_in: ["0x1", "0x2"]' in result
+        assert "first: 2" in result
+        assert "outcomeTokenAmounts" in result
+        assert "outcomeTokenMarginalPrices" in result
+        assert "scaledLiquidityMeasure" in result
+        assert "title" not in result
+        assert "outcomes\n" not in result
+
     def test_omen_trades_is_template(self) -> None:
         """Test that omen trades is a Template instance."""
         assert isinstance(omen_trades, Template)
@@ -26,6 +26,7 @@ from unittest.mock import MagicMock, patch
 from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
     FetchStatus,
     MAX_LOG_SIZE,
+    QUERY_BATCH_SIZE,
     QUESTION_DATA_SEPARATOR,
     QueryingBehaviour,
     _MAX_SLEEP_TIME,
@@ -477,6 +478,37 @@ class TestHandleResponse:
 # ---------------------------------------------------------------------------
 
 
+def _make_omen_behaviour(responses: Any) -> Any:
+    """Create a behaviour whose subgraph returns the given responses, recording the queries."""
+    b = _make_behaviour()
+    b._current_creators = ["0xcreator1"]
+    b._current_market = "omen_subgraph"
+
+    mock_sg = MagicMock()
+    mock_sg.get_spec.return_value = {}
+    process_returns = iter(responses)
+    mock_sg.process_response.side_effect = lambda _: next(process_returns)
+    mock_sg.is_retries_exceeded.return_value = False
+    mock_sg.retries_info.suggested_sleep_time = 1.0
+    b.context.omen_subgraph = mock_sg
+
+    mock_ts = MagicMock()
+    mock_ts.timestamp.return_value = 1700000000.0
+    b.context.state.round_sequence.last_round_transition_timestamp = mock_ts
+
+    queries = []
+
+    def mock_get_http_response(content: bytes, **kwargs: Any) -> Any:
+        """Record the query."""
+        queries.append(json.loads(content)["query"])
+        yield
+        return MagicMock()
+
+    b.get_http_response = mock_get_http_response  # type: ignore[method-assign]
+    b.sleep = _noop_gen  # type: ignore[method-assign]
+    return b, queries
+
+
 class TestFetchBets:
     """Tests for the _fetch_bets generator."""
 
@@ -534,6 +566,89 @@ class TestFetchBets:
 
         assert result is None
 
+    def test_fetch_bets_paginates_after_cursor(self) -> None:
+        """The questions created after the given timestamp are fetched in batches, past a single batch's size."""
+        full_batch = [
+            {"id": f"bet{i}", "creationTimestamp": str(100 + i)}
+            for i in range(QUERY_BATCH_SIZE)
+        ]
+        last_batch = [{"id": "last", "creationTimestamp": "5000"}]
+        b, queries = _make_omen_behaviour([full_batch, last_batch])
+
+        result = _exhaust(b._fetch_bets(50))
+
+        assert result == full_batch + last_batch
+        assert len(queries) == 2
+        assert "creationTimestamp_gte: 51" in queries[0]
+        assert f"creationTimestamp_gte: {100 + QUERY_BATCH_SIZE - 1}" in queries[1]
+
+    def test_fetch_bets_paginates_over_a_shared_timestamp(self) -> None:
+        """The questions which share the creation timestamp of a batch's last one are neither skipped nor repeated."""
+        full_batch = [
+            {"id": f"bet{i}", "creationTimestamp": str(min(100 + i, 500))}
+            for i in range(QUERY_BATCH_SIZE)
+        ]
+        shared = [bet for bet in full_batch if bet["creationTimestamp"] == "500"]
+        remaining = [
+            {"id": "shared", "creationTimestamp": "500"},
+            {"id": "last", "creationTimestamp": "600"},
+        ]
+        b, queries = _make_omen_behaviour([full_batch, shared + remaining])
+
+        result = _exhaust(b._fetch_bets())
+
+        assert result == full_batch + remaining
+        assert "creationTimestamp_gte: 500" in queries[1]
+
+    def test_fetch_bets_single_timestamp_overflow_fails(self) -> None:
+        """A full batch of questions which have all been fetched already makes the fetch fail, instead of looping."""
+        full_batch = [
+            {"id": f"bet{i}", "creationTimestamp": "500"}
+            for i in range(QUERY_BATCH_SIZE)
+        ]
+        b, queries = _make_omen_behaviour([full_batch, full_batch])
+
+        assert _exhaust(b._fetch_bets()) is None
+        assert len(queries) == 2
+
+    def test_fetch_bets_partial_failure_returns_none(self) -> None:
+        """A failed batch makes the whole fetch fail, so that the cursor is not advanced past missing questions."""
+        full_batch = [
+            {"id": f"bet{i}", "creationTimestamp": str(i)}
+            for i in range(QUERY_BATCH_SIZE)
+        ]
+        b, _ = _make_omen_behaviour([full_batch, None])
+
+        assert _exhaust(b._fetch_bets()) is None
+
+
+class TestFetchBetsMarketInfo:
+    """Tests for the _fetch_bets_market_info generator."""
+
+    def test_no_ids_no_requests(self) -> None:
+        """Without any ids, nothing is requested and the fetch status is untouched."""
+        b = _make_behaviour()
+        b._fetch_status = FetchStatus.SUCCESS
+        b.get_http_response = MagicMock()  # type: ignore[method-assign]
+
+        assert _exhaust(b._fetch_bets_market_info([])) == []
+        b.get_http_response.assert_not_called()
+        assert b._fetch_status == FetchStatus.SUCCESS
+
+    def test_ids_are_batched(self) -> None:
+        """The ids are requested in batches of `QUERY_BATCH_SIZE`."""
+        ids = [f"0x{i}" for i in range(QUERY_BATCH_SIZE + 1)]
+        first = [{"id": "0x0", "scaledLiquidityMeasure": "1"}]
+        second = [{"id": ids[-1], "scaledLiquidityMeasure": "2"}]
+        b, queries = _make_omen_behaviour([first, second])
+
+        result = _exhaust(b._fetch_bets_market_info(ids))
+
+        assert result == first + second
+        assert len(queries) == 2
+        assert f'id_in: ["{ids[-1]}"]' in queries[1]
+        assert b._fetch_status == FetchStatus.SUCCESS
+
 
 # ---------------------------------------------------------------------------
 # _fetch_redeem_info tests
@@ -597,6 +712,30 @@ class TestFetchRedeemInfo:
 
         assert result == batch1 + batch2
 
+    def test_multiple_batches_are_streamed(self) -> None:
+        """Each batch is handed to the processing function instead of being collected."""
+        b, mock_sg = self._setup_behaviour()
+        batch1 = [{"fpmm": {"creationTimestamp": "100"}}]
+        batch2 = [{"fpmm": {"creationTimestamp": "200"}}]
+
+        process_returns = iter([batch1, batch2, []])
+        mock_raw = MagicMock()
+        b.get_http_response = _return_gen(mock_raw)  # type: ignore[method-assign]
+        mock_sg.process_response.side_effect = lambda _: next(process_returns)
+
+        processed = []
+
+        def process_chunk(chunk: Any) -> Any:
+            """Record the processed chunk."""
+            processed.append(chunk)
+            yield
+
+        gen = b._fetch_redeem_info(process_chunk)
+        result = _exhaust(gen)
+
+        assert result == []
+        assert processed == [batch1, batch2]
+
     def test_none_response_returns_partial(self) -> None:
         """When process_response returns None, returns what was collected."""
         b, mock_sg = self._setup_behaviour()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the cursors of the markets' discovery."""
+
+from pathlib import Path
+
+import pytest
+
+from packages.valory.skills.market_manager_abci.markets_cursors import (
+    MARKETS_CURSORS_FILENAME,
+    MarketsCursors,
+    markets_scope,
+)
+
+SCOPE = markets_scope("omen_subgraph", ["0xA", "0xb"], 2, 100, ["en_US"])
+
+
+@pytest.fixture
+def cursors(tmp_path: Path) -> MarketsCursors:
+    """Get empty cursors."""
+    return MarketsCursors(str(tmp_path / MARKETS_CURSORS_FILENAME))
+
+
+def test_scope_depends_on_filters() -> None:
+    """Test that the scope is independent of the creators' order and casing, but depends on the filters."""
+    assert SCOPE == markets_scope("omen_subgraph", ["0xB", "0xa"], 2, 100, ["en_US"])
+    assert SCOPE != markets_scope("omen_subgraph", ["0xa"], 2, 100, ["en_US"])
+    assert SCOPE != markets_scope("omen_subgraph", ["0xa", "0xb"], 2, 50, ["en_US"])
+    assert SCOPE != markets_scope("other", ["0xa", "0xb"], 2, 100, ["en_US"])
+
+
+def test_advance(cursors: MarketsCursors) -> None:
+    """Test that a cursor only advances to the newest valid creation timestamp."""
+    assert cursors.get(SCOPE) == 0
+
+    cursors.advance(
+        SCOPE,
+        [
+            {"creationTimestamp": "200"},
+            {"creationTimestamp": "100"},
+            {"creationTimestamp": None},
+            {},
+        ],
+    )
+    assert cursors.get(SCOPE) == 200
+
+    cursors.advance(SCOPE, [{"creationTimestamp": "150"}])
+    assert cursors.get(SCOPE) == 200
+
+
+def test_store_and_load_roundtrip(cursors: MarketsCursors) -> None:
+    """Test that stored cursors are loaded back."""
+    assert cursors.load() is False
+
+    cursors.advance(SCOPE, [{"creationTimestamp": "300"}])
+    cursors.store()
+
+    loaded = MarketsCursors(cursors.path)
+    assert loaded.load() is True
+    assert loaded.cursors == {SCOPE: 300}
+
+
+@pytest.mark.parametrize("content", ["{", "[]", '{"scope": "x"}'])
+def test_malformed_cursors(cursors: MarketsCursors, content: str) -> None:
+    """Test that malformed cursors raise."""
+    Path(cursors.path).write_text(content)
+
+    with pytest.raises((ValueError, TypeError)):
+        cursors.load()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the Polymarket trades ledger of the MarketManager ABCI application."""
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from packages.valory.skills.market_manager_abci.trades_ledger import (
+    TRADES_LEDGER_FILENAME,
+    TRADES_SYNC_LOOKBACK,
+    USDC_DECIMALS,
+    TradesLedger,
+    trade_key,
+    trade_timestamp,
+    to_base_units,
+)
+
+
+def _make_trade(tx_hash: str, timestamp: Any, **overrides: Any) -> Dict[str, Any]:
+    """Create a Data API trade."""
+    trade: Dict[str, Any] = dict(
+        transactionHash=tx_hash,
+        conditionId="0xcond",
+        outcomeIndex=0,
+        side="BUY",
+        size="10",
+        price="0.5",
+        timestamp=timestamp,
+    )
+    trade.update(overrides)
+    return trade
+
+
+@pytest.fixture
+def ledger_path(tmp_path: Path) -> str:
+    """Get the path of the ledger."""
+    return str(tmp_path / TRADES_LEDGER_FILENAME)
+
+
+class TestTradeHelpers:
+    """Tests for the trade helpers."""
+
+    def test_trade_key_distinguishes_fills(self) -> None:
+        """Test that fills of the same transaction on different outcomes get different keys."""
+        first = _make_trade("0x1", 1)
+        second = _make_trade("0x1", 1, outcomeIndex=1)
+        assert trade_key(first) == trade_key(dict(first))
+        assert trade_key(first) != trade_key(second)
+
+    @pytest.mark.parametrize(
+        "timestamp, expected", [(5, 5), ("5", 5), (None, None), ("x", None)]
+    )
+    def test_trade_timestamp(self, timestamp: Any, expected: Any) -> None:
+        """Test parsing the timestamp of a trade."""
+        assert trade_timestamp(_make_trade("0x1", timestamp)) == expected
+
+    def test_missing_timestamp(self) -> None:
+        """Test that a trade without a timestamp has none."""
+        assert trade_timestamp({}) is None
+
+
+class TestTradesLedger:
+    """Tests for the TradesLedger."""
+
+    def test_empty_ledger_requests_full_sync(self, ledger_path: str) -> None:
+        """Test that a missing ledger loads nothing and asks for a full sync."""
+        ledger = TradesLedger(ledger_path)
+        assert ledger.load() is False
+        assert ledger.since_timestamp is None
+
+    def test_record_skips_seen_and_invalid_trades(self, ledger_path: str) -> None:
+        """Test that the already recorded trades and the ones without a timestamp are skipped."""
+        ledger = TradesLedger(ledger_path)
+        first = _make_trade("0x1", 1000)
+
+        assert ledger.record([first, _make_trade("0x2", None)]) == [first]
+        second = _make_trade("0x3", 2000)
+        assert ledger.record([second, dict(first)]) == [second]
+        assert ledger.cursor == 2000
+        assert ledger.since_timestamp == max(2000 - TRADES_SYNC_LOOKBACK, 0)
+
+    def test_record_prunes_old_keys(self, ledger_path: str) -> None:
+        """Test that the keys which fall out of the lookback window are forgotten."""
+        ledger = TradesLedger(ledger_path)
+        old = _make_trade("0x1", 0)
+        new = _make_trade("0x2", TRADES_SYNC_LOOKBACK + 1)
+        ledger.record([old, new])
+        assert list(ledger.recent) == [trade_key(new)]
+
+    def test_add_investments(self, ledger_path: str) -> None:
+        """Test that only the BUY amounts are accumulated and the changed conditions are reported."""
+        ledger = TradesLedger(ledger_path)
+        changed = ledger.add_investments(
+            {
+                "0xa": {
+                    0: [
+                        {"side": "BUY", "usdc_amount": 2.0},
+                        {"side": "SELL", "usdc_amount": 1.0},
+                    ]
+                },
+                "0xb": {1: [{"side": "SELL", "usdc_amount": 3.0}]},
+            }
+        )
+        assert changed == {"0xa"}
+        ledger.add_investments({"0xa": {0: [{"side": "BUY", "usdc_amount": 1.5}]}})
+
+        assert ledger.investments == {"0xa": {0: 3_500_000}}
+
+    def test_add_investments_is_order_independent(self, ledger_path: str) -> None:
+        """Test that the total does not depend on the order the trades were synced in."""
+        amounts = [22.209165, 27.499723, 12.637189]
+        totals = []
+        for ordered in (amounts, amounts[::-1]):
+            ledger = TradesLedger(ledger_path)
+            for amount in ordered:
+                ledger.add_investments(
+                    {"0xa": {0: [{"side": "BUY", "usdc_amount": amount}]}}
+                )
+            totals.append(ledger.investments["0xa"][0])
+        assert totals[0] == totals[1]
+        assert totals[0] == sum(to_base_units(amount) for amount in amounts)
+
+    def test_add_investments_skips_invalid_amounts(self, ledger_path: str) -> None:
+        """Test that trades with an unusable amount are ignored."""
+        ledger = TradesLedger(ledger_path)
+        changed = ledger.add_investments(
+            {
+                "0xa": {
+                    0: [
+                        {"side": "BUY", "usdc_amount": float("inf")},
+                        {"side": "BUY", "usdc_amount": None},
+                        {"side": "BUY", "usdc_amount": 1.0},
+                    ]
+                }
+            }
+        )
+        assert changed == {"0xa"}
+        assert ledger.investments == {"0xa": {0: USDC_DECIMALS}}
+
+    def test_store_and_load_roundtrip(self, ledger_path: str) -> None:
+        """Test that a stored ledger is loaded back identically."""
+        writer = TradesLedger(ledger_path)
+        writer.record([_make_trade("0x1", 1000)])
+        writer.add_investments({"0xa": {1: [{"side": "BUY", "usdc_amount": 2.0}]}})
+        writer.store()
+
+        reader = TradesLedger(ledger_path)
+        assert reader.load() is True
+        assert reader.cursor == writer.cursor
+        assert reader.recent == writer.recent
+        assert reader.investments == {"0xa": {1: 2_000_000}}
+
+    @pytest.mark.parametrize("content", ["{not json", "{}", '{"cursor": "x"}'])
+    def test_load_malformed(self, ledger_path: str, content: str) -> None:
+        """Test that a malformed ledger raises."""
+        with open(ledger_path, "w") as ledger_file:
+            ledger_file.write(content)
+
+        with pytest.raises((ValueError, TypeError, KeyError)):
+            TradesLedger(ledger_path).load()
+
+    def test_failed_store_keeps_previous_ledger(self, ledger_path: str) -> None:
+        """Test that a failed write leaves the previous ledger and no temporary file behind."""
+        ledger = TradesLedger(ledger_path)
+        ledger.record([_make_trade("0x1", 1000)])
+        ledger.store()
+
+        ledger.record([_make_trade("0x2", 2000)])
+        with patch("json.dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                ledger.store()
+
+        reader = TradesLedger(ledger_path)
+        reader.load()
+        assert reader.cursor == 1000
+        assert os.listdir(os.path.dirname(ledger_path)) == [TRADES_LEDGER_FILENAME]
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""A persisted ledger of the Polymarket trades, synced incrementally."""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Set
+
+TRADES_LEDGER_FILENAME = "polymarket_trades_ledger.json"
+# trades are re-requested this many seconds before the cursor, so that trades indexed late by the API are not missed;
+# the ones already recorded are recognized by their key and skipped
+TRADES_SYNC_LOOKBACK = 60 * 60
+CURSOR_KEY = "cursor"
+RECENT_KEY = "recent"
+INVESTMENTS_KEY = "investments"
+BUY_SIDE = "BUY"
+# USDC has 6 decimals on Polymarket
+USDC_DECIMALS = 10**6
+
+# condition id -> outcome index -> total amount spent on BUY trades, in USDC base units
+InvestmentsType = Dict[str, Dict[int, int]]
+
+
+def to_base_units(usdc_amount: float) -> int:
+    """Convert a USDC amount to base units, truncating any fraction of a unit."""
+    return int(usdc_amount * USDC_DECIMALS)
+
+
+def trade_key(trade: Dict[str, Any]) -> str:
+    """Get a key which identifies a trade."""
+    fields = ("transactionHash", "conditionId", "outcomeIndex", "side", "size", "price")
+    return ":".join(str(trade.get(field)) for field in fields)
+
+
+def trade_timestamp(trade: Dict[str, Any]) -> Optional[int]:
+    """Get the timestamp of a trade, or `None` if it is missing or invalid."""
+    try:
+        return int(trade["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TradesLedger:
+    """The agent's Polymarket trades, aggregated per condition id and outcome index.
+
+    Instead of downloading and regrouping the whole trade history on every round, the ledger keeps:
+
+    - the timestamp of the newest recorded trade (the cursor), from which the next sync continues,
+    - the keys of the trades recorded within `TRADES_SYNC_LOOKBACK` of the cursor, to skip re-fetched trades,
+    - the total amount invested per condition id and outcome index, in USDC base units.
+
+    Its size therefore depends on the number of traded markets, not on the length of the trade history.
+    Every trade is converted to base units once, before it is added, so that the totals do not depend on
+    the order in which the trades are synced, e.g., incrementally or with a full resync.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the ledger."""
+        self.path = str(path)
+        self.cursor: Optional[int] = None
+        self.recent: Dict[str, int] = {}
+        self.investments: InvestmentsType = {}
+
+    @property
+    def since_timestamp(self) -> Optional[int]:
+        """Get the timestamp from which the next sync should fetch the trades, or `None` for a full sync."""
+        if self.cursor is None:
+            return None
+        return max(self.cursor - TRADES_SYNC_LOOKBACK, 0)
+
+    def load(self) -> bool:
+        """Load the ledger from its file.
+
+        :return: whether a ledger was found and loaded.
+        :raises: `OSError` if the file cannot be read, `ValueError`, `TypeError` or `KeyError` if it is malformed.
+        """
+        if not os.path.isfile(self.path):
+            return False
+
+        with open(self.path) as ledger_file:
+            ledger = json.load(ledger_file)
+
+        cursor = ledger[CURSOR_KEY]
+        self.cursor = None if cursor is None else int(cursor)
+        self.recent = {str(key): int(ts) for key, ts in ledger[RECENT_KEY].items()}
+        self.investments = {
+            str(condition_id): {
+                int(outcome): int(amount) for outcome, amount in outcomes.items()
+            }
+            for condition_id, outcomes in ledger[INVESTMENTS_KEY].items()
+        }
+        return True
+
+    def store(self) -> None:
+        """Store the ledger to its file atomically.
+
+        :raises: `OSError` if the file cannot be written.
+        """
+        ledger = {
+            CURSOR_KEY: self.cursor,
+            RECENT_KEY: self.recent,
+            INVESTMENTS_KEY: self.investments,
+        }
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.path) + ".", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as ledger_file:
+                json.dump(ledger, ledger_file)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def record(self, trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Record the given trades, advancing the cursor.
+
+        Trades without a valid timestamp cannot be placed relative to the cursor and are ignored.
+
+        :param trades: the fetched trades.
+        :return: the trades which had not been recorded before.
+        """
+        new_trades = []
+        for trade in trades:
+            timestamp = trade_timestamp(trade)
+            key = trade_key(trade)
+            if timestamp is None or key in self.recent:
+                continue
+            new_trades.append(trade)
+            self.recent[key] = timestamp
+            if self.cursor is None or timestamp > self.cursor:
+                self.cursor = timestamp
+
+        if self.cursor is not None:
+            oldest = self.cursor - TRADES_SYNC_LOOKBACK
+            self.recent = {
+                key: timestamp
+                for key, timestamp in self.recent.items()
+                if timestamp >= oldest
+            }
+        return new_trades
+
+    def add_investments(
+        self, trades_by_condition_outcome: Dict[str, Dict[int, List[Dict[str, Any]]]]
+    ) -> Set[str]:
+        """Add the BUY amounts of the given grouped trades to the invested totals.
+
+        Trades whose amount cannot be converted to base units are ignored.
+
+        :param trades_by_condition_outcome: the new trades, grouped by condition id and outcome index.
+        :return: the condition ids whose totals changed.
+        """
+        changed = set()
+        for condition_id, trades_by_outcome in trades_by_condition_outcome.items():
+            for outcome_index, trades in trades_by_outcome.items():
+                amount = 0
+                for trade in trades:
+                    if trade["side"] != BUY_SIDE:
+                        continue
+                    try:
+                        amount += to_base_units(trade["usdc_amount"])
+                    except (ValueError, TypeError, OverflowError):
+                        continue
+                if amount <= 0:
+                    continue
+                outcomes = self.investments.setdefault(condition_id, {})
+                outcomes[outcome_index] = outcomes.get(outcome_index, 0) + amount
+                changed.add(condition_id)
+        return changed
@@ -26,6 +26,7 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Dict,
     Generator,
     List,
     Optional,
@@ -43,6 +44,7 @@ from packages.valory.contracts.gnosis_safe.contract import GnosisSafeContract
 from packages.valory.contracts.mech_activity.contract import MechActivityContract
 from packages.valory.contracts.service_staking_token.contract import (
     ServiceStakingTokenContract,
+    StakingSnapshot,
 )
 from packages.valory.contracts.staking_token.contract import StakingTokenContract
 from packages.valory.protocols.contract_api import ContractApiMessage
@@ -52,7 +54,11 @@ from packages.valory.skills.abstract_round_abci.behaviour_utils import (
     TimeoutException,
 )
 from packages.valory.skills.abstract_round_abci.behaviours import AbstractRoundBehaviour
-from packages.valory.skills.staking_abci.models import StakingParams
+from packages.valory.skills.staking_abci.models import (
+    EPOCH_FIELDS,
+    StakingEpochCache,
+    StakingParams,
+)
 from packages.valory.skills.staking_abci.payloads import CallCheckpointPayload
 from packages.valory.skills.staking_abci.rounds import (
     CallCheckpointRound,
@@ -100,6 +106,7 @@ class StakingInteractBaseBehaviour(BaseBehaviour, ABC):
         # because the round behaviour is re-instantiated on every round entry.
         self._activity_checker_address: Optional[str] = None
         self._checker_version: Optional[str] = None
+        self._staking_snapshot: Optional[StakingSnapshot] = None
 
     @property
     def params(self) -> StakingParams:
@@ -203,6 +210,30 @@ class StakingInteractBaseBehaviour(BaseBehaviour, ABC):
         """Set the agent ids."""
         self._agent_ids = json.dumps(agent_ids)
 
+    @property
+    def staking_snapshot(self) -> Optional[StakingSnapshot]:
+        """Get the staking values read with a single aggregate call."""
+        return self._staking_snapshot
+
+    @staking_snapshot.setter
+    def staking_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Set the staking snapshot and the staking values read with it."""
+        staking_snapshot = StakingSnapshot(**snapshot)
+        self._staking_snapshot = staking_snapshot
+        # the epoch values are `None` until they are filled in from the staking epoch cache
+        self.ts_checkpoint = cast(int, staking_snapshot.ts_checkpoint)
+        self.next_checkpoint = cast(int, staking_snapshot.next_checkpoint)
+        self.liveness_period = cast(int, staking_snapshot.liveness_period)
+        self.liveness_ratio = cast(int, staking_snapshot.liveness_ratio)
+        if staking_snapshot.staking_state is None:
+            # no service id is configured
+            return
+        self.service_staking_state = staking_snapshot.staking_state
+        self.service_info = cast(
+            Tuple[Any, Any, Tuple[Any, Any]], staking_snapshot.service_info
+        )
+        self.agent_ids = cast(List[int], staking_snapshot.agent_ids)
+
     @property
     def activity_checker_address(self) -> Optional[str]:
         """Get the activity checker address read from the staking contract."""
@@ -430,6 +461,52 @@ class StakingInteractBaseBehaviour(BaseBehaviour, ABC):
         )
         return status
 
+    @property
+    def staking_epoch_cache(self) -> StakingEpochCache:
+        """Get the staking epoch cache, which is shared across the skills."""
+        return self.context.state.staking_epoch_cache
+
+    def _get_staking_snapshot(self) -> WaitableConditionType:
+        """Read all the staking values of the service with a single aggregate call.
+
+        The snapshot replaces the separate reads of the staking state, the service info, the checkpoints,
+        the liveness period and ratio and the agent ids, and all of its values are read at the same block.
+        The values which only change once per epoch are read only if the cached ones may be outdated.
+
+        :return: whether the read succeeded.
+        :yield: the contract-api request step.
+        """
+        cache = self.staking_epoch_cache
+        epoch_values = not cache.is_valid(self.synced_timestamp)
+        # without a service id, the service-specific values are skipped and the service is assumed unstaked
+        has_service_id = self.ensure_service_id()
+        if epoch_values or has_service_id:
+            status = yield from self.contract_interact(
+                contract_address=self.staking_contract_address,
+                contract_public_id=ServiceStakingTokenContract.contract_id,
+                contract_callable="get_staking_snapshot",
+                data_key="data",
+                placeholder=get_name(StakingInteractBaseBehaviour.staking_snapshot),
+                service_id=self.params.on_chain_service_id,
+                activity_checker=(
+                    self.mech_activity_checker_contract if self.use_v2 else None
+                ),
+                epoch_values=epoch_values,
+            )
+            if not status:
+                return False
+        else:
+            self.staking_snapshot = dict.fromkeys(StakingSnapshot._fields)
+
+        snapshot = cast(StakingSnapshot, self.staking_snapshot)
+        if epoch_values:
+            cache.update(snapshot)
+        else:
+            filled = cache.fill(snapshot, saved_calls=len(EPOCH_FIELDS))
+            self.staking_snapshot = filled._asdict()
+        self.context.logger.debug(f"Staking epoch cache: {cache.stats}")
+        return True
+
     def _read_optional_contract_value(
         self,
         contract_address: str,
@@ -685,7 +762,8 @@ class CallCheckpointBehaviour(
 
     def check_new_epoch(self) -> Generator[None, None, bool]:
         """Check if a new epoch has been reached."""
-        yield from self.wait_for_condition_with_sleep(self._get_ts_checkpoint)
+        if self.staking_snapshot is None:
+            yield from self.wait_for_condition_with_sleep(self._get_ts_checkpoint)
         stored_timestamp_invalidated = False
 
         # if it is the first period of the service,
@@ -713,14 +791,14 @@ class CallCheckpointBehaviour(
     def async_act(self) -> Generator:
         """Do the action."""
         with self.context.benchmark_tool.measure(self.behaviour_id).local():
-            yield from self.wait_for_condition_with_sleep(self._check_service_staked)
-            yield from self.wait_for_condition_with_sleep(self._get_agent_ids)
+            yield from self.wait_for_condition_with_sleep(self._get_staking_snapshot)
 
             checkpoint_tx_hex = None
-            if self.service_staking_state == StakingState.STAKED:
-                yield from self.wait_for_condition_with_sleep(self._get_next_checkpoint)
-                if self.is_checkpoint_reached:
-                    checkpoint_tx_hex = yield from self._prepare_safe_tx()
+            if (
+                self.service_staking_state == StakingState.STAKED
+                and self.is_checkpoint_reached
+            ):
+                checkpoint_tx_hex = yield from self._prepare_safe_tx()
 
             if self.service_staking_state == StakingState.EVICTED:
                 self.context.logger.critical("Service has been evicted!")
@@ -21,9 +21,11 @@
 """Models for the Staking ABCI application."""
 
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List, Optional
 
+from packages.valory.contracts.service_staking_token.contract import StakingSnapshot
 from packages.valory.skills.abstract_round_abci.models import (
     BaseParams,
 )
@@ -39,6 +41,15 @@ from packages.valory.skills.staking_abci.rounds import StakingAbciApp
 Requests = BaseRequests
 BenchmarkTool = BaseBenchmarkTool
 
+# the snapshot fields which can only change when a checkpoint starts a new epoch
+EPOCH_FIELDS = (
+    "ts_checkpoint",
+    "next_checkpoint",
+    "liveness_period",
+    "liveness_ratio",
+    "agent_ids",
+)
+
 
 def get_store_path(kwargs: dict) -> Path:
     """Get the path of the store."""
@@ -59,6 +70,56 @@ def get_store_path(kwargs: dict) -> Path:
     return Path(path)
 
 
+@dataclass
+class StakingEpochCache:  # pylint: disable=too-many-instance-attributes
+    """The staking values that change at most once per staking epoch, shared across the skills.
+
+    A checkpoint cannot be called before `next_checkpoint`, so the cached values stay valid until then.
+    Once it is reached, the values are read again on every period, until a new epoch has started.
+    """
+
+    ts_checkpoint: Optional[int] = None
+    next_checkpoint: Optional[int] = None
+    liveness_period: Optional[int] = None
+    liveness_ratio: Optional[int] = None
+    agent_ids: List[int] = field(default_factory=list)
+    hits: int = 0
+    misses: int = 0
+    saved_calls: int = 0
+
+    def is_valid(self, timestamp: int) -> bool:
+        """Whether the cached epoch values are still valid at the given timestamp."""
+        return self.next_checkpoint is not None and timestamp < self.next_checkpoint
+
+    def update(self, snapshot: StakingSnapshot) -> None:
+        """Update the cache with the epoch values of a freshly read snapshot."""
+        self.misses += 1
+        for epoch_field in EPOCH_FIELDS:
+            setattr(self, epoch_field, getattr(snapshot, epoch_field))
+
+    def fill(self, snapshot: StakingSnapshot, saved_calls: int) -> StakingSnapshot:
+        """Fill in the epoch values of a snapshot that was read without them.
+
+        :param snapshot: the snapshot read without the epoch values.
+        :param saved_calls: the number of contract reads that were skipped thanks to the cache.
+        :return: the complete snapshot.
+        """
+        self.hits += 1
+        self.saved_calls += saved_calls
+        return snapshot._replace(
+            **{epoch_field: getattr(self, epoch_field) for epoch_field in EPOCH_FIELDS}
+        )
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The cache's counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_calls": self.saved_calls,
+        }
+
+
 class StakingParams(BaseParams):
     """Staking parameters."""
 
@@ -25,6 +25,10 @@ from unittest.mock import MagicMock, PropertyMock, mock_open, patch
 
 import pytest
 
+from packages.valory.contracts.service_staking_token.contract import (
+    ServiceStakingTokenContract,
+    StakingSnapshot,
+)
 from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.skills.abstract_round_abci.behaviour_utils import (
     BaseBehaviour,
@@ -36,7 +40,10 @@ from packages.valory.skills.staking_abci.behaviours import (
     NULL_ADDRESS,
     StakingInteractBaseBehaviour,
 )
-from packages.valory.skills.staking_abci.models import StakingParams
+from packages.valory.skills.staking_abci.models import (
+    StakingEpochCache,
+    StakingParams,
+)
 from packages.valory.skills.staking_abci.rounds import (
     CallCheckpointRound,
     StakingState,
@@ -44,6 +51,16 @@ from packages.valory.skills.staking_abci.rounds import (
 )
 from packages.valory.skills.transaction_settlement_abci.rounds import TX_HASH_LENGTH
 
+STAKING_SNAPSHOT = {
+    "staking_state": StakingState.STAKED.value,
+    "service_info": (1, 2, (3, 4)),
+    "ts_checkpoint": 100,
+    "next_checkpoint": 200,
+    "liveness_period": 300,
+    "liveness_ratio": 400,
+    "agent_ids": [25],
+}
+
 
 class _ConcreteStakingBehaviour(StakingInteractBaseBehaviour):
     """Concrete subclass for testing the abstract StakingInteractBaseBehaviour."""
@@ -87,6 +104,7 @@ class TestStakingInteractBaseBehaviourInit:
         assert b._service_staking_state == StakingState.UNSTAKED
         assert b._checkpoint_ts == 0
         assert b._agent_ids == "[]"
+        assert b._staking_snapshot is None
 
 
 class TestStakingInteractProperties:
@@ -246,6 +264,31 @@ class TestStakingInteractProperties:
         b.agent_ids = [1, 2, 3]  # type: ignore
         assert b.agent_ids == "[1, 2, 3]"
 
+    def test_staking_snapshot_setter(self) -> None:
+        """Staking_snapshot setter sets every staking value read with the snapshot."""
+        b = self._make()
+        b.staking_snapshot = STAKING_SNAPSHOT  # type: ignore
+        assert b.staking_snapshot == StakingSnapshot(**STAKING_SNAPSHOT)
+        assert b.service_staking_state == StakingState.STAKED
+        assert b.service_info == (1, 2, (3, 4))
+        assert b.ts_checkpoint == 100
+        assert b.next_checkpoint == 200
+        assert b.liveness_period == 300
+        assert b.liveness_ratio == 400
+        assert b.agent_ids == "[25]"
+
+    def test_staking_snapshot_setter_without_service(self) -> None:
+        """Staking_snapshot setter keeps the service unstaked without a service id."""
+        b = self._make()
+        b.staking_snapshot = {  # type: ignore
+            **STAKING_SNAPSHOT,
+            "staking_state": None,
+            "service_info": None,
+        }
+        assert b.service_staking_state == StakingState.UNSTAKED
+        assert b.ts_checkpoint == 100
+        assert b.agent_ids == "[]"
+
 
 # ---------------------------------------------------------------------------
 # wait_for_condition_with_sleep
@@ -613,6 +656,123 @@ class TestGetMethods:
             assert exc_info.value.value is True
 
 
+class TestGetStakingSnapshot:
+    """Tests for _get_staking_snapshot."""
+
+    def _run(
+        self,
+        cache: StakingEpochCache,
+        service_id: Any = 42,
+        checker: str = NULL_ADDRESS,
+        response: Any = STAKING_SNAPSHOT,
+    ) -> Any:
+        """Run the read against the given cache and return the behaviour, the result and the interact mock."""
+        b = object.__new__(_ConcreteStakingBehaviour)  # type: ignore[type-abstract]
+        b._service_staking_state = StakingState.UNSTAKED
+        b._agent_ids = "[]"
+        mock_ctx = MagicMock()
+        mock_ctx.params.on_chain_service_id = service_id
+        mock_ctx.params.staking_contract_address = "0xstaking"
+        mock_ctx.params.mech_activity_checker_contract = checker
+        mock_ctx.state.staking_epoch_cache = cache
+
+        def interact(**kwargs: Any) -> Generator:
+            """Store the response on the placeholder."""
+            if response is None:
+                return False
+            setattr(b, kwargs["placeholder"], response)
+            return True
+            yield  # pragma: no cover
+
+        mock_interact = MagicMock(side_effect=interact)
+        with (
+            patch.object(
+                type(b), "context", new_callable=PropertyMock, return_value=mock_ctx
+            ),
+            patch.object(
+                type(b), "synced_timestamp", new_callable=PropertyMock, return_value=150
+            ),
+            patch.object(b, "contract_interact", mock_interact),
+        ):
+            gen = b._get_staking_snapshot()
+            with pytest.raises(StopIteration) as exc_info:
+                next(gen)
+        return b, exc_info.value.value, mock_interact
+
+    @pytest.mark.parametrize(
+        "checker, expected_checker",
+        ((NULL_ADDRESS, None), ("0xchecker", "0xchecker")),
+    )
+    def test_delegates_to_contract_interact(
+        self, checker: str, expected_checker: Any
+    ) -> None:
+        """Reads the snapshot through the service staking token contract."""
+        _, result, mock_interact = self._run(StakingEpochCache(), checker=checker)
+
+        assert result is True
+        kwargs = mock_interact.call_args.kwargs
+        assert kwargs["contract_address"] == "0xstaking"
+        assert kwargs["contract_public_id"] == ServiceStakingTokenContract.contract_id
+        assert kwargs["contract_callable"] == "get_staking_snapshot"
+        assert kwargs["placeholder"] == "staking_snapshot"
+        assert kwargs["service_id"] == 42
+        assert kwargs["activity_checker"] == expected_checker
+
+    def test_cache_miss_reads_and_caches_epoch_values(self) -> None:
+        """An empty cache reads the epoch values and stores them."""
+        cache = StakingEpochCache()
+        b, result, mock_interact = self._run(cache)
+
+        assert result is True
+        assert mock_interact.call_args.kwargs["epoch_values"] is True
+        assert cache.next_checkpoint == 200
+        assert cache.agent_ids == [25]
+        assert cache.stats == {"hits": 0, "misses": 1, "saved_calls": 0}
+        assert b.ts_checkpoint == 100
+
+    def test_cache_hit_skips_epoch_values(self) -> None:
+        """A valid cache fills in the epoch values that were not read."""
+        cache = StakingEpochCache()
+        cache.update(StakingSnapshot(**STAKING_SNAPSHOT))
+        partial = {
+            **dict.fromkeys(StakingSnapshot._fields),
+            "staking_state": StakingState.EVICTED.value,
+            "service_info": (5, 6, (7, 8)),
+        }
+        b, result, mock_interact = self._run(cache, response=partial)
+
+        assert result is True
+        assert mock_interact.call_args.kwargs["epoch_values"] is False
+        assert b.service_staking_state == StakingState.EVICTED
+        assert b.service_info == (5, 6, (7, 8))
+        assert b.ts_checkpoint == 100
+        assert b.next_checkpoint == 200
+        assert b.liveness_period == 300
+        assert b.liveness_ratio == 400
+        assert b.agent_ids == "[25]"
+        assert cache.stats == {"hits": 1, "misses": 1, "saved_calls": 5}
+
+    def test_cache_hit_without_service_id_skips_the_call(self) -> None:
+        """Without a service id and with a valid cache, there is nothing to read."""
+        cache = StakingEpochCache()
+        cache.update(StakingSnapshot(**STAKING_SNAPSHOT))
+        b, result, mock_interact = self._run(cache, service_id=None)
+
+        assert result is True
+        mock_interact.assert_not_called()
+        assert b.service_staking_state == StakingState.UNSTAKED
+        assert b.ts_checkpoint == 100
+        assert cache.stats["hits"] == 1
+
+    def test_failed_read_leaves_the_cache_untouched(self) -> None:
+        """A failed read is reported and does not count as a miss."""
+        cache = StakingEpochCache()
+        _, result, _ = self._run(cache, response=None)
+
+        assert result is False
+        assert cache.stats == {"hits": 0, "misses": 0, "saved_calls": 0}
+
+
 # ---------------------------------------------------------------------------
 # ensure_service_id / _get_service_info / _get_agent_ids
 # ---------------------------------------------------------------------------
@@ -1379,6 +1539,7 @@ class TestCheckNewEpoch:
         b._next_checkpoint = 0
         b._service_staking_state = StakingState.STAKED
         b._agent_ids = "[]"
+        b._staking_snapshot = None
         return b
 
     def test_no_change(self) -> None:
@@ -1487,6 +1648,33 @@ class TestCheckNewEpoch:
                 next(gen)
             assert exc_info.value.value is True
 
+    def test_snapshot_skips_read(self) -> None:
+        """The checkpoint timestamp of the staking snapshot is not read again."""
+        b = self._make()
+        b.staking_snapshot = STAKING_SNAPSHOT  # type: ignore
+        mock_sync = MagicMock()
+        mock_sync.period_count = 5
+        mock_sync.previous_checkpoint = 100  # same as the snapshot's ts_checkpoint
+        mock_wait = MagicMock(side_effect=_noop_gen)
+
+        with (
+            patch.object(
+                type(b),
+                "synchronized_data",
+                new_callable=PropertyMock,
+                return_value=mock_sync,
+            ),
+            patch.object(
+                type(b), "context", new_callable=PropertyMock, return_value=MagicMock()
+            ),
+            patch.object(b, "wait_for_condition_with_sleep", mock_wait),
+        ):
+            gen = b.check_new_epoch()
+            with pytest.raises(StopIteration) as exc_info:
+                next(gen)
+            assert exc_info.value.value is False
+        mock_wait.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # async_act
@@ -1505,6 +1693,7 @@ class TestAsyncAct:
         b._safe_tx_hash = ""
         b._checkpoint_ts = 0
         b._agent_ids = "[]"
+        b._staking_snapshot = None
         return b
 
     def test_unstaked(self) -> None:
@@ -26,8 +26,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from packages.valory.contracts.service_staking_token.contract import StakingSnapshot
 from packages.valory.skills.abstract_round_abci.models import BaseParams
-from packages.valory.skills.staking_abci.models import StakingParams, get_store_path
+from packages.valory.skills.staking_abci.models import (
+    StakingEpochCache,
+    StakingParams,
+    get_store_path,
+)
 
 
 class TestGetStorePath:
@@ -145,3 +150,42 @@ class TestStakingParamsInit:
                     mech_activity_checker_contract="0xMechChecker",
                     store_path="",
                 )
+
+
+class TestStakingEpochCache:
+    """Tests for the StakingEpochCache."""
+
+    SNAPSHOT = StakingSnapshot(
+        staking_state=1,
+        service_info=(1, 2, (3, 4)),
+        ts_checkpoint=100,
+        next_checkpoint=200,
+        liveness_period=300,
+        liveness_ratio=400,
+        agent_ids=[25],
+    )
+
+    def test_empty_cache_is_invalid(self) -> None:
+        """An empty cache is never valid."""
+        assert not StakingEpochCache().is_valid(0)
+
+    @pytest.mark.parametrize("timestamp, expected", ((199, True), (200, False)))
+    def test_valid_until_next_checkpoint(self, timestamp: int, expected: bool) -> None:
+        """The cached values are valid until the next checkpoint is reached."""
+        cache = StakingEpochCache()
+        cache.update(self.SNAPSHOT)
+        assert cache.is_valid(timestamp) is expected
+
+    def test_fill(self) -> None:
+        """The epoch values of a partial snapshot are filled in from the cache."""
+        cache = StakingEpochCache()
+        cache.update(self.SNAPSHOT)
+        partial = self.SNAPSHOT._replace(
+            ts_checkpoint=None,
+            next_checkpoint=None,
+            liveness_period=None,
+            liveness_ratio=None,
+            agent_ids=None,
+        )
+        assert cache.fill(partial, saved_calls=5) == self.SNAPSHOT
+        assert cache.stats == {"hits": 1, "misses": 1, "saved_calls": 5}
@@ -25,6 +25,8 @@ import concurrent.futures
 import copy
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
@@ -127,6 +129,12 @@ FALLBACK_POL_TO_USD_RATE = 0.089935  # AS of 2026-02-11T18:35:09Z
 
 X402_SWAP_MAX_ROUTE_ATTEMPTS = 3
 
+WEB3_REQUEST_TIMEOUT_SECONDS = 30
+# How long a pooled provider is trusted before it is checked again
+WEB3_HEALTH_CHECK_INTERVAL_SECONDS = 60
+# Balance and nonce reads are reused across `/funds-status` polls for this long
+WEB3_READ_CACHE_SECONDS = 15
+
 
 class HttpHandler(BaseHttpHandler):
     """This implements the trader handler."""
@@ -149,6 +157,12 @@ class HttpHandler(BaseHttpHandler):
         # Guard against duplicate x402 swap submissions
         self._x402_swap_future: Optional[concurrent.futures.Future] = None
 
+        # One provider per RPC URL, with its keep-alive session and the time it was last known healthy
+        self._web3_pool: Dict[str, Tuple[Web3, requests.Session, float]] = {}
+        # Recent on-chain reads, mapped to the time they were made
+        self._web3_reads: Dict[Tuple[str, ...], Tuple[Any, float]] = {}
+        self._web3_lock = threading.Lock()
+
     @property
     def staking_synchronized_data(self) -> SynchronizedData:
         """Return the synchronized data."""
@@ -404,7 +418,9 @@ class HttpHandler(BaseHttpHandler):
         except FileNotFoundError:
             self._send_not_found_response(http_msg, http_dialogue)
 
-    def _get_adjusted_funds_status(self) -> FundRequirements:
+    def _get_adjusted_funds_status(
+        self, pol_to_usdc_rate: Optional[float] = None
+    ) -> FundRequirements:
         """
         Adjust fund status based on chain-specific token equivalence:
 
@@ -412,6 +428,7 @@ class HttpHandler(BaseHttpHandler):
         - Polygon (Polymarket): treat USDC as POL by converting via exchange rate
           and fold USDC.e balance into the pUSD bucket (v2 primary collateral)
 
+        :param pol_to_usdc_rate: the POL to USDC rate to convert with, if it has already been fetched.
         :return: The adjusted fund requirements.
         """
         funds_status = copy.deepcopy(self.funds_status)
@@ -457,7 +474,7 @@ class HttpHandler(BaseHttpHandler):
 
                 # Get POL equivalent for USDC balance using CoinGecko
                 pol_equivalent = self._get_pol_equivalent_for_usdc(
-                    usdc_balance, chain_config
+                    usdc_balance, chain_config, pol_to_usdc_rate
                 )
                 self.context.logger.info(
                     "USDC balance: raw=%s, decimals=%s",
@@ -584,16 +601,36 @@ class HttpHandler(BaseHttpHandler):
         :param chain_config: Chain configuration dictionary
         :return: Conversion rate (1 POL = X USDC), or None if failed
         """
+        current_time = self._get_pol_usdc_rate_time()
+
+        cached_rate = self._get_cached_pol_to_usdc_rate(current_time)
+        if cached_rate is not None:
+            return cached_rate
+
+        # Cache is stale or doesn't exist, fetch new rate from CoinGecko
+        return self._update_pol_to_usdc_rate(
+            self._fetch_pol_to_usdc_rate(), current_time
+        )
 
+    def _get_pol_usdc_rate_time(self) -> Optional[float]:
+        """Get the time against which the cached POL to USDC rate is checked, if the agent has synced it yet."""
         try:
-            current_time = self.shared_state.synced_timestamp
+            return self.shared_state.synced_timestamp
         except Exception as e:
             self.context.logger.warning(
                 f"Cannot access synced_timestamp because agent hasn't made any transitions yet: {str(e)}."
             )
-            current_time = None
+            return None
 
-        # Check if cached rate is still valid
+    def _get_cached_pol_to_usdc_rate(
+        self, current_time: Optional[float]
+    ) -> Optional[float]:
+        """
+        Get the cached POL to USDC rate, if it is still valid.
+
+        :param current_time: the time to check the cached rate against.
+        :return: the cached rate, or None if it is stale or missing.
+        """
         if (
             current_time is not None
             and self._pol_usdc_rate is not None
@@ -605,8 +642,16 @@ class HttpHandler(BaseHttpHandler):
                 f"(cached {int(current_time - self._pol_usdc_rate_timestamp)}s ago)"
             )
             return self._pol_usdc_rate
+        return None
 
-        # Cache is stale or doesn't exist, fetch new rate from CoinGecko
+    def _fetch_pol_to_usdc_rate(self) -> Optional[float]:
+        """
+        Fetch the POL to USDC rate from CoinGecko.
+
+        Only makes the request, so that it can run off the agent's event loop.
+
+        :return: the fetched rate, or None if it could not be fetched.
+        """
         try:
             self.context.logger.info(
                 "Fetching fresh POL→USDC rate from CoinGecko API (cache expired or missing)"
@@ -621,9 +666,7 @@ class HttpHandler(BaseHttpHandler):
                 self.context.logger.warning(
                     f"CoinGecko API returned status {response.status_code}: {response.text}"
                 )
-                return (
-                    self._pol_usdc_rate or FALLBACK_POL_TO_USD_RATE
-                )  # Return stale cache if available
+                return None
 
             data: Dict = response.json()
 
@@ -631,39 +674,50 @@ class HttpHandler(BaseHttpHandler):
 
             if price_usd is None:
                 self.context.logger.error(f"No USD price in CoinGecko response: {data}")
-                return (
-                    self._pol_usdc_rate or FALLBACK_POL_TO_USD_RATE
-                )  # Return stale cache if available
+                return None
 
             # CoinGecko returns price in USD, which we treat as USDC (1 USD ≈ 1 USDC)
-            rate = float(price_usd)
-
-            # Update cache only if we have a valid timestamp
-            if current_time is not None:
-                self._pol_usdc_rate = rate
-                self._pol_usdc_rate_timestamp = current_time
-                self.context.logger.info(
-                    f"Updated POL→USDC rate cache: 1 POL = {rate} USDC"
-                )
-            else:
-                self.context.logger.info(
-                    f"Fetched POL→USDC rate: 1 POL = {rate} USDC (not cached due to missing timestamp)"
-                )
-
-            return rate
+            return float(price_usd)
 
         except Exception as e:
             self.context.logger.error(
                 f"Error fetching POL→USDC rate from CoinGecko: {str(e)}"
             )
-            return (
-                self._pol_usdc_rate or FALLBACK_POL_TO_USD_RATE
-            )  # Return stale cache if available
+            return None
+
+    def _update_pol_to_usdc_rate(
+        self, rate: Optional[float], current_time: Optional[float]
+    ) -> Optional[float]:
+        """
+        Cache a freshly fetched POL to USDC rate.
+
+        :param rate: the fetched rate, or None if it could not be fetched.
+        :param current_time: the time at which the rate was fetched.
+        :return: the rate, or the stale cached one if it could not be fetched.
+        """
+        if rate is None:
+            # Return stale cache if available
+            return self._pol_usdc_rate or FALLBACK_POL_TO_USD_RATE
+
+        # Update cache only if we have a valid timestamp
+        if current_time is not None:
+            self._pol_usdc_rate = rate
+            self._pol_usdc_rate_timestamp = current_time
+            self.context.logger.info(
+                f"Updated POL→USDC rate cache: 1 POL = {rate} USDC"
+            )
+        else:
+            self.context.logger.info(
+                f"Fetched POL→USDC rate: 1 POL = {rate} USDC (not cached due to missing timestamp)"
+            )
+
+        return rate
 
     def _get_pol_equivalent_for_usdc(
         self,
         usdc_balance: int,
         chain_config: Dict[str, Any],
+        rate: Optional[float] = None,
     ) -> Optional[int]:
         """
         Get the POL equivalent for a given USDC balance using cached rate.
@@ -672,11 +726,13 @@ class HttpHandler(BaseHttpHandler):
 
         :param usdc_balance: USDC balance in wei (6 decimals for USDC)
         :param chain_config: Chain configuration dictionary
+        :param rate: the conversion rate (1 POL = X USDC), if it has already been fetched
         :return: POL equivalent amount in wei (18 decimals), or None if failed
         """
         try:
             # Get the conversion rate (1 POL = X USDC)
-            rate = self._get_pol_to_usdc_rate(chain_config)
+            if rate is None:
+                rate = self._get_pol_to_usdc_rate(chain_config)
 
             if rate is None or rate == 0:
                 self.context.logger.error(
@@ -715,10 +771,36 @@ class HttpHandler(BaseHttpHandler):
             if self.params.use_x402:
                 self._submit_x402_swap_if_idle()
 
-            self._send_ok_response(
+            current_time = self._get_pol_usdc_rate_time()
+            if (
+                not self.params.is_running_on_polymarket
+                or self._get_cached_pol_to_usdc_rate(current_time) is not None
+            ):
+                self._send_ok_response(
+                    http_msg,
+                    http_dialogue,
+                    self._get_adjusted_funds_status().get_response_body(),
+                )
+                return
+
+            def respond(fetched_rate: Optional[float]) -> None:
+                """Adjust the funds status with the fetched rate, on the agent's event loop."""
+                rate = self._update_pol_to_usdc_rate(fetched_rate, current_time)
+                self._send_ok_response(
+                    http_msg,
+                    http_dialogue,
+                    self._get_adjusted_funds_status(rate).get_response_body(),
+                )
+
+            # only the rate is fetched off the event loop, the funds status and the synchronized data are read
+            # on it; the funds status is polled by the frontend, so it waits for a worker instead of being rejected
+            self._run_deferred(
                 http_msg,
                 http_dialogue,
-                self._get_adjusted_funds_status().get_response_body(),
+                self._fetch_pol_to_usdc_rate,
+                respond,
+                {"error": "Failed to fetch funds status"},
+                reject_when_busy=False,
             )
         except Exception as e:
             self.context.logger.error(f"Error handling funds status request: {e}")
@@ -784,19 +866,83 @@ class HttpHandler(BaseHttpHandler):
                 self.context.logger.warning(f"No RPC URL for {chain}")
                 return None
 
-            # Commented for future debugging purposes:
-            # Note that you should create only one HTTPProvider with the same provider URL per python process,
-            # as the HTTPProvider recycles underlying TCP/IP network connections, for better performance.
-            # Multiple HTTPProviders with different URLs will work as expected.
-            return Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 30}))
+            return self._get_pooled_web3(rpc_url)
         except Exception as e:
             self.context.logger.error(f"Error creating Web3 instance: {str(e)}")
             return None
 
+    def _get_pooled_web3(self, rpc_url: str) -> Web3:
+        """Get the pooled Web3 instance for the given RPC URL, replacing it if it is unhealthy.
+
+        Only one provider is created per RPC URL, so that its keep-alive session recycles
+        the underlying TCP connections across requests.
+
+        :param rpc_url: the RPC URL.
+        :return: the Web3 instance.
+        """
+        with self._web3_lock:
+            now = time.monotonic()
+            pooled = self._web3_pool.get(rpc_url)
+            if pooled is not None:
+                w3, session, checked_at = pooled
+                if now - checked_at < WEB3_HEALTH_CHECK_INTERVAL_SECONDS:
+                    return w3
+                if w3.is_connected():
+                    self._web3_pool[rpc_url] = w3, session, now
+                    return w3
+                self.context.logger.warning(
+                    f"The provider for {rpc_url} is unhealthy, replacing it."
+                )
+                session.close()
+
+            session = requests.Session()
+            provider = Web3.HTTPProvider(
+                rpc_url,
+                request_kwargs={"timeout": WEB3_REQUEST_TIMEOUT_SECONDS},
+                session=session,
+            )
+            w3 = Web3(provider)
+            self._web3_pool[rpc_url] = w3, session, now
+            return w3
+
+    def _close_web3_pool(self) -> None:
+        """Close the sessions of all the pooled Web3 instances."""
+        with self._web3_lock:
+            for _, session, _ in self._web3_pool.values():
+                session.close()
+            self._web3_pool.clear()
+
+    def _get_cached_read(self, key: Tuple[str, ...]) -> Optional[Any]:
+        """Get a recent on-chain read, if it has not expired."""
+        with self._web3_lock:
+            cached = self._web3_reads.get(key)
+            if cached is None:
+                return None
+            value, read_at = cached
+            if time.monotonic() - read_at >= WEB3_READ_CACHE_SECONDS:
+                del self._web3_reads[key]
+                return None
+            return value
+
+    def _cache_read(self, key: Tuple[str, ...], value: Any) -> None:
+        """Cache an on-chain read."""
+        with self._web3_lock:
+            self._web3_reads[key] = value, time.monotonic()
+
+    def _invalidate_reads(self) -> None:
+        """Drop all the cached on-chain reads, as a submitted transaction may have changed them."""
+        with self._web3_lock:
+            self._web3_reads.clear()
+
     def _check_usdc_balance(
         self, eoa_address: str, chain: str, usdc_address: str
     ) -> Optional[float]:
         """Check USDC balance using Web3 library."""
+        cache_key = ("balance", chain, usdc_address.lower(), eoa_address.lower())
+        cached_balance = self._get_cached_read(cache_key)
+        if cached_balance is not None:
+            return cached_balance
+
         try:
             w3 = self._get_web3_instance(chain)
             if not w3:
@@ -819,6 +965,7 @@ class HttpHandler(BaseHttpHandler):
             balance = usdc_contract.functions.balanceOf(
                 Web3.to_checksum_address(eoa_address)
             ).call()
+            self._cache_read(cache_key, balance)
             return balance
         except Exception as e:
             self.context.logger.error(f"Error checking USDC balance: {str(e)}")
@@ -918,6 +1065,10 @@ class HttpHandler(BaseHttpHandler):
             self.context.logger.error(f"Error submitting transaction: {str(e)}")
             return None
 
+        finally:
+            # whether or not the submission succeeded, the cached nonce and balances may be stale
+            self._invalidate_reads()
+
     def _check_transaction_status(
         self, tx_hash: str, chain: str, timeout: int = 60
     ) -> bool:
@@ -951,6 +1102,11 @@ class HttpHandler(BaseHttpHandler):
         self, address: str, chain: str
     ) -> Tuple[Optional[int], Optional[int]]:
         """Get nonce and gas price using Web3."""
+        cache_key = ("nonce_and_gas", chain, address.lower())
+        cached = self._get_cached_read(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             w3 = self._get_web3_instance(chain)
             if not w3:
@@ -959,6 +1115,7 @@ class HttpHandler(BaseHttpHandler):
             nonce = w3.eth.get_transaction_count(Web3.to_checksum_address(address))
             gas_price = w3.eth.gas_price
 
+            self._cache_read(cache_key, (nonce, gas_price))
             return nonce, gas_price
 
         except Exception as e:
@@ -1199,6 +1356,7 @@ class HttpHandler(BaseHttpHandler):
         """Tear down the handler."""
         super().teardown()
         self._executor_shutdown()
+        self._close_web3_pool()
 
     def _executor_shutdown(self) -> None:
         """Shut down the executor."""
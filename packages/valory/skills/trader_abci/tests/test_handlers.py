@@ -1624,6 +1624,80 @@ class TestHandleGetFundsStatus:
             handler._handle_get_funds_status(http_msg, http_dialogue)
             handler.executor.submit.assert_called_once()  # type: ignore[attr-defined]
 
+    def test_failure(self) -> None:
+        """Test funds status responds with an internal server error when the status cannot be computed."""
+        handler = _make_handler(use_x402=False)
+        http_msg = MagicMock()
+        http_dialogue = MagicMock()
+
+        with (
+            patch.object(
+                handler,
+                "_get_adjusted_funds_status",
+                side_effect=ValueError("rate unavailable"),
+            ),
+            patch.object(handler, "_send_ok_response") as mock_ok,
+            patch.object(handler, "_send_internal_server_error_response") as mock_error,
+        ):
+            handler._handle_get_funds_status(http_msg, http_dialogue)
+            mock_ok.assert_not_called()
+            mock_error.assert_called_once_with(
+                http_msg, http_dialogue, {"error": "Failed to fetch funds status"}
+            )
+
+    def test_polymarket_fetches_only_the_rate_off_the_loop(self) -> None:
+        """Test that only the rate is fetched deferred, and the funds status is adjusted with it afterwards."""
+        handler = _make_handler(is_polymarket=True)
+        http_msg = MagicMock()
+        http_dialogue = MagicMock()
+
+        mock_result = MagicMock()
+        mock_result.get_response_body.return_value = {"funds": "ok"}
+
+        with (
+            patch.object(handler, "_get_pol_usdc_rate_time", return_value=1000.0),
+            patch.object(
+                handler, "_fetch_pol_to_usdc_rate", return_value=0.1
+            ) as mock_fetch,
+            patch.object(
+                handler, "_get_adjusted_funds_status", return_value=mock_result
+            ) as mock_adjusted,
+            patch.object(handler, "_send_ok_response") as mock_send,
+            patch.object(
+                handler, "_run_deferred", wraps=handler._run_deferred
+            ) as mock_run_deferred,
+        ):
+            handler._handle_get_funds_status(http_msg, http_dialogue)
+
+        assert mock_run_deferred.call_args.args[2] == handler._fetch_pol_to_usdc_rate
+        assert mock_run_deferred.call_args.kwargs["reject_when_busy"] is False
+        mock_fetch.assert_called_once_with()
+        mock_adjusted.assert_called_once_with(0.1)
+        mock_send.assert_called_once_with(http_msg, http_dialogue, {"funds": "ok"})
+        assert handler._pol_usdc_rate == 0.1
+
+    def test_polymarket_cached_rate_responds_directly(self) -> None:
+        """Test that a cached rate is used without deferring the request."""
+        handler = _make_handler(is_polymarket=True)
+        handler._pol_usdc_rate = 0.1
+        handler._pol_usdc_rate_timestamp = 1000.0
+
+        mock_result = MagicMock()
+        mock_result.get_response_body.return_value = {"funds": "ok"}
+
+        with (
+            patch.object(handler, "_get_pol_usdc_rate_time", return_value=1010.0),
+            patch.object(
+                handler, "_get_adjusted_funds_status", return_value=mock_result
+            ),
+            patch.object(handler, "_send_ok_response") as mock_send,
+            patch.object(handler, "_run_deferred") as mock_run_deferred,
+        ):
+            handler._handle_get_funds_status(MagicMock(), MagicMock())
+
+        mock_run_deferred.assert_not_called()
+        mock_send.assert_called_once()
+
 
 # type: ignore[attr-defined]
 # ---------------------------------------------------------------------------
@@ -1767,6 +1841,60 @@ class TestGetWeb3Instance:
             result = self.handler._get_web3_instance("polygon")
             assert result is None
 
+    def test_reuses_pooled_instance(self) -> None:
+        """Test that the provider of an RPC URL is created only once."""
+        with patch("packages.valory.skills.trader_abci.handlers.Web3") as MockWeb3:
+            first = self.handler._get_web3_instance("polygon")
+            second = self.handler._get_web3_instance("polygon")
+            assert first is second
+            MockWeb3.HTTPProvider.assert_called_once()
+            first.is_connected.assert_not_called()
+
+    def test_replaces_unhealthy_instance(self) -> None:
+        """Test that a pooled provider which fails its health check is replaced."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.is_connected.return_value = False
+        with (
+            patch(
+                "packages.valory.skills.trader_abci.handlers.Web3",
+                side_effect=[stale, fresh],
+            ),
+            patch(
+                "packages.valory.skills.trader_abci.handlers.WEB3_HEALTH_CHECK_INTERVAL_SECONDS",
+                0,
+            ),
+        ):
+            assert self.handler._get_web3_instance("gnosis") is stale
+            assert self.handler._get_web3_instance("gnosis") is fresh
+            stale.is_connected.assert_called_once()
+
+    def test_keeps_healthy_instance(self) -> None:
+        """Test that a pooled provider which passes its health check is kept."""
+        with (
+            patch("packages.valory.skills.trader_abci.handlers.Web3") as MockWeb3,
+            patch(
+                "packages.valory.skills.trader_abci.handlers.WEB3_HEALTH_CHECK_INTERVAL_SECONDS",
+                0,
+            ),
+        ):
+            MockWeb3.return_value.is_connected.return_value = True
+            first = self.handler._get_web3_instance("gnosis")
+            assert self.handler._get_web3_instance("gnosis") is first
+            MockWeb3.HTTPProvider.assert_called_once()
+
+    def test_teardown_closes_pool(self) -> None:
+        """Test that tearing down the handler closes the pooled sessions."""
+        with (
+            patch("packages.valory.skills.trader_abci.handlers.Web3"),
+            patch(
+                "packages.valory.skills.trader_abci.handlers.requests.Session"
+            ) as MockSession,
+        ):
+            self.handler._get_web3_instance("polygon")
+            self.handler._close_web3_pool()
+            MockSession.return_value.close.assert_called_once()
+            assert self.handler._web3_pool == {}
+
 
 # ---------------------------------------------------------------------------
 # _check_usdc_balance tests
@@ -1793,6 +1921,26 @@ class TestCheckUsdcBalance:
             result = self.handler._check_usdc_balance("0xAddress", "polygon", "0xUSDC")
             assert result == 5000000
 
+    def test_cached(self) -> None:
+        """Test that a recent balance read is reused."""
+        mock_w3 = MagicMock()
+        balance_of = mock_w3.eth.contract.return_value.functions.balanceOf
+        balance_of.return_value.call.return_value = 5000000
+
+        with patch.object(
+            self.handler, "_get_web3_instance", return_value=mock_w3
+        ) as mock_get_w3:
+            first = self.handler._check_usdc_balance("0xA", "polygon", "0xUSDC")
+            second = self.handler._check_usdc_balance("0xa", "polygon", "0xusdc")
+            assert first == second == 5000000
+            mock_get_w3.assert_called_once()
+
+            with patch(
+                "packages.valory.skills.trader_abci.handlers.WEB3_READ_CACHE_SECONDS", 0
+            ):
+                self.handler._check_usdc_balance("0xA", "polygon", "0xUSDC")
+            assert mock_get_w3.call_count == 2
+
     def test_no_web3(self) -> None:
         """Test when web3 instance is None."""
         with patch.object(self.handler, "_get_web3_instance", return_value=None):
@@ -2038,6 +2186,20 @@ class TestSignAndSubmitTxWeb3:
             )
             assert result is None
 
+    @pytest.mark.parametrize("send_error", (None, Exception("nonce too low")))
+    def test_invalidates_reads(self, send_error: Optional[Exception]) -> None:
+        """Test that a submission drops the cached reads, whether it succeeds or not."""
+        mock_w3 = MagicMock()
+        mock_w3.eth.send_raw_transaction.side_effect = send_error
+        self.handler._cache_read(("nonce_and_gas", "polygon", "0xa"), (5, 1000))
+
+        with patch.object(self.handler, "_get_web3_instance", return_value=mock_w3):
+            self.handler._sign_and_submit_tx_web3({"to": "0x1"}, "polygon", MagicMock())
+
+        assert (
+            self.handler._get_cached_read(("nonce_and_gas", "polygon", "0xa")) is None
+        )
+
 
 # ---------------------------------------------------------------------------
 # _check_transaction_status tests
@@ -2112,6 +2274,11 @@ class TestGetNonceAndGasWeb3:
             assert nonce == 42
             assert gas == 50000000000
 
+            mock_w3.eth.get_transaction_count.return_value = 43
+            nonce, _ = self.handler._get_nonce_and_gas_web3("0xAddress", "polygon")
+            assert nonce == 42
+            mock_w3.eth.get_transaction_count.assert_called_once()
+
     def test_no_web3(self) -> None:
         """Test when web3 is None."""
         with patch.object(self.handler, "_get_web3_instance", return_value=None):
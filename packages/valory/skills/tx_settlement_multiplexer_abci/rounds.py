@@ -19,7 +19,6 @@
 
 """This package contains the rounds of `TxSettlementMultiplexerAbciApp`."""
 
-import json
 from enum import Enum
 from typing import Any, Dict, Optional, Set, Tuple
 
@@ -64,6 +63,7 @@ from packages.valory.skills.decision_maker_abci.states.redeem import RedeemRound
 from packages.valory.skills.decision_maker_abci.states.sell_outcome_tokens import (
     SellOutcomeTokensRound,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 from packages.valory.skills.mech_interact_abci.states.purchase_subscription import (
     MechPurchaseSubscriptionRound,
 )
@@ -171,7 +171,7 @@ class PostTxSettlementRound(CollectSameUntilThresholdRound):
 
         # if a bet was just placed, edit the utilized tools mapping
         if event in (Event.BET_PLACEMENT_DONE, Event.SELL_OUTCOME_TOKENS_DONE):
-            utilized_tools = synced_data.utilized_tools
+            utilized_tools = UtilizedTools(synced_data.utilized_tools)
             if synced_data.final_tx_hash is None:
                 self.context.logger.warning(
                     f"The tx hash was not set. This is unexpected as {event} has just been emitted!"
@@ -179,7 +179,7 @@ class PostTxSettlementRound(CollectSameUntilThresholdRound):
                 return synced_data, event
 
             utilized_tools[synced_data.final_tx_hash] = synced_data.mech_tool
-            tools_update = json.dumps(utilized_tools, sort_keys=True)
+            tools_update = utilized_tools.serialize()
             self.synchronized_data.update(utilized_tools=tools_update)
 
         return synced_data, event
@@ -49,6 +49,7 @@ from packages.valory.skills.decision_maker_abci.states.redeem import RedeemRound
 from packages.valory.skills.decision_maker_abci.states.sell_outcome_tokens import (
     SellOutcomeTokensRound,
 )
+from packages.valory.skills.decision_maker_abci.utilized_tools import UtilizedTools
 from packages.valory.skills.mech_interact_abci.states.purchase_subscription import (
     MechPurchaseSubscriptionRound,
 )
@@ -508,6 +509,32 @@ class TestPostTxSettlementRoundEndBlock:
             utilized_tools=expected_tools_json  # type: ignore[attr-defined]
         )
 
+    # type: ignore[attr-defined]
+    def test_bet_placement_done_utilized_tools_keeps_timestamps(self) -> None:
+        """Test that the timestamps of the existing utilized_tools are kept."""
+        round_ = self._create_round()
+        existing_tools = UtilizedTools({"0xold": "old-tool"}, recorded={"0xold": 100})
+
+        with patch(
+            "packages.valory.skills.tx_settlement_multiplexer_abci.rounds.SynchronizedData"
+        ) as MockSyncData:
+            mock_synced = MagicMock()
+            mock_synced.tx_submitter = BetPlacementRound.auto_round_id()
+            mock_synced.utilized_tools = existing_tools
+            mock_synced.final_tx_hash = "0xnew"
+            mock_synced.mech_tool = "new-tool"
+            MockSyncData.return_value = mock_synced
+
+            result = round_.end_block()
+
+        assert result is not None
+        expected_tools_json = json.dumps(
+            {"0xnew": "new-tool", "0xold": ["old-tool", 100]}, sort_keys=True
+        )
+        round_.synchronized_data.update.assert_called_once_with(  # type: ignore[attr-defined]
+            utilized_tools=expected_tools_json  # type: ignore[attr-defined]
+        )
+
     @pytest.mark.parametrize(
         "submitter_round_cls,expected_event",
         [